@@ -5,175 +5,162 @@ Advanced Health Monitor Log Viewer
 自動更新機能付きの高度なHTMLダッシュボードを生成するツール
 """
 
-import json
 import os
 import glob
+import json
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import argparse
 
+from health_monitor.services.log_aggregator import LogAggregator, aggregate_log_files, extract_response_time
+from health_monitor.services.log_checkpoint import LogCheckpointCache
+
+# 解析済みログから保持する最新エントリ数
+RECENT_ENTRY_LIMIT = 50
+
+# 最新アクティビティに表示する件数
+RECENT_ACTIVITY_LIMIT = 15
+
+# 監視対象ごとの応答時間推移（スパークライン）の最大点数
+SPARKLINE_POINTS = 24
+
+# 埋め込みJSONの行データの列順
+PAYLOAD_COLUMNS = [
+    'name', 'type', 'status', 'uptime', 'response_time', 'avg',
+    'p50', 'p95', 'p99', 'down_seconds', 'sparkline'
+]
+
 
 class AdvancedHealthLogViewer:
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(self, log_dir: str = "logs", cache_file: Optional[str] = None, use_cache: bool = True,
+                 workers: Optional[int] = None):
         self.log_dir = log_dir
+        self.use_cache = use_cache
+        self.workers = workers
+        self.cache_file = cache_file or os.path.join(log_dir, ".advanced_log_viewer_cache.json")
         
     def get_log_files(self) -> List[str]:
         """ログディレクトリから全てのログファイルを取得"""
         pattern = os.path.join(self.log_dir, "health_monitor_*.log")
         return sorted(glob.glob(pattern), reverse=True)
     
-    def parse_log_file(self, log_file: str) -> List[Dict[str, Any]]:
-        """JSONログファイルを解析"""
-        entries = []
-        try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            entry = json.loads(line)
-                            # タイムスタンプを解析
-                            entry['parsed_timestamp'] = datetime.fromisoformat(
-                                entry['timestamp'].replace('Z', '+00:00')
-                            )
-                            entries.append(entry)
-                        except json.JSONDecodeError:
-                            continue
-        except FileNotFoundError:
-            print(f"ログファイルが見つかりません: {log_file}")
-        
-        return entries
-    
-    def get_latest_status(self, entries: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
-        """各監視対象の最新ステータスを取得"""
-        latest_status = {}
-        
-        for entry in entries:
-            target_name = entry.get('target_name')
-            if target_name and target_name != 'system':
-                # ステータス変更を解析
-                status_change = entry.get('status_change', '')
-                if '->' in status_change:
-                    current_status = status_change.split('->')[-1]
-                else:
-                    current_status = status_change
-                
-                # 応答時間を抽出
-                response_time = None
-                details = entry.get('details', '')
-                if 'Response time:' in details:
-                    try:
-                        time_str = details.split('Response time: ')[1].split('s')[0]
-                        response_time = float(time_str)
-                    except (IndexError, ValueError):
-                        pass
-                
-                latest_status[target_name] = {
-                    'status': current_status,
-                    'type': entry.get('target_type'),
-                    'timestamp': entry['parsed_timestamp'],
-                    'details': details,
-                    'response_time': response_time
-                }
-        
-        return latest_status
-    
-    def get_uptime_stats(self, entries: List[Dict[str, Any]], hours: int = 24) -> Dict[str, Dict[str, Any]]:
-        """稼働率統計を計算"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        uptime_stats = {}
-        
-        # 各ターゲットの状態変化を追跡
-        for entry in entries:
-            if entry['parsed_timestamp'] < cutoff_time:
-                continue
-                
-            target_name = entry.get('target_name')
-            if target_name and target_name != 'system':
-                if target_name not in uptime_stats:
-                    uptime_stats[target_name] = {
-                        'total_checks': 0,
-                        'up_checks': 0,
-                        'down_checks': 0,
-                        'response_times': []
-                    }
-                
-                status_change = entry.get('status_change', '')
-                current_status = status_change.split('->')[-1] if '->' in status_change else status_change
-                
-                uptime_stats[target_name]['total_checks'] += 1
-                
-                if current_status == 'up':
-                    uptime_stats[target_name]['up_checks'] += 1
-                elif current_status == 'down':
-                    uptime_stats[target_name]['down_checks'] += 1
-                
-                # 応答時間を記録
-                details = entry.get('details', '')
-                if 'Response time:' in details:
-                    try:
-                        time_str = details.split('Response time: ')[1].split('s')[0]
-                        response_time = float(time_str)
-                        uptime_stats[target_name]['response_times'].append(response_time)
-                    except (IndexError, ValueError):
-                        pass
-        
-        # 稼働率を計算
-        for target_name in uptime_stats:
-            stats = uptime_stats[target_name]
-            if stats['total_checks'] > 0:
-                stats['uptime_percentage'] = (stats['up_checks'] / stats['total_checks']) * 100
-            else:
-                stats['uptime_percentage'] = 0
-            
-            # 平均応答時間を計算
-            if stats['response_times']:
-                stats['avg_response_time'] = sum(stats['response_times']) / len(stats['response_times'])
-                stats['max_response_time'] = max(stats['response_times'])
-                stats['min_response_time'] = min(stats['response_times'])
-            else:
-                stats['avg_response_time'] = None
-                stats['max_response_time'] = None
-                stats['min_response_time'] = None
-        
-        return uptime_stats
-    
-    def generate_advanced_dashboard(self, output_file: str = "advanced_dashboard.html", days: int = 1):
-        """高度なHTMLダッシュボードを生成"""
-        # 指定日数分のログファイルを処理
-        all_entries = []
+    def aggregate_logs(self, days: int = 1) -> LogAggregator:
+        """最新N日分のログを1パスで集計（チェックポイントがあれば追記分のみ解析）"""
         log_files = self.get_log_files()
+        cache = LogCheckpointCache(self.cache_file, namespace="log_aggregator") if self.use_cache else None
         
-        for log_file in log_files[:days]:
-            entries = self.parse_log_file(log_file)
-            all_entries.extend(entries)
+        aggregator = aggregate_log_files(
+            log_files[:days],
+            since=datetime.now() - timedelta(hours=24 * days),
+            cache=cache,
+            recent_limit=RECENT_ENTRY_LIMIT,
+            workers=self.workers
+        )
         
-        # 時系列順にソート
-        all_entries.sort(key=lambda x: x['parsed_timestamp'], reverse=True)
+        if cache:
+            cache.prune(log_files)
+            cache.save()
         
-        # データを分析
-        latest_status = self.get_latest_status(all_entries)
-        uptime_stats = self.get_uptime_stats(all_entries, hours=24 * days)
+        return aggregator
+    
+    def generate_advanced_dashboard(self, output_file: str = "advanced_dashboard.html", days: int = 1):
+        """高度なHTMLダッシュボードを生成"""
+        aggregator = self.aggregate_logs(days)
         
         # HTMLを生成
-        html_content = self._generate_advanced_html_content(latest_status, uptime_stats, all_entries[:50])
+        html_content = self._generate_advanced_html_content(
+            aggregator.get_latest_status(),
+            aggregator.get_uptime_stats(),
+            aggregator.get_recent_entries(),
+            aggregator.get_status_history()
+        )
         
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(html_content)
         
         print(f"高度なHTMLダッシュボードを生成しました: {output_file}")
     
-    def _generate_advanced_html_content(self, latest_status: Dict, uptime_stats: Dict, recent_entries: List) -> str:
-        """高度なHTML内容を生成"""
+    def build_dashboard_payload(self, latest_status: Dict, uptime_stats: Dict, recent_entries: List,
+                                history: Optional[Dict] = None) -> Dict[str, Any]:
+        """ダッシュボードに埋め込むJSONデータを作成（監視対象ごとの行は列順の配列）"""
+        history = history or {}
         
-        # 統計情報を計算
         total_services = len(latest_status)
         up_services = sum(1 for info in latest_status.values() if info['status'] == 'up')
         down_services = sum(1 for info in latest_status.values() if info['status'] == 'down')
         
-        overall_uptime = (up_services / total_services * 100) if total_services > 0 else 0
+        rows = []
+        for target_name, info in sorted(latest_status.items()):
+            stats = uptime_stats.get(target_name, {})
+            rows.append([
+                target_name,
+                info['type'],
+                info['status'],
+                _round(stats.get('uptime_percentage')),
+                _round(info.get('response_time')),
+                _round(stats.get('avg_response_time')),
+                _round(stats.get('p50_response_time')),
+                _round(stats.get('p95_response_time')),
+                _round(stats.get('p99_response_time')),
+                _round(stats.get('down_seconds'), 0),
+                self._sparkline(history.get(target_name, []))
+            ])
+        
+        recent = []
+        for entry in recent_entries[:RECENT_ACTIVITY_LIMIT]:
+            details = entry.get('details', '') or ''
+            if len(details) > 80:
+                details = details[:80] + "..."
+            recent.append([
+                entry['parsed_timestamp'].strftime('%H:%M:%S'),
+                entry.get('target_name', 'Unknown'),
+                entry.get('status_change', ''),
+                details
+            ])
+        
+        return {
+            'generated_at': datetime.now().strftime('%Y年%m月%d日 %H:%M:%S'),
+            'summary': {
+                'total': total_services,
+                'up': up_services,
+                'down': down_services,
+                'overall_uptime': (up_services / total_services * 100) if total_services > 0 else 0
+            },
+            'columns': PAYLOAD_COLUMNS,
+            'rows': rows,
+            'recent': recent
+        }
+    
+    @staticmethod
+    def _sparkline(history: List[Dict]) -> List[Optional[float]]:
+        """応答時間の推移を SPARKLINE_POINTS 点以下に間引く（障害時は null）"""
+        values = []
+        for item in history:
+            response_time = extract_response_time(item.get('details') or '')
+            status = (item.get('status_change') or '').split('->')[-1]
+            values.append(None if status == 'down' else response_time)
+        
+        if len(values) <= SPARKLINE_POINTS:
+            return [_round(v) for v in values]
+        
+        # 等幅のバケットに分け、各バケットの平均値を1点にする
+        points = []
+        for i in range(SPARKLINE_POINTS):
+            bucket = values[i * len(values) // SPARKLINE_POINTS:(i + 1) * len(values) // SPARKLINE_POINTS]
+            samples = [v for v in bucket if v is not None]
+            points.append(_round(sum(samples) / len(samples)) if samples else None)
+        return points
+    
+    def _generate_advanced_html_content(self, latest_status: Dict, uptime_stats: Dict, recent_entries: List,
+                                        history: Optional[Dict] = None) -> str:
+        """高度なHTML内容を生成（表はJSONデータからブラウザ側で描画）"""
         
-        current_time = datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')
+        payload = self.build_dashboard_payload(latest_status, uptime_stats, recent_entries, history)
+        summary = payload['summary']
+        overall_uptime = summary['overall_uptime']
+        
+        # </script> で埋め込みが途切れないようにエスケープ
+        payload_json = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
         
         html = f"""
 <!DOCTYPE html>
@@ -280,7 +267,7 @@ class AdvancedHealthLogViewer:
         
         .main-content {{
             display: grid;
-            grid-template-columns: 2fr 1fr;
+            grid-template-columns: 3fr 1fr;
             gap: 30px;
             margin-bottom: 30px;
         }}
@@ -291,6 +278,7 @@ class AdvancedHealthLogViewer:
             padding: 25px;
             box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
             backdrop-filter: blur(10px);
+            min-width: 0;
         }}
         
         .panel h2 {{
@@ -303,51 +291,79 @@ class AdvancedHealthLogViewer:
             gap: 10px;
         }}
         
-        .service-grid {{
-            display: grid;
-            gap: 15px;
+        .table-controls {{
+            display: flex;
+            gap: 10px;
+            margin-bottom: 15px;
+            align-items: center;
         }}
         
-        .service-card {{
-            background: #f8f9fa;
-            border-radius: 10px;
-            padding: 20px;
-            border-left: 4px solid #ddd;
-            transition: transform 0.2s, box-shadow 0.2s;
+        .table-controls input, .table-controls select {{
+            padding: 8px 12px;
+            border: 1px solid #dfe6e9;
+            border-radius: 8px;
+            font-size: 0.9em;
         }}
         
-        .service-card:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);
+        .table-controls input {{
+            flex: 1;
         }}
         
-        .service-card.up {{ border-left-color: #27ae60; }}
-        .service-card.down {{ border-left-color: #e74c3c; }}
-        .service-card.unknown {{ border-left-color: #f39c12; }}
-        .service-card.shutdown {{ border-left-color: #95a5a6; }}
+        .row-count {{
+            color: #7f8c8d;
+            font-size: 0.85em;
+            white-space: nowrap;
+        }}
         
-        .service-header {{
-            display: flex;
-            justify-content: space-between;
+        .service-table {{
+            overflow-x: auto;
+        }}
+        
+        .service-row {{
+            display: grid;
+            grid-template-columns: minmax(160px, 2fr) 90px 80px repeat(6, minmax(60px, 1fr)) 80px 110px;
             align-items: center;
-            margin-bottom: 15px;
+            height: 40px;
+            padding: 0 10px;
+            border-bottom: 1px solid #ecf0f1;
+            font-size: 0.9em;
+            color: #2c3e50;
+            min-width: 1000px;
         }}
         
-        .service-name {{
+        .service-row.head {{
+            background: #f8f9fa;
             font-weight: 600;
+            color: #5a6c7d;
+            cursor: pointer;
+            user-select: none;
+        }}
+        
+        .service-row.head div:hover {{
             color: #2c3e50;
-            font-size: 1.1em;
         }}
         
-        .service-type {{
-            font-size: 0.8em;
-            color: #7f8c8d;
-            text-transform: uppercase;
-            letter-spacing: 1px;
+        .service-row div {{
+            overflow: hidden;
+            text-overflow: ellipsis;
+            white-space: nowrap;
+        }}
+        
+        .service-viewport {{
+            height: 600px;
+            overflow-y: auto;
+            position: relative;
+            min-width: 1000px;
+        }}
+        
+        .service-body {{
+            position: absolute;
+            left: 0;
+            right: 0;
         }}
         
         .status-badge {{
-            padding: 5px 12px;
+            padding: 3px 10px;
             border-radius: 20px;
             font-size: 0.8em;
             font-weight: 600;
@@ -375,30 +391,10 @@ class AdvancedHealthLogViewer:
             color: #95a5a6;
         }}
         
-        .service-stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(100px, 1fr));
-            gap: 10px;
-            margin-top: 15px;
-        }}
-        
-        .stat-item {{
-            text-align: center;
-            padding: 10px;
-            background: white;
-            border-radius: 8px;
-        }}
-        
-        .stat-value {{
-            font-weight: bold;
-            color: #2c3e50;
-            font-size: 1.1em;
-        }}
-        
-        .stat-label {{
-            font-size: 0.8em;
-            color: #7f8c8d;
-            margin-top: 5px;
+        .sparkline polyline {{
+            fill: none;
+            stroke: #3498db;
+            stroke-width: 1.5;
         }}
         
         .log-entry {{
@@ -466,7 +462,7 @@ class AdvancedHealthLogViewer:
         <div class="header">
             <div class="auto-refresh" onclick="toggleAutoRefresh()">🔄 自動更新: OFF</div>
             <h1>🏥 Health Monitor</h1>
-            <div class="subtitle">高度なステータスダッシュボード - {current_time}</div>
+            <div class="subtitle">高度なステータスダッシュボード - {payload['generated_at']}</div>
         </div>
         
         <div class="overview-grid">
@@ -475,15 +471,15 @@ class AdvancedHealthLogViewer:
                 <div class="overview-label">全体稼働率</div>
             </div>
             <div class="overview-card">
-                <div class="overview-number uptime-good">{up_services}</div>
+                <div class="overview-number uptime-good">{summary['up']}</div>
                 <div class="overview-label">正常稼働</div>
             </div>
             <div class="overview-card">
-                <div class="overview-number uptime-critical">{down_services}</div>
+                <div class="overview-number uptime-critical">{summary['down']}</div>
                 <div class="overview-label">障害発生</div>
             </div>
             <div class="overview-card">
-                <div class="overview-number">{total_services}</div>
+                <div class="overview-number">{summary['total']}</div>
                 <div class="overview-label">総監視対象</div>
             </div>
         </div>
@@ -491,85 +487,29 @@ class AdvancedHealthLogViewer:
         <div class="main-content">
             <div class="panel">
                 <h2>🎯 サービス詳細ステータス</h2>
-                <div class="service-grid">
-"""
-        
-        # サービス詳細カード
-        for target_name, info in sorted(latest_status.items()):
-            status = info['status']
-            service_type = info['type']
-            response_time = info.get('response_time')
-            
-            # 稼働率統計を取得
-            stats = uptime_stats.get(target_name, {})
-            uptime_pct = stats.get('uptime_percentage', 0)
-            avg_response = stats.get('avg_response_time')
-            
-            html += f"""
-                    <div class="service-card {status}">
-                        <div class="service-header">
-                            <div>
-                                <div class="service-name">{target_name}</div>
-                                <div class="service-type">{service_type}</div>
-                            </div>
-                            <span class="status-badge {status}">{status}</span>
-                        </div>
-                        <div class="service-stats">
-                            <div class="stat-item">
-                                <div class="stat-value">{uptime_pct:.1f}%</div>
-                                <div class="stat-label">稼働率</div>
-                            </div>
-"""
-            
-            if response_time is not None:
-                html += f"""
-                            <div class="stat-item">
-                                <div class="stat-value">{response_time:.2f}s</div>
-                                <div class="stat-label">現在の応答</div>
-                            </div>
-"""
-            
-            if avg_response is not None:
-                html += f"""
-                            <div class="stat-item">
-                                <div class="stat-value">{avg_response:.2f}s</div>
-                                <div class="stat-label">平均応答</div>
-                            </div>
-"""
-            
-            html += """
-                        </div>
+                <div class="table-controls">
+                    <input id="filter-text" type="search" placeholder="監視対象名・種別で絞り込み">
+                    <select id="filter-status">
+                        <option value="">すべてのステータス</option>
+                        <option value="up">up</option>
+                        <option value="down">down</option>
+                        <option value="unknown">unknown</option>
+                        <option value="shutdown">shutdown</option>
+                    </select>
+                    <span class="row-count" id="row-count"></span>
+                </div>
+                <div class="service-table">
+                    <div class="service-row head" id="service-head"></div>
+                    <div class="service-viewport" id="service-viewport">
+                        <div id="service-spacer"></div>
+                        <div class="service-body" id="service-body"></div>
                     </div>
-"""
-        
-        html += """
                 </div>
             </div>
             
             <div class="panel">
                 <h2>📊 最新アクティビティ</h2>
-"""
-        
-        # 最新のログエントリ
-        for entry in recent_entries[:15]:
-            timestamp = entry['parsed_timestamp'].strftime('%H:%M:%S')
-            target_name = entry.get('target_name', 'Unknown')
-            status_change = entry.get('status_change', '')
-            details = entry.get('details', '')
-            
-            # 詳細を短縮
-            if len(details) > 80:
-                details = details[:80] + "..."
-            
-            html += f"""
-                <div class="log-entry">
-                    <div class="log-timestamp">{timestamp}</div>
-                    <div class="log-target">{target_name} - {status_change}</div>
-                    <div class="log-details">{details}</div>
-                </div>
-"""
-        
-        html += """
+                <div id="recent-activity"></div>
             </div>
         </div>
         
@@ -578,7 +518,172 @@ class AdvancedHealthLogViewer:
         </div>
     </div>
     
+    <script id="dashboard-data" type="application/json">{payload_json}</script>
+"""
+        
+        html += """
     <script>
+        const DATA = JSON.parse(document.getElementById('dashboard-data').textContent);
+        const ROW_HEIGHT = 40;
+        const OVERSCAN = 10;
+        const COL = {};
+        DATA.columns.forEach((name, i) => { COL[name] = i; });
+        
+        // 表示列: [見出し, 列名, 表示形式]
+        const COLUMNS = [
+            ['監視対象', 'name', 'text'],
+            ['種別', 'type', 'text'],
+            ['ステータス', 'status', 'status'],
+            ['稼働率', 'uptime', 'percent'],
+            ['現在の応答', 'response_time', 'seconds'],
+            ['平均応答', 'avg', 'seconds'],
+            ['p50応答', 'p50', 'seconds'],
+            ['p95応答', 'p95', 'seconds'],
+            ['p99応答', 'p99', 'seconds'],
+            ['停止時間', 'down_seconds', 'duration'],
+            ['応答時間の推移', 'sparkline', 'sparkline']
+        ];
+        
+        let sortColumn = 'name';
+        let sortAscending = true;
+        let visibleRows = DATA.rows;
+        
+        const viewport = document.getElementById('service-viewport');
+        const spacer = document.getElementById('service-spacer');
+        const body = document.getElementById('service-body');
+        
+        function formatDuration(seconds) {
+            const minutes = Math.floor(seconds / 60);
+            const hours = Math.floor(minutes / 60);
+            if (hours) return `${hours}時間${minutes % 60}分`;
+            if (minutes) return `${minutes}分`;
+            return `${Math.floor(seconds)}秒`;
+        }
+        
+        function sparklineSvg(points) {
+            const values = points.filter(v => v !== null);
+            if (values.length < 2) return null;
+            const max = Math.max(...values) || 1;
+            const step = 100 / (points.length - 1);
+            const coords = [];
+            points.forEach((v, i) => {
+                if (v !== null) coords.push(`${(i * step).toFixed(1)},${(28 - v / max * 26).toFixed(1)}`);
+            });
+            const svg = document.createElementNS('http://www.w3.org/2000/svg', 'svg');
+            svg.setAttribute('class', 'sparkline');
+            svg.setAttribute('viewBox', '0 0 100 30');
+            svg.setAttribute('preserveAspectRatio', 'none');
+            svg.setAttribute('width', '100');
+            svg.setAttribute('height', '30');
+            const line = document.createElementNS('http://www.w3.org/2000/svg', 'polyline');
+            line.setAttribute('points', coords.join(' '));
+            svg.appendChild(line);
+            return svg;
+        }
+        
+        function renderCell(row, column) {
+            const cell = document.createElement('div');
+            const value = row[COL[column[1]]];
+            switch (column[2]) {
+                case 'status': {
+                    const badge = document.createElement('span');
+                    badge.className = `status-badge ${value}`;
+                    badge.textContent = value;
+                    cell.appendChild(badge);
+                    break;
+                }
+                case 'percent':
+                    cell.textContent = value === null ? '-' : `${value.toFixed(1)}%`;
+                    break;
+                case 'seconds':
+                    cell.textContent = value === null ? '-' : `${value.toFixed(2)}s`;
+                    break;
+                case 'duration':
+                    cell.textContent = value ? formatDuration(value) : '-';
+                    break;
+                case 'sparkline': {
+                    const svg = sparklineSvg(value);
+                    if (svg) cell.appendChild(svg);
+                    break;
+                }
+                default:
+                    cell.textContent = value === null ? '-' : value;
+                    cell.title = cell.textContent;
+            }
+            return cell;
+        }
+        
+        // 表示範囲の行だけを描画する（仮想スクロール）
+        function renderVisible() {
+            const first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+            const count = Math.ceil(viewport.clientHeight / ROW_HEIGHT) + OVERSCAN * 2;
+            const fragment = document.createDocumentFragment();
+            visibleRows.slice(first, first + count).forEach(row => {
+                const element = document.createElement('div');
+                element.className = 'service-row';
+                COLUMNS.forEach(column => element.appendChild(renderCell(row, column)));
+                fragment.appendChild(element);
+            });
+            body.style.top = `${first * ROW_HEIGHT}px`;
+            body.replaceChildren(fragment);
+        }
+        
+        function compareRows(a, b) {
+            const index = COL[sortColumn];
+            const x = a[index], y = b[index];
+            if (x === y) return 0;
+            if (x === null) return 1;
+            if (y === null) return -1;
+            const result = x < y ? -1 : 1;
+            return sortAscending ? result : -result;
+        }
+        
+        function applyView() {
+            const text = document.getElementById('filter-text').value.trim().toLowerCase();
+            const status = document.getElementById('filter-status').value;
+            visibleRows = DATA.rows.filter(row =>
+                (!status || row[COL.status] === status) &&
+                (!text || row[COL.name].toLowerCase().includes(text) || String(row[COL.type]).toLowerCase().includes(text))
+            );
+            if (sortColumn !== 'sparkline') visibleRows.sort(compareRows);
+            spacer.style.height = `${visibleRows.length * ROW_HEIGHT}px`;
+            document.getElementById('row-count').textContent = `${visibleRows.length} / ${DATA.rows.length} 件`;
+            renderHead();
+            renderVisible();
+        }
+        
+        function renderHead() {
+            const head = document.getElementById('service-head');
+            head.replaceChildren();
+            COLUMNS.forEach(column => {
+                const cell = document.createElement('div');
+                const marker = column[1] === sortColumn ? (sortAscending ? ' ▲' : ' ▼') : '';
+                cell.textContent = column[0] + marker;
+                cell.addEventListener('click', () => {
+                    if (column[2] === 'sparkline') return;
+                    sortAscending = column[1] === sortColumn ? !sortAscending : true;
+                    sortColumn = column[1];
+                    applyView();
+                });
+                head.appendChild(cell);
+            });
+        }
+        
+        function renderRecent() {
+            const container = document.getElementById('recent-activity');
+            DATA.recent.forEach(([time, target, change, details]) => {
+                const entry = document.createElement('div');
+                entry.className = 'log-entry';
+                [['log-timestamp', time], ['log-target', `${target} - ${change}`], ['log-details', details]].forEach(([cls, text]) => {
+                    const div = document.createElement('div');
+                    div.className = cls;
+                    div.textContent = text;
+                    entry.appendChild(div);
+                });
+                container.appendChild(entry);
+            });
+        }
+        
         let autoRefreshEnabled = false;
         let refreshInterval;
         
@@ -609,6 +714,12 @@ class AdvancedHealthLogViewer:
         
         // ページ読み込み時の初期化
         document.addEventListener('DOMContentLoaded', function() {
+            viewport.addEventListener('scroll', () => requestAnimationFrame(renderVisible));
+            document.getElementById('filter-text').addEventListener('input', applyView);
+            document.getElementById('filter-status').addEventListener('change', applyView);
+            applyView();
+            renderRecent();
+            
             // 現在時刻を更新
             setInterval(() => {
                 const now = new Date();
@@ -624,15 +735,24 @@ class AdvancedHealthLogViewer:
         return html
 
 
+def _round(value: Optional[float], digits: int = 3) -> Optional[float]:
+    """JSONを小さくするために数値を丸める"""
+    return round(value, digits) if value is not None else None
+
+
 def main():
     parser = argparse.ArgumentParser(description='Advanced Health Monitor Log Viewer')
     parser.add_argument('--log-dir', default='logs', help='ログディレクトリのパス (デフォルト: logs)')
     parser.add_argument('--output', default='advanced_dashboard.html', help='出力HTMLファイル名 (デフォルト: advanced_dashboard.html)')
     parser.add_argument('--days', type=int, default=1, help='表示する日数 (デフォルト: 1)')
+    parser.add_argument('--cache-file', help='解析チェックポイントの保存先 (デフォルト: <log-dir>/.advanced_log_viewer_cache.json)')
+    parser.add_argument('--no-cache', action='store_true', help='チェックポイントを使わずに全ログを再解析')
+    parser.add_argument('--workers', type=int, help='ログ解析に使うプロセス数 (デフォルト: 解析量に応じて自動, 1で並列化なし)')
     
     args = parser.parse_args()
     
-    viewer = AdvancedHealthLogViewer(args.log_dir)
+    viewer = AdvancedHealthLogViewer(args.log_dir, cache_file=args.cache_file, use_cache=not args.no_cache,
+                                     workers=args.workers)
     viewer.generate_advanced_dashboard(args.output, args.days)
 
 
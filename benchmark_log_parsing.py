@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Log parsing benchmark
+日次ログの解析を単一プロセスと複数プロセスで比較し、ファイル数ごとの高速化率を表示するスクリプト
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from health_monitor.services.log_aggregator import aggregate_log_files
+
+
+def generate_logs(log_dir: str, days: int, lines_per_day: int, targets: int) -> list:
+    """ベンチマーク用の日次ログファイルを生成"""
+    start = datetime(2025, 1, 1)
+    log_files = []
+
+    for day in range(days):
+        day_start = start + timedelta(days=day)
+        path = os.path.join(log_dir, f"health_monitor_{day_start.strftime('%Y%m%d')}.log")
+        step = 86400 / lines_per_day
+
+        with open(path, 'w', encoding='utf-8') as f:
+            for i in range(lines_per_day):
+                target = i % targets
+                healthy = (i // targets) % 17 != 0
+                entry = {
+                    "timestamp": (day_start + timedelta(seconds=i * step)).isoformat(),
+                    "target_name": f"target-{target:04d}",
+                    "target_type": "website" if target % 4 else "database",
+                    "status_change": "up" if healthy else "down",
+                    "details": f"Response time: {0.05 + (i % 97) / 100:.2f}s" if healthy else "Error: Connection timeout"
+                }
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+        log_files.append(path)
+
+    return log_files
+
+
+def time_aggregation(log_files: list, workers: int, repeat: int) -> float:
+    """集計時間の最小値を計測（秒）"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        aggregate_log_files(log_files, workers=workers)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Health Monitor log parsing benchmark')
+    parser.add_argument('--days', type=int, nargs='+', default=[1, 2, 4, 8, 16, 30],
+                        help='計測するファイル数 (デフォルト: 1 2 4 8 16 30)')
+    parser.add_argument('--lines-per-day', type=int, default=20000, help='1ファイルあたりの行数 (デフォルト: 20000)')
+    parser.add_argument('--targets', type=int, default=200, help='監視対象数 (デフォルト: 200)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='並列実行時のプロセス数 (デフォルト: CPU数)')
+    parser.add_argument('--repeat', type=int, default=3, help='各計測の繰り返し回数 (デフォルト: 3)')
+
+    args = parser.parse_args()
+
+    log_dir = tempfile.mkdtemp(prefix="health_monitor_bench_")
+    try:
+        all_files = generate_logs(log_dir, max(args.days), args.lines_per_day, args.targets)
+
+        print(f"lines/file={args.lines_per_day} targets={args.targets} workers={args.workers}")
+        print(f"{'files':>6} {'serial (s)':>12} {'parallel (s)':>13} {'speedup':>8}")
+
+        for count in args.days:
+            files = all_files[:count]
+            serial = time_aggregation(files, 1, args.repeat)
+            parallel = time_aggregation(files, args.workers, args.repeat)
+            print(f"{count:>6} {serial:>12.3f} {parallel:>13.3f} {serial / parallel:>7.2f}x")
+    finally:
+        shutil.rmtree(log_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,15 +13,32 @@ from pathlib import Path
 
 from health_monitor.services.configuration_manager import ConfigurationManager, ConfigurationError
 from health_monitor.services.health_check_engine import HealthCheckEngine
-from health_monitor.services.status_display import StatusDisplay
+from health_monitor.services.status_display import StatusDisplay, DISPLAY_MODES
+from health_monitor.services.display_refresher import DisplayRefresher, DEFAULT_MAX_FPS
+from health_monitor.services import curses_display
 from health_monitor.services.log_manager import LogManager
+from health_monitor.services.dashboard_server import DashboardServer
+from health_monitor.services.log_query import LogQuery
+from health_monitor.services.sampling_profiler import SamplingProfiler
+from health_monitor.services.tracing import JsonFileSpanExporter, Tracer
+from health_monitor.services.target_diff import diff_targets
+from health_monitor.services.config_watcher import ConfigWatcher, DEFAULT_POLL_INTERVAL, file_signature
+from health_monitor.services.check_scheduler import CheckScheduler
+from health_monitor.services.target_selector import TargetSelector, parse_tag_intervals
+from health_monitor.services.target_registry import TargetRegistry
 from health_monitor.models.data_models import WebsiteTarget, DatabaseTarget, HealthStatus
 
 
 class HealthMonitorApp:
     """Main Health Monitor application class."""
     
-    def __init__(self, config_dir: str = "config", log_dir: str = "logs", check_interval: int = 300, log_all_checks: bool = False):
+    def __init__(self, config_dir: str = "config", log_dir: str = "logs", check_interval: int = 300, log_all_checks: bool = False,
+                 dashboard_port: Optional[int] = None, dashboard_host: str = "127.0.0.1",
+                 trace_file: Optional[str] = None, trace_sample_rate: float = 1.0,
+                 trace_slow_threshold: Optional[float] = None, display_max_fps: float = DEFAULT_MAX_FPS,
+                 display_mode: str = "auto", config_poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 config_snapshot: bool = True, selector: Optional[TargetSelector] = None,
+                 tag_intervals: Optional[Dict[str, float]] = None):
         """
         Initialize the Health Monitor application.
         
@@ -30,26 +47,94 @@ class HealthMonitorApp:
             log_dir: Directory for log files
             check_interval: Interval between health checks in seconds
             log_all_checks: Whether to log all health check results (not just status changes)
+            dashboard_port: Port of the embedded live dashboard; None disables it
+            dashboard_host: Interface the live dashboard binds to
+            trace_file: File per-check traces are written to; None disables tracing
+            trace_sample_rate: Fraction of checks traced
+            trace_slow_threshold: Checks taking at least this many seconds are always traced
+            display_max_fps: Upper bound on console redraws per second
+            display_mode: Console layout: 'detail', 'summary', 'auto' or 'tui'
+                for the interactive curses display
+            config_poll_interval: Seconds between checks of the configuration
+                files while waiting for the next cycle; 0 only checks once per cycle
+            config_snapshot: Whether validated configuration is cached in
+                config_dir for fast startup
+            selector: Only monitor the configured targets it matches
+            tag_intervals: Check interval in seconds for targets carrying each
+                tag, instead of check_interval
         """
         self.config_dir = config_dir
         self.log_dir = log_dir
         self.check_interval = check_interval
+        self.selector = selector or TargetSelector()
+        self.check_scheduler = CheckScheduler(check_interval, tag_intervals)
         self.running = False
         
         # Initialize components
-        self.config_manager = ConfigurationManager(config_dir)
+        self.config_manager = ConfigurationManager(config_dir, use_snapshot=config_snapshot)
         self.log_manager = LogManager(log_dir)
-        self.health_engine = HealthCheckEngine(log_manager=self.log_manager, log_all_checks=log_all_checks)
-        self.status_display = StatusDisplay()
+        tracer = None
+        if trace_file:
+            tracer = Tracer(
+                JsonFileSpanExporter(trace_file),
+                sample_rate=trace_sample_rate,
+                slow_threshold=trace_slow_threshold
+            )
+        self.targets = TargetRegistry()
+        self.health_engine = HealthCheckEngine(log_manager=self.log_manager, log_all_checks=log_all_checks,
+                                               tracer=tracer, check_interval=check_interval,
+                                               target_registry=self.targets)
+        if display_mode == "tui" and not curses_display.is_available():
+            print("curses が利用できないため、通常のコンソール表示を使用します (Windows では windows-curses をインストールしてください)")
+            display_mode = "auto"
+        if display_mode == "tui":
+            self.status_display = curses_display.CursesStatusDisplay(
+                group_resolver=self._get_target_type,
+                on_quit=self._request_stop
+            )
+        else:
+            self.status_display = StatusDisplay(mode=display_mode, group_resolver=self._get_target_type)
+        
+        # The console is redrawn on its own thread so checks never wait on terminal output
+        self.display_refresher = DisplayRefresher(
+            self.status_display,
+            snapshot=self.health_engine.get_current_statuses,
+            version=self.health_engine.get_status_version,
+            max_fps=display_max_fps
+        )
+        
+        # On-demand sampling profiler; profiles are written next to diagnostics exports
+        self.profiler = SamplingProfiler(output_dir=log_dir)
+        
+        # Optional live dashboard served from in-memory statuses
+        self.dashboard_server: Optional[DashboardServer] = None
+        if dashboard_port is not None:
+            self.dashboard_server = DashboardServer(
+                self.health_engine,
+                host=dashboard_host,
+                port=dashboard_port,
+                target_type_resolver=self._get_target_type,
+                log_query=LogQuery(log_dir),
+                profiler=self.profiler,
+                check_runner=self.run_selected_checks
+            )
         
         # Configuration cache
-        self.website_targets: List[WebsiteTarget] = []
-        self.database_targets: List[DatabaseTarget] = []
         self.last_config_load_time = None
         
-        # Configuration file monitoring
-        self.config_file_timestamps = {}
-        self._update_config_timestamps()
+        # Configuration file monitoring, with the same signatures the watcher compares
+        self.config_file_signatures = {}
+        self._update_config_signatures()
+        
+        # The watcher wakes the main loop so edits apply without waiting for the next cycle
+        self.config_changed = threading.Event()
+        self.config_watcher = None
+        if config_poll_interval > 0:
+            self.config_watcher = ConfigWatcher(
+                self.config_manager.config_files,
+                on_change=self.config_changed.set,
+                poll_interval=config_poll_interval
+            )
         
         # Shutdown handling
         self.shutdown_event = threading.Event()
@@ -74,7 +159,10 @@ class HealthMonitorApp:
             
             # Validate that we have at least one target to monitor
             if not self.website_targets and not self.database_targets:
-                print("警告: 監視対象が設定されていません。設定ファイルを確認してください。")
+                if self.selector.is_empty:
+                    print("警告: 監視対象が設定されていません。設定ファイルを確認してください。")
+                else:
+                    print(f"警告: 選択条件 ({self.selector.describe()}) に一致する監視対象がありません。")
                 return False
             
             print(f"初期化完了: Webサイト {len(self.website_targets)}件, データベース {len(self.database_targets)}件")
@@ -94,8 +182,15 @@ class HealthMonitorApp:
             return
         
         self.running = True
+        self._start_dashboard_server()
         print(f"監視を開始します (間隔: {self.check_interval}秒)")
+        if self.check_scheduler.tag_intervals:
+            intervals = ", ".join(f"{tag}={seconds:g}秒" for tag, seconds in self.check_scheduler.tag_intervals.items())
+            print(f"タグ別の間隔: {intervals}")
         print("監視を停止するには Ctrl+C を押してください。")
+        self.display_refresher.start()
+        if self.config_watcher:
+            self.config_watcher.start()
         
         try:
             while self.running and not self.shutdown_event.is_set():
@@ -105,15 +200,16 @@ class HealthMonitorApp:
                 # Perform health checks
                 self._perform_health_checks()
                 
-                # Wait for next check interval with shutdown check
-                self._interruptible_sleep(self.check_interval)
+                # Wait until the next target group is due, with shutdown check
+                self._interruptible_sleep(self.check_scheduler.seconds_until_due())
                 
         except KeyboardInterrupt:
-            print("\n\nキーボード割り込みを受信しました。監視を停止しています...")
-            self._shutdown()
+            self.status_display.show_message("\n\nキーボード割り込みを受信しました。監視を停止しています...")
         except Exception as e:
-            print(f"\n予期しないエラーが発生しました: {e}")
-            self._shutdown()
+            self.status_display.show_message(f"\n予期しないエラーが発生しました: {e}")
+        
+        # Also reached when a signal or the TUI stopped the loop
+        self._shutdown()
     
     def run_once(self) -> None:
         """
@@ -125,19 +221,17 @@ class HealthMonitorApp:
         if not self.initialize():
             return
         
-        print("1回限りのヘルスチェックを実行しています...")
+        if self.selector.is_empty:
+            print("1回限りのヘルスチェックを実行しています...")
+        else:
+            print(f"1回限りのヘルスチェックを実行しています ({self.selector.describe()})...")
         
         try:
             # Perform single health check
             self._perform_health_checks()
             
-            # Display results
-            self.status_display.display_status(
-                website_statuses={name: status for name, status in self.health_engine.get_current_statuses().items() 
-                                if any(target.name == name for target in self.website_targets)},
-                database_statuses={name: status for name, status in self.health_engine.get_current_statuses().items() 
-                                 if any(target.name == name for target in self.database_targets)}
-            )
+            # Display results, all of them and without redrawing the screen
+            self.status_display.show_results(self.health_engine.get_current_statuses())
             
             print("\nヘルスチェックが完了しました。")
             
@@ -159,39 +253,66 @@ class HealthMonitorApp:
         try:
             # Load website targets
             try:
-                self.website_targets = self.config_manager.load_website_config()
+                website_targets = self.config_manager.load_website_config()
             except ConfigurationError as e:
                 print(f"Webサイト設定の読み込みエラー: {e}")
-                self.website_targets = []
+                website_targets = []
             
             # Load database targets
             try:
-                self.database_targets = self.config_manager.load_database_config()
+                database_targets = self.config_manager.load_database_config()
             except ConfigurationError as e:
                 print(f"データベース設定の読み込みエラー: {e}")
-                self.database_targets = []
+                database_targets = []
             
-            self.last_config_load_time = datetime.now()
+            self._set_targets(website_targets, database_targets)
             
         except Exception as e:
             print(f"設定読み込み中にエラーが発生しました: {e}")
             raise
     
+    def _set_targets(self, website_targets: List[WebsiteTarget], database_targets: List[DatabaseTarget]) -> None:
+        """Replace the monitored targets with the selected targets of a loaded configuration."""
+        self.targets.replace(self.selector.select(website_targets), self.selector.select(database_targets))
+        self.health_engine.update_target_count(len(self.targets))
+        self.last_config_load_time = datetime.now()
+    
+    def _read_configuration(self):
+        """
+        Load and validate both configuration files for a reload.
+        A type with no file or fragment at all has no targets, as at startup.
+        
+        Returns:
+            (website targets, database targets)
+            
+        Raises:
+            ConfigurationError: If an existing file is invalid
+        """
+        website_targets = []
+        if self.config_manager.has_website_config():
+            website_targets = self.config_manager.load_website_config()
+        database_targets = []
+        if self.config_manager.has_database_config():
+            database_targets = self.config_manager.load_database_config()
+        return website_targets, database_targets
+    
     def _perform_health_checks(self) -> None:
-        """Perform health checks on all configured targets."""
+        """Perform health checks on the targets whose group is due."""
+        groups = self.check_scheduler.due_groups(self.website_targets, self.database_targets)
         try:
-            # Run all health checks
-            results = self.health_engine.run_all_checks(
-                website_targets=self.website_targets,
-                database_targets=self.database_targets
-            )
-            
-            # Update status display
-            self.status_display.update_display(results)
+            # Results reach the console through the display refresher; with
+            # tag intervals each group is a cycle measured against its own interval
+            for interval, website_targets, database_targets in groups:
+                self.health_engine.run_all_checks(
+                    website_targets=website_targets,
+                    database_targets=database_targets,
+                    interval=interval,
+                    partial=bool(self.check_scheduler.tag_intervals)
+                )
             
         except Exception as e:
             error_msg = f"ヘルスチェック実行中にエラーが発生しました: {e}"
-            print(f"\n{error_msg}")
+            self.status_display.show_message(f"\n{error_msg}")
             self.log_manager.log_status_change(
                 target="system",
                 target_type="application",
@@ -199,12 +320,34 @@ class HealthMonitorApp:
                 new_status="error",
                 details=error_msg
             )
+        finally:
+            self.check_scheduler.finish()
+    
+    def run_selected_checks(self, selector: TargetSelector) -> Dict[str, HealthStatus]:
+        """
+        Check the monitored targets matching a selector right away, after
+        any running check cycle; called from the dashboard thread.
+        
+        Args:
+            selector: Targets to check
+            
+        Returns:
+            Dictionary mapping target names to their new health status
+        """
+        return self.health_engine.run_selected_checks(
+            website_targets=selector.select(self.website_targets),
+            database_targets=selector.select(self.database_targets)
+        )
     
     def _shutdown(self) -> None:
         """Perform graceful shutdown of the application."""
-        print("グレースフルシャットダウンを実行しています...")
         self.running = False
         self.shutdown_event.set()
+        self.display_refresher.stop()
+        self.status_display.close()
+        if self.config_watcher:
+            self.config_watcher.stop()
+        print("グレースフルシャットダウンを実行しています...")
         
         try:
             # Log shutdown initiation
@@ -234,6 +377,11 @@ class HealthMonitorApp:
             
             # Clean up resources
             print("リソースをクリーンアップしています...")
+            if self.dashboard_server:
+                self.dashboard_server.stop()
+            self.profiler.stop_toggle_listener()
+            if self.profiler.is_running:
+                self.profiler.stop()
             self.health_engine.close()
             
             # Log successful shutdown
@@ -261,72 +409,91 @@ class HealthMonitorApp:
             except:
                 pass  # Ignore logging errors during shutdown
     
+    def _start_dashboard_server(self) -> None:
+        """Start the live dashboard server if enabled; monitoring continues without it on failure."""
+        if not self.dashboard_server:
+            return
+        try:
+            self.dashboard_server.start()
+            print(f"ライブダッシュボード: {self.dashboard_server.url}")
+        except OSError as e:
+            print(f"ライブダッシュボードを起動できません: {e}")
+            self.dashboard_server = None
+    
+    @property
+    def website_targets(self) -> List[WebsiteTarget]:
+        """Monitored website targets in configuration order."""
+        return self.targets.websites
+    
+    @property
+    def database_targets(self) -> List[DatabaseTarget]:
+        """Monitored database targets in configuration order."""
+        return self.targets.databases
+    
     def _get_target_type(self, target_name: str) -> str:
         """Get the type of a target by its name."""
-        for target in self.website_targets:
-            if target.name == target_name:
-                return "website"
-        for target in self.database_targets:
-            if target.name == target_name:
-                return "database"
-        return "unknown"
+        return self.targets.type_of(target_name)
     
-    def _update_config_timestamps(self) -> None:
-        """Update the timestamps of configuration files for change detection."""
-        config_files = [
-            Path(self.config_dir) / "websites.json",
-            Path(self.config_dir) / "databases.json"
-        ]
-        
-        for config_file in config_files:
-            if config_file.exists():
-                self.config_file_timestamps[str(config_file)] = config_file.stat().st_mtime
-            else:
-                self.config_file_timestamps[str(config_file)] = 0
+    def _config_files(self) -> List[Path]:
+        """Get the configuration files and fragment directories watched for changes."""
+        return [Path(path) for path in self.config_manager.config_files()]
+    
+    def _update_config_signatures(self) -> None:
+        """Record the signatures of configuration files for change detection."""
+        for config_file in self._config_files():
+            self.config_file_signatures[str(config_file)] = file_signature(str(config_file))
     
     def _check_config_file_changes(self) -> bool:
         """
         Check if any configuration files have been modified.
         
+        Compares modification time, size and inode like the config watcher,
+        so a save that replaces the file by renaming is also detected.
+        
         Returns:
             True if any configuration file has changed, False otherwise
         """
-        config_files = [
-            Path(self.config_dir) / "websites.json",
-            Path(self.config_dir) / "databases.json"
-        ]
-        
-        for config_file in config_files:
+        for config_file in self._config_files():
             file_path = str(config_file)
-            current_mtime = config_file.stat().st_mtime if config_file.exists() else 0
-            last_mtime = self.config_file_timestamps.get(file_path, 0)
-            
-            if current_mtime != last_mtime:
+            if file_signature(file_path) != self.config_file_signatures.get(file_path):
                 return True
         
         return False
     
-    def _check_and_reload_config(self) -> None:
-        """Check for configuration changes and reload if necessary."""
+    def _check_and_reload_config(self) -> bool:
+        """
+        Check for configuration changes and reload if necessary.
+        An invalid configuration is rejected and the current targets are kept.
+        
+        Returns:
+            True if the monitored targets changed
+        """
         try:
             if self._check_config_file_changes():
-                print("\n設定ファイルの変更を検出しました。設定を再読み込みしています...")
+                self.status_display.show_message("\n設定ファイルの変更を検出しました。設定を再読み込みしています...")
                 
                 # Store old configuration for comparison
-                old_website_count = len(self.website_targets)
-                old_database_count = len(self.database_targets)
+                old_website_targets = self.website_targets
+                old_database_targets = self.database_targets
                 
-                # Reload configuration
-                self._load_configuration()
-                self._update_config_timestamps()
+                # Reload configuration; the signatures are taken first so a
+                # rejected file is not retried until it changes again
+                self._update_config_signatures()
+                website_targets, database_targets = self._read_configuration()
+                self._set_targets(website_targets, database_targets)
                 
-                # Log configuration reload
-                new_website_count = len(self.website_targets)
-                new_database_count = len(self.database_targets)
+                # Only targets that were added, removed or edited affect engine state
+                diff = diff_targets(old_website_targets, self.website_targets,
+                                    old_database_targets, self.database_targets)
+                self.health_engine.apply_target_diff(diff, self.website_targets)
+                if not diff.is_empty():
+                    self.check_scheduler.reset()
                 
+                # Log configuration reload
                 reload_details = (
-                    f"Webサイト: {old_website_count} -> {new_website_count}, "
-                    f"データベース: {old_database_count} -> {new_database_count}"
+                    f"Webサイト: {len(old_website_targets)} -> {len(self.website_targets)}, "
+                    f"データベース: {len(old_database_targets)} -> {len(self.database_targets)} "
+                    f"({diff.summary()})"
                 )
                 
                 self.log_manager.log_status_change(
@@ -337,11 +504,12 @@ class HealthMonitorApp:
                     details=reload_details
                 )
                 
-                print(f"設定再読み込み完了: {reload_details}")
+                self.status_display.show_message(f"設定再読み込み完了: {reload_details}")
+                return not diff.is_empty()
                 
         except Exception as e:
-            error_msg = f"設定再読み込み中にエラーが発生しました: {e}"
-            print(f"\n{error_msg}")
+            error_msg = f"設定再読み込み中にエラーが発生しました（現在の設定で監視を継続します）: {e}"
+            self.status_display.show_message(f"\n{error_msg}")
             self.log_manager.log_status_change(
                 target="system",
                 target_type="application",
@@ -349,6 +517,7 @@ class HealthMonitorApp:
                 new_status="config_reload_error",
                 details=error_msg
             )
+        return False
     
     def get_status_summary(self) -> Dict[str, int]:
         """
@@ -385,7 +554,7 @@ class HealthMonitorApp:
         """Set up signal handlers for graceful shutdown."""
         def signal_handler(signum, frame):
             signal_name = signal.Signals(signum).name
-            print(f"\n\n{signal_name} シグナルを受信しました。グレースフルシャットダウンを開始します...")
+            self.status_display.show_message(f"\n\n{signal_name} シグナルを受信しました。グレースフルシャットダウンを開始します...")
             self.shutdown_event.set()
             self.running = False
         
@@ -397,10 +566,23 @@ class HealthMonitorApp:
         # Windows specific
         if hasattr(signal, 'SIGBREAK'):
             signal.signal(signal.SIGBREAK, signal_handler)
+        
+        # SIGUSR2 starts or stops the sampling profiler (not available on Windows);
+        # the handler only queues the request, so a repeated signal cannot deadlock
+        if hasattr(signal, 'SIGUSR2'):
+            self.profiler.start_toggle_listener()
+            signal.signal(signal.SIGUSR2, lambda signum, frame: self.profiler.request_toggle())
+    
+    def _request_stop(self) -> None:
+        """Stop the monitoring loop at its next check, as a termination signal does."""
+        self.shutdown_event.set()
+        self.running = False
     
     def _interruptible_sleep(self, duration: float) -> None:
         """
         Sleep for the specified duration but can be interrupted by shutdown event.
+        A configuration change reported by the watcher is reloaded right away,
+        and ends the sleep early when it changed the monitored targets.
         
         Args:
             duration: Sleep duration in seconds
@@ -410,8 +592,10 @@ class HealthMonitorApp:
         while time.time() < end_time and not self.shutdown_event.is_set():
             remaining = end_time - time.time()
             sleep_time = min(1.0, remaining)  # Check shutdown event every second
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            if sleep_time > 0 and self.config_changed.wait(sleep_time):
+                self.config_changed.clear()
+                if self._check_and_reload_config():
+                    return
 
 
 def main():
@@ -425,15 +609,43 @@ def main():
     parser.add_argument("--interval", type=int, default=300, help="チェック間隔（秒） (デフォルト: 300)")
     parser.add_argument("--log-all-checks", action="store_true", help="すべてのヘルスチェック結果をログに記録")
     parser.add_argument("--once", action="store_true", help="1回だけヘルスチェックを実行して終了")
+    parser.add_argument("--dashboard-port", type=int, help="ライブダッシュボードを指定ポートで公開 (例: 8080)")
+    parser.add_argument("--dashboard-host", default="127.0.0.1", help="ライブダッシュボードの待ち受けアドレス (デフォルト: 127.0.0.1)")
+    parser.add_argument("--trace-file", help="ヘルスチェックごとのトレースを OpenTelemetry 互換 JSON で出力するファイル")
+    parser.add_argument("--trace-sample-rate", type=float, default=1.0, help="トレースを記録するチェックの割合 0〜1 (デフォルト: 1.0)")
+    parser.add_argument("--trace-slow-threshold", type=float, help="この秒数以上かかったチェックはサンプリングに関係なく記録")
+    parser.add_argument("--display-mode", choices=DISPLAY_MODES + ("tui",), default="auto", help="コンソール表示形式: detail=全件表示, summary=集計表示, auto=監視対象が多い場合に集計表示, tui=キー操作で並べ替え・絞り込みができる対話表示 (デフォルト: auto)")
+    parser.add_argument("--display-fps", type=float, default=DEFAULT_MAX_FPS, help=f"コンソール表示の最大更新回数/秒 (デフォルト: {DEFAULT_MAX_FPS:g})")
+    parser.add_argument("--tags", help="指定したタグ（カンマ区切り、いずれかに一致）の監視対象だけを監視 (例: payments,critical)")
+    parser.add_argument("--targets", help="指定した名前（カンマ区切り、* などのワイルドカード可）の監視対象だけを監視 (例: 'payment-*')")
+    parser.add_argument("--tag-interval", action="append", default=[], metavar="TAG=SECONDS", help="指定タグの監視対象のチェック間隔（秒）。複数指定可 (例: payments=30)")
+    parser.add_argument("--no-config-snapshot", action="store_true", help="検証済み設定のスナップショット (config/.snapshot.json) を使用・保存しない")
+    parser.add_argument("--config-poll-interval", type=float, default=DEFAULT_POLL_INTERVAL, help=f"設定ファイルの変更を確認する間隔（秒）。0 でチェックサイクルごとのみ確認 (デフォルト: {DEFAULT_POLL_INTERVAL:g})")
     
     args = parser.parse_args()
+    try:
+        tag_intervals = parse_tag_intervals(args.tag_interval)
+    except ValueError as e:
+        parser.error(f"--tag-interval: {e}")
     
     # Create and run the application
     app = HealthMonitorApp(
         config_dir=args.config_dir,
         log_dir=args.log_dir,
         check_interval=args.interval,
-        log_all_checks=args.log_all_checks
+        log_all_checks=args.log_all_checks,
+        dashboard_port=args.dashboard_port,
+        dashboard_host=args.dashboard_host,
+        trace_file=args.trace_file,
+        trace_sample_rate=args.trace_sample_rate,
+        trace_slow_threshold=args.trace_slow_threshold,
+        display_max_fps=args.display_fps,
+        # A single run prints its results instead of taking over the terminal
+        display_mode="auto" if args.once and args.display_mode == "tui" else args.display_mode,
+        config_poll_interval=args.config_poll_interval,
+        config_snapshot=not args.no_config_snapshot,
+        selector=TargetSelector.parse(args.tags, args.targets),
+        tag_intervals=tag_intervals
     )
     
     if args.once:
@@ -1,9 +1,9 @@
 """
 Core data models for the Health Monitor application.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 @dataclass
@@ -13,6 +13,7 @@ class WebsiteTarget:
     url: str
     timeout: int = 10
     expected_status: int = 200
+    tags: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -25,6 +26,7 @@ class DatabaseTarget:
     username: str
     password: str
     sslmode: str = "prefer"
+    tags: List[str] = field(default_factory=list)
 
 
 @dataclass
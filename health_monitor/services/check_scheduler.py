@@ -0,0 +1,114 @@
+"""
+Per-group check scheduling.
+Targets are grouped by their check interval: the shortest interval among
+their tags' configured intervals, or the default interval. Each group is
+checked when its interval has passed since its previous run finished, so
+critical targets can be checked every few seconds while the rest of the
+fleet keeps the normal cycle.
+"""
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class CheckScheduler:
+    """Decides which targets are due for a check."""
+
+    def __init__(self, default_interval: float, tag_intervals: Optional[Dict[str, float]] = None):
+        """
+        Initialize the scheduler; every group is due on the first call.
+
+        Args:
+            default_interval: Seconds between checks of untagged targets
+            tag_intervals: Seconds between checks of targets carrying a tag
+        """
+        self.default_interval = default_interval
+        self.tag_intervals = dict(tag_intervals or {})
+        self._next_due: Dict[float, float] = {}
+        self._running: List[float] = []
+
+    def interval_for(self, target) -> float:
+        """Get the check interval of a target."""
+        intervals = [self.tag_intervals[tag] for tag in target.tags if tag in self.tag_intervals]
+        return min(intervals) if intervals else self.default_interval
+
+    def due_targets(self, website_targets: List, database_targets: List,
+                    now: Optional[float] = None) -> Tuple[List, List]:
+        """
+        Get the targets whose group is due; call finish() once they were checked.
+
+        Args:
+            website_targets: All monitored website targets
+            database_targets: All monitored database targets
+            now: Current time.monotonic() value
+
+        Returns:
+            (due website targets, due database targets)
+        """
+        websites, databases = [], []
+        for _, group_websites, group_databases in self.due_groups(website_targets, database_targets, now):
+            websites.extend(group_websites)
+            databases.extend(group_databases)
+        return websites, databases
+
+    def due_groups(self, website_targets: List, database_targets: List,
+                   now: Optional[float] = None) -> List[Tuple[float, List, List]]:
+        """
+        Get the due groups, shortest interval first; call finish() once they were checked.
+
+        Args:
+            website_targets: All monitored website targets
+            database_targets: All monitored database targets
+            now: Current time.monotonic() value
+
+        Returns:
+            (interval, due website targets, due database targets) per due group
+        """
+        now = time.monotonic() if now is None else now
+        if not self.tag_intervals:
+            groups = {self.default_interval: (list(website_targets), list(database_targets))}
+        else:
+            groups: Dict[float, Tuple[List, List]] = {}
+            for target in website_targets:
+                groups.setdefault(self.interval_for(target), ([], []))[0].append(target)
+            for target in database_targets:
+                groups.setdefault(self.interval_for(target), ([], []))[1].append(target)
+
+        due = []
+        self._running = []
+        # Groups whose targets were all removed stop being scheduled
+        self._next_due = {interval: self._next_due.get(interval, now) for interval in groups}
+        for interval, (group_websites, group_databases) in sorted(groups.items()):
+            if self._next_due[interval] <= now:
+                due.append((interval, group_websites, group_databases))
+                self._running.append(interval)
+        return due
+
+    def finish(self, now: Optional[float] = None) -> None:
+        """
+        Schedule the next run of the groups returned by due_targets().
+
+        Args:
+            now: Time the checks finished, as a time.monotonic() value
+        """
+        now = time.monotonic() if now is None else now
+        for interval in self._running:
+            self._next_due[interval] = now + interval
+        self._running = []
+
+    def reset(self) -> None:
+        """Make every group due, for example after the targets were reloaded."""
+        self._next_due = {}
+        self._running = []
+
+    def seconds_until_due(self, now: Optional[float] = None) -> float:
+        """
+        Get how long to wait before the next group is due.
+
+        Returns:
+            Seconds, 0 if a group is already due, or the default interval
+            when nothing has been scheduled
+        """
+        if not self._next_due:
+            return self.default_interval
+        now = time.monotonic() if now is None else now
+        return max(0.0, min(self._next_due.values()) - now)
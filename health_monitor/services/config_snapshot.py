@@ -0,0 +1,156 @@
+"""
+Persistent snapshot of validated configuration files.
+Stores the targets parsed from each configuration file as compact rows,
+keyed by the SHA-256 of the file's contents. At startup a file whose hash
+matches is rebuilt from its rows without JSON object parsing, template
+expansion or URL validation. The snapshot contains database passwords,
+so it is written readable by the owner only.
+"""
+import hashlib
+import json
+import logging
+import os
+from dataclasses import fields
+from typing import Any, Dict, Iterable, List, Optional
+
+from health_monitor.models.data_models import WebsiteTarget, DatabaseTarget
+
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+SECTION_TYPES = {"websites": WebsiteTarget, "databases": DatabaseTarget}
+
+
+def file_digest(path: str) -> Optional[str]:
+    """
+    Hash the contents of a file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex SHA-256 digest, or None if the file cannot be read
+    """
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _field_names() -> Dict[str, List[str]]:
+    return {section: [field.name for field in fields(cls)] for section, cls in SECTION_TYPES.items()}
+
+
+class ConfigSnapshotCache:
+    """Validated targets per configuration file, persisted between runs."""
+
+    def __init__(self, snapshot_file: str):
+        """
+        Initialize the cache, loading an existing snapshot if it is usable.
+
+        Args:
+            snapshot_file: Path of the JSON snapshot
+        """
+        self.snapshot_file = snapshot_file
+        self.logger = logging.getLogger(__name__)
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load the snapshot, ignoring missing, corrupt or outdated files."""
+        try:
+            with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        # A snapshot written for other target fields cannot be rebuilt
+        if (not isinstance(data, dict) or data.get("version") != SNAPSHOT_FORMAT_VERSION
+                or data.get("fields") != _field_names()):
+            return
+
+        files = data.get("files")
+        if isinstance(files, dict):
+            self._files = files
+
+    def get(self, path: str, digest: str, section: str) -> Optional[list]:
+        """
+        Get the targets of a file from the snapshot.
+
+        Args:
+            path: Configuration file
+            digest: Current SHA-256 of the file
+            section: 'websites' or 'databases'
+
+        Returns:
+            Targets in file order, or None if the snapshot does not match
+        """
+        entry = self._files.get(self._key(path))
+        if entry is None or entry.get("sha256") != digest or entry.get("section") != section:
+            return None
+        cls = SECTION_TYPES[section]
+        try:
+            return [cls(*row) for row in entry["rows"]]
+        except (KeyError, TypeError):
+            return None
+
+    def put(self, path: str, digest: str, section: str, targets: list) -> None:
+        """
+        Store the validated targets of a file.
+
+        Args:
+            path: Configuration file
+            digest: SHA-256 of the contents the targets were parsed from
+            section: 'websites' or 'databases'
+            targets: Targets parsed from the file
+        """
+        names = [field.name for field in fields(SECTION_TYPES[section])]
+        self._files[self._key(path)] = {
+            "sha256": digest,
+            "section": section,
+            "rows": [[getattr(target, name) for name in names] for target in targets]
+        }
+        self._dirty = True
+
+    def prune(self, section: str, paths: Iterable[str]) -> None:
+        """
+        Drop the files of a section that are no longer part of the configuration.
+
+        Args:
+            section: 'websites' or 'databases'
+            paths: Files of the section that are still present
+        """
+        keep = {self._key(path) for path in paths}
+        stale = [key for key, entry in self._files.items() if entry.get("section") == section and key not in keep]
+        for key in stale:
+            del self._files[key]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the snapshot atomically, readable by the owner only, if anything changed."""
+        if not self._dirty:
+            return
+
+        data = {
+            "version": SNAPSHOT_FORMAT_VERSION,
+            "fields": _field_names(),
+            "files": self._files
+        }
+
+        tmp_file = f"{self.snapshot_file}.tmp"
+        try:
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.chmod(tmp_file, 0o600)  # O_CREAT keeps the mode of a leftover file
+            os.replace(tmp_file, self.snapshot_file)
+            self._dirty = False
+        except OSError as e:
+            self.logger.warning(f"Cannot write configuration snapshot {self.snapshot_file}: {e}")
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.abspath(path)
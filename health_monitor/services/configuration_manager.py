@@ -1,13 +1,33 @@
 """
 Configuration Manager for Health Monitor application.
 Handles loading and validation of configuration files.
+
+Targets come from websites.json / databases.json plus any *.json fragments
+in websites.d / databases.d, read in file name order. Each file may list
+targets directly and define templates whose "matrix" of variables expands
+into one target per combination. Parsed files are cached by size and
+modification time, so a reload only re-parses the files that changed, and
+persisted in a snapshot keyed by content hash, so a restart with unchanged
+files skips parsing and validation altogether.
 """
+import itertools
 import json
 import os
-from typing import List, Dict, Any
+import re
+from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import urlparse
 
 from ..models.data_models import WebsiteTarget, DatabaseTarget
+from .config_snapshot import ConfigSnapshotCache, file_digest
+from .config_watcher import file_signature
+
+
+SNAPSHOT_FILE_NAME = ".snapshot.json"
+
+
+# A template value that is exactly one placeholder keeps the variable's type,
+# so numeric fields such as "port": "{port}" stay numbers.
+_WHOLE_PLACEHOLDER = re.compile(r"\{(\w+)\}")
 
 
 class ConfigurationError(Exception):
@@ -18,97 +38,241 @@ class ConfigurationError(Exception):
 class ConfigurationManager:
     """Manages configuration files for the Health Monitor application."""
     
-    def __init__(self, config_dir: str = "config"):
+    def __init__(self, config_dir: str = "config", use_snapshot: bool = True):
         """
         Initialize the Configuration Manager.
         
         Args:
             config_dir: Directory containing configuration files
+            use_snapshot: Whether to keep validated targets in a snapshot file
+                in config_dir that is reused while the source files are unchanged
         """
         self.config_dir = config_dir
         self.websites_file = os.path.join(config_dir, "websites.json")
         self.databases_file = os.path.join(config_dir, "databases.json")
+        self.websites_dir = os.path.join(config_dir, "websites.d")
+        self.databases_dir = os.path.join(config_dir, "databases.d")
+        
+        # path -> (file signature, section, parsed targets)
+        self._file_cache: Dict[str, Tuple[Any, str, list]] = {}
+        
+        self.snapshot_file = os.path.join(config_dir, SNAPSHOT_FILE_NAME) if use_snapshot else None
+        self._snapshot: Optional[ConfigSnapshotCache] = None
     
     def load_website_config(self) -> List[WebsiteTarget]:
         """
-        Load website configuration from JSON file.
+        Load website configuration from websites.json and websites.d fragments.
         
         Returns:
             List of WebsiteTarget objects
             
         Raises:
-            ConfigurationError: If configuration file is invalid or missing
+            ConfigurationError: If a file is invalid, a target name is defined
+                twice, or there is no website configuration at all
         """
-        try:
-            if not os.path.exists(self.websites_file):
-                raise ConfigurationError(f"Website configuration file not found: {self.websites_file}")
-            
-            with open(self.websites_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            
-            if not self.validate_website_config(config_data):
-                raise ConfigurationError("Invalid website configuration format")
-            
-            websites = []
-            for site_config in config_data.get("websites", []):
-                website = WebsiteTarget(
-                    name=site_config["name"],
-                    url=site_config["url"],
-                    timeout=site_config.get("timeout", 10),
-                    expected_status=site_config.get("expected_status", 200)
-                )
-                websites.append(website)
-            
-            return websites
-            
-        except json.JSONDecodeError as e:
-            raise ConfigurationError(f"Invalid JSON in website configuration: {e}")
-        except KeyError as e:
-            raise ConfigurationError(f"Missing required field in website configuration: {e}")
-        except Exception as e:
-            raise ConfigurationError(f"Error loading website configuration: {e}")
+        return self._load_targets("websites", self.websites_file, self.websites_dir)
     
     def load_database_config(self) -> List[DatabaseTarget]:
         """
-        Load database configuration from JSON file.
+        Load database configuration from databases.json and databases.d fragments.
         
         Returns:
             List of DatabaseTarget objects
             
         Raises:
-            ConfigurationError: If configuration file is invalid or missing
+            ConfigurationError: If a file is invalid, a target name is defined
+                twice, or there is no database configuration at all
+        """
+        return self._load_targets("databases", self.databases_file, self.databases_dir)
+    
+    def has_website_config(self) -> bool:
+        """Whether websites.json or any websites.d fragment exists."""
+        return os.path.exists(self.websites_file) or bool(self._fragment_files(self.websites_dir))
+    
+    def has_database_config(self) -> bool:
+        """Whether databases.json or any databases.d fragment exists."""
+        return os.path.exists(self.databases_file) or bool(self._fragment_files(self.databases_dir))
+    
+    def config_files(self) -> List[str]:
         """
+        Get the paths whose changes affect the loaded configuration.
+        
+        Returns:
+            Main files, fragment directories (which change when fragments are
+            added or removed) and the current fragment files
+        """
+        paths = [self.websites_file, self.databases_file, self.websites_dir, self.databases_dir]
+        for directory in (self.websites_dir, self.databases_dir):
+            paths.extend(self._fragment_files(directory))
+        return paths
+    
+    def _fragment_files(self, directory: str) -> List[str]:
+        """Get the *.json fragments of a directory in name order, skipping hidden files."""
         try:
-            if not os.path.exists(self.databases_file):
-                raise ConfigurationError(f"Database configuration file not found: {self.databases_file}")
-            
-            with open(self.databases_file, 'r', encoding='utf-8') as f:
+            names = sorted(os.listdir(directory))
+        except OSError:
+            return []
+        return [os.path.join(directory, name) for name in names
+                if name.endswith(".json") and not name.startswith(".")]
+    
+    def _load_targets(self, section: str, main_file: str, fragment_dir: str) -> list:
+        """Load and merge the targets of a section from its main file and fragments."""
+        kind = section[:-1]
+        files = [main_file] if os.path.exists(main_file) else []
+        files.extend(self._fragment_files(fragment_dir))
+        if not files:
+            raise ConfigurationError(f"{kind.capitalize()} configuration file not found: {main_file}")
+        
+        # Files that disappeared must not keep their parsed targets alive
+        for path in [path for path, entry in self._file_cache.items() if entry[1] == section and path not in files]:
+            del self._file_cache[path]
+        
+        targets = []
+        sources: Dict[str, str] = {}
+        for path in files:
+            for target in self._load_file(section, path):
+                if target.name in sources:
+                    raise ConfigurationError(
+                        f"Duplicate {kind} target name '{target.name}' in {path} "
+                        f"(already defined in {sources[target.name]})"
+                    )
+                sources[target.name] = path
+                targets.append(target)
+        
+        if self._snapshot is not None:
+            self._snapshot.prune(section, files)
+            self._snapshot.save()
+        return targets
+    
+    def _load_file(self, section: str, path: str) -> list:
+        """Get the targets of one file, parsing it only if it changed since the last load."""
+        signature = file_signature(path)
+        cached = self._file_cache.get(path)
+        if cached is not None and signature is not None and cached[0] == signature:
+            return cached[2]
+        
+        snapshot = self._get_snapshot()
+        digest = file_digest(path) if snapshot is not None else None
+        targets = snapshot.get(path, digest, section) if digest is not None else None
+        if targets is None:
+            targets = self._parse_file(section, path)
+            if digest is not None:
+                snapshot.put(path, digest, section, targets)
+        
+        self._file_cache[path] = (signature, section, targets)
+        return targets
+    
+    def _get_snapshot(self) -> Optional[ConfigSnapshotCache]:
+        """Get the snapshot, reading it on first use."""
+        if self._snapshot is None and self.snapshot_file is not None:
+            self._snapshot = ConfigSnapshotCache(self.snapshot_file)
+        return self._snapshot
+    
+    def _parse_file(self, section: str, path: str) -> list:
+        """
+        Parse and validate one configuration file.
+        
+        Raises:
+            ConfigurationError: If the file is unreadable or invalid
+        """
+        kind = section[:-1]
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
                 config_data = json.load(f)
             
-            if not self.validate_database_config(config_data):
-                raise ConfigurationError("Invalid database configuration format")
+            if (not isinstance(config_data, dict) or not isinstance(config_data.get(section, []), list)
+                    or (section not in config_data and "templates" not in config_data)):
+                raise ConfigurationError(f"Invalid {kind} configuration format: {path}")
             
-            databases = []
-            for db_config in config_data.get("databases", []):
-                database = DatabaseTarget(
-                    name=db_config["name"],
-                    host=db_config["host"],
-                    port=db_config["port"],
-                    database=db_config["database"],
-                    username=db_config["username"],
-                    password=db_config["password"],
-                    sslmode=db_config.get("sslmode", "prefer")
-                )
-                databases.append(database)
+            entries = config_data.get(section, []) + self._expand_templates(config_data.get("templates", []), path)
+            validate = self.validate_website_config if section == "websites" else self.validate_database_config
+            if not validate({section: entries}):
+                raise ConfigurationError(f"Invalid {kind} configuration format: {path}")
             
-            return databases
+            build = self._build_website if section == "websites" else self._build_database
+            return [build(entry) for entry in entries]
             
+        except ConfigurationError:
+            raise
         except json.JSONDecodeError as e:
-            raise ConfigurationError(f"Invalid JSON in database configuration: {e}")
+            raise ConfigurationError(f"Invalid JSON in {kind} configuration {path}: {e}")
         except KeyError as e:
-            raise ConfigurationError(f"Missing required field in database configuration: {e}")
+            raise ConfigurationError(f"Missing required field in {kind} configuration {path}: {e}")
         except Exception as e:
-            raise ConfigurationError(f"Error loading database configuration: {e}")
+            raise ConfigurationError(f"Error loading {kind} configuration {path}: {e}")
+    
+    def _expand_templates(self, templates: Any, path: str) -> List[Dict[str, Any]]:
+        """
+        Expand templates into target entries.
+        
+        Each template is a target entry whose string values may contain
+        {variable} placeholders, plus a "matrix" mapping each variable to a
+        list of values. One entry is produced per combination of values.
+        
+        Args:
+            templates: The file's "templates" list
+            path: File the templates come from, for error messages
+            
+        Returns:
+            Expanded entries in matrix order
+            
+        Raises:
+            ConfigurationError: If a template is malformed or uses an unknown variable
+        """
+        if not isinstance(templates, list):
+            raise ConfigurationError(f"'templates' must be a list: {path}")
+        
+        entries = []
+        for template in templates:
+            matrix = template.get("matrix") if isinstance(template, dict) else None
+            if (not isinstance(matrix, dict) or not matrix
+                    or not all(isinstance(values, list) and values for values in matrix.values())):
+                raise ConfigurationError(f"Template needs a 'matrix' of non-empty value lists: {path}")
+            
+            fields = {key: value for key, value in template.items() if key != "matrix"}
+            names = list(matrix)
+            for combination in itertools.product(*matrix.values()):
+                variables = dict(zip(names, combination))
+                try:
+                    entries.append({key: self._substitute(value, variables) for key, value in fields.items()})
+                except (KeyError, IndexError, ValueError) as e:
+                    raise ConfigurationError(f"Invalid template placeholder {e} in {path}")
+        return entries
+    
+    @staticmethod
+    def _substitute(value: Any, variables: Dict[str, Any]) -> Any:
+        """Fill the placeholders of a template value, including list items such as tags."""
+        if isinstance(value, list):
+            return [ConfigurationManager._substitute(item, variables) for item in value]
+        if not isinstance(value, str):
+            return value
+        whole = _WHOLE_PLACEHOLDER.fullmatch(value)
+        if whole:
+            return variables[whole.group(1)]
+        return value.format_map(variables)
+    
+    @staticmethod
+    def _build_website(site_config: Dict[str, Any]) -> WebsiteTarget:
+        return WebsiteTarget(
+            name=site_config["name"],
+            url=site_config["url"],
+            timeout=site_config.get("timeout", 10),
+            expected_status=site_config.get("expected_status", 200),
+            tags=list(site_config.get("tags", []))
+        )
+    
+    @staticmethod
+    def _build_database(db_config: Dict[str, Any]) -> DatabaseTarget:
+        return DatabaseTarget(
+            name=db_config["name"],
+            host=db_config["host"],
+            port=db_config["port"],
+            database=db_config["database"],
+            username=db_config["username"],
+            password=db_config["password"],
+            sslmode=db_config.get("sslmode", "prefer"),
+            tags=list(db_config.get("tags", []))
+        )
     
     def validate_website_config(self, config: Dict[str, Any]) -> bool:
         """
@@ -152,6 +316,9 @@ class ConfigurationManager:
             if "expected_status" in site:
                 if not isinstance(site["expected_status"], int) or not (100 <= site["expected_status"] <= 599):
                     return False
+            
+            if "tags" in site and not self._is_valid_tags(site["tags"]):
+                return False
         
         return True
     
@@ -197,6 +364,9 @@ class ConfigurationManager:
                 valid_ssl_modes = ["disable", "allow", "prefer", "require", "verify-ca", "verify-full"]
                 if db["sslmode"] not in valid_ssl_modes:
                     return False
+            
+            if "tags" in db and not self._is_valid_tags(db["tags"]):
+                return False
         
         return True
     
@@ -209,6 +379,11 @@ class ConfigurationManager:
         # In a full implementation, this might notify other components
         pass
     
+    @staticmethod
+    def _is_valid_tags(tags: Any) -> bool:
+        """Check that tags are a list of non-empty strings."""
+        return isinstance(tags, list) and all(isinstance(tag, str) and tag.strip() for tag in tags)
+    
     def _is_valid_url(self, url: str) -> bool:
         """
         Validate URL format.
@@ -0,0 +1,392 @@
+"""
+Interactive curses status display with sorting, filtering and drill-down.
+Statuses handed to update_display() are folded into a StatusSummaryIndex
+on the caller's thread. A separate UI thread owns the terminal, reads keys
+and draws only the rows that fit on screen from the index's maintained
+orderings, so sorting, filtering and scrolling stay instant with
+thousands of targets; curses then sends only the cells that changed.
+"""
+import locale
+import logging
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+try:
+    import curses
+except ImportError:  # Windows without the windows-curses package
+    curses = None
+
+from health_monitor.models.data_models import HealthStatus
+from health_monitor.services.interfaces import StatusDisplayInterface
+from health_monitor.services.status_summary import StatusSummaryIndex, SORT_KEYS
+
+
+# Recent statuses kept per target for the drill-down view.
+HISTORY_SIZE = 50
+
+# Milliseconds the UI thread waits for a key before looking for new statuses.
+INPUT_TIMEOUT_MS = 100
+
+KEY_ESCAPE = 27
+KEY_CTRL_L = 12
+KEY_ENTER_CODES = (10, 13)
+KEY_BACKSPACE_CODES = (8, 127)
+
+SORT_LABELS = {"name": "名前", "latency": "応答時間", "change": "変化"}
+SORT_SHORTCUTS = {ord("n"): "name", ord("l"): "latency", ord("c"): "change"}
+
+LIST_HELP = "q:終了 ↑↓/PgUp/PgDn:選択 Enter:詳細 /:絞り込み n:名前順 l:応答時間順 c:変化順 r:逆順 Ctrl+L:再描画"
+DETAIL_HELP = "Esc/←:一覧に戻る q:終了"
+
+
+def is_available() -> bool:
+    """Whether the curses module can be imported on this platform."""
+    return curses is not None
+
+
+class CursesStatusDisplay(StatusDisplayInterface):
+    """Full-screen interactive status display built on curses."""
+
+    def __init__(self, group_resolver: Optional[Callable[[str], str]] = None,
+                 on_quit: Optional[Callable[[], None]] = None,
+                 history_size: int = HISTORY_SIZE):
+        """
+        Initialize the display; the terminal is taken over on the first update.
+
+        Args:
+            group_resolver: Maps a target name to the group shown in its details
+            on_quit: Called when the user presses 'q'
+            history_size: Recent statuses kept per target for the detail view
+
+        Raises:
+            RuntimeError: If curses is not available
+        """
+        if curses is None:
+            raise RuntimeError("curses is not available; install windows-curses on Windows")
+        self.group_resolver = group_resolver or (lambda name: "unknown")
+        self.on_quit = on_quit
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._index = StatusSummaryIndex(history_size)
+        self._groups: Dict[str, str] = {}
+        self._previous: Dict[str, HealthStatus] = {}
+        self._view: Optional[List[str]] = None
+        self._dirty = True
+        self._full_redraw = False
+        self._message = ""
+        self._page_rows = 10
+        self._attrs = {"ok": 0, "ng": 0, "header": 0, "selected": 0}
+
+        # View state, changed only through handle_key
+        self.sort_key = "name"
+        self.descending = False
+        self.filter_text = ""
+        self.editing_filter = False
+        self.selected = 0
+        self.scroll = 0
+        self.detail_target: Optional[str] = None
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def update_display(self, statuses: Dict[str, HealthStatus]) -> None:
+        """Fold new statuses into the index and start the UI if needed."""
+        with self._lock:
+            previous = self._previous
+            changed = False
+            for name, status in statuses.items():
+                if previous.get(name) is status:
+                    continue
+                if name not in self._groups:
+                    self._groups[name] = self.group_resolver(name)
+                self._index.update(name, status, self._groups[name])
+                changed = True
+
+            # Any removed target leaves the index larger than the current set
+            if len(self._index) != len(statuses):
+                for name in self._index.names():
+                    if name not in statuses:
+                        self._index.remove(name)
+                        self._groups.pop(name, None)
+                changed = True
+
+            self._previous = statuses.copy()
+            if changed:
+                self._view = None
+                self._dirty = True
+
+        self._ensure_started()
+
+    def show_error(self, target: str, error: str) -> None:
+        """Show an error message in the status line until the next key press."""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        with self._lock:
+            self._message = f"[{timestamp}] エラー - {target}: {error}"
+            self._dirty = True
+
+    def show_message(self, message: str) -> None:
+        """Show an application message in the status line until the next key press."""
+        with self._lock:
+            self._message = _one_line(message.strip())
+            self._dirty = True
+
+    def refresh_ui(self) -> None:
+        """Repaint the whole screen on the next frame."""
+        with self._lock:
+            self._full_redraw = True
+            self._dirty = True
+
+    def close(self) -> None:
+        """Stop the UI thread and restore the terminal."""
+        self._closed = True
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(2.0)
+
+    def visible_targets(self) -> List[str]:
+        """
+        Get the target names of the list view in display order.
+
+        Returns:
+            Names sorted by the current sort key and matching the filter
+        """
+        if self._view is None:
+            names = self._index.ordered(self.sort_key, self.descending)
+            if self.filter_text:
+                needle = self.filter_text.lower()
+                names = [name for name in names if needle in name.lower()]
+            self._view = names
+        return self._view
+
+    def handle_key(self, key: int) -> None:
+        """
+        Apply a key press to the view state.
+
+        Args:
+            key: Character code or curses KEY_* constant
+        """
+        with self._lock:
+            quit_requested = self._handle_key(key)
+            self._message = ""
+            self._dirty = True
+        if quit_requested and self.on_quit is not None:
+            self.on_quit()
+
+    def _handle_key(self, key: int) -> bool:
+        if self.editing_filter:
+            self._handle_filter_key(key)
+            return False
+        if key == ord("q"):
+            return True
+        if key == KEY_CTRL_L:
+            self._full_redraw = True
+        elif self.detail_target is not None:
+            if key in (KEY_ESCAPE, curses.KEY_LEFT, curses.KEY_BACKSPACE) + KEY_BACKSPACE_CODES:
+                self.detail_target = None
+        elif key == ord("/"):
+            self.editing_filter = True
+        elif key == KEY_ESCAPE:
+            self._set_filter("")
+        elif key in SORT_SHORTCUTS:
+            self.sort_key = SORT_SHORTCUTS[key]
+            self.descending = False
+            self._view = None
+        elif key == ord("r"):
+            self.descending = not self.descending
+            self._view = None
+        elif key in KEY_ENTER_CODES or key in (curses.KEY_ENTER, curses.KEY_RIGHT):
+            names = self.visible_targets()
+            if names:
+                self.detail_target = names[min(self.selected, len(names) - 1)]
+        else:
+            self._move_selection(key)
+        return False
+
+    def _handle_filter_key(self, key: int) -> None:
+        if key in KEY_ENTER_CODES or key == curses.KEY_ENTER:
+            self.editing_filter = False
+        elif key == KEY_ESCAPE:
+            self.editing_filter = False
+            self._set_filter("")
+        elif key in KEY_BACKSPACE_CODES or key == curses.KEY_BACKSPACE:
+            self._set_filter(self.filter_text[:-1])
+        elif 32 <= key < 0x110000 and chr(key).isprintable():
+            self._set_filter(self.filter_text + chr(key))
+
+    def _set_filter(self, text: str) -> None:
+        self.filter_text = text
+        self.selected = 0
+        self.scroll = 0
+        self._view = None
+
+    def _move_selection(self, key: int) -> None:
+        moves = {
+            curses.KEY_UP: -1,
+            curses.KEY_DOWN: 1,
+            curses.KEY_PPAGE: -self._page_rows,
+            curses.KEY_NPAGE: self._page_rows,
+        }
+        count = len(self.visible_targets())
+        if key in moves:
+            self.selected += moves[key]
+        elif key == curses.KEY_HOME:
+            self.selected = 0
+        elif key == curses.KEY_END:
+            self.selected = count - 1
+        self.selected = max(0, min(self.selected, count - 1))
+
+    def _ensure_started(self) -> None:
+        if self._closed or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="CursesStatusDisplay")
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            locale.setlocale(locale.LC_ALL, "")
+            curses.wrapper(self._main)
+        except Exception as e:
+            self.logger.error(f"Curses display failed: {e}")
+
+    def _main(self, screen) -> None:
+        self._init_screen(screen)
+        while not self._stop_event.is_set():
+            with self._lock:
+                if self._dirty:
+                    if self._full_redraw:
+                        screen.clearok(True)
+                        self._full_redraw = False
+                    self._draw(screen)
+                    curses.doupdate()
+                    self._dirty = False
+            try:
+                key = screen.get_wch()
+            except curses.error:  # no key within the input timeout
+                continue
+            self.handle_key(ord(key) if isinstance(key, str) else key)
+
+    def _init_screen(self, screen) -> None:
+        screen.timeout(INPUT_TIMEOUT_MS)
+        screen.keypad(True)
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass
+        self._attrs["selected"] = curses.A_REVERSE
+        self._attrs["header"] = curses.A_BOLD
+        if curses.has_colors():
+            curses.start_color()
+            try:
+                curses.use_default_colors()
+                background = -1
+            except curses.error:
+                background = curses.COLOR_BLACK
+            curses.init_pair(1, curses.COLOR_GREEN, background)
+            curses.init_pair(2, curses.COLOR_RED, background)
+            curses.init_pair(3, curses.COLOR_CYAN, background)
+            self._attrs["ok"] = curses.color_pair(1)
+            self._attrs["ng"] = curses.color_pair(2)
+            self._attrs["header"] = curses.color_pair(3) | curses.A_BOLD
+
+    def _draw(self, screen) -> None:
+        """Draw the current view; called with the lock held."""
+        height, width = screen.getmaxyx()
+        screen.erase()
+        if self.detail_target is not None and self.detail_target in self._index:
+            self._draw_detail(screen, height, width)
+        else:
+            self.detail_target = None
+            self._draw_list(screen, height, width)
+        screen.noutrefresh()
+
+    def _draw_list(self, screen, height: int, width: int) -> None:
+        healthy, unhealthy = self._index.totals()
+        names = self.visible_targets()
+        arrow = "↓" if self.descending else "↑"
+        title = (
+            f"ヘルスモニター  監視対象: {healthy + unhealthy}  正常: {healthy}  異常: {unhealthy}"
+            f"  表示: {len(names)}  並び順: {SORT_LABELS[self.sort_key]}{arrow}"
+        )
+        if self.filter_text:
+            title += f"  絞り込み: {self.filter_text}"
+        self._put(screen, 0, title, width, self._attrs["header"])
+        self._put(screen, 1, f"  {'名前':<30} {'応答時間':>8}  {'最終確認':<8}  {'最終変化':<8}  エラー", width,
+                  curses.A_UNDERLINE)
+
+        rows = max(1, height - 3)
+        self._page_rows = rows
+        self.selected = max(0, min(self.selected, len(names) - 1))
+        if self.selected < self.scroll:
+            self.scroll = self.selected
+        elif self.selected >= self.scroll + rows:
+            self.scroll = self.selected - rows + 1
+        self.scroll = max(0, min(self.scroll, max(0, len(names) - rows)))
+
+        for offset, name in enumerate(names[self.scroll:self.scroll + rows]):
+            status = self._index.get(name)
+            position = self.scroll + offset
+            attr = self._attrs["ok"] if status.is_healthy else self._attrs["ng"]
+            if position == self.selected:
+                attr |= self._attrs["selected"]
+            self._put(screen, 2 + offset, self._format_row(name, status), width, attr)
+
+        self._put(screen, height - 1, self._status_line(LIST_HELP), width, curses.A_BOLD)
+
+    def _draw_detail(self, screen, height: int, width: int) -> None:
+        name = self.detail_target
+        status = self._index.get(name)
+        changed_at = self._index.changed_at(name)
+        state = "正常" if status.is_healthy else "異常"
+
+        self._put(screen, 0, f"{name}  ({self._groups.get(name, 'unknown')})", width, self._attrs["header"])
+        self._put(screen, 1, f"状態: {state}  応答時間: {_format_response_time(status)}  "
+                             f"最終確認: {status.timestamp.strftime('%Y-%m-%d %H:%M:%S')}", width,
+                  self._attrs["ok"] if status.is_healthy else self._attrs["ng"])
+        if changed_at is not None:
+            self._put(screen, 2, f"最終変化: {changed_at.strftime('%Y-%m-%d %H:%M:%S')}", width)
+        if status.error_message:
+            self._put(screen, 3, f"エラー: {_one_line(status.error_message)}", width, self._attrs["ng"])
+
+        self._put(screen, 5, "最近の履歴（新しい順）", width, curses.A_UNDERLINE)
+        history = self._index.history(name)
+        for row, entry in enumerate(reversed(history[-max(0, height - 7):])):
+            line = (f"{entry.timestamp.strftime('%H:%M:%S')}  {'正常' if entry.is_healthy else '異常'}  "
+                    f"{_format_response_time(entry):>8}  {_one_line(entry.error_message or '')}")
+            self._put(screen, 6 + row, line, width, self._attrs["ok"] if entry.is_healthy else self._attrs["ng"])
+
+        self._put(screen, height - 1, self._status_line(DETAIL_HELP), width, curses.A_BOLD)
+
+    def _status_line(self, help_text: str) -> str:
+        if self.editing_filter:
+            return f"絞り込み: {self.filter_text}_  (Enter:確定 Esc:解除)"
+        return self._message or help_text
+
+    def _format_row(self, name: str, status: HealthStatus) -> str:
+        symbol = "✓" if status.is_healthy else "✗"
+        changed_at = self._index.changed_at(name)
+        changed = changed_at.strftime("%H:%M:%S") if changed_at else ""
+        return (f"{symbol} {name:<30} {_format_response_time(status):>8}  "
+                f"{status.timestamp.strftime('%H:%M:%S'):<8}  {changed:<8}  "
+                f"{_one_line(status.error_message or '')}")
+
+    @staticmethod
+    def _put(screen, row: int, text: str, width: int, attr: int = 0) -> None:
+        height = screen.getmaxyx()[0]
+        if not 0 <= row < height or width <= 1:
+            return
+        try:
+            screen.addnstr(row, 0, text, width - 1, attr)
+        except curses.error:  # text reaching the bottom-right cell
+            pass
+
+
+def _format_response_time(status: HealthStatus) -> str:
+    return f"{status.response_time:.2f}s" if status.response_time > 0 else "N/A"
+
+
+def _one_line(text: str) -> str:
+    return " ".join(text.split())
@@ -0,0 +1,553 @@
+"""
+Embedded live dashboard server.
+Serves the current in-memory health statuses over HTTP and pushes
+per-target changes to browsers with server-sent events, so the dashboard
+updates as soon as a check completes without re-parsing log files. The
+same state is exposed to Prometheus-compatible scrapers at /metrics.
+"""
+import json
+import logging
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from health_monitor.models.data_models import HealthStatus
+from health_monitor.services.log_aggregator import parse_timestamp
+from health_monitor.services.log_query import DEFAULT_PAGE_SIZE, LogQuery
+from health_monitor.services.metrics_exporter import OPENMETRICS_CONTENT_TYPE, OpenMetricsExporter
+from health_monitor.services.sampling_profiler import DEFAULT_DURATION, SamplingProfiler
+from health_monitor.services.target_selector import TargetSelector
+
+
+# Seconds between keep-alive comments on idle event streams.
+KEEPALIVE_INTERVAL = 15.0
+
+# Pending events per client before a slow client is told to resync.
+CLIENT_QUEUE_SIZE = 256
+
+
+def status_to_dict(status: HealthStatus, target_type: str = "unknown") -> Dict[str, Any]:
+    """
+    Convert a HealthStatus to JSON-compatible data.
+
+    Args:
+        status: Health status of a target
+        target_type: Type of the target ('website' or 'database')
+
+    Returns:
+        Dictionary describing the status
+    """
+    return {
+        'name': status.target_name,
+        'type': target_type,
+        'status': 'up' if status.is_healthy else 'down',
+        'response_time': status.response_time,
+        'error_message': status.error_message,
+        'timestamp': status.timestamp.isoformat() if status.timestamp else None
+    }
+
+
+class DashboardServer:
+    """Background HTTP server exposing live statuses and a change stream."""
+
+    def __init__(self, health_engine, host: str = "127.0.0.1", port: int = 8080,
+                 target_type_resolver: Optional[Callable[[str], str]] = None,
+                 log_query: Optional[LogQuery] = None,
+                 profiler: Optional[SamplingProfiler] = None,
+                 check_runner: Optional[Callable[[TargetSelector], Dict[str, HealthStatus]]] = None):
+        """
+        Initialize the dashboard server.
+
+        Args:
+            health_engine: HealthCheckEngine providing current statuses
+            host: Interface to bind to
+            port: Port to listen on; 0 picks a free port
+            target_type_resolver: Function mapping a target name to its type
+            log_query: Query service backing /api/history; None disables it
+            profiler: Sampling profiler controlled by /api/profiler; None disables it
+            check_runner: Checks the targets matching a selector for /api/checks;
+                None disables it
+        """
+        self.health_engine = health_engine
+        self.host = host
+        self.port = port
+        self.target_type_resolver = target_type_resolver or (lambda name: "unknown")
+        self.log_query = log_query
+        self.profiler = profiler
+        self.check_runner = check_runner
+        self.metrics_exporter = OpenMetricsExporter(health_engine, self.target_type_resolver)
+        self.logger = logging.getLogger(__name__)
+
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._clients: List[queue.Queue] = []
+        self._published: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self) -> None:
+        """Start serving on a background thread and subscribe to status updates."""
+        if self._httpd is not None:
+            return
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _DashboardRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.dashboard = self
+        self.port = self._httpd.server_address[1]
+
+        with self._lock:
+            self._published = self._snapshot()
+        self.health_engine.add_status_listener(self.publish)
+
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            daemon=True,
+            name="DashboardServer"
+        )
+        self._thread.start()
+        self.logger.info(f"Dashboard server listening on {self.url}")
+
+    def stop(self) -> None:
+        """Stop the server and close all event streams."""
+        if self._httpd is None:
+            return
+
+        self.health_engine.remove_status_listener(self.publish)
+
+        with self._lock:
+            clients = list(self._clients)
+            self._clients.clear()
+        for client in clients:
+            _offer(client, None)
+
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self._httpd = None
+        self._thread = None
+
+    def publish(self, results: Dict[str, HealthStatus]) -> None:
+        """
+        Push targets whose status changed, and targets that are no longer
+        monitored, to every connected client.
+
+        Args:
+            results: New health check results keyed by target name
+        """
+        current = self.health_engine.get_current_statuses()
+        delta = {}
+        with self._lock:
+            for name, status in results.items():
+                if name not in current:
+                    continue
+                item = status_to_dict(status, self.target_type_resolver(name))
+                if self._published.get(name) != item:
+                    self._published[name] = item
+                    delta[name] = item
+            removed = [name for name in self._published if name not in current]
+            for name in removed:
+                del self._published[name]
+            if not delta and not removed:
+                return
+            clients = list(self._clients)
+
+        messages = []
+        if delta:
+            messages.append(('update', delta))
+        if removed:
+            messages.append(('remove', removed))
+        for client in clients:
+            for message in messages:
+                if not _offer(client, message):
+                    # The client fell behind; let it reload the full state instead
+                    _drain(client)
+                    _offer(client, ('snapshot', None))
+                    break
+
+    def get_status_payload(self) -> Dict[str, Any]:
+        """Get the full current state served by /api/status."""
+        targets = self._snapshot()
+        return {
+            'targets': targets,
+            'summary': _summarize(targets)
+        }
+
+    def get_history_page(self, params: Dict[str, List[str]]) -> Dict[str, Any]:
+        """
+        Get a page of log history for /api/history.
+
+        Args:
+            params: Parsed query string with optional target, start, end,
+                status, limit and cursor
+
+        Returns:
+            Page as returned by LogQuery.query()
+
+        Raises:
+            ValueError: If a parameter is invalid
+        """
+        def param(name: str) -> Optional[str]:
+            values = params.get(name)
+            return values[0] if values else None
+
+        start = param('start')
+        end = param('end')
+        limit = param('limit')
+        return self.log_query.query(
+            target=param('target'),
+            start=parse_timestamp(start) if start else None,
+            end=parse_timestamp(end) if end else None,
+            status=param('status'),
+            limit=int(limit) if limit else DEFAULT_PAGE_SIZE,
+            cursor=param('cursor')
+        )
+
+    def control_profiler(self, action: str, params: Dict[str, List[str]]) -> Dict[str, Any]:
+        """
+        Start or stop the sampling profiler for /api/profiler/<action>.
+
+        Args:
+            action: 'start' or 'stop'
+            params: Parsed query string with an optional duration in seconds
+
+        Returns:
+            Profiler status, with 'started' for the start action
+
+        Raises:
+            ValueError: If the action or duration is invalid
+        """
+        if action == 'start':
+            duration = params.get('duration')
+            started = self.profiler.start(float(duration[0]) if duration else DEFAULT_DURATION)
+            return dict(self.profiler.get_status(), started=started)
+        if action == 'stop':
+            self.profiler.stop()
+            return self.profiler.get_status()
+        raise ValueError(f"Unknown profiler action: {action}")
+
+    def run_checks(self, params: Dict[str, List[str]]) -> Dict[str, Any]:
+        """
+        Check selected targets immediately for /api/checks.
+
+        Args:
+            params: Parsed query string with tags and/or targets, each
+                comma-separated or repeated
+
+        Returns:
+            Number of targets checked and their new statuses
+
+        Raises:
+            ValueError: If no selection was given or nothing matched
+        """
+        selector = TargetSelector.parse(",".join(params.get('tags', [])), ",".join(params.get('targets', [])))
+        if selector.is_empty:
+            raise ValueError("Specify tags or targets to check")
+        results = self.check_runner(selector)
+        if not results:
+            raise ValueError("No targets match the selection")
+        return {
+            'checked': len(results),
+            'targets': {name: status_to_dict(status, self.target_type_resolver(name))
+                        for name, status in results.items()}
+        }
+
+    def _snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: status_to_dict(status, self.target_type_resolver(name))
+            for name, status in self.health_engine.get_current_statuses().items()
+        }
+
+    def _subscribe(self) -> queue.Queue:
+        client = queue.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        with self._lock:
+            self._clients.append(client)
+        return client
+
+    def _unsubscribe(self, client: queue.Queue) -> None:
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+
+
+class _DashboardRequestHandler(BaseHTTPRequestHandler):
+    """Routes dashboard requests to the owning DashboardServer."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        path = url.path
+        dashboard = self.server.dashboard
+        if path in ("/", "/index.html"):
+            self._send(200, "text/html; charset=utf-8", DASHBOARD_HTML.encode('utf-8'))
+        elif path == "/api/status":
+            self._send_json(200, dashboard.get_status_payload())
+        elif path == "/api/history" and dashboard.log_query is not None:
+            try:
+                page = dashboard.get_history_page(parse_qs(url.query))
+            except ValueError as e:
+                self._send_json(400, {'error': str(e)})
+                return
+            self._send_json(200, page)
+        elif path == "/api/profiler" and dashboard.profiler is not None:
+            self._send_json(200, dashboard.profiler.get_status())
+        elif path == "/metrics":
+            self._send(200, OPENMETRICS_CONTENT_TYPE, dashboard.metrics_exporter.render().encode('utf-8'))
+        elif path == "/events":
+            self._stream_events()
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        dashboard = self.server.dashboard
+        prefix = "/api/profiler/"
+        if url.path.startswith(prefix) and dashboard.profiler is not None:
+            try:
+                status = dashboard.control_profiler(url.path[len(prefix):], parse_qs(url.query))
+            except ValueError as e:
+                self._send_json(400, {'error': str(e)})
+                return
+            self._send_json(409 if status.get('started') is False else 200, status)
+        elif url.path == "/api/checks" and dashboard.check_runner is not None:
+            try:
+                payload = dashboard.run_checks(parse_qs(url.query))
+            except ValueError as e:
+                self._send_json(400, {'error': str(e)})
+                return
+            self._send_json(200, payload)
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def log_message(self, format, *args):
+        logging.getLogger(__name__).debug("%s - %s", self.address_string(), format % args)
+
+    def _send(self, code: int, content_type: str, body: bytes) -> None:
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, code: int, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        self._send(code, "application/json; charset=utf-8", body)
+
+    def _stream_events(self) -> None:
+        dashboard = self.server.dashboard
+        client = dashboard._subscribe()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+
+            self._write_event('snapshot', dashboard.get_status_payload())
+            while True:
+                try:
+                    message = client.get(timeout=KEEPALIVE_INTERVAL)
+                except queue.Empty:
+                    self.wfile.write(b": keepalive\n\n")
+                    self.wfile.flush()
+                    continue
+
+                if message is None:
+                    break
+                event, data = message
+                if event == 'snapshot':
+                    data = dashboard.get_status_payload()
+                self._write_event(event, data)
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            pass
+        finally:
+            dashboard._unsubscribe(client)
+
+    def _write_event(self, event: str, data: Any) -> None:
+        payload = json.dumps(data, ensure_ascii=False, default=str)
+        self.wfile.write(f"event: {event}\ndata: {payload}\n\n".encode('utf-8'))
+        self.wfile.flush()
+
+
+def _offer(client: queue.Queue, message) -> bool:
+    """Queue a message without blocking; return False if the queue is full."""
+    try:
+        client.put_nowait(message)
+        return True
+    except queue.Full:
+        return False
+
+
+def _drain(client: queue.Queue) -> None:
+    """Discard every pending message of a client queue."""
+    try:
+        while True:
+            client.get_nowait()
+    except queue.Empty:
+        pass
+
+
+def _summarize(targets: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+    summary = {'total': len(targets), 'up': 0, 'down': 0}
+    for item in targets.values():
+        summary[item['status']] += 1
+    return summary
+
+
+DASHBOARD_HTML = """<!DOCTYPE html>
+<html lang="ja">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Health Monitor ライブダッシュボード</title>
+    <style>
+        body { font-family: 'Segoe UI', 'Meiryo', sans-serif; margin: 0; background: #f5f6fa; color: #2c3e50; }
+        header { background: #2c3e50; color: white; padding: 16px 24px; display: flex; justify-content: space-between; align-items: center; }
+        header h1 { margin: 0; font-size: 1.4em; }
+        #connection { font-size: 0.9em; }
+        #connection.live { color: #2ecc71; }
+        #connection.offline { color: #e74c3c; }
+        .summary { display: flex; gap: 16px; padding: 16px 24px; }
+        .card { background: white; border-radius: 8px; padding: 12px 20px; box-shadow: 0 1px 3px rgba(0,0,0,0.1); }
+        .card .number { font-size: 1.8em; font-weight: bold; }
+        table { width: calc(100% - 48px); margin: 0 24px 24px; border-collapse: collapse; background: white; }
+        th, td { padding: 8px 12px; border-bottom: 1px solid #ecf0f1; text-align: left; }
+        th { background: #ecf0f1; }
+        .status-up { color: #27ae60; font-weight: bold; }
+        .status-down { color: #c0392b; font-weight: bold; }
+        tr.changed { animation: flash 1.5s ease-out; }
+        @keyframes flash { from { background: #fff3b0; } to { background: white; } }
+    </style>
+</head>
+<body>
+    <header>
+        <h1>🏥 Health Monitor ライブダッシュボード</h1>
+        <span id="connection" class="offline">接続中...</span>
+    </header>
+    <div class="summary">
+        <div class="card"><div class="number status-up" id="count-up">0</div>正常稼働</div>
+        <div class="card"><div class="number status-down" id="count-down">0</div>障害発生</div>
+        <div class="card"><div class="number" id="count-total">0</div>総監視対象</div>
+    </div>
+    <table>
+        <thead>
+            <tr><th>監視対象</th><th>種別</th><th>ステータス</th><th>応答時間</th><th>最終チェック</th><th>詳細</th></tr>
+        </thead>
+        <tbody id="targets"></tbody>
+    </table>
+    <script>
+        const targets = new Map();
+        const rows = new Map();
+        const order = [];
+        const tbody = document.getElementById('targets');
+        let upCount = 0;
+
+        function orderIndex(name) {
+            let low = 0, high = order.length;
+            while (low < high) {
+                const mid = (low + high) >> 1;
+                if (order[mid] < name) low = mid + 1; else high = mid;
+            }
+            return low;
+        }
+
+        function storeTarget(item) {
+            const previous = targets.get(item.name);
+            if (previous && previous.status === 'up') upCount--;
+            if (item.status === 'up') upCount++;
+            targets.set(item.name, item);
+        }
+
+        function renderRow(item, changed) {
+            let row = rows.get(item.name);
+            if (!row) {
+                row = document.createElement('tr');
+                const index = orderIndex(item.name);
+                order.splice(index, 0, item.name);
+                tbody.insertBefore(row, rows.get(order[index + 1]) || null);
+                rows.set(item.name, row);
+            }
+            const cells = [
+                item.name,
+                item.type,
+                item.status,
+                item.response_time != null ? item.response_time.toFixed(2) + 's' : '-',
+                item.timestamp ? new Date(item.timestamp).toLocaleTimeString('ja-JP') : '-',
+                item.error_message || ''
+            ];
+            row.innerHTML = '';
+            cells.forEach((text, i) => {
+                const td = document.createElement('td');
+                td.textContent = text;
+                if (i === 2) td.className = 'status-' + item.status;
+                row.appendChild(td);
+            });
+            if (changed) {
+                row.classList.remove('changed');
+                void row.offsetWidth;
+                row.classList.add('changed');
+            }
+        }
+
+        function updateSummary() {
+            document.getElementById('count-up').textContent = upCount;
+            document.getElementById('count-down').textContent = targets.size - upCount;
+            document.getElementById('count-total').textContent = targets.size;
+        }
+
+        function applySnapshot(payload) {
+            targets.clear();
+            rows.clear();
+            order.length = 0;
+            upCount = 0;
+            tbody.innerHTML = '';
+            Object.values(payload.targets).forEach(item => {
+                storeTarget(item);
+                renderRow(item, false);
+            });
+            updateSummary();
+        }
+
+        function applyRemoval(names) {
+            names.forEach(name => {
+                const item = targets.get(name);
+                if (item && item.status === 'up') upCount--;
+                targets.delete(name);
+                const row = rows.get(name);
+                if (row) {
+                    row.remove();
+                    order.splice(orderIndex(name), 1);
+                }
+                rows.delete(name);
+            });
+            updateSummary();
+        }
+
+        function applyUpdate(delta) {
+            Object.values(delta).forEach(item => {
+                storeTarget(item);
+                renderRow(item, true);
+            });
+            updateSummary();
+        }
+
+        const connection = document.getElementById('connection');
+        const source = new EventSource('/events');
+        source.addEventListener('snapshot', e => applySnapshot(JSON.parse(e.data)));
+        source.addEventListener('update', e => applyUpdate(JSON.parse(e.data)));
+        source.addEventListener('remove', e => applyRemoval(JSON.parse(e.data)));
+        source.onopen = () => { connection.textContent = '● ライブ'; connection.className = 'live'; };
+        source.onerror = () => { connection.textContent = '再接続中...'; connection.className = 'offline'; };
+    </script>
+</body>
+</html>
+"""
@@ -7,6 +7,7 @@ import time
 import logging
 
 from health_monitor.models.data_models import DatabaseTarget, HealthStatus
+from health_monitor.services import tracing
 from health_monitor.services.retry_handler import RetryHandler, RetryConfig, CircuitBreaker, CircuitBreakerOpenException
 
 
@@ -91,6 +92,17 @@ class DatabaseHealthChecker:
                 timestamp=timestamp
             )
     
+    def release_target(self, target_name: str) -> None:
+        """
+        Drop the circuit breaker of a target that was removed or redefined.
+        Connections are opened per check, so there is nothing else to close.
+        
+        Args:
+            target_name: Name of the target
+        """
+        if self.circuit_breakers is not None:
+            self.circuit_breakers.pop(target_name, None)
+    
     def _perform_database_connection(self, target: DatabaseTarget) -> HealthStatus:
         """
         Perform the actual database connection test.
@@ -118,13 +130,18 @@ class DatabaseHealthChecker:
             }
             
             # Establish connection
-            connection = psycopg2.connect(**connection_params)
+            with tracing.span("db.connect", kind=tracing.SPAN_KIND_CLIENT,
+                              **{"db.system": "postgresql", "server.address": target.host,
+                                 "server.port": target.port, "db.name": target.database}):
+                connection = psycopg2.connect(**connection_params)
             
             # Test the connection with a simple query
-            cursor = connection.cursor()
-            cursor.execute("SELECT 1")
-            result = cursor.fetchone()
-            cursor.close()
+            with tracing.span("db.query", kind=tracing.SPAN_KIND_CLIENT,
+                              **{"db.system": "postgresql", "db.statement": "SELECT 1"}):
+                cursor = connection.cursor()
+                cursor.execute("SELECT 1")
+                result = cursor.fetchone()
+                cursor.close()
             
             response_time = time.time() - start_time
             
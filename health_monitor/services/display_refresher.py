@@ -0,0 +1,112 @@
+"""
+Background refresh of the console status display.
+The display is redrawn on its own thread from a snapshot of the engine's
+current statuses, at most max_fps times per second. The check loop never
+waits on terminal output, and results show up as individual checks finish
+instead of once per cycle.
+"""
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from health_monitor.models.data_models import HealthStatus
+from health_monitor.services.interfaces import StatusDisplayInterface
+
+
+DEFAULT_MAX_FPS = 4.0
+
+# Seconds between redraws when no status changed, so the clock and the
+# recent-change highlights stay current.
+IDLE_REFRESH_INTERVAL = 1.0
+
+
+class DisplayRefresher:
+    """Redraws a status display from engine snapshots at a capped frame rate."""
+
+    def __init__(self, display: StatusDisplayInterface,
+                 snapshot: Callable[[], Dict[str, HealthStatus]],
+                 version: Optional[Callable[[], int]] = None,
+                 max_fps: float = DEFAULT_MAX_FPS,
+                 idle_interval: float = IDLE_REFRESH_INTERVAL):
+        """
+        Initialize a stopped refresher.
+
+        Args:
+            display: Display to draw on
+            snapshot: Returns a copy of the current statuses
+            version: Returns a number that changes whenever the statuses do;
+                without it every frame is redrawn
+            max_fps: Upper bound on frames drawn per second
+            idle_interval: Seconds between redraws when nothing changed
+
+        Raises:
+            ValueError: If max_fps is not positive
+        """
+        if max_fps <= 0:
+            raise ValueError("max_fps must be positive")
+        self.display = display
+        self.snapshot = snapshot
+        self.version = version
+        self.max_fps = max_fps
+        self.idle_interval = idle_interval
+        self.logger = logging.getLogger(__name__)
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._force_redraw = True
+        self.frames_drawn = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the refresh thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start redrawing in the background; does nothing if already running."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._force_redraw = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name="DisplayRefresher")
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop redrawing and wait for the current frame to finish.
+
+        Args:
+            timeout: Seconds to wait for the refresh thread
+        """
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def request_refresh(self) -> None:
+        """Redraw on the next frame even if no status changed."""
+        self._force_redraw = True
+
+    def _run(self) -> None:
+        frame_interval = 1.0 / self.max_fps
+        last_version = None
+        last_frame = float('-inf')
+
+        while not self._stop_event.is_set():
+            version = self.version() if self.version is not None else None
+            now = time.monotonic()
+            if (self._force_redraw or version is None or version != last_version
+                    or now - last_frame >= self.idle_interval):
+                self._force_redraw = False
+                last_version = version
+                last_frame = now
+                self._draw()
+
+            self._stop_event.wait(frame_interval)
+
+    def _draw(self) -> None:
+        try:
+            self.display.update_display(self.snapshot())
+            self.frames_drawn += 1
+        except Exception as e:
+            self.logger.error(f"Status display refresh failed: {e}")
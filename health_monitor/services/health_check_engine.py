@@ -2,7 +2,8 @@
 Health check engine implementation with parallel execution support.
 """
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
+import logging
 import threading
 import time
 
@@ -10,8 +11,13 @@ from health_monitor.models.data_models import WebsiteTarget, DatabaseTarget, Hea
 from health_monitor.services.interfaces import HealthCheckEngineInterface
 from health_monitor.services.website_checker import WebsiteHealthChecker
 from health_monitor.services.database_checker import DatabaseHealthChecker
+from health_monitor.services.latency_histogram import LatencyHistogramRegistry
 from health_monitor.services.log_manager import LogManager
 from health_monitor.services.self_monitor import SelfMonitor
+from health_monitor.services.target_diff import TargetDiff
+from health_monitor.services.target_registry import TargetRegistry
+from health_monitor.services import tracing
+from health_monitor.services.tracing import Tracer
 
 
 class HealthCheckEngine(HealthCheckEngineInterface):
@@ -21,7 +27,9 @@ class HealthCheckEngine(HealthCheckEngineInterface):
     
     def __init__(self, max_workers: int = 10, log_manager: Optional[LogManager] = None,
                  enable_retry: bool = True, enable_circuit_breaker: bool = True,
-                 enable_self_monitoring: bool = True, log_all_checks: bool = False):
+                 enable_self_monitoring: bool = True, log_all_checks: bool = False,
+                 tracer: Optional[Tracer] = None, check_interval: Optional[float] = None,
+                 target_registry: Optional[TargetRegistry] = None):
         """
         Initialize the health check engine.
         
@@ -32,6 +40,11 @@ class HealthCheckEngine(HealthCheckEngineInterface):
             enable_circuit_breaker: Whether to enable circuit breaker pattern
             enable_self_monitoring: Whether to enable self-monitoring and diagnostics
             log_all_checks: Whether to log all health check results (not just status changes)
+            tracer: Tracer recording a trace per check; None disables tracing
+            check_interval: Seconds between check cycles; a cycle taking longer
+                counts as an overrun
+            target_registry: Registry resolving target types for logging; without
+                it the types are taken from the targets of each run
         """
         self.max_workers = max_workers
         self.website_checker = WebsiteHealthChecker(
@@ -44,9 +57,23 @@ class HealthCheckEngine(HealthCheckEngineInterface):
         )
         self.log_manager = log_manager or LogManager()
         self.log_all_checks = log_all_checks
+        self.target_registry = target_registry
         self._lock = threading.Lock()
+        self._run_lock = threading.Lock()  # one check run at a time
         self._current_statuses: Dict[str, HealthStatus] = {}
         self._previous_statuses: Dict[str, bool] = {}  # Track previous healthy status
+        self._status_listeners: List[Callable[[Dict[str, HealthStatus]], None]] = []
+        self._status_version = 0
+        self._busy_workers = 0
+        self.latency_histograms = LatencyHistogramRegistry()
+        self.queue_wait_histograms = LatencyHistogramRegistry()
+        self.run_time_histograms = LatencyHistogramRegistry()
+        self.check_interval = check_interval
+        self._cycle_count = 0
+        self._cycle_overruns = 0
+        self._last_cycle_duration: Optional[float] = None
+        self.tracer = tracer or Tracer()
+        self.logger = logging.getLogger(__name__)
         
         # Self-monitoring
         self.self_monitor = SelfMonitor() if enable_self_monitoring else None
@@ -78,17 +105,57 @@ class HealthCheckEngine(HealthCheckEngineInterface):
         return self.database_checker.check_database(target)
     
     def run_all_checks(self, website_targets: List[WebsiteTarget] = None, 
-                      database_targets: List[DatabaseTarget] = None) -> Dict[str, HealthStatus]:
+                      database_targets: List[DatabaseTarget] = None,
+                      interval: Optional[float] = None, partial: bool = False) -> Dict[str, HealthStatus]:
         """
-        Run health checks on all configured targets in parallel.
+        Run a check cycle on the configured targets in parallel.
         
         Args:
             website_targets: List of website targets to check
             database_targets: List of database targets to check
+            interval: Seconds until these targets are checked again; a cycle
+                taking longer counts as an overrun. Defaults to check_interval
+            partial: The targets are one scheduled group rather than every
+                monitored target, so the monitored target count is left alone
             
         Returns:
             Dictionary mapping target names to their health status
         """
+        with self._run_lock:
+            cycle_start = time.monotonic()
+            results = self._run_checks(website_targets, database_targets, update_target_count=not partial)
+            if results:
+                self._record_cycle(time.monotonic() - cycle_start,
+                                   self.check_interval if interval is None else interval)
+        return results
+    
+    def run_selected_checks(self, website_targets: List[WebsiteTarget] = None,
+                            database_targets: List[DatabaseTarget] = None) -> Dict[str, HealthStatus]:
+        """
+        Check targets on demand, outside the check cycle.
+        
+        Waits for a running cycle to finish, and neither counts as a cycle
+        nor changes the monitored target count.
+        
+        Args:
+            website_targets: List of website targets to check
+            database_targets: List of database targets to check
+            
+        Returns:
+            Dictionary mapping target names to their health status
+        """
+        with self._run_lock:
+            return self._run_checks(website_targets, database_targets, update_target_count=False)
+    
+    def update_target_count(self, count: int) -> None:
+        """Report the number of monitored targets to self-monitoring."""
+        if self.self_monitor:
+            self.self_monitor.update_target_count(count)
+    
+    def _run_checks(self, website_targets: Optional[List[WebsiteTarget]],
+                    database_targets: Optional[List[DatabaseTarget]],
+                    update_target_count: bool) -> Dict[str, HealthStatus]:
+        """Check targets in parallel, record their statuses and notify listeners."""
         if website_targets is None:
             website_targets = []
         if database_targets is None:
@@ -111,8 +178,8 @@ class HealthCheckEngine(HealthCheckEngineInterface):
             return results
         
         # Update self-monitoring with target count
-        if self.self_monitor:
-            self.self_monitor.update_target_count(len(check_tasks))
+        if update_target_count:
+            self.update_target_count(len(check_tasks))
         
         # Execute all checks in parallel
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
@@ -120,11 +187,7 @@ class HealthCheckEngine(HealthCheckEngineInterface):
             future_to_target = {}
             
             for check_type, target in check_tasks:
-                if check_type == 'website':
-                    future = executor.submit(self.check_website, target)
-                else:  # database
-                    future = executor.submit(self.check_database, target)
-                    
+                future = executor.submit(self._run_check, check_type, target, time.time_ns())
                 future_to_target[future] = (check_type, target)
             
             # Collect results as they complete
@@ -134,12 +197,14 @@ class HealthCheckEngine(HealthCheckEngineInterface):
                 try:
                     health_status = future.result()
                     results[target.name] = health_status
+                    self._publish_status(target.name, health_status)
                     
                     # Record metrics for self-monitoring
                     if self.self_monitor:
                         self.self_monitor.record_health_check(
                             success=health_status.is_healthy,
-                            response_time=health_status.response_time
+                            response_time=health_status.response_time,
+                            target_name=target.name
                         )
                     
                 except Exception as e:
@@ -153,17 +218,20 @@ class HealthCheckEngine(HealthCheckEngineInterface):
                         timestamp=datetime.now()
                     )
                     results[target.name] = error_status
+                    self._publish_status(target.name, error_status)
                     
                     # Record failed check for self-monitoring
                     if self.self_monitor:
-                        self.self_monitor.record_health_check(success=False, response_time=0.0)
+                        self.self_monitor.record_health_check(
+                            success=False, response_time=0.0, target_name=target.name
+                        )
                         self.self_monitor.add_diagnostic(
                             "HealthCheckEngine", "ERROR", 
                             f"Health check execution failed for {target.name}: {str(e)}"
                         )
         
         # Update internal status tracking and log status changes
-        with self._lock:
+        with self._lock, self.tracer.start_trace("status_logging", **{"check.count": len(results)}):
             self._update_statuses_and_log_changes(results, website_targets, database_targets)
             
             # Update circuit breaker count for self-monitoring
@@ -174,9 +242,147 @@ class HealthCheckEngine(HealthCheckEngineInterface):
                 if hasattr(self.database_checker, 'circuit_breakers') and self.database_checker.circuit_breakers:
                     open_breakers += sum(1 for cb in self.database_checker.circuit_breakers.values() if cb.state == 'OPEN')
                 self.self_monitor.update_circuit_breaker_count(open_breakers)
-            
+        
         return results
     
+    def _publish_status(self, target_name: str, status: HealthStatus):
+        """Make a finished check visible, and push it to listeners, before the rest of its cycle completes."""
+        with self._lock:
+            self._current_statuses[target_name] = status
+            self._status_version += 1
+        self._notify_status_listeners({target_name: status})
+    
+    def _record_cycle(self, duration: float, interval: Optional[float]):
+        """Count a finished cycle and whether it overran its interval."""
+        overran = interval is not None and duration > interval
+        with self._lock:
+            self._cycle_count += 1
+            self._last_cycle_duration = duration
+            if overran:
+                self._cycle_overruns += 1
+        
+        if overran:
+            self.logger.warning(
+                f"Check cycle took {duration:.1f}s, longer than the {interval:g}s interval"
+            )
+        if self.self_monitor:
+            self.self_monitor.record_cycle(duration, interval)
+    
+    def _run_check(self, check_type: str, target, scheduled_ns: int):
+        """Run one check on a worker thread, tracking pool utilization, latency, queue wait and a trace."""
+        started_ns = time.time_ns()
+        with self._lock:
+            self._busy_workers += 1
+        try:
+            with self.tracer.start_trace("health_check", start_ns=scheduled_ns,
+                                         **{"target.name": target.name, "check.type": check_type}) as root:
+                tracing.record_span("queue_wait", scheduled_ns, started_ns)
+                if check_type == 'website':
+                    status = self.check_website(target)
+                else:  # database
+                    status = self.check_database(target)
+                root.set_attribute("check.healthy", status.is_healthy)
+                root.set_attribute("check.response_time", status.response_time)
+                if not status.is_healthy:
+                    root.set_error(status.error_message or "unhealthy")
+            finished_ns = time.time_ns()
+            queue_wait = max(0, started_ns - scheduled_ns) / 1e9
+            run_time = (finished_ns - started_ns) / 1e9
+            self.latency_histograms.observe(check_type, target.name, status.response_time)
+            self.queue_wait_histograms.observe(check_type, target.name, queue_wait)
+            self.run_time_histograms.observe(check_type, target.name, run_time)
+            if self.self_monitor:
+                self.self_monitor.record_check_timing(queue_wait, run_time)
+            return status
+        finally:
+            with self._lock:
+                self._busy_workers -= 1
+    
+    def get_worker_pool_stats(self) -> Dict[str, int]:
+        """
+        Get the size of the check worker pool and how many workers are busy.
+        
+        Returns:
+            Dictionary with 'size' and 'busy'
+        """
+        with self._lock:
+            return {'size': self.max_workers, 'busy': self._busy_workers}
+    
+    def get_cycle_stats(self) -> Dict[str, Any]:
+        """
+        Get check cycle counters.
+        
+        Returns:
+            Dictionary with 'cycles', 'overruns' (cycles longer than the check
+            interval), 'last_duration' in seconds and the 'check_interval'
+        """
+        with self._lock:
+            return {
+                'cycles': self._cycle_count,
+                'overruns': self._cycle_overruns,
+                'last_duration': self._last_cycle_duration,
+                'check_interval': self.check_interval
+            }
+    
+    def get_resilience_stats(self) -> Dict[str, Any]:
+        """
+        Get retry and circuit breaker counters.
+        
+        Returns:
+            Dictionary with 'retries' mapping check type to retries performed,
+            and 'circuit_breakers' mapping target name to its check type,
+            state, times opened and calls rejected
+        """
+        retries = {}
+        circuit_breakers = {}
+        for check_type, checker in (('website', self.website_checker), ('database', self.database_checker)):
+            retry_handler = getattr(checker, 'retry_handler', None)
+            if getattr(checker, 'enable_retry', False) and retry_handler is not None:
+                retries[check_type] = retry_handler.retry_count
+            
+            breakers = getattr(checker, 'circuit_breakers', None) or {}
+            for name, breaker in list(breakers.items()):
+                circuit_breakers[name] = {
+                    'check_type': check_type,
+                    'state': breaker.state,
+                    'opened': breaker.open_count,
+                    'rejected': breaker.rejected_count
+                }
+        
+        return {'retries': retries, 'circuit_breakers': circuit_breakers}
+    
+    def add_status_listener(self, listener: Callable[[Dict[str, HealthStatus]], None]):
+        """
+        Register a callback invoked with each new health check result as soon
+        as its check finishes, and with an empty dictionary after targets
+        were removed.
+        
+        Listeners run on the checking thread after statuses are updated, so
+        they should hand work off rather than block.
+        
+        Args:
+            listener: Callable receiving a dictionary of target name to HealthStatus
+        """
+        with self._lock:
+            self._status_listeners.append(listener)
+    
+    def remove_status_listener(self, listener: Callable[[Dict[str, HealthStatus]], None]):
+        """Unregister a callback added with add_status_listener."""
+        with self._lock:
+            if listener in self._status_listeners:
+                self._status_listeners.remove(listener)
+    
+    def _notify_status_listeners(self, results: Dict[str, HealthStatus]):
+        """Deliver new results to listeners; a failing listener does not affect the others."""
+        with self._lock:
+            listeners = list(self._status_listeners)
+        
+        for listener in listeners:
+            try:
+                listener(results)
+            except Exception as e:
+                self.logger.error(f"Status listener failed: {e}")
+    
     def get_current_statuses(self) -> Dict[str, HealthStatus]:
         """
         Get the current health statuses of all targets.
@@ -187,6 +393,16 @@ class HealthCheckEngine(HealthCheckEngineInterface):
         with self._lock:
             return self._current_statuses.copy()
     
+    def get_status_version(self) -> int:
+        """
+        Get a counter that changes whenever the current statuses change.
+        
+        Returns:
+            Number of status updates so far
+        """
+        with self._lock:
+            return self._status_version
+    
     def get_target_status(self, target_name: str) -> HealthStatus:
         """
         Get the current health status of a specific target.
@@ -211,12 +427,12 @@ class HealthCheckEngine(HealthCheckEngineInterface):
             website_targets: List of website targets checked
             database_targets: List of database targets checked
         """
-        # Create target type mapping
-        target_types = {}
-        for target in website_targets:
-            target_types[target.name] = 'website'
-        for target in database_targets:
-            target_types[target.name] = 'database'
+        if self.target_registry is not None:
+            type_of = self.target_registry.type_of
+        else:
+            target_types = {target.name: 'database' for target in database_targets}
+            target_types.update((target.name, 'website') for target in website_targets)
+            type_of = lambda name: target_types.get(name, 'unknown')
         
         # Check for status changes and log them
         for target_name, new_status in new_results.items():
@@ -227,7 +443,7 @@ class HealthCheckEngine(HealthCheckEngineInterface):
             if (previous_healthy is not None and previous_healthy != current_healthy) or previous_healthy is None:
                 old_status = "up" if previous_healthy else ("unknown" if previous_healthy is None else "down")
                 new_status_str = "up" if current_healthy else "down"
-                target_type = target_types.get(target_name, 'unknown')
+                target_type = type_of(target_name)
                 
                 details = ""
                 if new_status.error_message:
@@ -235,13 +451,14 @@ class HealthCheckEngine(HealthCheckEngineInterface):
                 elif current_healthy:
                     details = f"Response time: {new_status.response_time:.2f}s"
                 
-                self.log_manager.log_status_change(
-                    target=target_name,
-                    target_type=target_type,
-                    old_status=old_status,
-                    new_status=new_status_str,
-                    details=details
-                )
+                with tracing.span("log_status_change", **{"target.name": target_name}):
+                    self.log_manager.log_status_change(
+                        target=target_name,
+                        target_type=target_type,
+                        old_status=old_status,
+                        new_status=new_status_str,
+                        details=details
+                    )
             
             # Update tracking
             self._previous_statuses[target_name] = current_healthy
@@ -249,7 +466,7 @@ class HealthCheckEngine(HealthCheckEngineInterface):
             # Log all health checks if enabled (regardless of status change)
             if self.log_all_checks:
                 status_str = "up" if current_healthy else "down"
-                target_type = target_types.get(target_name, 'unknown')
+                target_type = type_of(target_name)
                 
                 self.log_manager.log_health_check(
                     target=target_name,
@@ -261,6 +478,7 @@ class HealthCheckEngine(HealthCheckEngineInterface):
         
         # Update current statuses
         self._current_statuses.update(new_results)
+        self._status_version += 1
     
     def get_status_history(self, days: int = 7) -> List:
         """
@@ -290,17 +508,83 @@ class HealthCheckEngine(HealthCheckEngineInterface):
         with self._lock:
             self._current_statuses.clear()
             self._previous_statuses.clear()
+            self._status_version += 1
+    
+    def apply_target_diff(self, diff: TargetDiff, website_targets: List[WebsiteTarget]) -> None:
+        """
+        Release the state of targets a configuration reload removed or changed.
+        Removed targets lose their statuses, histograms, circuit breakers and
+        self-monitoring stats; modified targets keep their statuses but start
+        over with a fresh circuit breaker and histograms. Unchanged targets
+        are not touched.
+        
+        Args:
+            diff: Changes between the old and new configuration
+            website_targets: Website targets after the reload, whose hosts keep
+                their pooled HTTP connections
+        """
+        checkers = {'website': self.website_checker, 'database': self.database_checker}
+        for check_type, target in diff.removed + diff.modified:
+            checkers[check_type].release_target(target.name)
+            for registry in (self.latency_histograms, self.queue_wait_histograms, self.run_time_histograms):
+                registry.remove(check_type, target.name)
+        
+        if diff.removed:
+            with self._lock:
+                for _, target in diff.removed:
+                    self._current_statuses.pop(target.name, None)
+                    self._previous_statuses.pop(target.name, None)
+                self._status_version += 1
+            if self.self_monitor:
+                for _, target in diff.removed:
+                    self.self_monitor.forget_target(target.name)
+            # Listeners compare against the current statuses to drop removed targets
+            self._notify_status_listeners({})
+        
+        if any(check_type == 'website' for check_type, _ in diff.removed + diff.modified):
+            self.website_checker.prune_connection_pools(website_targets)
+    
+    def get_latency_histograms(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Get per-target response time histograms.
+        
+        Returns:
+            Histograms grouped by check type, then target name
+        """
+        return self.latency_histograms.to_dict()
+    
+    def get_scheduling_stats(self) -> Dict[str, Any]:
+        """
+        Get where check time goes: waiting for a worker versus running.
+        
+        Returns:
+            Dictionary with 'cycle' counters, and 'queue_wait' and 'run_time'
+            histograms grouped by check type, then target name
+        """
+        return {
+            'cycle': self.get_cycle_stats(),
+            'queue_wait': self.queue_wait_histograms.to_dict(),
+            'run_time': self.run_time_histograms.to_dict()
+        }
     
     def get_self_monitoring_data(self) -> Optional[Dict[str, Any]]:
-        """Get self-monitoring data if available."""
+        """Get self-monitoring data, including latency histograms and scheduling stats, if available."""
         if self.self_monitor:
-            return self.self_monitor.get_health_summary()
+            data = self.self_monitor.get_health_summary()
+            data["latency_histograms"] = self.get_latency_histograms()
+            data["scheduling"] = self.get_scheduling_stats()
+            return data
         return None
     
     def export_diagnostics(self, filepath: str):
         """Export diagnostic information to a file."""
         if self.self_monitor:
-            self.self_monitor.export_diagnostics(filepath)
+            self.self_monitor.export_diagnostics(
+                filepath, extra_sections={
+                    "latency_histograms": self.get_latency_histograms(),
+                    "scheduling": self.get_scheduling_stats()
+                }
+            )
         else:
             raise RuntimeError("Self-monitoring is not enabled")
     
@@ -308,6 +592,7 @@ class HealthCheckEngine(HealthCheckEngineInterface):
         """Clean up resources used by the health check engine."""
         if self.self_monitor:
             self.self_monitor.stop_monitoring()
+        self.tracer.close()
         self.website_checker.close()
         # Database checker doesn't need explicit cleanup
         
@@ -70,6 +70,18 @@ class StatusDisplayInterface(ABC):
     def refresh_ui(self) -> None:
         """Refresh the user interface display."""
         pass
+    
+    def show_message(self, message: str) -> None:
+        """Display an application message, such as a configuration reload notice."""
+        print(message)
+    
+    def show_results(self, statuses: Dict[str, HealthStatus]) -> None:
+        """Display the results of a one-shot check run; defaults to a regular update."""
+        self.update_display(statuses)
+    
+    def close(self) -> None:
+        """Release the terminal; displays without terminal state need not override this."""
+        pass
 
 
 class LogManagerInterface(ABC):
@@ -0,0 +1,151 @@
+"""
+Fixed-bucket latency histograms per target and check type.
+Bucket bounds never change, so histograms from different targets, check
+types or scrapes can be compared and summed directly. Worker threads
+record into a registry that spreads targets over a fixed set of striped
+locks, so concurrent checks of different targets rarely contend.
+"""
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Sequence, Tuple
+
+
+# Upper bounds in seconds; an implicit +Inf bucket catches everything slower.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+DEFAULT_STRIPES = 16
+
+
+class LatencyHistogram:
+    """Counts of observations per fixed latency bucket."""
+
+    __slots__ = ('bounds', 'counts', 'count', 'total')
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            bounds: Increasing bucket upper bounds in seconds
+
+        Raises:
+            ValueError: If the bounds are empty or not strictly increasing
+        """
+        bounds = tuple(float(bound) for bound in bounds)
+        if not bounds or any(a >= b for a, b in zip(bounds, bounds[1:])):
+            raise ValueError("bucket bounds must be non-empty and strictly increasing")
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation; a value equal to a bound falls in that bucket."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """
+        Get (upper bound, observations at or below it) pairs.
+
+        Returns:
+            One pair per bucket, ending with (inf, count)
+        """
+        pairs = []
+        running = 0
+        for bound, bucket_count in zip(self.bounds + (float('inf'),), self.counts):
+            running += bucket_count
+            pairs.append((bound, running))
+        return pairs
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the histogram to JSON-compatible data."""
+        return {
+            'buckets': list(self.bounds),
+            'counts': list(self.counts),
+            'count': self.count,
+            'sum': self.total
+        }
+
+
+class LatencyHistogramRegistry:
+    """Thread-safe per-(check type, target) histograms behind striped locks."""
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS, stripes: int = DEFAULT_STRIPES):
+        """
+        Initialize an empty registry.
+
+        Args:
+            bounds: Bucket upper bounds shared by every histogram
+            stripes: Number of locks the targets are spread over
+        """
+        self.bounds = tuple(bounds)
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._shards: List[Dict[Tuple[str, str], LatencyHistogram]] = [{} for _ in range(stripes)]
+
+    def observe(self, check_type: str, target_name: str, value: float) -> None:
+        """
+        Record a check's response time.
+
+        Args:
+            check_type: Kind of check ('website' or 'database')
+            target_name: Name of the checked target
+            value: Response time in seconds
+        """
+        key = (check_type, target_name)
+        stripe = hash(key) % len(self._locks)
+        with self._locks[stripe]:
+            histogram = self._shards[stripe].get(key)
+            if histogram is None:
+                histogram = self._shards[stripe][key] = LatencyHistogram(self.bounds)
+            histogram.observe(value)
+
+    def snapshot(self) -> Dict[Tuple[str, str], LatencyHistogram]:
+        """
+        Get a consistent copy of every histogram.
+
+        Returns:
+            Dictionary mapping (check type, target name) to a histogram copy
+        """
+        copies = {}
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                for key, histogram in shard.items():
+                    copy = LatencyHistogram(histogram.bounds)
+                    copy.counts = list(histogram.counts)
+                    copy.count = histogram.count
+                    copy.total = histogram.total
+                    copies[key] = copy
+        return copies
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Serialize all histograms, grouped by check type then target name.
+
+        Returns:
+            Nested dictionary of LatencyHistogram.to_dict() results
+        """
+        grouped: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (check_type, target_name), histogram in sorted(self.snapshot().items()):
+            grouped.setdefault(check_type, {})[target_name] = histogram.to_dict()
+        return grouped
+
+    def remove(self, check_type: str, target_name: str) -> None:
+        """
+        Drop the histogram of a target; unknown targets are ignored.
+
+        Args:
+            check_type: Kind of check ('website' or 'database')
+            target_name: Name of the target
+        """
+        key = (check_type, target_name)
+        stripe = hash(key) % len(self._locks)
+        with self._locks[stripe]:
+            self._shards[stripe].pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all histograms."""
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                shard.clear()
@@ -0,0 +1,198 @@
+"""
+Mergeable quantile sketch for response time percentiles.
+Samples are counted in logarithmically sized buckets, so any quantile is
+reported within a fixed relative error while memory stays bounded by the
+dynamic range of the data rather than the number of samples.
+"""
+import math
+from typing import Any, Dict, Optional
+
+
+# Percentiles reported by the dashboards and self-monitoring.
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+# Response times at or below this many seconds are counted as zero.
+MIN_TRACKED_VALUE = 1e-6
+
+
+class LatencySketch:
+    """Log-bucketed quantile sketch with bounded relative error."""
+
+    __slots__ = ('relative_accuracy', 'max_buckets', '_gamma', '_log_gamma', 'buckets',
+                 'zero_count', 'count', 'total', 'min', 'max')
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles
+            max_buckets: Upper bound on the number of buckets. When exceeded,
+                the lowest buckets are collapsed, so only the smallest
+                quantiles lose accuracy.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_buckets < 1:
+            raise ValueError("max_buckets must be positive")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        """
+        Add a sample.
+
+        Args:
+            value: Response time in seconds; negative values are ignored
+        """
+        if value < 0:
+            return
+
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+        if value <= MIN_TRACKED_VALUE:
+            self.zero_count += 1
+            return
+
+        index = self._index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def merge(self, other: 'LatencySketch') -> None:
+        """
+        Merge another sketch into this one.
+
+        Args:
+            other: Sketch built with the same relative accuracy
+
+        Raises:
+            ValueError: If the sketches use different accuracies
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if not other.count:
+            return
+
+        self.count += other.count
+        self.total += other.total
+        self.zero_count += other.zero_count
+        if self.min is None or other.min < self.min:
+            self.min = other.min
+        if self.max is None or other.max > self.max:
+            self.max = other.max
+
+        for index, bucket_count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + bucket_count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        if not self.count:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        # Nearest-rank definition: the smallest sample covering q of the data
+        rank = max(1, math.ceil(q * self.count))
+        if rank <= self.zero_count:
+            return 0.0
+
+        seen = self.zero_count
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                value = self._value(index)
+                # The bucket midpoint can fall outside the observed range
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def quantiles(self, qs=DEFAULT_QUANTILES) -> Dict[str, Optional[float]]:
+        """
+        Estimate several quantiles at once.
+
+        Args:
+            qs: Quantiles between 0 and 1
+
+        Returns:
+            Dictionary keyed like 'p50', 'p95', 'p99'
+        """
+        return {_quantile_key(q): self.quantile(q) for q in qs}
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Exact mean of all samples, or None if the sketch is empty."""
+        return self.total / self.count if self.count else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the sketch to JSON-compatible data."""
+        return {
+            'accuracy': self.relative_accuracy,
+            'max_buckets': self.max_buckets,
+            'count': self.count,
+            'sum': self.total,
+            'min': self.min,
+            'max': self.max,
+            'zero': self.zero_count,
+            'buckets': [[index, bucket_count] for index, bucket_count in sorted(self.buckets.items())]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatencySketch':
+        """Restore a sketch serialized with to_dict()."""
+        sketch = cls(relative_accuracy=data['accuracy'], max_buckets=data['max_buckets'])
+        sketch.count = data['count']
+        sketch.total = data['sum']
+        sketch.min = data['min']
+        sketch.max = data['max']
+        sketch.zero_count = data['zero']
+        sketch.buckets = {int(index): bucket_count for index, bucket_count in data['buckets']}
+        return sketch
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        # Midpoint of the bucket (gamma^(i-1), gamma^i] with bounded relative error
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    def _collapse(self) -> None:
+        """Fold the lowest buckets together until the bucket limit holds."""
+        indexes = sorted(self.buckets)
+        excess = len(indexes) - self.max_buckets
+        target = indexes[excess]
+        for index in indexes[:excess]:
+            self.buckets[target] += self.buckets.pop(index)
+
+
+def _quantile_key(q: float) -> str:
+    """Format a quantile as a percentile key such as 'p99' or 'p99.9'."""
+    percent = round(q * 100, 6)
+    if percent == int(percent):
+        return f"p{int(percent)}"
+    return f"p{percent:g}"
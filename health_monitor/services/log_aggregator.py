@@ -0,0 +1,577 @@
+"""
+Streaming aggregation of health monitor log entries.
+Computes latest status, time-weighted uptime, latency percentiles and
+bounded recent-entry lists in a single pass, with memory proportional to the
+number of targets rather than the number of log lines. Checkpointed
+whole-file aggregates keep a sparse offset index, so a query window that
+starts inside a file only parses the lines from the window start onwards.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from health_monitor.services.latency_sketch import LatencySketch
+from health_monitor.services.log_checkpoint import LogCheckpointCache, fold_log_file
+from health_monitor.services.uptime import UptimeTracker
+
+
+# Version of the serialized aggregate; bump when to_dict() changes shape.
+AGGREGATE_FORMAT_VERSION = 4
+
+# Bytes of log data between offset index points of a checkpointed aggregate.
+INDEX_INTERVAL_BYTES = 256 * 1024
+
+# Below this much unparsed log data, starting worker processes costs more
+# than it saves.
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 log timestamp."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def extract_response_time(details: str) -> Optional[float]:
+    """
+    Extract the response time from a log entry's details string.
+
+    Args:
+        details: Details field such as "Response time: 0.27s"
+
+    Returns:
+        Response time in seconds, or None if not present
+    """
+    if details and 'Response time:' in details:
+        try:
+            return float(details.split('Response time: ')[1].split('s')[0])
+        except (IndexError, ValueError):
+            pass
+    return None
+
+
+class TargetAggregate:
+    """Aggregated log state for a single monitoring target."""
+
+    __slots__ = (
+        'name', 'target_type', 'status', 'timestamp', 'details', 'response_time',
+        'total_checks', 'up_checks', 'down_checks', 'latency', 'uptime', 'history'
+    )
+
+    def __init__(self, name: str, history_limit: int, since: Optional[datetime] = None):
+        self.name = name
+        self.target_type: Optional[str] = None
+        self.status: Optional[str] = None
+        self.timestamp: Optional[datetime] = None
+        self.details = ""
+        self.response_time: Optional[float] = None
+        self.total_checks = 0
+        self.up_checks = 0
+        self.down_checks = 0
+        self.latency = LatencySketch()
+        self.uptime = UptimeTracker(since=since)
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=history_limit)
+
+
+class LogAggregator:
+    """Single-pass, mergeable aggregator over health monitor log entries."""
+
+    def __init__(self, since: Optional[datetime] = None, history_limit: int = 50,
+                 recent_limit: int = 100, indexed: bool = False):
+        """
+        Initialize the aggregator.
+
+        Args:
+            since: Entries older than this only update the latest status and
+                recent entries; uptime, latency and history ignore them
+            history_limit: Maximum number of history items kept per target
+            recent_limit: Maximum number of recent entries kept overall
+            indexed: Record an offset index while folding a single file, see
+                mark() and seek_point()
+        """
+        self.since = since
+        self.history_limit = history_limit
+        self.recent_limit = recent_limit
+        self.first_timestamp: Optional[datetime] = None
+        self.targets: Dict[str, TargetAggregate] = {}
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=recent_limit)
+
+        # (offset, newest timestamp before it, statuses changed since the previous point)
+        self.index: Optional[List[Tuple[int, datetime, Dict[str, str]]]] = [] if indexed else None
+        self._index_pending: Dict[str, str] = {}
+        self._index_newest: Optional[datetime] = None
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        """
+        Apply one log entry. Each field is parsed exactly once.
+
+        Args:
+            entry: Decoded JSON log entry
+        """
+        timestamp = parse_timestamp(entry['timestamp'])
+        if self.first_timestamp is None or timestamp < self.first_timestamp:
+            self.first_timestamp = timestamp
+        if self.index is not None and (self._index_newest is None or timestamp > self._index_newest):
+            self._index_newest = timestamp
+
+        self.recent.append(entry)
+
+        target_name = entry.get('target_name')
+        if not target_name or target_name == 'system':
+            return
+
+        target = self.targets.get(target_name)
+        if target is None:
+            target = self.targets[target_name] = TargetAggregate(target_name, self.history_limit, self.since)
+
+        status_change = entry.get('status_change') or ''
+        status = status_change.split('->')[-1]
+        details = entry.get('details') or ''
+        response_time = extract_response_time(details)
+        if self.index is not None:
+            self._index_pending[target_name] = status
+
+        if target.timestamp is None or timestamp >= target.timestamp:
+            target.target_type = entry.get('target_type')
+            target.status = status
+            target.timestamp = timestamp
+            target.details = details
+            target.response_time = response_time
+
+        # Changes before the window only set the status in force when it opens
+        target.uptime.observe(timestamp, status)
+
+        if self.since is not None and timestamp < self.since:
+            return
+
+        target.total_checks += 1
+        if status == 'up':
+            target.up_checks += 1
+        elif status == 'down':
+            target.down_checks += 1
+
+        if response_time is not None:
+            target.latency.add(response_time)
+
+        target.history.append({
+            'timestamp': timestamp,
+            'status_change': entry.get('status_change'),
+            'details': entry.get('details'),
+            'type': entry.get('target_type')
+        })
+
+    def merge(self, other: 'LogAggregator') -> None:
+        """
+        Merge another aggregator into this one.
+
+        The result does not depend on the order in which partial aggregates
+        are merged, except that ties on the latest timestamp favour `other`.
+
+        Args:
+            other: Aggregator covering another set of entries
+        """
+        if other.first_timestamp is not None and (
+                self.first_timestamp is None or other.first_timestamp < self.first_timestamp):
+            self.first_timestamp = other.first_timestamp
+
+        self.recent = deque(
+            _newest(self.recent, other.recent, self.recent_limit,
+                    key=lambda e: parse_timestamp(e['timestamp'])),
+            maxlen=self.recent_limit
+        )
+
+        for name, theirs in other.targets.items():
+            mine = self.targets.get(name)
+            if mine is None:
+                mine = self.targets[name] = TargetAggregate(name, self.history_limit, self.since)
+
+            if theirs.timestamp is not None and (mine.timestamp is None or theirs.timestamp >= mine.timestamp):
+                mine.target_type = theirs.target_type
+                mine.status = theirs.status
+                mine.timestamp = theirs.timestamp
+                mine.details = theirs.details
+                mine.response_time = theirs.response_time
+
+            mine.total_checks += theirs.total_checks
+            mine.up_checks += theirs.up_checks
+            mine.down_checks += theirs.down_checks
+            mine.latency.merge(theirs.latency)
+            mine.uptime.merge(theirs.uptime)
+
+            mine.history = deque(
+                _newest(mine.history, theirs.history, self.history_limit, key=lambda h: h['timestamp']),
+                maxlen=self.history_limit
+            )
+
+    def mark(self, offset: int, force: bool = False) -> None:
+        """
+        Record an offset index point while folding a file; no-op unless indexed.
+
+        Args:
+            offset: Byte offset just past the last entry added
+            force: Record a point even if less than INDEX_INTERVAL_BYTES were
+                added, as at the end of a fold so a checkpoint loses nothing
+        """
+        if self.index is None or self._index_newest is None:
+            return
+        last_offset = self.index[-1][0] if self.index else 0
+        if offset <= last_offset or (not force and offset - last_offset < INDEX_INTERVAL_BYTES):
+            return
+        self.index.append((offset, self._index_newest, self._index_pending))
+        self._index_pending = {}
+
+    def seek_point(self, since: datetime) -> Tuple[int, Dict[str, str]]:
+        """
+        Find where a window starting at `since` can start parsing this file.
+
+        Args:
+            since: Start of the window
+
+        Returns:
+            Offset of the last index point with only older entries before it
+            (0 if there is none) and each target's status in force there
+        """
+        offset = 0
+        statuses: Dict[str, str] = {}
+        for point_offset, newest, changes in self.index or ():
+            if newest >= since:
+                break
+            offset = point_offset
+            statuses.update(changes)
+        return offset, statuses
+
+    def window_prefix(self, since: datetime, statuses: Dict[str, str]) -> 'LogAggregator':
+        """
+        Build what the entries before a seek point contribute to a window.
+
+        Merging a windowed fold from the seek point into the result gives
+        the same aggregate as a windowed fold of the whole file, provided
+        the fold's recent entries are dropped: this aggregate's already
+        cover the file.
+
+        Args:
+            since: Start of the window
+            statuses: Status in force at the seek point, from seek_point()
+
+        Returns:
+            Windowed aggregator with no checks counted
+        """
+        prefix = LogAggregator(since=since, history_limit=self.history_limit, recent_limit=self.recent_limit)
+        prefix.first_timestamp = self.first_timestamp
+        prefix.recent.extend(self.recent)
+        for name, source in self.targets.items():
+            target = prefix.targets[name] = TargetAggregate(name, self.history_limit, since)
+            target.target_type = source.target_type
+            target.status = source.status
+            target.timestamp = source.timestamp
+            target.details = source.details
+            target.response_time = source.response_time
+            if name in statuses:
+                target.uptime.observe(since, statuses[name])
+        return prefix
+
+    def get_latest_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get the latest status of each target."""
+        return {
+            name: {
+                'status': target.status,
+                'type': target.target_type,
+                'timestamp': target.timestamp,
+                'details': target.details,
+                'response_time': target.response_time
+            }
+            for name, target in self.targets.items()
+        }
+
+    def get_uptime_stats(self, until: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get uptime and latency statistics, including p50/p95/p99, for the window.
+
+        Uptime is weighted by the time spent up or down between status
+        changes; the check ratio is only used when no such time is known.
+
+        Args:
+            until: End of the window; defaults to the current time
+
+        Returns:
+            Dictionary mapping target name to statistics
+        """
+        uptime_stats = {}
+        for name, target in self.targets.items():
+            if target.uptime.last_time is None:
+                continue
+
+            end = until
+            if end is None:
+                end = datetime.now(target.uptime.last_time.tzinfo)
+            durations = target.uptime.get_stats(end)
+
+            uptime_percentage = durations['uptime_percentage']
+            if uptime_percentage is None:
+                if not target.total_checks:
+                    continue
+                uptime_percentage = (target.up_checks / target.total_checks) * 100
+
+            stats = {
+                'total_checks': target.total_checks,
+                'up_checks': target.up_checks,
+                'down_checks': target.down_checks,
+                'uptime_percentage': uptime_percentage,
+                'up_seconds': durations['up_seconds'],
+                'down_seconds': durations['down_seconds'],
+                'avg_response_time': None,
+                'max_response_time': None,
+                'min_response_time': None
+            }
+            latency = target.latency
+            if latency.count:
+                stats['avg_response_time'] = latency.mean
+                stats['max_response_time'] = latency.max
+                stats['min_response_time'] = latency.min
+            for key, value in latency.quantiles().items():
+                stats[f'{key}_response_time'] = value
+
+            uptime_stats[name] = stats
+        return uptime_stats
+
+    def get_status_history(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the bounded per-target history for the window in chronological order."""
+        return {
+            name: list(target.history)
+            for name, target in self.targets.items()
+            if target.history
+        }
+
+    def get_recent_entries(self) -> List[Dict[str, Any]]:
+        """Get the recent entries, newest first, with parsed timestamps."""
+        entries = []
+        for entry in self.recent:
+            entry = dict(entry)
+            entry['parsed_timestamp'] = parse_timestamp(entry['timestamp'])
+            entries.append(entry)
+        entries.sort(key=lambda x: x['parsed_timestamp'], reverse=True)
+        return entries
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the aggregate to JSON-compatible data."""
+        return {
+            'version': AGGREGATE_FORMAT_VERSION,
+            'since': _isoformat(self.since),
+            'history_limit': self.history_limit,
+            'recent_limit': self.recent_limit,
+            'first_timestamp': _isoformat(self.first_timestamp),
+            'recent': list(self.recent),
+            'index': None if self.index is None else [
+                [offset, newest.isoformat(), changes] for offset, newest, changes in self.index
+            ],
+            'targets': {
+                name: {
+                    'type': t.target_type,
+                    'status': t.status,
+                    'timestamp': _isoformat(t.timestamp),
+                    'details': t.details,
+                    'response_time': t.response_time,
+                    'counts': [t.total_checks, t.up_checks, t.down_checks],
+                    'latency': t.latency.to_dict(),
+                    'uptime': t.uptime.to_dict(),
+                    'history': [
+                        [h['timestamp'].isoformat(), h['status_change'], h['details'], h['type']]
+                        for h in t.history
+                    ]
+                }
+                for name, t in self.targets.items()
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LogAggregator':
+        """
+        Restore an aggregate serialized with to_dict().
+
+        Raises:
+            ValueError: If the data was written by an incompatible version
+        """
+        if not isinstance(data, dict) or data.get('version') != AGGREGATE_FORMAT_VERSION:
+            raise ValueError("Unsupported aggregate format")
+
+        aggregator = cls(
+            since=_parse_optional(data.get('since')),
+            history_limit=data['history_limit'],
+            recent_limit=data['recent_limit']
+        )
+        aggregator.first_timestamp = _parse_optional(data.get('first_timestamp'))
+        aggregator.recent.extend(data['recent'])
+        if data.get('index') is not None:
+            aggregator.index = [(offset, parse_timestamp(newest), changes) for offset, newest, changes in data['index']]
+            if aggregator.index:
+                aggregator._index_newest = aggregator.index[-1][1]
+
+        for name, item in data['targets'].items():
+            target = TargetAggregate(name, aggregator.history_limit, aggregator.since)
+            target.target_type = item['type']
+            target.status = item['status']
+            target.timestamp = _parse_optional(item['timestamp'])
+            target.details = item['details']
+            target.response_time = item['response_time']
+            target.total_checks, target.up_checks, target.down_checks = item['counts']
+            target.latency = LatencySketch.from_dict(item['latency'])
+            target.uptime = UptimeTracker.from_dict(item['uptime'])
+            for timestamp, status_change, details, target_type in item['history']:
+                target.history.append({
+                    'timestamp': parse_timestamp(timestamp),
+                    'status_change': status_change,
+                    'details': details,
+                    'type': target_type
+                })
+            aggregator.targets[name] = target
+
+        return aggregator
+
+
+def aggregate_log_files(log_files: Iterable[str], since: Optional[datetime] = None,
+                        cache: Optional[LogCheckpointCache] = None,
+                        history_limit: int = 50, recent_limit: int = 100,
+                        workers: Optional[int] = None) -> LogAggregator:
+    """
+    Aggregate log files, reusing per-file checkpoints when a cache is given.
+
+    Files that need parsing are fanned out to a process pool, each worker
+    returning a partial aggregate. Partials are merged oldest file first,
+    so the result does not depend on which worker finishes first.
+
+    A cached aggregate covers its whole file, so a file with entries older
+    than `since` is re-aggregated with the cutoff applied instead, starting
+    from the last point of the checkpoint's offset index before `since`.
+
+    Args:
+        log_files: Log file paths
+        since: Start of the statistics window
+        cache: Optional checkpoint cache
+        history_limit: Maximum number of history items kept per target
+        recent_limit: Maximum number of recent entries kept overall
+        workers: Number of worker processes. None picks one per CPU when
+            there is enough unparsed data to outweigh the pool start-up cost;
+            1 parses in the calling process.
+
+    Returns:
+        Aggregator covering all files
+    """
+    log_files = sorted(log_files)
+    partials: List[Optional[LogAggregator]] = [None] * len(log_files)
+
+    # Pass 1: bring each file's checkpointed aggregate up to date
+    if cache is not None:
+        tasks = {}
+        for index, log_file in enumerate(log_files):
+            base, offset = _restore_checkpoint(cache, log_file, history_limit, recent_limit)
+            if base is not None and _is_fully_parsed(log_file, offset):
+                partials[index] = base
+            else:
+                if base is None:
+                    base = LogAggregator(history_limit=history_limit, recent_limit=recent_limit, indexed=True)
+                tasks[index] = (log_file, base, offset)
+
+        for index, (aggregator, new_offset) in _run_tasks(tasks, workers).items():
+            cache.put(log_files[index], new_offset, aggregator.to_dict())
+            partials[index] = aggregator
+
+    # Pass 2: files without a usable whole-file aggregate are folded with the
+    # cutoff, from the checkpoint's last index point before it when there is one
+    tasks = {}
+    prefixes: Dict[int, LogAggregator] = {}
+    for index, log_file in enumerate(log_files):
+        partial = partials[index]
+        if partial is None or (since is not None and partial.first_timestamp is not None
+                               and partial.first_timestamp < since):
+            partials[index] = None
+            offset = 0
+            if partial is not None and since is not None:
+                offset, statuses = partial.seek_point(since)
+                if offset:
+                    prefixes[index] = partial.window_prefix(since, statuses)
+            tasks[index] = (log_file, LogAggregator(since=since, history_limit=history_limit,
+                                                    recent_limit=recent_limit), offset)
+
+    for index, (aggregator, _) in _run_tasks(tasks, workers).items():
+        prefix = prefixes.get(index)
+        if prefix is not None:
+            aggregator.recent.clear()
+            prefix.merge(aggregator)
+            aggregator = prefix
+        partials[index] = aggregator
+
+    result = LogAggregator(since=since, history_limit=history_limit, recent_limit=recent_limit)
+    for partial in partials:
+        result.merge(partial)
+    return result
+
+
+def _restore_checkpoint(cache: LogCheckpointCache, log_file: str, history_limit: int,
+                        recent_limit: int) -> Tuple[Optional[LogAggregator], int]:
+    """Restore a file's checkpointed aggregate and offset, if usable."""
+    checkpoint = cache.get(log_file)
+    if checkpoint is None:
+        return None, 0
+    try:
+        aggregator = LogAggregator.from_dict(checkpoint['state'])
+    except (ValueError, KeyError, TypeError):
+        return None, 0
+    if aggregator.history_limit != history_limit or aggregator.recent_limit != recent_limit:
+        return None, 0
+    return aggregator, checkpoint['offset']
+
+
+def _is_fully_parsed(log_file: str, offset: int) -> bool:
+    """Check whether a checkpoint already covers the whole file."""
+    try:
+        return os.path.getsize(log_file) == offset
+    except OSError:
+        return True
+
+
+def _fold_file(log_file: str, aggregator: LogAggregator, offset: int) -> Tuple[LogAggregator, int]:
+    """Worker entry point: fold a log file from an offset into a partial aggregate."""
+    if aggregator.index is None:
+        return aggregator, fold_log_file(log_file, aggregator, LogAggregator.add, offset)
+    new_offset = fold_log_file(log_file, aggregator, LogAggregator.add, offset, LogAggregator.mark)
+    aggregator.mark(new_offset, force=True)
+    return aggregator, new_offset
+
+
+def _run_tasks(tasks: Dict[int, Tuple[str, LogAggregator, int]],
+               workers: Optional[int]) -> Dict[int, Tuple[LogAggregator, int]]:
+    """Run fold tasks, in a process pool when worthwhile, keyed by file index."""
+    if not tasks:
+        return {}
+
+    if workers is None:
+        pending_bytes = 0
+        for log_file, _, offset in tasks.values():
+            try:
+                pending_bytes += max(0, os.path.getsize(log_file) - offset)
+            except OSError:
+                pass
+        workers = (os.cpu_count() or 1) if pending_bytes >= PARALLEL_MIN_BYTES else 1
+
+    workers = min(workers, len(tasks))
+    if workers <= 1:
+        return {index: _fold_file(*task) for index, task in tasks.items()}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {index: executor.submit(_fold_file, *task) for index, task in tasks.items()}
+        return {index: future.result() for index, future in futures.items()}
+
+
+def _newest(first: Iterable, second: Iterable, limit: int, key) -> List:
+    """Return the `limit` newest items of two sequences in chronological order."""
+    items = sorted(list(first) + list(second), key=key)
+    return items[-limit:]
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _parse_optional(value: Optional[str]) -> Optional[datetime]:
+    return parse_timestamp(value) if value else None
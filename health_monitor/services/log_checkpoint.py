@@ -0,0 +1,226 @@
+"""
+Incremental parsing of the JSON-lines health monitor logs.
+Keeps a persistent checkpoint per log file so that repeated dashboard
+generation only parses the lines appended since the previous run.
+"""
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, Optional
+
+
+CACHE_FORMAT_VERSION = 1
+
+# Number of leading bytes hashed to detect a log file that was replaced
+# rather than appended to.
+FINGERPRINT_BYTES = 256
+
+
+class LogCheckpointCache:
+    """Persistent cache of parsed state and byte offsets keyed by log file."""
+
+    def __init__(self, cache_file: str, namespace: str = "default"):
+        """
+        Initialize the checkpoint cache.
+
+        Args:
+            cache_file: Path of the JSON file used to persist checkpoints
+            namespace: Identifier of the state format stored in the cache.
+                Checkpoints written under a different namespace are discarded.
+        """
+        self.cache_file = cache_file
+        self.namespace = namespace
+        self._checkpoints: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load checkpoints from the cache file, ignoring unusable caches."""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict):
+            return
+        if data.get("version") != CACHE_FORMAT_VERSION or data.get("namespace") != self.namespace:
+            return
+
+        files = data.get("files")
+        if isinstance(files, dict):
+            self._checkpoints = files
+
+    def save(self) -> None:
+        """Persist checkpoints atomically if anything changed."""
+        if not self._dirty:
+            return
+
+        data = {
+            "version": CACHE_FORMAT_VERSION,
+            "namespace": self.namespace,
+            "files": self._checkpoints
+        }
+
+        tmp_file = f"{self.cache_file}.tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+        except OSError as e:
+            print(f"チェックポイントキャッシュを書き込めません: {self.cache_file}: {e}")
+
+    def get(self, log_file: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a usable checkpoint for a log file.
+
+        A checkpoint is usable when the file still has the same size and
+        mtime (nothing to parse), or when it has grown and its leading bytes
+        are unchanged (only the appended part needs parsing).
+
+        Args:
+            log_file: Path of the log file
+
+        Returns:
+            Checkpoint dictionary with 'offset' and 'state', or None
+        """
+        checkpoint = self._checkpoints.get(self._key(log_file))
+        if checkpoint is None:
+            return None
+
+        try:
+            stat = os.stat(log_file)
+        except OSError:
+            return None
+
+        if stat.st_size == checkpoint["size"] and stat.st_mtime == checkpoint["mtime"]:
+            return checkpoint
+
+        if (stat.st_size >= checkpoint["offset"] and
+                _fingerprint(log_file, checkpoint["offset"]) == checkpoint["fingerprint"]):
+            return checkpoint
+
+        return None
+
+    def put(self, log_file: str, offset: int, state: Any) -> None:
+        """
+        Store a checkpoint for a log file.
+
+        Args:
+            log_file: Path of the log file
+            offset: Byte offset up to which the file has been parsed
+            state: JSON-serializable state derived from the parsed lines
+        """
+        try:
+            stat = os.stat(log_file)
+        except OSError:
+            return
+
+        self._checkpoints[self._key(log_file)] = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "offset": offset,
+            "fingerprint": _fingerprint(log_file, offset),
+            "state": state
+        }
+        self._dirty = True
+
+    def prune(self, log_files) -> None:
+        """
+        Drop checkpoints of log files that no longer exist.
+
+        Args:
+            log_files: Iterable of log file paths that are still present
+        """
+        keep = {self._key(path) for path in log_files}
+        stale = [key for key in self._checkpoints if key not in keep]
+        for key in stale:
+            del self._checkpoints[key]
+        if stale:
+            self._dirty = True
+
+    def fold(self, log_file: str, new_state: Callable[[], Any],
+             feed: Callable[[Any, Dict[str, Any]], None]) -> Any:
+        """
+        Fold a log file into a state, parsing only lines appended since the last checkpoint.
+
+        Args:
+            log_file: Path of the log file
+            new_state: Factory returning an empty state
+            feed: Function applying one parsed log entry to the state in place
+
+        Returns:
+            The state covering every complete line of the file
+        """
+        checkpoint = self.get(log_file)
+        if checkpoint is not None:
+            state = checkpoint["state"]
+            offset = checkpoint["offset"]
+        else:
+            state = new_state()
+            offset = 0
+
+        new_offset = fold_log_file(log_file, state, feed, offset)
+        if checkpoint is None or new_offset != offset:
+            self.put(log_file, new_offset, state)
+
+        return state
+
+    @staticmethod
+    def _key(log_file: str) -> str:
+        return os.path.abspath(log_file)
+
+
+def fold_log_file(log_file: str, state: Any, feed: Callable[[Any, Dict[str, Any]], None],
+                  offset: int = 0, on_offset: Optional[Callable[[Any, int], None]] = None) -> int:
+    """
+    Feed every complete JSON line of a log file, starting at a byte offset, into a state.
+
+    A trailing line without a newline is left unread so that a line still
+    being written by the monitor is picked up on the next run.
+
+    Args:
+        log_file: Path of the log file
+        state: State passed to feed
+        feed: Function applying one parsed log entry to the state in place
+        offset: Byte offset to start reading from
+        on_offset: Called with the state and the offset just past each fed
+            entry, for states that index their position in the file
+
+    Returns:
+        Byte offset just past the last complete line
+    """
+    try:
+        with open(log_file, 'rb') as f:
+            f.seek(offset)
+            for raw_line in f:
+                if not raw_line.endswith(b'\n'):
+                    break
+                offset += len(raw_line)
+
+                line = raw_line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line.decode('utf-8'))
+                except (ValueError, UnicodeDecodeError):
+                    continue
+                if isinstance(entry, dict) and 'timestamp' in entry:
+                    feed(state, entry)
+                    if on_offset is not None:
+                        on_offset(state, offset)
+    except FileNotFoundError:
+        print(f"ログファイルが見つかりません: {log_file}")
+
+    return offset
+
+
+def _fingerprint(log_file: str, parsed_bytes: int) -> str:
+    """Hash the leading bytes of the already parsed part of a file."""
+    try:
+        with open(log_file, 'rb') as f:
+            head = f.read(min(parsed_bytes, FINGERPRINT_BYTES))
+    except OSError:
+        return ""
+    return hashlib.sha1(head).hexdigest()
@@ -0,0 +1,244 @@
+"""
+Paginated queries over the health monitor log history.
+Daily log files are selected by the date in their name and read backwards,
+newest entry first, so a page only touches the files and bytes it needs.
+Every request stops after a fixed number of bytes and returns a cursor to
+resume from, which keeps the response time bounded however many days of
+logs exist.
+"""
+import json
+import os
+import re
+from datetime import datetime, date
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from health_monitor.services.log_aggregator import parse_timestamp
+
+
+LOG_FILE_PATTERN = re.compile(r"^health_monitor_(\d{8})\.log$")
+
+# Entries returned per page when no limit is given, and the upper bound.
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Bytes of log data read per request before returning a partial page.
+DEFAULT_SCAN_BUDGET = 8 * 1024 * 1024
+
+# Size of the blocks read when scanning a file backwards.
+READ_BLOCK_SIZE = 64 * 1024
+
+
+class LogQuery:
+    """Newest-first, cursor-paginated queries over daily log files."""
+
+    def __init__(self, log_dir: str = "logs", scan_budget: int = DEFAULT_SCAN_BUDGET):
+        """
+        Initialize the query service.
+
+        Args:
+            log_dir: Directory containing health_monitor_YYYYMMDD.log files
+            scan_budget: Maximum number of bytes read per query
+        """
+        self.log_dir = log_dir
+        self.scan_budget = scan_budget
+
+    def query(self, target: Optional[str] = None, start: Optional[datetime] = None,
+              end: Optional[datetime] = None, status: Optional[str] = None,
+              limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get one page of log entries, newest first.
+
+        Args:
+            target: Only entries of this target
+            start: Only entries at or after this time; an aware time is
+                converted to local time, which the log timestamps use
+            end: Only entries at or before this time, converted likewise
+            status: Only entries whose new status matches (e.g. 'down')
+            limit: Maximum number of entries in the page
+            cursor: Cursor returned by the previous page
+
+        Returns:
+            Dictionary with 'entries', 'next_cursor' (None when the history
+            is exhausted) and 'scanned_bytes'. A page can hold fewer than
+            `limit` entries when the scan budget ran out; keep following
+            `next_cursor` until it is None.
+
+        Raises:
+            ValueError: If the cursor or limit is invalid
+        """
+        if limit < 1 or limit > MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+        position = decode_cursor(cursor) if cursor else None
+        start = _local_naive(start)
+        end = _local_naive(end)
+        target_bytes = json.dumps(target, ensure_ascii=False).encode('utf-8') if target else None
+
+        entries: List[Dict[str, Any]] = []
+        scanned = 0
+
+        for file_date, path in self._files_newest_first(start, end, position):
+            offset = None
+            if position is not None and position[0] == file_date:
+                offset = position[1]
+
+            for line_start, raw_line in _read_lines_backwards(path, offset):
+                scanned += len(raw_line) + 1
+                next_position = (file_date, line_start)
+
+                if target_bytes is not None and target_bytes not in raw_line:
+                    entry = None
+                else:
+                    entry = _decode(raw_line)
+
+                if entry is not None:
+                    timestamp = _local_naive(parse_timestamp(entry['timestamp']))
+                    if start is not None and timestamp < start:
+                        # Files are chronological, so everything older is out of range too
+                        return _page(entries, None, scanned)
+                    if _matches(entry, timestamp, target, end, status):
+                        entries.append(entry)
+                        if len(entries) >= limit:
+                            return _page(entries, next_position, scanned)
+
+                if scanned >= self.scan_budget:
+                    return _page(entries, next_position, scanned)
+
+        return _page(entries, None, scanned)
+
+    def _files_newest_first(self, start: Optional[datetime], end: Optional[datetime],
+                            position: Optional[Tuple[str, int]]) -> Iterator[Tuple[str, str]]:
+        """Yield (YYYYMMDD, path) of the daily files that can hold matching entries."""
+        try:
+            names = os.listdir(self.log_dir)
+        except OSError:
+            return
+
+        files = []
+        for name in names:
+            match = LOG_FILE_PATTERN.match(name)
+            if match:
+                files.append((match.group(1), os.path.join(self.log_dir, name)))
+        files.sort(reverse=True)
+
+        first_day = _day_key(start.date()) if start is not None else None
+        last_day = _day_key(end.date()) if end is not None else None
+
+        for file_date, path in files:
+            if position is not None and file_date > position[0]:
+                continue
+            if last_day is not None and file_date > last_day:
+                continue
+            if first_day is not None and file_date < first_day:
+                break
+            yield file_date, path
+
+
+def encode_cursor(file_date: str, offset: int) -> str:
+    """Encode a resume position as an opaque cursor string."""
+    return f"{file_date}-{offset}"
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    match = re.fullmatch(r"(\d{8})-(\d+)", cursor or "")
+    if not match:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return match.group(1), int(match.group(2))
+
+
+def _read_lines_backwards(path: str, end_offset: Optional[int] = None) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield (start offset, line) of non-empty lines, last line first.
+
+    Reading starts at end_offset, which must be a line boundary, or at the
+    end of the file. A trailing line without a newline is still being
+    written and is skipped.
+    """
+    try:
+        f = open(path, 'rb')
+    except OSError:
+        return
+
+    with f:
+        partial = end_offset is None
+        if partial:
+            f.seek(0, os.SEEK_END)
+            end_offset = f.tell()
+
+        # buffer always holds the bytes [position, boundary) where boundary
+        # is the end of a complete line
+        position = end_offset
+        buffer = b""
+        while position > 0:
+            read_size = min(READ_BLOCK_SIZE, position)
+            position -= read_size
+            f.seek(position)
+            buffer = f.read(read_size) + buffer
+
+            if partial:
+                newline = buffer.rfind(b"\n")
+                if newline < 0:
+                    continue
+                buffer = buffer[:newline + 1]
+                partial = False
+
+            while True:
+                body = buffer[:-1] if buffer.endswith(b"\n") else buffer
+                newline = body.rfind(b"\n")
+                if newline < 0:
+                    break
+                line = body[newline + 1:]
+                if line.strip():
+                    yield position + newline + 1, line
+                buffer = buffer[:newline + 1]
+
+        if not partial:
+            line = buffer.rstrip(b"\n")
+            if line.strip():
+                yield 0, line
+
+
+def _decode(raw_line: bytes) -> Optional[Dict[str, Any]]:
+    try:
+        entry = json.loads(raw_line.decode('utf-8'))
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if isinstance(entry, dict) and 'timestamp' in entry:
+        return entry
+    return None
+
+
+def _local_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert an aware time to naive local time so it compares with the log timestamps."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+def _matches(entry: Dict[str, Any], timestamp: datetime, target: Optional[str],
+             end: Optional[datetime], status: Optional[str]) -> bool:
+    if target is not None and entry.get('target_name') != target:
+        return False
+    if end is not None and timestamp > end:
+        return False
+    if status is not None and (entry.get('status_change') or '').split('->')[-1] != status:
+        return False
+    return True
+
+
+def _page(entries: List[Dict[str, Any]], position: Optional[Tuple[str, int]], scanned: int) -> Dict[str, Any]:
+    return {
+        'entries': entries,
+        'next_cursor': encode_cursor(*position) if position is not None else None,
+        'scanned_bytes': scanned
+    }
+
+
+def _day_key(day: date) -> str:
+    return day.strftime('%Y%m%d')
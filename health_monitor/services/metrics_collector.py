@@ -0,0 +1,143 @@
+"""
+Non-blocking system metrics collection for self-monitoring.
+CPU usage is measured as the delta since the previous sample instead of
+sleeping through a measurement window, each metric has its own sampling
+interval, and the monitor's own process is preferred over machine-wide
+scans such as enumerating every PID.
+"""
+import logging
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+import psutil
+
+
+# Metrics collected when no explicit set is configured. 'process_count'
+# walks every process on the machine and is therefore opt-in.
+DEFAULT_METRICS = (
+    'cpu_percent',
+    'memory',
+    'disk',
+    'process_cpu_percent',
+    'process_rss_mb',
+    'process_open_fds',
+    'thread_count',
+)
+
+# Minimum seconds between samples of a metric; metrics not listed are
+# sampled on every collection.
+DEFAULT_INTERVALS = {
+    'disk': 300.0,
+    'process_count': 300.0,
+}
+
+
+class MetricsCollector:
+    """Collects a configurable set of metrics without blocking the caller."""
+
+    def __init__(self, metrics: Optional[Iterable[str]] = None,
+                 intervals: Optional[Dict[str, float]] = None,
+                 disk_path: str = '/'):
+        """
+        Initialize the collector.
+
+        Args:
+            metrics: Names of the metrics to collect; defaults to DEFAULT_METRICS
+            intervals: Per-metric minimum sampling interval in seconds,
+                overriding DEFAULT_INTERVALS
+            disk_path: Path whose filesystem usage is reported
+
+        Raises:
+            ValueError: If an unknown metric name is given
+        """
+        self.logger = logging.getLogger(__name__)
+        self.disk_path = disk_path
+        self._process = psutil.Process()
+
+        self._samplers: Dict[str, Callable[[], Dict[str, float]]] = {
+            'cpu_percent': self._sample_cpu_percent,
+            'memory': self._sample_memory,
+            'disk': self._sample_disk,
+            'process_cpu_percent': self._sample_process_cpu_percent,
+            'process_rss_mb': self._sample_process_rss,
+            'process_open_fds': self._sample_process_open_fds,
+            'thread_count': self._sample_thread_count,
+            'process_count': self._sample_process_count,
+        }
+
+        self.metrics = tuple(metrics) if metrics is not None else DEFAULT_METRICS
+        unknown = [name for name in self.metrics if name not in self._samplers]
+        if unknown:
+            raise ValueError(f"Unknown metrics: {', '.join(unknown)}")
+
+        self.intervals = dict(DEFAULT_INTERVALS)
+        if intervals:
+            self.intervals.update(intervals)
+
+        self._values: Dict[str, float] = {}
+        self._last_sampled: Dict[str, float] = {}
+
+        # CPU percentages are deltas since the previous call; prime them so
+        # the first collection reports a real value.
+        if 'cpu_percent' in self.metrics:
+            psutil.cpu_percent(interval=None)
+        if 'process_cpu_percent' in self.metrics:
+            self._process.cpu_percent(interval=None)
+
+    def collect(self) -> Dict[str, float]:
+        """
+        Sample every metric whose interval has elapsed.
+
+        Metrics that are not due keep their previous value, and a metric
+        that fails to sample is logged and left out until it succeeds.
+
+        Returns:
+            Dictionary of the latest value of each collected field
+        """
+        now = time.monotonic()
+        for name in self.metrics:
+            last = self._last_sampled.get(name)
+            if last is not None and now - last < self.intervals.get(name, 0.0):
+                continue
+            try:
+                self._values.update(self._samplers[name]())
+                self._last_sampled[name] = now
+            except (psutil.Error, OSError, AttributeError) as e:
+                self.logger.warning(f"Failed to sample metric {name}: {e}")
+        return dict(self._values)
+
+    def _sample_cpu_percent(self) -> Dict[str, float]:
+        return {'cpu_percent': psutil.cpu_percent(interval=None)}
+
+    def _sample_memory(self) -> Dict[str, float]:
+        memory = psutil.virtual_memory()
+        return {
+            'memory_percent': memory.percent,
+            'memory_used_mb': memory.used / (1024 * 1024),
+            'memory_available_mb': memory.available / (1024 * 1024),
+        }
+
+    def _sample_disk(self) -> Dict[str, float]:
+        disk = psutil.disk_usage(self.disk_path)
+        return {
+            'disk_usage_percent': (disk.used / disk.total) * 100,
+            'disk_free_gb': disk.free / (1024 * 1024 * 1024),
+        }
+
+    def _sample_process_cpu_percent(self) -> Dict[str, float]:
+        return {'process_cpu_percent': self._process.cpu_percent(interval=None)}
+
+    def _sample_process_rss(self) -> Dict[str, float]:
+        return {'process_rss_mb': self._process.memory_info().rss / (1024 * 1024)}
+
+    def _sample_process_open_fds(self) -> Dict[str, float]:
+        # Windows has handles instead of file descriptors
+        if hasattr(self._process, 'num_fds'):
+            return {'process_open_fds': self._process.num_fds()}
+        return {'process_open_fds': self._process.num_handles()}
+
+    def _sample_thread_count(self) -> Dict[str, float]:
+        return {'thread_count': self._process.num_threads()}
+
+    def _sample_process_count(self) -> Dict[str, float]:
+        return {'process_count': len(psutil.pids())}
@@ -0,0 +1,184 @@
+"""
+OpenMetrics text exposition of the health monitor's state.
+Every value is read from counters and histograms the engine and self-monitor
+already maintain in memory, so rendering a scrape costs O(targets) and
+never reads log files.
+"""
+import math
+from typing import Any, Callable, Dict, List, Optional
+
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+METRIC_PREFIX = "healthmonitor"
+
+
+class OpenMetricsExporter:
+    """Renders health engine state in the OpenMetrics text format."""
+
+    def __init__(self, health_engine, target_type_resolver: Optional[Callable[[str], str]] = None):
+        """
+        Initialize the exporter.
+
+        Args:
+            health_engine: HealthCheckEngine whose state is exposed
+            target_type_resolver: Function mapping a target name to its type
+        """
+        self.health_engine = health_engine
+        self.target_type_resolver = target_type_resolver or (lambda name: "unknown")
+
+    def render(self) -> str:
+        """
+        Render all metrics.
+
+        Returns:
+            OpenMetrics text ending with '# EOF'
+        """
+        writer = _MetricWriter()
+        self._render_targets(writer)
+        self._render_checks(writer)
+        self._render_latency(writer)
+        self._render_resilience(writer)
+        self._render_worker_pool(writer)
+        self._render_scheduling(writer)
+        return writer.finish()
+
+    def _render_targets(self, writer: '_MetricWriter') -> None:
+        statuses = self.health_engine.get_current_statuses()
+
+        writer.family("target_up", "gauge", "Whether the last check of the target succeeded.")
+        for name, status in sorted(statuses.items()):
+            writer.sample("target_up", {"target": name, "type": self.target_type_resolver(name)},
+                          1 if status.is_healthy else 0)
+
+        writer.family("target_response_time_seconds", "gauge", "Response time of the last check.", unit="seconds")
+        for name, status in sorted(statuses.items()):
+            writer.sample("target_response_time_seconds",
+                          {"target": name, "type": self.target_type_resolver(name)},
+                          status.response_time)
+
+    def _render_checks(self, writer: '_MetricWriter') -> None:
+        self_monitor = getattr(self.health_engine, 'self_monitor', None)
+        if self_monitor is None:
+            return
+        stats = self_monitor.get_target_check_stats()
+
+        writer.family("checks", "counter", "Health checks performed per target and result.")
+        for name, target in sorted(stats.items()):
+            writer.sample("checks_total", {"target": name, "result": "success"}, target["successful"])
+            writer.sample("checks_total", {"target": name, "result": "failure"}, target["failed"])
+
+    def _render_latency(self, writer: '_MetricWriter') -> None:
+        _render_histograms(writer, "check_latency_seconds", "Health check response time.",
+                           self.health_engine.latency_histograms)
+
+    def _render_resilience(self, writer: '_MetricWriter') -> None:
+        stats = self.health_engine.get_resilience_stats()
+
+        writer.family("retries", "counter", "Retries performed after a failed check attempt.")
+        for check_type, count in sorted(stats["retries"].items()):
+            writer.sample("retries_total", {"check_type": check_type}, count)
+
+        breakers = sorted(stats["circuit_breakers"].items())
+        writer.family("circuit_breaker_open", "gauge", "Whether the target's circuit breaker is open.")
+        for name, breaker in breakers:
+            writer.sample("circuit_breaker_open", {"target": name, "check_type": breaker["check_type"]},
+                          1 if breaker["state"] == "OPEN" else 0)
+
+        writer.family("circuit_breaker_opened", "counter", "Times the target's circuit breaker opened.")
+        for name, breaker in breakers:
+            writer.sample("circuit_breaker_opened_total", {"target": name, "check_type": breaker["check_type"]},
+                          breaker["opened"])
+
+        writer.family("circuit_breaker_rejected", "counter", "Checks rejected by an open circuit breaker.")
+        for name, breaker in breakers:
+            writer.sample("circuit_breaker_rejected_total", {"target": name, "check_type": breaker["check_type"]},
+                          breaker["rejected"])
+
+    def _render_worker_pool(self, writer: '_MetricWriter') -> None:
+        pool = self.health_engine.get_worker_pool_stats()
+
+        writer.family("worker_pool_size", "gauge", "Maximum number of concurrent check workers.")
+        writer.sample("worker_pool_size", {}, pool["size"])
+
+        writer.family("worker_pool_busy", "gauge", "Check workers currently running a check.")
+        writer.sample("worker_pool_busy", {}, pool["busy"])
+
+        writer.family("worker_pool_utilization_ratio", "gauge", "Fraction of check workers currently busy.", unit="ratio")
+        writer.sample("worker_pool_utilization_ratio", {}, pool["busy"] / pool["size"] if pool["size"] else 0.0)
+
+    def _render_scheduling(self, writer: '_MetricWriter') -> None:
+        _render_histograms(writer, "check_queue_wait_seconds",
+                           "Time from a check being scheduled to a worker starting it.",
+                           self.health_engine.queue_wait_histograms)
+        _render_histograms(writer, "check_run_time_seconds",
+                           "Time a worker spent running a check, including retries.",
+                           self.health_engine.run_time_histograms)
+
+        cycle = self.health_engine.get_cycle_stats()
+        writer.family("cycles", "counter", "Completed check cycles.")
+        writer.sample("cycles_total", {}, cycle["cycles"])
+
+        writer.family("cycle_overruns", "counter", "Check cycles that took longer than the check interval.")
+        writer.sample("cycle_overruns_total", {}, cycle["overruns"])
+
+        writer.family("cycle_duration_seconds", "gauge", "Duration of the last check cycle.", unit="seconds")
+        if cycle["last_duration"] is not None:
+            writer.sample("cycle_duration_seconds", {}, cycle["last_duration"])
+
+        writer.family("check_interval_seconds", "gauge", "Configured time between check cycles.", unit="seconds")
+        if cycle["check_interval"] is not None:
+            writer.sample("check_interval_seconds", {}, cycle["check_interval"])
+
+
+def _render_histograms(writer: '_MetricWriter', name: str, help_text: str, registry) -> None:
+    """Render a LatencyHistogramRegistry as one histogram family labelled by target and check type."""
+    writer.family(name, "histogram", help_text, unit="seconds")
+    for (check_type, target_name), histogram in sorted(registry.snapshot().items()):
+        labels = {"target": target_name, "check_type": check_type}
+        for bound, cumulative in histogram.cumulative():
+            writer.sample(f"{name}_bucket", dict(labels, le=_format_value(bound)), cumulative)
+        writer.sample(f"{name}_count", labels, histogram.count)
+        writer.sample(f"{name}_sum", labels, histogram.total)
+
+
+class _MetricWriter:
+    """Accumulates exposition lines for metric families and samples."""
+
+    def __init__(self):
+        self._lines: List[str] = []
+
+    def family(self, name: str, metric_type: str, help_text: str, unit: Optional[str] = None) -> None:
+        full_name = f"{METRIC_PREFIX}_{name}"
+        self._lines.append(f"# TYPE {full_name} {metric_type}")
+        if unit:
+            self._lines.append(f"# UNIT {full_name} {unit}")
+        self._lines.append(f"# HELP {full_name} {_escape(help_text)}")
+
+    def sample(self, name: str, labels: Dict[str, Any], value: Any) -> None:
+        if labels:
+            label_text = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+            self._lines.append(f"{METRIC_PREFIX}_{name}{{{label_text}}} {_format_value(value)}")
+        else:
+            self._lines.append(f"{METRIC_PREFIX}_{name} {_format_value(value)}")
+
+    def finish(self) -> str:
+        self._lines.append("# EOF")
+        return "\n".join(self._lines) + "\n"
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
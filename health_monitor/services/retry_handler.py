@@ -3,10 +3,13 @@ Retry handler with exponential backoff for health checks.
 """
 import time
 import random
+import threading
 from typing import Callable, Any, Optional, List, Type
 from datetime import datetime
 import logging
 
+from health_monitor.services import tracing
+
 
 class RetryConfig:
     """Configuration for retry behavior."""
@@ -49,6 +52,10 @@ class RetryHandler:
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
+        
+        # Number of retries performed, for metrics
+        self.retry_count = 0
+        self._count_lock = threading.Lock()
     
     def execute_with_retry(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -70,7 +77,8 @@ class RetryHandler:
         for attempt in range(self.config.max_attempts):
             try:
                 # Execute the function
-                result = func(*args, **kwargs)
+                with tracing.span("retry.attempt", **{"retry.attempt": attempt + 1}):
+                    result = func(*args, **kwargs)
                 
                 # If we get here, the function succeeded
                 if attempt > 0:
@@ -89,11 +97,14 @@ class RetryHandler:
                 # Calculate delay for next attempt
                 if attempt < self.config.max_attempts - 1:  # Don't delay after last attempt
                     delay = self._calculate_delay(attempt)
+                    with self._count_lock:
+                        self.retry_count += 1
                     self.logger.warning(
                         f"Attempt {attempt + 1} failed with {type(e).__name__}: {e}. "
                         f"Retrying in {delay:.2f} seconds..."
                     )
-                    time.sleep(delay)
+                    with tracing.span("retry.backoff", **{"retry.delay": delay}):
+                        time.sleep(delay)
                 else:
                     self.logger.error(f"All {self.config.max_attempts} attempts failed. Last error: {e}")
         
@@ -171,6 +182,10 @@ class CircuitBreaker:
         self.last_failure_time = None
         self.state = 'CLOSED'  # CLOSED, OPEN, HALF_OPEN
         self.logger = logging.getLogger(__name__)
+        
+        # Lifetime counters, for metrics
+        self.open_count = 0
+        self.rejected_count = 0
     
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -188,23 +203,26 @@ class CircuitBreaker:
             CircuitBreakerOpenException: When circuit is open
             Original exception: When function fails
         """
-        if self.state == 'OPEN':
-            if self._should_attempt_reset():
-                self.state = 'HALF_OPEN'
-                self.logger.info("Circuit breaker moving to HALF_OPEN state")
-            else:
-                raise CircuitBreakerOpenException(
-                    f"Circuit breaker is OPEN. Last failure: {self.last_failure_time}"
-                )
-        
-        try:
-            result = func(*args, **kwargs)
-            self._on_success()
-            return result
+        with tracing.span("circuit_breaker", **{"circuit_breaker.state": self.state}) as breaker_span:
+            if self.state == 'OPEN':
+                if self._should_attempt_reset():
+                    self.state = 'HALF_OPEN'
+                    self.logger.info("Circuit breaker moving to HALF_OPEN state")
+                else:
+                    self.rejected_count += 1
+                    breaker_span.set_attribute("circuit_breaker.rejected", True)
+                    raise CircuitBreakerOpenException(
+                        f"Circuit breaker is OPEN. Last failure: {self.last_failure_time}"
+                    )
             
-        except self.expected_exception as e:
-            self._on_failure()
-            raise e
+            try:
+                result = func(*args, **kwargs)
+                self._on_success()
+                return result
+                
+            except self.expected_exception as e:
+                self._on_failure()
+                raise e
     
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset."""
@@ -227,6 +245,8 @@ class CircuitBreaker:
         self.last_failure_time = datetime.now()
         
         if self.failure_count >= self.failure_threshold:
+            if self.state != 'OPEN':
+                self.open_count += 1
             self.state = 'OPEN'
             self.logger.warning(
                 f"Circuit breaker opened after {self.failure_count} failures"
@@ -0,0 +1,149 @@
+"""
+Fixed-capacity ring buffers for self-monitoring history.
+Appending never grows a buffer past its capacity, so memory stays flat
+however long the monitor runs and however many checks it records. Records
+are appended in chronological order, which lets expiry drop entries from
+the oldest end without rebuilding the buffer.
+"""
+import math
+from array import array
+from collections import deque
+from datetime import datetime
+from typing import Deque, Generic, Iterable, Iterator, Optional, TypeVar
+
+
+T = TypeVar('T')
+
+
+class RingBuffer(Generic[T]):
+    """Bounded, time-ordered buffer of records with a `timestamp` attribute."""
+
+    __slots__ = ('_items',)
+
+    def __init__(self, capacity: int):
+        """
+        Initialize an empty buffer.
+
+        Args:
+            capacity: Maximum number of records; the oldest is dropped when full
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self._items: Deque[T] = deque(maxlen=capacity)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of records held."""
+        return self._items.maxlen
+
+    def append(self, item: T) -> None:
+        """Add a record, dropping the oldest one when the buffer is full."""
+        self._items.append(item)
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Add several records in order."""
+        self._items.extend(items)
+
+    def expire(self, cutoff: datetime) -> int:
+        """
+        Drop records at or before the cutoff time.
+
+        Args:
+            cutoff: Records with a timestamp not after this are removed
+
+        Returns:
+            Number of records removed
+        """
+        removed = 0
+        items = self._items
+        while items and items[0].timestamp <= cutoff:
+            items.popleft()
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove all records."""
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __getitem__(self, index: int) -> T:
+        return self._items[index]
+
+
+class NumericRingBuffer:
+    """Bounded buffer of floats backed by a preallocated array."""
+
+    __slots__ = ('_values', '_start', '_size')
+
+    def __init__(self, capacity: int):
+        """
+        Initialize an empty buffer.
+
+        Args:
+            capacity: Maximum number of values; the oldest is overwritten when full
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self._values = array('d', bytes(8 * capacity))
+        self._start = 0
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of values held."""
+        return len(self._values)
+
+    def append(self, value: float) -> None:
+        """Add a value, overwriting the oldest one when the buffer is full."""
+        capacity = len(self._values)
+        if self._size < capacity:
+            self._values[(self._start + self._size) % capacity] = value
+            self._size += 1
+        else:
+            self._values[self._start] = value
+            self._start = (self._start + 1) % capacity
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Add several values in order."""
+        for value in values:
+            self.append(value)
+
+    def mean(self) -> Optional[float]:
+        """Mean of the values held, or None when empty."""
+        if not self._size:
+            return None
+        # An exact sum at read time; a running sum would drift over a long run
+        if self._size == len(self._values):
+            return math.fsum(self._values) / self._size
+        return math.fsum(self._values[:self._size]) / self._size
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[float]:
+        capacity = len(self._values)
+        for offset in range(self._size):
+            yield self._values[(self._start + offset) % capacity]
+
+    def __getitem__(self, index: int) -> float:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ring buffer index out of range")
+        return self._values[(self._start + index) % len(self._values)]
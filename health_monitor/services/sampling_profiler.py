@@ -0,0 +1,255 @@
+"""
+Sampling profiler that can be switched on in a running monitor.
+A background thread periodically snapshots the stack of every other
+thread with sys._current_frames() and counts identical stacks. Nothing is
+traced between samples, so the cost is bounded by the sampling rate, and
+the result is written in the collapsed-stack format understood by
+flamegraph.pl, speedscope and similar tools.
+"""
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+
+# Seconds between stack samples.
+DEFAULT_SAMPLE_INTERVAL = 0.01
+
+# Seconds a profiling session runs unless stopped earlier, and the upper bound.
+DEFAULT_DURATION = 30.0
+MAX_DURATION = 600.0
+
+# Worker threads of successive executors share one root frame.
+_POOL_THREAD_NAME = re.compile(r"^(.*?)-\d+_\d+$")
+
+
+class SamplingProfiler:
+    """Collects collapsed stack samples from all threads for a fixed duration."""
+
+    def __init__(self, output_dir: str = "logs", interval: float = DEFAULT_SAMPLE_INTERVAL):
+        """
+        Initialize an idle profiler.
+
+        Args:
+            output_dir: Directory the collapsed-stack files are written to
+            interval: Seconds between samples
+        """
+        self.output_dir = output_dir
+        self.interval = interval
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stacks: Counter = Counter()
+        self._sample_count = 0
+        self._started_at: Optional[datetime] = None
+        self._duration = 0.0
+        self._toggle_pipe: Optional[Tuple[int, int]] = None
+        self.last_output_path: Optional[str] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether a profiling session is in progress."""
+        with self._lock:
+            return self._thread is not None and self._thread.is_alive()
+
+    def start(self, duration: float = DEFAULT_DURATION) -> bool:
+        """
+        Start a profiling session in the background.
+
+        Args:
+            duration: Seconds to sample before writing the profile
+
+        Returns:
+            True if a session was started, False if one is already running
+
+        Raises:
+            ValueError: If the duration is not in (0, MAX_DURATION]
+        """
+        if not 0 < duration <= MAX_DURATION:
+            raise ValueError(f"duration must be between 0 and {MAX_DURATION:g} seconds")
+
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self._stop_event.clear()
+            self._stacks = Counter()
+            self._sample_count = 0
+            self._started_at = datetime.now()
+            self._duration = duration
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(duration,),
+                daemon=True,
+                name="SamplingProfiler"
+            )
+            self._thread.start()
+
+        self.logger.info(f"Sampling profiler started for {duration:g}s")
+        return True
+
+    def stop(self, wait: bool = True) -> Optional[str]:
+        """
+        End the running session early; the samples so far are still written.
+
+        Args:
+            wait: Block until the profile file has been written
+
+        Returns:
+            Path of the written profile when waiting, otherwise the previous one
+        """
+        self._stop_event.set()
+        with self._lock:
+            thread = self._thread
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join()
+        return self.last_output_path
+
+    def toggle(self, duration: float = DEFAULT_DURATION) -> bool:
+        """
+        Stop the running session, or start one if none is running.
+
+        Stopping does not wait for the profile to be written. Signal handlers
+        use request_toggle() instead, since this takes the profiler lock.
+
+        Args:
+            duration: Seconds to sample when starting
+
+        Returns:
+            True if a session was started, False if one was stopped
+        """
+        if self.is_running:
+            self.stop(wait=False)
+            return False
+        return self.start(duration)
+
+    def start_toggle_listener(self) -> None:
+        """
+        Start the thread that carries out request_toggle() calls.
+
+        Requests are passed through a pipe, so the caller of request_toggle()
+        never takes a lock; the listener runs toggle() once per request.
+        """
+        if self._toggle_pipe is not None:
+            return
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(write_fd, False)
+        self._toggle_pipe = (read_fd, write_fd)
+        threading.Thread(
+            target=self._listen_for_toggles,
+            args=(read_fd,),
+            daemon=True,
+            name="SamplingProfilerToggle"
+        ).start()
+
+    def stop_toggle_listener(self) -> None:
+        """Stop the thread started by start_toggle_listener()."""
+        pipe, self._toggle_pipe = self._toggle_pipe, None
+        if pipe is not None:
+            # The listener sees end of file and closes the read end
+            os.close(pipe[1])
+
+    def request_toggle(self) -> None:
+        """
+        Ask the toggle listener to start or stop a session.
+
+        Safe to call from a signal handler, including one that interrupts a
+        toggle in progress: only a byte is written to the listener's pipe.
+        Does nothing unless start_toggle_listener() was called.
+        """
+        pipe = self._toggle_pipe
+        if pipe is None:
+            return
+        try:
+            os.write(pipe[1], b'\0')
+        except OSError:
+            # Pipe full of pending requests or listener stopped
+            pass
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get the state of the profiler.
+
+        Returns:
+            Dictionary with 'running', 'started_at', 'duration', 'samples'
+            and 'last_output'
+        """
+        with self._lock:
+            running = self._thread is not None and self._thread.is_alive()
+            return {
+                'running': running,
+                'started_at': self._started_at.isoformat() if self._started_at else None,
+                'duration': self._duration,
+                'samples': self._sample_count,
+                'last_output': self.last_output_path
+            }
+
+    def _listen_for_toggles(self, read_fd: int) -> None:
+        try:
+            while os.read(read_fd, 1):
+                try:
+                    self.toggle()
+                except Exception as e:
+                    self.logger.error(f"Failed to toggle sampling profiler: {e}")
+        finally:
+            os.close(read_fd)
+
+    def _run(self, duration: float) -> None:
+        deadline = time.monotonic() + duration
+        own_ident = threading.get_ident()
+        while time.monotonic() < deadline and not self._stop_event.wait(self.interval):
+            self._sample(own_ident)
+
+        try:
+            self.last_output_path = self._write()
+            self.logger.info(f"Sampling profile written to {self.last_output_path}")
+        except OSError as e:
+            self.logger.error(f"Failed to write sampling profile: {e}")
+
+    def _sample(self, own_ident: int) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        frames = sys._current_frames()
+        stacks = []
+        for ident, frame in frames.items():
+            if ident == own_ident:
+                continue
+            stacks.append(_collapse(_thread_label(names.get(ident, str(ident))), frame))
+
+        with self._lock:
+            self._stacks.update(stacks)
+            self._sample_count += 1
+
+    def _write(self) -> str:
+        os.makedirs(self.output_dir, exist_ok=True)
+        timestamp = (self._started_at or datetime.now()).strftime('%Y%m%d_%H%M%S')
+        path = os.path.join(self.output_dir, f"profile_{timestamp}.collapsed")
+
+        with self._lock:
+            stacks = self._stacks.most_common()
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in stacks:
+                f.write(f"{stack} {count}\n")
+        return path
+
+
+def _thread_label(name: str) -> str:
+    match = _POOL_THREAD_NAME.match(name)
+    return match.group(1) if match else name
+
+
+def _collapse(thread_name: str, frame) -> str:
+    """Render a stack as 'thread;outermost;...;innermost'."""
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    frames.append(thread_name)
+    frames.reverse()
+    return ";".join(part.replace(";", ":") for part in frames)
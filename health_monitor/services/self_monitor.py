@@ -1,16 +1,27 @@
 """
 Self-monitoring and diagnostics for the health monitor application.
 """
-import psutil
 import threading
 import time
 import logging
+import math
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 import json
 import os
 
+from health_monitor.services.latency_sketch import LatencySketch
+from health_monitor.services.metrics_collector import MetricsCollector
+from health_monitor.services.ring_buffer import NumericRingBuffer, RingBuffer
+
+
+# Number of recent response times averaged for ApplicationMetrics.
+RESPONSE_TIME_WINDOW = 100
+
+# Upper bound on stored diagnostics, which can arrive in bursts.
+MAX_DIAGNOSTICS = 10000
+
 
 @dataclass
 class SystemMetrics:
@@ -24,6 +35,9 @@ class SystemMetrics:
     disk_free_gb: float
     process_count: int
     thread_count: int
+    process_cpu_percent: float = 0.0
+    process_rss_mb: float = 0.0
+    process_open_fds: int = 0
 
 
 @dataclass
@@ -38,6 +52,14 @@ class ApplicationMetrics:
     active_targets: int
     circuit_breakers_open: int
     retry_attempts: int
+    p50_response_time: Optional[float] = None
+    p95_response_time: Optional[float] = None
+    p99_response_time: Optional[float] = None
+    average_queue_wait: float = 0.0
+    average_check_run_time: float = 0.0
+    last_cycle_duration: Optional[float] = None
+    cycle_overruns: int = 0
+    check_interval: Optional[float] = None
 
 
 @dataclass
@@ -53,42 +75,59 @@ class DiagnosticInfo:
 class SelfMonitor:
     """Monitors the health monitor application itself."""
     
-    def __init__(self, metrics_retention_hours: int = 24):
+    def __init__(self, metrics_retention_hours: int = 24,
+                 metrics: Optional[List[str]] = None,
+                 metric_intervals: Optional[Dict[str, float]] = None):
         """
         Initialize self-monitoring system.
         
         Args:
             metrics_retention_hours: How long to keep metrics history
+            metrics: System metrics to collect (see metrics_collector.DEFAULT_METRICS)
+            metric_intervals: Per-metric minimum sampling interval in seconds
         """
         self.logger = logging.getLogger(__name__)
         self.start_time = datetime.now()
         self.metrics_retention_hours = metrics_retention_hours
+        self._collector = MetricsCollector(metrics, metric_intervals)
+        self._monitoring_interval = 30  # seconds
         
-        # Metrics storage
-        self._system_metrics: List[SystemMetrics] = []
-        self._app_metrics: List[ApplicationMetrics] = []
-        self._diagnostics: List[DiagnosticInfo] = []
+        # Metrics storage, sized to hold one sample per interval over the
+        # retention period
+        samples = math.ceil(metrics_retention_hours * 3600 / self._monitoring_interval) + 1
+        self._system_metrics: RingBuffer[SystemMetrics] = RingBuffer(samples)
+        self._app_metrics: RingBuffer[ApplicationMetrics] = RingBuffer(samples)
+        self._diagnostics: RingBuffer[DiagnosticInfo] = RingBuffer(MAX_DIAGNOSTICS)
         self._lock = threading.Lock()
         
-        # Application counters
+        # Application counters, updated under _lock
         self._total_checks = 0
         self._successful_checks = 0
         self._failed_checks = 0
-        self._response_times: List[float] = []
+        self._response_times = NumericRingBuffer(RESPONSE_TIME_WINDOW)
+        self._latency = LatencySketch()
+        self._target_latency: Dict[str, LatencySketch] = {}
+        self._target_checks: Dict[str, List[int]] = {}  # [successful, failed]
         self._active_targets = 0
         self._circuit_breakers_open = 0
         self._retry_attempts = 0
+        self._queue_waits = NumericRingBuffer(RESPONSE_TIME_WINDOW)
+        self._check_run_times = NumericRingBuffer(RESPONSE_TIME_WINDOW)
+        self._last_cycle_duration: Optional[float] = None
+        self._cycle_overruns = 0
+        self._reported_cycle_overruns = 0
+        self._check_interval: Optional[float] = None
         
         # Monitoring thread
         self._monitoring_active = False
         self._monitoring_thread = None
-        self._monitoring_interval = 30  # seconds
         
         # Health thresholds
         self.cpu_threshold = 80.0  # %
         self.memory_threshold = 85.0  # %
         self.disk_threshold = 90.0  # %
         self.response_time_threshold = 10.0  # seconds
+        self.queue_wait_threshold = 1.0  # seconds
         
     def start_monitoring(self):
         """Start the self-monitoring thread."""
@@ -140,73 +179,58 @@ class SelfMonitor:
             time.sleep(self._monitoring_interval)
     
     def _collect_system_metrics(self) -> SystemMetrics:
-        """Collect system performance metrics."""
-        try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
-            
-            # Memory usage
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-            memory_used_mb = memory.used / (1024 * 1024)
-            memory_available_mb = memory.available / (1024 * 1024)
-            
-            # Disk usage
-            disk = psutil.disk_usage('/')
-            disk_usage_percent = (disk.used / disk.total) * 100
-            disk_free_gb = disk.free / (1024 * 1024 * 1024)
-            
-            # Process info
-            current_process = psutil.Process()
-            process_count = len(psutil.pids())
-            thread_count = current_process.num_threads()
-            
-            return SystemMetrics(
-                timestamp=datetime.now(),
-                cpu_percent=cpu_percent,
-                memory_percent=memory_percent,
-                memory_used_mb=memory_used_mb,
-                memory_available_mb=memory_available_mb,
-                disk_usage_percent=disk_usage_percent,
-                disk_free_gb=disk_free_gb,
-                process_count=process_count,
-                thread_count=thread_count
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error collecting system metrics: {e}")
-            # Return default metrics on error
-            return SystemMetrics(
-                timestamp=datetime.now(),
-                cpu_percent=0.0,
-                memory_percent=0.0,
-                memory_used_mb=0.0,
-                memory_available_mb=0.0,
-                disk_usage_percent=0.0,
-                disk_free_gb=0.0,
-                process_count=0,
-                thread_count=0
-            )
+        """Collect system performance metrics without blocking."""
+        values = self._collector.collect()
+        return SystemMetrics(
+            timestamp=datetime.now(),
+            cpu_percent=values.get('cpu_percent', 0.0),
+            memory_percent=values.get('memory_percent', 0.0),
+            memory_used_mb=values.get('memory_used_mb', 0.0),
+            memory_available_mb=values.get('memory_available_mb', 0.0),
+            disk_usage_percent=values.get('disk_usage_percent', 0.0),
+            disk_free_gb=values.get('disk_free_gb', 0.0),
+            process_count=values.get('process_count', 0),
+            thread_count=values.get('thread_count', 0),
+            process_cpu_percent=values.get('process_cpu_percent', 0.0),
+            process_rss_mb=values.get('process_rss_mb', 0.0),
+            process_open_fds=values.get('process_open_fds', 0)
+        )
     
     def _collect_application_metrics(self) -> ApplicationMetrics:
         """Collect application-specific metrics."""
         uptime = (datetime.now() - self.start_time).total_seconds()
         
-        # Calculate average response time
-        avg_response_time = 0.0
-        if self._response_times:
-            avg_response_time = sum(self._response_times) / len(self._response_times)
+        with self._lock:
+            avg_response_time = self._response_times.mean() or 0.0
+            percentiles = self._latency.quantiles()
+            total_checks = self._total_checks
+            successful_checks = self._successful_checks
+            failed_checks = self._failed_checks
+            retry_attempts = self._retry_attempts
+            avg_queue_wait = self._queue_waits.mean() or 0.0
+            avg_check_run_time = self._check_run_times.mean() or 0.0
+            last_cycle_duration = self._last_cycle_duration
+            cycle_overruns = self._cycle_overruns
+            check_interval = self._check_interval
         
         return ApplicationMetrics(
             timestamp=datetime.now(),
             uptime_seconds=uptime,
-            total_checks_performed=self._total_checks,
-            successful_checks=self._successful_checks,
-            failed_checks=self._failed_checks,
+            total_checks_performed=total_checks,
+            successful_checks=successful_checks,
+            failed_checks=failed_checks,
             average_response_time=avg_response_time,
             active_targets=self._active_targets,
             circuit_breakers_open=self._circuit_breakers_open,
-            retry_attempts=self._retry_attempts
+            retry_attempts=retry_attempts,
+            p50_response_time=percentiles['p50'],
+            p95_response_time=percentiles['p95'],
+            p99_response_time=percentiles['p99'],
+            average_queue_wait=avg_queue_wait,
+            average_check_run_time=avg_check_run_time,
+            last_cycle_duration=last_cycle_duration,
+            cycle_overruns=cycle_overruns,
+            check_interval=check_interval
         )
     
     def _check_system_health(self, system_metrics: SystemMetrics, app_metrics: ApplicationMetrics):
@@ -233,6 +257,22 @@ class SelfMonitor:
         if app_metrics.circuit_breakers_open > 0:
             issues.append(f"Circuit breakers open: {app_metrics.circuit_breakers_open}")
         
+        # Check time spent waiting for a free worker (pool saturation)
+        if app_metrics.average_queue_wait > self.queue_wait_threshold:
+            issues.append(
+                f"Checks waiting for workers: {app_metrics.average_queue_wait:.2f}s average queue wait "
+                f"vs {app_metrics.average_check_run_time:.2f}s run time"
+            )
+        
+        # Check cycles overrunning the check interval since the last report
+        if app_metrics.cycle_overruns > self._reported_cycle_overruns:
+            new_overruns = app_metrics.cycle_overruns - self._reported_cycle_overruns
+            self._reported_cycle_overruns = app_metrics.cycle_overruns
+            issues.append(
+                f"Check cycle overran interval {new_overruns} time(s): last cycle "
+                f"{app_metrics.last_cycle_duration:.1f}s > {app_metrics.check_interval:g}s"
+            )
+        
         # Log issues
         for issue in issues:
             self.logger.warning(f"Health issue detected: {issue}")
@@ -242,33 +282,99 @@ class SelfMonitor:
         """Remove metrics older than retention period."""
         cutoff_time = datetime.now() - timedelta(hours=self.metrics_retention_hours)
         
-        # Clean system metrics
-        self._system_metrics = [
-            m for m in self._system_metrics if m.timestamp > cutoff_time
-        ]
+        # Buffers are chronological, so expiry only drops from the oldest end
+        self._system_metrics.expire(cutoff_time)
+        self._app_metrics.expire(cutoff_time)
+        self._diagnostics.expire(cutoff_time)
+    
+    def record_health_check(self, success: bool, response_time: float, target_name: Optional[str] = None):
+        """Record a health check result."""
+        with self._lock:
+            self._total_checks += 1
+            if success:
+                self._successful_checks += 1
+            else:
+                self._failed_checks += 1
+            
+            # Keep only recent response times for average calculation
+            self._response_times.append(response_time)
+            
+            # Percentiles are tracked over all checks in fixed-size sketches
+            self._latency.add(response_time)
+            if target_name is not None:
+                counts = self._target_checks.get(target_name)
+                if counts is None:
+                    counts = self._target_checks[target_name] = [0, 0]
+                counts[0 if success else 1] += 1
+                
+                sketch = self._target_latency.get(target_name)
+                if sketch is None:
+                    sketch = self._target_latency[target_name] = LatencySketch()
+                sketch.add(response_time)
+    
+    def forget_target(self, target_name: str):
+        """Drop the per-target check counts and latency of a target no longer monitored."""
+        with self._lock:
+            self._target_checks.pop(target_name, None)
+            self._target_latency.pop(target_name, None)
+    
+    def record_check_timing(self, queue_wait: float, run_time: float):
+        """
+        Record how long a check waited for a worker and how long it ran.
         
-        # Clean application metrics
-        self._app_metrics = [
-            m for m in self._app_metrics if m.timestamp > cutoff_time
-        ]
+        Args:
+            queue_wait: Seconds from scheduling to a worker starting the check
+            run_time: Seconds the check ran, including retries
+        """
+        with self._lock:
+            self._queue_waits.append(queue_wait)
+            self._check_run_times.append(run_time)
+    
+    def record_cycle(self, duration: float, check_interval: Optional[float] = None):
+        """
+        Record a completed check cycle.
         
-        # Clean diagnostics
-        self._diagnostics = [
-            d for d in self._diagnostics if d.timestamp > cutoff_time
-        ]
+        Args:
+            duration: Seconds the cycle took
+            check_interval: Configured seconds between cycles, if known
+        """
+        with self._lock:
+            self._last_cycle_duration = duration
+            self._check_interval = check_interval
+            if check_interval is not None and duration > check_interval:
+                self._cycle_overruns += 1
     
-    def record_health_check(self, success: bool, response_time: float):
-        """Record a health check result."""
-        self._total_checks += 1
-        if success:
-            self._successful_checks += 1
-        else:
-            self._failed_checks += 1
+    def get_latency_percentiles(self) -> Dict[str, Any]:
+        """Get p50/p95/p99 response times overall and per target since start."""
+        with self._lock:
+            return {
+                "overall": self._latency.quantiles(),
+                "targets": {
+                    name: sketch.quantiles()
+                    for name, sketch in self._target_latency.items()
+                }
+            }
+    
+    def get_target_check_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-target check counts and latency since start.
         
-        # Keep only recent response times for average calculation
-        self._response_times.append(response_time)
-        if len(self._response_times) > 100:  # Keep last 100 measurements
-            self._response_times.pop(0)
+        Returns:
+            Dictionary mapping target name to 'successful', 'failed',
+            'latency_count', 'latency_sum' and the p50/p95/p99 'quantiles'
+        """
+        with self._lock:
+            stats = {}
+            for name, (successful, failed) in self._target_checks.items():
+                sketch = self._target_latency.get(name)
+                stats[name] = {
+                    "successful": successful,
+                    "failed": failed,
+                    "latency_count": sketch.count if sketch else 0,
+                    "latency_sum": sketch.total if sketch else 0.0,
+                    "quantiles": sketch.quantiles() if sketch else {}
+                }
+            return stats
     
     def update_target_count(self, count: int):
         """Update the count of active monitoring targets."""
@@ -280,7 +386,8 @@ class SelfMonitor:
     
     def record_retry_attempt(self):
         """Record a retry attempt."""
-        self._retry_attempts += 1
+        with self._lock:
+            self._retry_attempts += 1
     
     def add_diagnostic(self, component: str, level: str, message: str, details: Optional[Dict[str, Any]] = None):
         """Add diagnostic information."""
@@ -355,10 +462,14 @@ class SelfMonitor:
         error_count = len([d for d in recent_diagnostics if d["log_level"] == "ERROR"])
         warning_count = len([d for d in recent_diagnostics if d["log_level"] == "WARNING"])
         
+        with self._lock:
+            total_checks = self._total_checks
+            successful_checks = self._successful_checks
+        
         # Calculate success rate
         success_rate = 0.0
-        if self._total_checks > 0:
-            success_rate = (self._successful_checks / self._total_checks) * 100
+        if total_checks > 0:
+            success_rate = (successful_checks / total_checks) * 100
         
         # Determine overall health status
         health_status = "HEALTHY"
@@ -371,16 +482,23 @@ class SelfMonitor:
             "status": health_status,
             "uptime_hours": (datetime.now() - self.start_time).total_seconds() / 3600,
             "success_rate_percent": success_rate,
-            "total_checks": self._total_checks,
+            "total_checks": total_checks,
             "active_targets": self._active_targets,
             "circuit_breakers_open": self._circuit_breakers_open,
+            "latency_percentiles": self.get_latency_percentiles(),
             "recent_errors": error_count,
             "recent_warnings": warning_count,
             "current_metrics": current_metrics
         }
     
-    def export_diagnostics(self, filepath: str):
-        """Export diagnostic information to a file."""
+    def export_diagnostics(self, filepath: str, extra_sections: Optional[Dict[str, Any]] = None):
+        """
+        Export diagnostic information to a file.
+        
+        Args:
+            filepath: Path of the JSON file to write
+            extra_sections: Additional top-level sections supplied by the caller
+        """
         try:
             diagnostics_data = {
                 "export_timestamp": datetime.now().isoformat(),
@@ -388,6 +506,8 @@ class SelfMonitor:
                 "metrics_history": self.get_metrics_history(hours=24),
                 "diagnostics": self.get_diagnostics(hours=24)
             }
+            if extra_sections:
+                diagnostics_data.update(extra_sections)
             
             with open(filepath, 'w') as f:
                 json.dump(diagnostics_data, f, indent=2, default=str)
@@ -2,53 +2,110 @@
 Status display implementation for the Health Monitor application.
 Provides console-based status display with colorama for colored output.
 """
-import os
-import sys
+import time
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, TextIO
 from colorama import init, Fore, Back, Style
 
 from health_monitor.models.data_models import HealthStatus
 from health_monitor.services.interfaces import StatusDisplayInterface
+from health_monitor.services.status_summary import StatusSummaryIndex
+from health_monitor.services.terminal_renderer import DifferentialRenderer
+
+
+DISPLAY_MODES = ("detail", "summary", "auto")
+
+# In auto mode, the summary is shown above this many targets.
+AUTO_SUMMARY_THRESHOLD = 50
+
+# Targets per page of the summary list when the terminal height is unknown.
+DEFAULT_PAGE_SIZE = 20
 
 
 class StatusDisplay(StatusDisplayInterface):
     """Console-based status display with colored output."""
     
-    def __init__(self):
-        """Initialize the status display with colorama."""
+    def __init__(self, stream: Optional[TextIO] = None, mode: str = "detail",
+                 group_resolver: Optional[Callable[[str], str]] = None,
+                 top_n: int = 5, page_interval: float = 5.0):
+        """
+        Initialize the status display with colorama.
+        
+        Args:
+            stream: Output stream; defaults to sys.stdout
+            mode: 'detail' lists every target, 'summary' shows group counts,
+                the slowest targets, the newest failures and one page of
+                targets, and 'auto' switches to the summary above
+                AUTO_SUMMARY_THRESHOLD targets
+            group_resolver: Maps a target name to its summary group
+            top_n: Entries in the slowest and newest failure lists
+            page_interval: Seconds each page of the summary list is shown
+            
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in DISPLAY_MODES:
+            raise ValueError(f"Unknown display mode: {mode}")
         # Initialize colorama for Windows compatibility
         init(autoreset=True)
+        self.mode = mode
+        self.group_resolver = group_resolver or (lambda name: "unknown")
+        self.top_n = top_n
+        self.page_interval = page_interval
         self._previous_statuses: Dict[str, HealthStatus] = {}
         self._status_changes: Dict[str, str] = {}
         self._change_tracker = StatusChangeTracker()
+        self._summary = StatusSummaryIndex()
+        self._renderer = DifferentialRenderer(stream)
         
     def update_display(self, statuses: Dict[str, HealthStatus]) -> None:
         """Update the status display with current health statuses."""
-        # Detect status changes before updating display
-        self._detect_status_changes(statuses)
-        
-        # Clear screen for real-time updates
-        self._clear_screen()
+        # Only targets with a new status object are re-examined
+        previous = self._previous_statuses
+        changed = {
+            name: status for name, status in statuses.items()
+            if previous.get(name) is not status
+        }
         
-        # Display header
-        self._display_header()
-        
-        # Display each target status
-        for target_name, status in statuses.items():
-            self._display_target_status(target_name, status)
+        # Detect status changes before updating display
+        self._detect_status_changes(changed)
+        self._update_summary(statuses, changed)
         
-        # Display footer with timestamp
-        self._display_footer()
+        # Build the whole frame in memory; only changed lines are redrawn
+        max_lines = self._renderer.max_lines()
+        if self._use_summary(statuses):
+            frame = self._build_summary_frame(max_lines)
+        else:
+            frame = self._build_frame(statuses, max_lines)
+        self._renderer.render(frame)
         
         # Update previous statuses for next comparison
         self._previous_statuses = statuses.copy()
     
+    def show_results(self, statuses: Dict[str, HealthStatus]) -> None:
+        """
+        Print every status once as plain text below the earlier output.
+        
+        Unlike update_display, the screen is not cleared, the list is neither
+        clipped to the terminal height nor paged, and the Ctrl+C hint is left
+        out, so the whole result stays in the scrollback or redirected output.
+        
+        Args:
+            statuses: Statuses to show, in display order
+        """
+        self._detect_status_changes(statuses)
+        frame = self._build_frame(statuses, footer=self._format_footer(stop_hint=False))
+        self._renderer.write("\n".join(frame))
+    
     def show_error(self, target: str, error: str) -> None:
         """Display error message for a specific target."""
         timestamp = datetime.now().strftime("%H:%M:%S")
         error_msg = f"[{timestamp}] エラー - {target}: {error}"
-        print(f"{Fore.RED}{Style.BRIGHT}{error_msg}{Style.RESET_ALL}")
+        self._renderer.write(f"{Fore.RED}{Style.BRIGHT}{error_msg}{Style.RESET_ALL}")
+    
+    def show_message(self, message: str) -> None:
+        """Display an application message between frames."""
+        self._renderer.write(message)
     
     def refresh_ui(self) -> None:
         """Refresh the user interface display."""
@@ -74,22 +131,136 @@ class StatusDisplay(StatusDisplayInterface):
             if change_indicator:
                 self._status_changes[target_name] = change_indicator
     
-    def _clear_screen(self) -> None:
-        """Clear the console screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+    def _use_summary(self, statuses: Dict[str, HealthStatus]) -> bool:
+        """Whether the current frame is drawn in summary mode."""
+        if self.mode == "auto":
+            return len(statuses) > AUTO_SUMMARY_THRESHOLD
+        return self.mode == "summary"
+    
+    def _update_summary(self, statuses: Dict[str, HealthStatus], changed: Dict[str, HealthStatus]) -> None:
+        """Apply new and removed statuses to the summary index."""
+        for name, status in changed.items():
+            if name in self._summary:
+                self._summary.update(name, status)
+            else:
+                self._summary.update(name, status, self.group_resolver(name))
+        
+        # Any removed target leaves the index larger than the current set
+        if len(self._summary) != len(statuses):
+            for name in self._summary.names():
+                if name not in statuses:
+                    self._summary.remove(name)
     
-    def _display_header(self) -> None:
-        """Display the application header."""
+    def _build_summary_frame(self, max_lines: Optional[int] = None) -> List[str]:
+        """
+        Build a summary screen from the incrementally maintained index.
+        
+        Args:
+            max_lines: Screen rows available; the target list uses what the
+                summary sections leave over
+            
+        Returns:
+            Frame lines without trailing newlines
+        """
+        healthy, unhealthy = self._summary.totals()
+        lines = self._format_header()
+        lines.append(
+            f"監視対象: {healthy + unhealthy}件  "
+            f"{Fore.GREEN}正常: {healthy}{Style.RESET_ALL}  "
+            f"{Fore.RED}異常: {unhealthy}{Style.RESET_ALL}"
+        )
+        lines.append("")
+        
+        lines.append(f"{Style.BRIGHT}グループ別{Style.RESET_ALL}")
+        for group, (group_healthy, group_unhealthy) in self._summary.group_counts().items():
+            unhealthy_color = Fore.RED if group_unhealthy else ""
+            lines.append(
+                f"  {group:<20} 正常 {group_healthy:>6}  "
+                f"{unhealthy_color}異常 {group_unhealthy:>6}{Style.RESET_ALL}"
+            )
+        lines.append("")
+        
+        lines.append(f"{Style.BRIGHT}応答が遅い上位 {self.top_n} 件{Style.RESET_ALL}")
+        for status in self._summary.slowest(self.top_n):
+            lines.append(f"  {status.target_name:<30} {status.response_time:>8.2f}s")
+        lines.append("")
+        
+        lines.append(f"{Style.BRIGHT}最近の異常 {self.top_n} 件{Style.RESET_ALL}")
+        for since, status in self._summary.newest_failures(self.top_n):
+            error_message = " ".join((status.error_message or "").split())
+            lines.append(
+                f"  {Fore.RED}{since.strftime('%H:%M:%S')} {status.target_name:<30}{Style.RESET_ALL} {error_message}"
+            )
+        lines.append("")
+        
+        footer = self._format_footer()
+        page_size = DEFAULT_PAGE_SIZE
+        if max_lines is not None:
+            page_size = max(1, max_lines - len(lines) - len(footer) - 1)
+        page_count = self._summary.page_count(page_size)
+        page = int(time.monotonic() // self.page_interval) % page_count if self.page_interval > 0 else 0
+        
+        lines.append(f"{Style.BRIGHT}一覧 (ページ {page + 1}/{page_count}){Style.RESET_ALL}")
+        for status in self._summary.page(page, page_size):
+            color, symbol = (Fore.GREEN, "✓") if status.is_healthy else (Fore.RED, "✗")
+            response_time_str = f"{status.response_time:.2f}s" if status.response_time > 0 else "N/A"
+            lines.append(f"{color}{symbol} {status.target_name:<30}{Style.RESET_ALL} {response_time_str:>8}")
+        
+        return lines + footer
+    
+    def _build_frame(self, statuses: Dict[str, HealthStatus], max_lines: Optional[int] = None,
+                     footer: Optional[List[str]] = None) -> List[str]:
+        """
+        Build the lines of one screen.
+        
+        Args:
+            statuses: Statuses to show, in display order
+            max_lines: Screen rows available; targets that do not fit are
+                summarized in a single line
+            footer: Footer lines; defaults to the live display footer
+            
+        Returns:
+            Frame lines without trailing newlines
+        """
+        header = self._format_header()
+        if footer is None:
+            footer = self._format_footer()
+        blocks = [self._format_target_status(name, status) for name, status in statuses.items()]
+        
+        body: List[str] = []
+        if max_lines is None:
+            for block in blocks:
+                body.extend(block)
+        else:
+            room = max_lines - len(header) - len(footer)
+            shown = 0
+            for block in blocks:
+                remaining = len(blocks) - shown - 1
+                # Keep one row for the overflow notice unless this is the last block
+                if len(body) + len(block) + (1 if remaining else 0) > room:
+                    break
+                body.extend(block)
+                shown += 1
+            hidden = len(blocks) - shown
+            if hidden:
+                body.append(f"{Fore.YELLOW}... 他 {hidden} 件の監視対象は画面に収まりません{Style.RESET_ALL}")
+        
+        return header + body + footer
+    
+    def _format_header(self) -> List[str]:
+        """Format the application header."""
         header = "=" * 60
         title = "ヘルスモニター - ステータスダッシュボード"
         
-        print(f"{Fore.CYAN}{Style.BRIGHT}{header}")
-        print(f"{title:^60}")
-        print(f"{header}{Style.RESET_ALL}")
-        print()
+        return [
+            f"{Fore.CYAN}{Style.BRIGHT}{header}",
+            f"{title:^60}",
+            f"{header}{Style.RESET_ALL}",
+            ""
+        ]
     
-    def _display_target_status(self, target_name: str, status: HealthStatus) -> None:
-        """Display status for a single target."""
+    def _format_target_status(self, target_name: str, status: HealthStatus) -> List[str]:
+        """Format the status lines of a single target."""
         # Determine status color and symbol
         if status.is_healthy:
             color = Fore.GREEN
@@ -113,10 +284,13 @@ class StatusDisplay(StatusDisplayInterface):
         # Format timestamp
         timestamp_str = status.timestamp.strftime("%H:%M:%S")
         
-        # Check for status change indicator
+        # Status change indicator, kept as long as the change is recent since
+        # frames are redrawn far more often than targets are checked
         change_indicator = ""
-        if target_name in self._status_changes:
-            change = self._status_changes[target_name]
+        change = self._status_changes.get(target_name)
+        if change is None and has_recent_change:
+            change = self._change_tracker.get_change_indicator(target_name)
+        if change:
             change_time = self._change_tracker.get_change_timestamp(target_name)
             change_time_str = change_time.strftime("%H:%M:%S") if change_time else ""
             
@@ -125,30 +299,34 @@ class StatusDisplay(StatusDisplayInterface):
             else:  # 正常→異常
                 change_indicator = f" {Fore.RED}{Back.BLACK}{Style.BRIGHT}[{change} {change_time_str}]{Style.RESET_ALL}"
         
-        # Display target status line
+        # Target status line
         target_line = f"{color}{symbol} {target_name:<25} {status_text:<10}{Style.RESET_ALL}"
         time_line = f" | 応答時間: {response_time_str:<8} | 最終確認: {timestamp_str}"
+        lines = [f"{target_line}{time_line}{change_indicator}"]
         
-        print(f"{target_line}{time_line}{change_indicator}")
-        
-        # Display error message if unhealthy
+        # Error message if unhealthy
         if not status.is_healthy and status.error_message:
             error_indent = " " * 4
-            print(f"{error_indent}{Fore.YELLOW}エラー: {status.error_message}{Style.RESET_ALL}")
+            error_message = " ".join(status.error_message.split())  # one screen row
+            lines.append(f"{error_indent}{Fore.YELLOW}エラー: {error_message}{Style.RESET_ALL}")
         
-        print()  # Add spacing between targets
+        lines.append("")  # Spacing between targets
+        return lines
     
-    def _display_footer(self) -> None:
-        """Display the footer with current timestamp."""
+    def _format_footer(self, stop_hint: bool = True) -> List[str]:
+        """Format the footer with current timestamp, and the Ctrl+C hint if stop_hint is set."""
         footer = "=" * 60
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         footer_text = f"最終更新: {current_time}"
         
-        print(f"{Fore.CYAN}{footer}")
-        print(f"{footer_text:^60}")
-        print(f"{footer}{Style.RESET_ALL}")
-        print()
-        print(f"{Fore.YELLOW}監視を停止するにはCtrl+Cを押してください{Style.RESET_ALL}")
+        lines = [
+            f"{Fore.CYAN}{footer}",
+            f"{footer_text:^60}",
+            f"{footer}{Style.RESET_ALL}"
+        ]
+        if stop_hint:
+            lines += ["", f"{Fore.YELLOW}監視を停止するにはCtrl+Cを押してください{Style.RESET_ALL}"]
+        return lines
 
 
 class StatusChangeTracker:
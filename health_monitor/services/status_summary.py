@@ -0,0 +1,238 @@
+"""
+Incrementally maintained index of target statuses for the console displays.
+Each new status updates per-group counts and the name, latency, failure
+and last-change orderings in O(log n) plus a list shift, so a frame reads
+its counts, top-N lists, sorted views and current page without scanning
+or re-sorting every target.
+"""
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from health_monitor.models.data_models import HealthStatus
+from health_monitor.services.ring_buffer import RingBuffer
+
+
+SORT_KEYS = ("name", "latency", "change")
+
+
+class StatusSummaryIndex:
+    """Per-group counts and orderings of the latest status of each target."""
+
+    def __init__(self, history_size: int = 0):
+        """
+        Initialize an empty index.
+
+        Args:
+            history_size: Recent statuses kept per target; 0 keeps none
+        """
+        self.history_size = history_size
+        self._statuses: Dict[str, HealthStatus] = {}
+        self._groups: Dict[str, str] = {}
+        self._group_counts: Dict[str, List[int]] = {}  # [healthy, unhealthy]
+        self._names: List[str] = []
+        self._by_latency: List[Tuple[float, str]] = []  # (-response_time, name)
+        self._failing_since: Dict[str, datetime] = {}
+        self._by_failure: List[Tuple[datetime, str]] = []
+        self._changed_at: Dict[str, datetime] = {}
+        self._by_change: List[Tuple[datetime, str]] = []
+        self._history: Dict[str, RingBuffer[HealthStatus]] = {}
+        self._unhealthy = 0
+
+    def __len__(self) -> int:
+        return len(self._statuses)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._statuses
+
+    def names(self) -> List[str]:
+        """Get the indexed target names in sorted order."""
+        return list(self._names)
+
+    def get(self, name: str) -> Optional[HealthStatus]:
+        """Get the latest status of a target, or None if it is not indexed."""
+        return self._statuses.get(name)
+
+    def changed_at(self, name: str) -> Optional[datetime]:
+        """Get when a target was first seen or last changed health, or None."""
+        return self._changed_at.get(name)
+
+    def history(self, name: str) -> List[HealthStatus]:
+        """
+        Get the recent statuses of a target.
+
+        Args:
+            name: Target name
+
+        Returns:
+            Up to history_size statuses, oldest first
+        """
+        history = self._history.get(name)
+        return list(history) if history is not None else []
+
+    def ordered(self, sort_key: str = "name", descending: bool = False) -> List[str]:
+        """
+        Get target names in a maintained order.
+
+        Args:
+            sort_key: 'name', 'latency' (slowest first) or 'change' (most
+                recent change first)
+            descending: Reverse the order
+
+        Returns:
+            Target names
+
+        Raises:
+            ValueError: If the sort key is unknown
+        """
+        if sort_key == "name":
+            names = list(self._names)
+        elif sort_key == "latency":
+            names = [name for _, name in self._by_latency]
+        elif sort_key == "change":
+            names = [name for _, name in reversed(self._by_change)]
+        else:
+            raise ValueError(f"Unknown sort key: {sort_key}")
+        if descending:
+            names.reverse()
+        return names
+
+    def update(self, name: str, status: HealthStatus, group: str = "unknown") -> None:
+        """
+        Record the latest status of a target.
+
+        Args:
+            name: Target name
+            status: Latest health status
+            group: Group the target is counted under; only used the first
+                time the target is seen
+        """
+        previous = self._statuses.get(name)
+        if previous is None:
+            self._groups[name] = group
+            self._group_counts.setdefault(group, [0, 0])
+            insort(self._names, name)
+        else:
+            group = self._groups[name]
+            self._group_counts[group][0 if previous.is_healthy else 1] -= 1
+            self._unhealthy -= 0 if previous.is_healthy else 1
+            self._remove_sorted(self._by_latency, (-previous.response_time, name))
+
+        self._statuses[name] = status
+        self._group_counts[group][0 if status.is_healthy else 1] += 1
+        self._unhealthy += 0 if status.is_healthy else 1
+        insort(self._by_latency, (-status.response_time, name))
+
+        if status.is_healthy:
+            since = self._failing_since.pop(name, None)
+            if since is not None:
+                self._remove_sorted(self._by_failure, (since, name))
+        elif name not in self._failing_since:
+            self._failing_since[name] = status.timestamp
+            insort(self._by_failure, (status.timestamp, name))
+
+        if previous is None or previous.is_healthy != status.is_healthy:
+            changed_at = self._changed_at.get(name)
+            if changed_at is not None:
+                self._remove_sorted(self._by_change, (changed_at, name))
+            self._changed_at[name] = status.timestamp
+            insort(self._by_change, (status.timestamp, name))
+
+        if self.history_size > 0:
+            history = self._history.get(name)
+            if history is None:
+                history = self._history[name] = RingBuffer(self.history_size)
+            history.append(status)
+
+    def remove(self, name: str) -> None:
+        """
+        Drop a target from the index.
+
+        Args:
+            name: Target name; unknown names are ignored
+        """
+        status = self._statuses.pop(name, None)
+        if status is None:
+            return
+        group = self._groups.pop(name)
+        counts = self._group_counts[group]
+        counts[0 if status.is_healthy else 1] -= 1
+        if counts == [0, 0]:
+            del self._group_counts[group]
+        self._unhealthy -= 0 if status.is_healthy else 1
+        self._remove_sorted(self._names, name)
+        self._remove_sorted(self._by_latency, (-status.response_time, name))
+        since = self._failing_since.pop(name, None)
+        if since is not None:
+            self._remove_sorted(self._by_failure, (since, name))
+        self._remove_sorted(self._by_change, (self._changed_at.pop(name), name))
+        self._history.pop(name, None)
+
+    def totals(self) -> Tuple[int, int]:
+        """
+        Get overall counts.
+
+        Returns:
+            (healthy, unhealthy) target counts
+        """
+        return len(self._statuses) - self._unhealthy, self._unhealthy
+
+    def group_counts(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Get counts per group.
+
+        Returns:
+            Dictionary mapping group name to (healthy, unhealthy), sorted by group
+        """
+        return {group: (counts[0], counts[1]) for group, counts in sorted(self._group_counts.items())}
+
+    def slowest(self, count: int) -> List[HealthStatus]:
+        """
+        Get the targets with the highest response times.
+
+        Args:
+            count: Maximum number of targets
+
+        Returns:
+            Statuses ordered slowest first
+        """
+        return [self._statuses[name] for _, name in self._by_latency[:count]]
+
+    def newest_failures(self, count: int) -> List[Tuple[datetime, HealthStatus]]:
+        """
+        Get the targets that most recently started failing.
+
+        Args:
+            count: Maximum number of targets
+
+        Returns:
+            (failing since, latest status) pairs, newest first
+        """
+        if count <= 0:
+            return []
+        newest = self._by_failure[-count:]
+        return [(since, self._statuses[name]) for since, name in reversed(newest)]
+
+    def page_count(self, page_size: int) -> int:
+        """Get the number of pages of page_size targets, at least 1."""
+        return max(1, -(-len(self._names) // page_size))
+
+    def page(self, number: int, page_size: int) -> List[HealthStatus]:
+        """
+        Get one page of targets in name order.
+
+        Args:
+            number: Zero-based page number
+            page_size: Targets per page
+
+        Returns:
+            Statuses on the page
+        """
+        start = number * page_size
+        return [self._statuses[name] for name in self._names[start:start + page_size]]
+
+    @staticmethod
+    def _remove_sorted(items: list, item) -> None:
+        position = bisect_left(items, item)
+        if position < len(items) and items[position] == item:
+            del items[position]
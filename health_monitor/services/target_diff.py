@@ -0,0 +1,63 @@
+"""
+Differences between two loaded sets of monitoring targets.
+Targets are keyed by check type and name, so a configuration reload only
+touches the targets that were added, removed or edited, and the engine
+keeps its circuit breakers, statuses and histograms for everything else.
+"""
+from dataclasses import dataclass, field
+from typing import List, Sequence, Tuple, Union
+
+from health_monitor.models.data_models import WebsiteTarget, DatabaseTarget
+
+
+Target = Union[WebsiteTarget, DatabaseTarget]
+
+
+@dataclass
+class TargetDiff:
+    """Targets added, removed and modified between two configurations."""
+    added: List[Tuple[str, Target]] = field(default_factory=list)
+    removed: List[Tuple[str, Target]] = field(default_factory=list)
+    modified: List[Tuple[str, Target]] = field(default_factory=list)  # new definitions
+    unchanged: int = 0
+
+    def is_empty(self) -> bool:
+        """Whether the two configurations define the same targets."""
+        return not (self.added or self.removed or self.modified)
+
+    def summary(self) -> str:
+        """Describe the counts of each kind of change."""
+        return (f"追加 {len(self.added)}件, 削除 {len(self.removed)}件, "
+                f"変更 {len(self.modified)}件, 変更なし {self.unchanged}件")
+
+
+def diff_targets(old_websites: Sequence[WebsiteTarget], new_websites: Sequence[WebsiteTarget],
+                 old_databases: Sequence[DatabaseTarget], new_databases: Sequence[DatabaseTarget]) -> TargetDiff:
+    """
+    Compare two configurations target by target.
+
+    Args:
+        old_websites: Website targets currently monitored
+        new_websites: Website targets after the reload
+        old_databases: Database targets currently monitored
+        new_databases: Database targets after the reload
+
+    Returns:
+        TargetDiff with (check type, target) entries in configuration order
+    """
+    diff = TargetDiff()
+    for check_type, old_targets, new_targets in (('website', old_websites, new_websites),
+                                                  ('database', old_databases, new_databases)):
+        old_by_name = {target.name: target for target in old_targets}
+        new_names = set()
+        for target in new_targets:
+            new_names.add(target.name)
+            previous = old_by_name.get(target.name)
+            if previous is None:
+                diff.added.append((check_type, target))
+            elif previous != target:
+                diff.modified.append((check_type, target))
+            else:
+                diff.unchanged += 1
+        diff.removed.extend((check_type, target) for target in old_targets if target.name not in new_names)
+    return diff
@@ -0,0 +1,97 @@
+"""
+Central index of the monitored targets.
+Holds the loaded targets in configuration order together with name and id
+indexes, so resolving a target's type or definition is a dictionary lookup
+instead of a scan over both target lists. Ids are small integers that stay
+the same for a name across configuration reloads.
+"""
+import itertools
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from health_monitor.models.data_models import WebsiteTarget, DatabaseTarget
+
+
+Target = Union[WebsiteTarget, DatabaseTarget]
+
+
+class TargetRegistry:
+    """Monitored targets indexed by name and id."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._websites: List[WebsiteTarget] = []
+        self._databases: List[DatabaseTarget] = []
+        self._by_name: Dict[str, Tuple[str, Target]] = {}
+        self._ids: Dict[str, int] = {}
+        self._by_id: Dict[int, str] = {}
+        self._next_id = itertools.count(1)
+
+    def replace(self, websites: Sequence[WebsiteTarget], databases: Sequence[DatabaseTarget]) -> None:
+        """
+        Replace the registered targets, for example after a configuration load.
+
+        Names that were already registered keep their id; names that are no
+        longer present are forgotten.
+
+        Args:
+            websites: Website targets in configuration order
+            databases: Database targets in configuration order
+        """
+        self._websites = list(websites)
+        self._databases = list(databases)
+
+        # A website shadows a database of the same name, as in the status views
+        by_name: Dict[str, Tuple[str, Target]] = {target.name: ('database', target) for target in self._databases}
+        by_name.update((target.name, ('website', target)) for target in self._websites)
+        self._by_name = by_name
+
+        ids = {}
+        for name in by_name:
+            target_id = self._ids.get(name)
+            ids[name] = next(self._next_id) if target_id is None else target_id
+        self._ids = ids
+        self._by_id = {target_id: name for name, target_id in ids.items()}
+
+    @property
+    def websites(self) -> List[WebsiteTarget]:
+        """Website targets in configuration order."""
+        return self._websites
+
+    @property
+    def databases(self) -> List[DatabaseTarget]:
+        """Database targets in configuration order."""
+        return self._databases
+
+    def get(self, name: str) -> Optional[Target]:
+        """Get a target by name, or None if it is not registered."""
+        entry = self._by_name.get(name)
+        return entry[1] if entry else None
+
+    def get_by_id(self, target_id: int) -> Optional[Target]:
+        """Get a target by id, or None if it is not registered."""
+        name = self._by_id.get(target_id)
+        return None if name is None else self._by_name[name][1]
+
+    def id_of(self, name: str) -> Optional[int]:
+        """Get the id of a target, or None if it is not registered."""
+        return self._ids.get(name)
+
+    def type_of(self, name: str, default: str = "unknown") -> str:
+        """
+        Get the check type of a target.
+
+        Args:
+            name: Target name
+            default: Returned for names that are not registered
+
+        Returns:
+            'website', 'database' or default
+        """
+        entry = self._by_name.get(name)
+        return entry[0] if entry else default
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def __len__(self) -> int:
+        return len(self._by_name)
@@ -0,0 +1,100 @@
+"""
+Selection of monitoring targets by tag and name.
+Used to narrow a run to part of the fleet, from the command line or the
+dashboard API, for example to re-check only the payment endpoints.
+"""
+from fnmatch import fnmatchcase
+from typing import Dict, Iterable, List, Optional
+
+
+def _split(values: Optional[str]) -> List[str]:
+    return [value.strip() for value in (values or "").split(",") if value.strip()]
+
+
+class TargetSelector:
+    """Matches targets carrying any of the given tags and any of the given name patterns."""
+
+    def __init__(self, tags: Iterable[str] = (), names: Iterable[str] = ()):
+        """
+        Initialize the selector; with neither tags nor names it matches every target.
+
+        Args:
+            tags: A target must carry at least one of these tags
+            names: A target's name must match at least one of these shell-style
+                patterns, such as 'payment-*'
+        """
+        self.tags = frozenset(tags)
+        self.names = tuple(names)
+
+    @classmethod
+    def parse(cls, tags: Optional[str] = None, names: Optional[str] = None) -> "TargetSelector":
+        """
+        Build a selector from comma-separated lists.
+
+        Args:
+            tags: Comma-separated tags
+            names: Comma-separated target names or patterns
+
+        Returns:
+            TargetSelector instance
+        """
+        return cls(_split(tags), _split(names))
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the selector matches every target."""
+        return not self.tags and not self.names
+
+    def matches(self, target) -> bool:
+        """
+        Check whether a target is selected.
+
+        Args:
+            target: WebsiteTarget or DatabaseTarget
+
+        Returns:
+            True if the target matches both the tag and the name criteria
+        """
+        if self.tags and self.tags.isdisjoint(target.tags):
+            return False
+        return not self.names or any(fnmatchcase(target.name, pattern) for pattern in self.names)
+
+    def select(self, targets: Iterable) -> list:
+        """Get the matching targets, keeping their order."""
+        if self.is_empty:
+            return list(targets)
+        return [target for target in targets if self.matches(target)]
+
+    def describe(self) -> str:
+        """Describe the criteria for messages."""
+        parts = []
+        if self.tags:
+            parts.append(f"タグ: {', '.join(sorted(self.tags))}")
+        if self.names:
+            parts.append(f"名前: {', '.join(self.names)}")
+        return " / ".join(parts) or "すべて"
+
+
+def parse_tag_intervals(values: Iterable[str]) -> Dict[str, float]:
+    """
+    Parse per-tag check intervals given as TAG=SECONDS.
+
+    Args:
+        values: Strings such as 'payments=30'
+
+    Returns:
+        Dictionary mapping tag to interval in seconds
+
+    Raises:
+        ValueError: If a value is malformed or its interval is not positive
+    """
+    intervals = {}
+    for value in values:
+        tag, separator, seconds = value.partition("=")
+        if not separator or not tag.strip():
+            raise ValueError(f"Expected TAG=SECONDS: {value}")
+        interval = float(seconds)
+        if interval <= 0:
+            raise ValueError(f"Interval must be positive: {value}")
+        intervals[tag.strip()] = interval
+    return intervals
@@ -0,0 +1,125 @@
+"""
+Differential full-screen rendering for the console status display.
+A frame is a list of lines built in memory. The renderer compares it with
+the frame it drew last and emits only the lines that changed, addressed
+with ANSI cursor positioning, in a single buffered write. Streams that are
+not terminals receive each frame as plain text instead. Frames and
+messages are written under one lock, so a message printed from another
+thread never lands in the middle of a frame's cursor sequences.
+"""
+import os
+import shutil
+import sys
+import threading
+from typing import List, Optional, TextIO
+
+
+CSI = "\x1b["
+
+# Lines longer than the terminal are clipped instead of wrapping, so one
+# frame line always occupies exactly one screen row.
+DISABLE_WRAP = CSI + "?7l"
+ENABLE_WRAP = CSI + "?7h"
+
+CLEAR_SCREEN = CSI + "H" + CSI + "2J"
+CLEAR_TO_LINE_END = CSI + "K"
+CLEAR_TO_SCREEN_END = CSI + "J"
+
+
+class DifferentialRenderer:
+    """Redraws only the changed lines of successive frames."""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        """
+        Initialize the renderer.
+
+        Args:
+            stream: Output stream; defaults to sys.stdout at render time
+        """
+        self.stream = stream
+        self._previous: Optional[List[str]] = None
+        self._size: Optional[os.terminal_size] = None
+        self._lock = threading.RLock()
+
+    def _output(self) -> TextIO:
+        return self.stream if self.stream is not None else sys.stdout
+
+    def is_terminal(self) -> bool:
+        """Whether output goes to an interactive terminal."""
+        isatty = getattr(self._output(), 'isatty', None)
+        try:
+            return bool(isatty and isatty())
+        except ValueError:  # closed stream
+            return False
+
+    def max_lines(self) -> Optional[int]:
+        """
+        Get the number of lines a frame can use without scrolling.
+
+        Returns:
+            Terminal rows minus one for the cursor, or None when not a terminal
+        """
+        if not self.is_terminal():
+            return None
+        return max(1, shutil.get_terminal_size().lines - 1)
+
+    def invalidate(self) -> None:
+        """Force the next frame to clear the screen and redraw every line."""
+        self._previous = None
+
+    def write(self, text: str) -> None:
+        """
+        Print a message between frames, from any thread.
+
+        The message scrolls the screen, so the next frame is drawn in full.
+
+        Args:
+            text: Message, without a trailing newline
+        """
+        with self._lock:
+            print(text, file=self._output(), flush=True)
+            self.invalidate()
+
+    def render(self, lines: List[str]) -> int:
+        """
+        Draw a frame.
+
+        Args:
+            lines: Frame content, one entry per screen row, without newlines
+
+        Returns:
+            Number of lines written
+        """
+        with self._lock:
+            stream = self._output()
+            if not self.is_terminal():
+                stream.write("\n".join(lines) + "\n")
+                stream.flush()
+                return len(lines)
+
+            size = shutil.get_terminal_size()
+            if size != self._size:
+                self._size = size
+                self._previous = None
+
+            parts = [DISABLE_WRAP]
+            previous = self._previous
+            if previous is None:
+                parts.append(CLEAR_SCREEN)
+                previous = []
+
+            written = 0
+            for row, line in enumerate(lines):
+                if row < len(previous) and previous[row] == line:
+                    continue
+                parts.append(f"{CSI}{row + 1};1H{line}{CLEAR_TO_LINE_END}")
+                written += 1
+
+            if len(lines) < len(previous):
+                parts.append(f"{CSI}{len(lines) + 1};1H{CLEAR_TO_SCREEN_END}")
+            parts.append(f"{CSI}{len(lines) + 1};1H{ENABLE_WRAP}")
+
+            stream.write("".join(parts))
+            stream.flush()
+            self._previous = list(lines)
+            return written
@@ -0,0 +1,362 @@
+"""
+Lightweight per-check tracing with OpenTelemetry-compatible JSON output.
+A Tracer opens one trace per health check; code further down the call
+path (retries, circuit breakers, HTTP and database calls) adds child spans
+through span(), which finds the active trace in a context variable and is
+a no-op when none is active. Finished traces that pass the sampling
+decision are written as OTLP/JSON lines to a size-rotated local file.
+"""
+import json
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+
+# Bytes per trace file before it is rotated, and rotated files kept.
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+
+SERVICE_NAME = "health-monitor"
+INSTRUMENTATION_SCOPE = "health_monitor"
+
+# OTLP status codes
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    __slots__ = ('trace', 'span_id', 'parent_span_id', 'name', 'kind',
+                 'start_ns', 'end_ns', 'attributes', 'events', 'status_code', 'status_message')
+
+    def __init__(self, trace: Optional['_Trace'], name: str, parent_span_id: Optional[str] = None,
+                 kind: int = SPAN_KIND_INTERNAL, start_ns: Optional[int] = None,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.trace = trace
+        self.span_id = _random_id(8) if trace is not None else ""
+        self.parent_span_id = parent_span_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = start_ns if start_ns is not None else time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.events: List[Dict[str, Any]] = []
+        self.status_code = STATUS_UNSET
+        self.status_message = ""
+
+    @property
+    def recording(self) -> bool:
+        """Whether this span is part of a trace that may be exported."""
+        return self.trace is not None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Duration in seconds once the span has ended."""
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a key/value pair describing the operation."""
+        if self.trace is not None:
+            self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Mark the span as failed and record the exception as an event."""
+        if self.trace is None:
+            return
+        self.status_code = STATUS_ERROR
+        self.status_message = str(exception)
+        self.events.append({
+            'name': 'exception',
+            'time_ns': time.time_ns(),
+            'attributes': {
+                'exception.type': type(exception).__name__,
+                'exception.message': str(exception)
+            }
+        })
+
+    def set_error(self, message: str) -> None:
+        """Mark the span as failed without an exception."""
+        if self.trace is not None:
+            self.status_code = STATUS_ERROR
+            self.status_message = message
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        """Finish the span and hand it to its trace."""
+        if self.trace is None or self.end_ns is not None:
+            return
+        self.end_ns = end_ns if end_ns is not None else time.time_ns()
+        self.trace.finished.append(self)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Convert the span to OTLP/JSON."""
+        data = {
+            'traceId': self.trace.trace_id,
+            'spanId': self.span_id,
+            'name': self.name,
+            'kind': self.kind,
+            'startTimeUnixNano': str(self.start_ns),
+            'endTimeUnixNano': str(self.end_ns),
+            'attributes': _otlp_attributes(self.attributes),
+            'status': {'code': self.status_code}
+        }
+        if self.parent_span_id:
+            data['parentSpanId'] = self.parent_span_id
+        if self.status_message:
+            data['status']['message'] = self.status_message
+        if self.events:
+            data['events'] = [
+                {
+                    'timeUnixNano': str(event['time_ns']),
+                    'name': event['name'],
+                    'attributes': _otlp_attributes(event['attributes'])
+                }
+                for event in self.events
+            ]
+        return data
+
+
+class _Trace:
+    """Spans of one trace collected until its root span ends."""
+
+    __slots__ = ('trace_id', 'sampled', 'finished')
+
+    def __init__(self, sampled: bool):
+        self.trace_id = _random_id(16)
+        self.sampled = sampled
+        self.finished: List[Span] = []
+
+
+# Not-recording span handed out when no trace is active.
+_NOOP_SPAN = Span(None, "noop")
+
+_current_span: ContextVar[Optional[Span]] = ContextVar('health_monitor_current_span', default=None)
+
+
+def current_span() -> Span:
+    """Get the active span, or a no-op span when no trace is active."""
+    return _current_span.get() or _NOOP_SPAN
+
+
+@contextmanager
+def span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> Iterator[Span]:
+    """
+    Time a block as a child of the active span.
+
+    Exceptions leaving the block are recorded on the span and re-raised.
+    When no trace is active this yields a no-op span and costs almost nothing.
+
+    Args:
+        name: Operation name
+        kind: OTLP span kind
+        **attributes: Initial span attributes
+    """
+    parent = _current_span.get()
+    if parent is None:
+        yield _NOOP_SPAN
+        return
+
+    child = Span(parent.trace, name, parent.span_id, kind, attributes=attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.record_exception(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        child.end()
+
+
+def record_span(name: str, start_ns: int, end_ns: int, **attributes: Any) -> None:
+    """
+    Add an already finished child span to the active trace.
+
+    Args:
+        name: Operation name
+        start_ns: Start time in nanoseconds since the epoch
+        end_ns: End time in nanoseconds since the epoch
+        **attributes: Span attributes
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return
+    child = Span(parent.trace, name, parent.span_id, start_ns=start_ns, attributes=attributes)
+    child.end(end_ns)
+
+
+class JsonFileSpanExporter:
+    """Appends traces as OTLP/JSON lines to a size-rotated file."""
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES,
+                 backup_count: int = DEFAULT_BACKUP_COUNT, service_name: str = SERVICE_NAME):
+        """
+        Initialize the exporter.
+
+        Args:
+            path: File the traces are written to
+            max_bytes: Size at which the file is rotated to path.1
+            backup_count: Number of rotated files kept
+            service_name: Value of the service.name resource attribute
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.service_name = service_name
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, spans: List[Span]) -> None:
+        """
+        Write the spans of one trace as a single OTLP/JSON line.
+
+        Args:
+            spans: Finished spans of the trace
+        """
+        request = {
+            'resourceSpans': [{
+                'resource': {'attributes': _otlp_attributes({'service.name': self.service_name})},
+                'scopeSpans': [{
+                    'scope': {'name': INSTRUMENTATION_SCOPE},
+                    'spans': [s.to_otlp() for s in spans]
+                }]
+            }]
+        }
+        line = (json.dumps(request, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+
+        with self._lock:
+            try:
+                if self._needs_rollover(len(line)):
+                    self._rollover()
+                with open(self.path, 'ab') as f:
+                    f.write(line)
+            except OSError as e:
+                self.logger.error(f"Failed to write trace to {self.path}: {e}")
+
+    def close(self) -> None:
+        """Release resources; files are opened per write, so nothing is held."""
+
+    def _needs_rollover(self, size: int) -> bool:
+        if self.max_bytes <= 0:
+            return False
+        try:
+            return os.path.getsize(self.path) + size > self.max_bytes
+        except OSError:
+            return False
+
+    def _rollover(self) -> None:
+        if self.backup_count <= 0:
+            os.remove(self.path)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+
+class Tracer:
+    """Starts per-check traces and exports the ones selected by sampling."""
+
+    def __init__(self, exporter: Optional[JsonFileSpanExporter] = None, sample_rate: float = 1.0,
+                 slow_threshold: Optional[float] = None):
+        """
+        Initialize the tracer.
+
+        Args:
+            exporter: Destination of finished traces; None disables tracing
+            sample_rate: Fraction of traces exported, decided when a trace starts
+            slow_threshold: Traces whose root span takes at least this many
+                seconds are exported even when not sampled
+
+        Raises:
+            ValueError: If sample_rate is outside [0, 1]
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+
+    @property
+    def enabled(self) -> bool:
+        """Whether traces are recorded at all."""
+        return self.exporter is not None
+
+    @contextmanager
+    def start_trace(self, name: str, start_ns: Optional[int] = None, **attributes: Any) -> Iterator[Span]:
+        """
+        Open a new trace whose root span times the block.
+
+        Args:
+            name: Root operation name
+            start_ns: Root start time in nanoseconds since the epoch; defaults to now
+            **attributes: Root span attributes
+        """
+        if self.exporter is None:
+            yield _NOOP_SPAN
+            return
+
+        sampled = self.sample_rate >= 1.0 or random.random() < self.sample_rate
+        if not sampled and self.slow_threshold is None:
+            yield _NOOP_SPAN
+            return
+
+        root = Span(_Trace(sampled), name, start_ns=start_ns, attributes=attributes)
+        token = _current_span.set(root)
+        try:
+            yield root
+        except BaseException as e:
+            root.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            root.end()
+            self._finish(root)
+
+    def close(self) -> None:
+        """Close the exporter."""
+        if self.exporter is not None:
+            self.exporter.close()
+
+    def _finish(self, root: Span) -> None:
+        trace = root.trace
+        keep = trace.sampled or (
+            self.slow_threshold is not None and root.duration >= self.slow_threshold
+        )
+        if keep:
+            self.exporter.export(trace.finished)
+
+
+def _random_id(num_bytes: int) -> str:
+    return os.urandom(num_bytes).hex()
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{'key': key, 'value': _otlp_value(value)} for key, value in attributes.items()]
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
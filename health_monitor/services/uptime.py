@@ -0,0 +1,184 @@
+"""
+Time-weighted uptime computed from status-change timestamps.
+A single sweep over chronologically ordered transitions attributes the
+time between consecutive changes to the status that was in force, so the
+result reflects how long a target was up or down rather than how many
+status events happened to be logged.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+# Statuses whose time counts towards the uptime percentage. Time spent in
+# any other status (unknown, shutdown, ...) is reported but not judged.
+UP_STATUS = "up"
+DOWN_STATUS = "down"
+
+
+class UptimeTracker:
+    """Streaming, mergeable interval sweep over one target's status changes."""
+
+    __slots__ = ('since', 'first_time', 'last_time', 'last_status', 'durations')
+
+    def __init__(self, since: Optional[datetime] = None):
+        """
+        Initialize an empty tracker.
+
+        Args:
+            since: Start of the window. Earlier changes only determine the
+                status in force when the window opens.
+        """
+        self.since = since
+        self.first_time: Optional[datetime] = None
+        self.last_time: Optional[datetime] = None
+        self.last_status: Optional[str] = None
+        self.durations: Dict[str, float] = {}
+
+    def observe(self, timestamp: datetime, status: str) -> None:
+        """
+        Apply a status change.
+
+        Changes are expected in chronological order; a change older than
+        the previous one takes effect at the previous change's time.
+
+        Args:
+            timestamp: When the status was observed
+            status: Status in force from that time on
+        """
+        if self.since is not None and timestamp < self.since:
+            timestamp = self.since
+
+        if self.last_time is None:
+            self.first_time = timestamp
+        elif timestamp > self.last_time:
+            self._credit(self.last_status, (timestamp - self.last_time).total_seconds())
+        else:
+            timestamp = self.last_time
+
+        self.last_time = timestamp
+        self.last_status = status
+
+    def merge(self, other: 'UptimeTracker') -> None:
+        """
+        Merge a tracker covering an adjacent period.
+
+        The gap between the earlier tracker's last change and the later
+        tracker's first change is credited to the earlier tracker's last
+        status, exactly as a single sweep over both periods would.
+
+        Args:
+            other: Tracker over changes before or after this one's
+        """
+        if other.last_time is None:
+            return
+        if self.last_time is None:
+            self.first_time = other.first_time
+            self.last_time = other.last_time
+            self.last_status = other.last_status
+            self.durations = dict(other.durations)
+            return
+
+        for status, seconds in other.durations.items():
+            self._credit(status, seconds)
+
+        if other.first_time >= self.last_time:
+            self._credit(self.last_status, (other.first_time - self.last_time).total_seconds())
+            self.last_time = other.last_time
+            self.last_status = other.last_status
+        elif other.last_time <= self.first_time:
+            self._credit(other.last_status, (self.first_time - other.last_time).total_seconds())
+            self.first_time = other.first_time
+        elif other.last_time > self.last_time:
+            # Overlapping periods cannot be swept exactly; keep the newest status
+            self.first_time = min(self.first_time, other.first_time)
+            self.last_time = other.last_time
+            self.last_status = other.last_status
+
+    def get_durations(self, until: Optional[datetime] = None) -> Dict[str, float]:
+        """
+        Get seconds spent in each status.
+
+        Args:
+            until: End of the window; the last status is extended to it
+
+        Returns:
+            Dictionary mapping status to seconds
+        """
+        durations = dict(self.durations)
+        if until is not None and self.last_time is not None and until > self.last_time:
+            seconds = (until - self.last_time).total_seconds()
+            durations[self.last_status] = durations.get(self.last_status, 0.0) + seconds
+        return durations
+
+    def get_stats(self, until: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Get time-weighted uptime statistics.
+
+        Args:
+            until: End of the window; the last status is extended to it
+
+        Returns:
+            Dictionary with 'up_seconds', 'down_seconds', 'monitored_seconds'
+            and 'uptime_percentage' (None when no up or down time was seen)
+        """
+        durations = self.get_durations(until)
+        up_seconds = durations.get(UP_STATUS, 0.0)
+        down_seconds = durations.get(DOWN_STATUS, 0.0)
+        monitored = up_seconds + down_seconds
+        return {
+            'up_seconds': up_seconds,
+            'down_seconds': down_seconds,
+            'monitored_seconds': monitored,
+            'uptime_percentage': (up_seconds / monitored) * 100 if monitored else None
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the tracker to JSON-compatible data."""
+        return {
+            'since': _isoformat(self.since),
+            'first': _isoformat(self.first_time),
+            'last': _isoformat(self.last_time),
+            'status': self.last_status,
+            'durations': self.durations
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'UptimeTracker':
+        """Restore a tracker serialized with to_dict()."""
+        tracker = cls(since=_parse_optional(data['since']))
+        tracker.first_time = _parse_optional(data['first'])
+        tracker.last_time = _parse_optional(data['last'])
+        tracker.last_status = data['status']
+        tracker.durations = dict(data['durations'])
+        return tracker
+
+    def _credit(self, status: Optional[str], seconds: float) -> None:
+        if status is not None and seconds > 0:
+            self.durations[status] = self.durations.get(status, 0.0) + seconds
+
+
+def compute_uptime(changes: Iterable[Tuple[datetime, str]], since: Optional[datetime] = None,
+                   until: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Compute time-weighted uptime in one pass over sorted status changes.
+
+    Args:
+        changes: (timestamp, status) pairs in chronological order
+        since: Start of the window
+        until: End of the window
+
+    Returns:
+        Statistics as returned by UptimeTracker.get_stats()
+    """
+    tracker = UptimeTracker(since=since)
+    for timestamp, status in changes:
+        tracker.observe(timestamp, status)
+    return tracker.get_stats(until)
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _parse_optional(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
@@ -3,11 +3,13 @@ Website health checker implementation.
 """
 import requests
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
 import time
 import logging
 
 from health_monitor.models.data_models import WebsiteTarget, HealthStatus
+from health_monitor.services import tracing
 from health_monitor.services.retry_handler import RetryHandler, RetryConfig, CircuitBreaker, CircuitBreakerOpenException
 
 
@@ -99,6 +101,42 @@ class WebsiteHealthChecker:
                 timestamp=timestamp
             )
     
+    def release_target(self, target_name: str) -> None:
+        """
+        Drop the circuit breaker of a target that was removed or redefined.
+        
+        Args:
+            target_name: Name of the target
+        """
+        if self.circuit_breakers is not None:
+            self.circuit_breakers.pop(target_name, None)
+    
+    def prune_connection_pools(self, targets: Iterable[WebsiteTarget]) -> int:
+        """
+        Close pooled connections to hosts that none of the given targets use.
+        
+        Args:
+            targets: Website targets still being monitored
+            
+        Returns:
+            Number of connection pools closed
+        """
+        origins = {_origin(target.url) for target in targets}
+        closed = 0
+        for adapter in self.session.adapters.values():
+            pools = getattr(getattr(adapter, 'poolmanager', None), 'pools', None)
+            if pools is None:
+                continue
+            for key in list(pools.keys()):
+                if (key.key_scheme, key.key_host, key.key_port) in origins:
+                    continue
+                try:
+                    del pools[key]  # the pool manager closes the evicted pool
+                    closed += 1
+                except KeyError:
+                    pass
+        return closed
+    
     def _perform_http_request(self, target: WebsiteTarget) -> HealthStatus:
         """
         Perform the actual HTTP request for health checking.
@@ -114,11 +152,20 @@ class WebsiteHealthChecker:
         
         try:
             # Perform HTTP GET request with timeout
-            response = self.session.get(
-                target.url,
-                timeout=target.timeout,
-                allow_redirects=True
-            )
+            with tracing.span("http.request", kind=tracing.SPAN_KIND_CLIENT,
+                              **{"http.request.method": "GET", "url.full": _without_userinfo(target.url)}) as http_span:
+                request_start_ns = time.time_ns()
+                response = self.session.get(
+                    target.url,
+                    timeout=target.timeout,
+                    allow_redirects=True
+                )
+                http_span.set_attribute("http.response.status_code", response.status_code)
+                if http_span.recording:
+                    # Split the request into waiting for headers and reading the body
+                    headers_ns = request_start_ns + int(response.elapsed.total_seconds() * 1e9)
+                    tracing.record_span("http.headers", request_start_ns, headers_ns)
+                    tracing.record_span("http.body", headers_ns, time.time_ns())
             
             response_time = time.time() - start_time
             
@@ -182,4 +229,23 @@ class WebsiteHealthChecker:
     
     def close(self):
         """Close the HTTP session."""
-        self.session.close()
\ No newline at end of file
+        self.session.close()
+
+
+def _without_userinfo(url: str) -> str:
+    """Get the URL without the user:password@ part, so credentials stay out of exported traces."""
+    if '@' not in url:
+        return url
+    parts = urlsplit(url)
+    return urlunsplit(parts._replace(netloc=parts.netloc.rpartition('@')[2]))
+
+
+def _origin(url: str) -> Tuple[str, Optional[str], Optional[int]]:
+    """Get the (scheme, host, port) a URL's connections are pooled under."""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    return scheme, parts.hostname, port or {'http': 80, 'https': 443}.get(scheme)
\ No newline at end of file
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Health Monitor Log Query
+ログ履歴を新しい順にページ単位でJSON出力するツール
+"""
+
+import argparse
+import json
+import sys
+
+from health_monitor.services.log_aggregator import parse_timestamp
+from health_monitor.services.log_query import DEFAULT_PAGE_SIZE, LogQuery
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Health Monitor Log Query')
+    parser.add_argument('--log-dir', default='logs', help='ログディレクトリのパス (デフォルト: logs)')
+    parser.add_argument('--target', help='監視対象名で絞り込み')
+    parser.add_argument('--start', help='開始日時 (ISO形式, 例: 2024-01-15T00:00:00)')
+    parser.add_argument('--end', help='終了日時 (ISO形式)')
+    parser.add_argument('--status', help='変化後のステータスで絞り込み (例: down)')
+    parser.add_argument('--limit', type=int, default=DEFAULT_PAGE_SIZE,
+                        help=f'1ページの件数 (デフォルト: {DEFAULT_PAGE_SIZE})')
+    parser.add_argument('--cursor', help='前のページの next_cursor')
+
+    args = parser.parse_args()
+
+    try:
+        page = LogQuery(args.log_dir).query(
+            target=args.target,
+            start=parse_timestamp(args.start) if args.start else None,
+            end=parse_timestamp(args.end) if args.end else None,
+            status=args.status,
+            limit=args.limit,
+            cursor=args.cursor
+        )
+    except ValueError as e:
+        print(f"検索条件が不正です: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    print(json.dumps(page, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
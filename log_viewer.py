@@ -5,132 +5,70 @@ Health Monitor Log Viewer
 JSONログファイルを読み込んで美しいHTMLダッシュボードを生成するツール
 """
 
-import json
 import os
 import glob
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import argparse
 
+from health_monitor.services.log_aggregator import LogAggregator, aggregate_log_files
+from health_monitor.services.log_checkpoint import LogCheckpointCache
+
+# 解析済みログから保持する最新エントリ数
+RECENT_ENTRY_LIMIT = 100
+
 
 class HealthLogViewer:
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(self, log_dir: str = "logs", cache_file: Optional[str] = None, use_cache: bool = True,
+                 workers: Optional[int] = None):
         self.log_dir = log_dir
+        self.use_cache = use_cache
+        self.workers = workers
+        self.cache_file = cache_file or os.path.join(log_dir, ".log_viewer_cache.json")
         
     def get_log_files(self) -> List[str]:
         """ログディレクトリから全てのログファイルを取得"""
         pattern = os.path.join(self.log_dir, "health_monitor_*.log")
         return sorted(glob.glob(pattern), reverse=True)
     
-    def parse_log_file(self, log_file: str) -> List[Dict[str, Any]]:
-        """JSONログファイルを解析"""
-        entries = []
-        try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            entry = json.loads(line)
-                            # タイムスタンプを解析
-                            entry['parsed_timestamp'] = datetime.fromisoformat(
-                                entry['timestamp'].replace('Z', '+00:00')
-                            )
-                            entries.append(entry)
-                        except json.JSONDecodeError:
-                            continue
-        except FileNotFoundError:
-            print(f"ログファイルが見つかりません: {log_file}")
-        
-        return entries
-    
-    def get_latest_status(self, entries: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
-        """各監視対象の最新ステータスを取得"""
-        latest_status = {}
-        
-        for entry in entries:
-            target_name = entry.get('target_name')
-            if target_name and target_name != 'system':
-                # ステータス変更を解析
-                status_change = entry.get('status_change', '')
-                if '->' in status_change:
-                    current_status = status_change.split('->')[-1]
-                else:
-                    current_status = status_change
-                
-                # 応答時間を抽出
-                response_time = None
-                details = entry.get('details', '')
-                if 'Response time:' in details:
-                    try:
-                        time_str = details.split('Response time: ')[1].split('s')[0]
-                        response_time = float(time_str)
-                    except (IndexError, ValueError):
-                        pass
-                
-                latest_status[target_name] = {
-                    'status': current_status,
-                    'type': entry.get('target_type'),
-                    'timestamp': entry['parsed_timestamp'],
-                    'details': details,
-                    'response_time': response_time
-                }
-        
-        return latest_status
-    
-    def get_status_history(self, entries: List[Dict[str, Any]], hours: int = 24) -> Dict[str, List[Dict[str, Any]]]:
-        """指定時間内のステータス履歴を取得"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        history = {}
-        
-        for entry in entries:
-            if entry['parsed_timestamp'] < cutoff_time:
-                continue
-                
-            target_name = entry.get('target_name')
-            if target_name and target_name != 'system':
-                if target_name not in history:
-                    history[target_name] = []
-                
-                history[target_name].append({
-                    'timestamp': entry['parsed_timestamp'],
-                    'status_change': entry.get('status_change'),
-                    'details': entry.get('details'),
-                    'type': entry.get('target_type')
-                })
-        
-        # 各ターゲットの履歴を時系列順にソート
-        for target_name in history:
-            history[target_name].sort(key=lambda x: x['timestamp'])
-        
-        return history
-    
-    def generate_html_dashboard(self, output_file: str = "dashboard.html", days: int = 1):
-        """HTMLダッシュボードを生成"""
-        # 指定日数分のログファイルを処理
-        all_entries = []
+    def aggregate_logs(self, days: int = 1) -> LogAggregator:
+        """最新N日分のログを1パスで集計（チェックポイントがあれば追記分のみ解析）"""
         log_files = self.get_log_files()
+        cache = LogCheckpointCache(self.cache_file, namespace="log_aggregator") if self.use_cache else None
         
-        for log_file in log_files[:days]:  # 最新のN日分
-            entries = self.parse_log_file(log_file)
-            all_entries.extend(entries)
+        aggregator = aggregate_log_files(
+            log_files[:days],
+            since=datetime.now() - timedelta(hours=24 * days),
+            cache=cache,
+            recent_limit=RECENT_ENTRY_LIMIT,
+            workers=self.workers
+        )
         
-        # 時系列順にソート
-        all_entries.sort(key=lambda x: x['parsed_timestamp'], reverse=True)
+        if cache:
+            cache.prune(log_files)
+            cache.save()
         
-        # データを分析
-        latest_status = self.get_latest_status(all_entries)
-        history = self.get_status_history(all_entries, hours=24 * days)
+        return aggregator
+    
+    def generate_html_dashboard(self, output_file: str = "dashboard.html", days: int = 1):
+        """HTMLダッシュボードを生成"""
+        aggregator = self.aggregate_logs(days)
         
         # HTMLを生成
-        html_content = self._generate_html_content(latest_status, history, all_entries[:100])  # 最新100件
+        html_content = self._generate_html_content(
+            aggregator.get_latest_status(),
+            aggregator.get_status_history(),
+            aggregator.get_recent_entries(),
+            aggregator.get_uptime_stats()
+        )
         
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(html_content)
         
         print(f"HTMLダッシュボードを生成しました: {output_file}")
     
-    def _generate_html_content(self, latest_status: Dict, history: Dict, recent_entries: List) -> str:
+    def _generate_html_content(self, latest_status: Dict, history: Dict, recent_entries: List,
+                               uptime_stats: Optional[Dict] = None) -> str:
         """HTML内容を生成"""
         
         # ステータス別の統計
@@ -412,6 +350,17 @@ class HealthLogViewer:
             if response_time is not None:
                 response_time_text = f'<span class="response-time">({response_time:.2f}s)</span>'
             
+            # 稼働率（時間加重）と応答時間のパーセンタイル (p50/p95/p99)
+            stats = (uptime_stats or {}).get(target_name, {})
+            if stats.get('uptime_percentage') is not None:
+                response_time_text += f'<span class="response-time">稼働率 {stats["uptime_percentage"]:.1f}%</span>'
+            if stats.get('p50_response_time') is not None:
+                response_time_text += (
+                    f'<span class="response-time">p50 {stats["p50_response_time"]:.2f}s / '
+                    f'p95 {stats["p95_response_time"]:.2f}s / '
+                    f'p99 {stats["p99_response_time"]:.2f}s</span>'
+                )
+            
             html += f"""
                 <div class="service-item {status}">
                     <div>
@@ -471,10 +420,14 @@ def main():
     parser.add_argument('--log-dir', default='logs', help='ログディレクトリのパス (デフォルト: logs)')
     parser.add_argument('--output', default='dashboard.html', help='出力HTMLファイル名 (デフォルト: dashboard.html)')
     parser.add_argument('--days', type=int, default=1, help='表示する日数 (デフォルト: 1)')
+    parser.add_argument('--cache-file', help='解析チェックポイントの保存先 (デフォルト: <log-dir>/.log_viewer_cache.json)')
+    parser.add_argument('--no-cache', action='store_true', help='チェックポイントを使わずに全ログを再解析')
+    parser.add_argument('--workers', type=int, help='ログ解析に使うプロセス数 (デフォルト: 解析量に応じて自動, 1で並列化なし)')
     
     args = parser.parse_args()
     
-    viewer = HealthLogViewer(args.log_dir)
+    viewer = HealthLogViewer(args.log_dir, cache_file=args.cache_file, use_cache=not args.no_cache,
+                             workers=args.workers)
     viewer.generate_html_dashboard(args.output, args.days)
 
 
@@ -45,8 +45,31 @@ def run_all_tests():
         'test_database_checker',
         'test_health_check_engine',
         'test_log_manager',
+        'test_log_checkpoint',
+        'test_log_aggregator',
+        'test_latency_sketch',
+        'test_latency_histogram',
+        'test_uptime',
+        'test_log_query',
+        'test_metrics_exporter',
+        'test_sampling_profiler',
+        'test_tracing',
+        'test_dashboard_server',
         'test_retry_handler',
         'test_self_monitor',
+        'test_metrics_collector',
+        'test_ring_buffer',
+        'test_terminal_renderer',
+        'test_display_refresher',
+        'test_status_summary',
+        'test_curses_display',
+        'test_target_diff',
+        'test_config_watcher',
+        'test_config_snapshot',
+        'test_target_selector',
+        'test_target_registry',
+        'test_check_scheduler',
+        'test_configuration_manager',
         'test_status_display',
         'test_main_integration'
     ]
@@ -0,0 +1,72 @@
+"""
+Unit tests for per-group check scheduling.
+"""
+import unittest
+
+from health_monitor.models.data_models import WebsiteTarget, DatabaseTarget
+from health_monitor.services.check_scheduler import CheckScheduler
+
+
+class TestCheckScheduler(unittest.TestCase):
+    """Test cases for CheckScheduler."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.payment = WebsiteTarget(name="payment", url="https://pay.example.com", tags=["payments"])
+        self.critical = WebsiteTarget(name="critical", url="https://c.example.com", tags=["payments", "critical"])
+        self.blog = WebsiteTarget(name="blog", url="https://blog.example.com")
+        self.db = DatabaseTarget(name="db", host="localhost", port=5432, database="app",
+                                 username="user", password="secret", tags=["critical"])
+        self.scheduler = CheckScheduler(300, {"payments": 30, "critical": 10})
+
+    def _due(self, now):
+        websites, databases = self.scheduler.due_targets([self.payment, self.critical, self.blog], [self.db], now=now)
+        return sorted(t.name for t in websites + databases)
+
+    def test_interval_is_shortest_tag_interval(self):
+        """Test a target uses the shortest interval among its tags."""
+        self.assertEqual(self.scheduler.interval_for(self.payment), 30)
+        self.assertEqual(self.scheduler.interval_for(self.critical), 10)
+        self.assertEqual(self.scheduler.interval_for(self.blog), 300)
+
+    def test_groups_run_on_their_own_interval(self):
+        """Test every group is due at first and then on its own cycle."""
+        self.assertEqual(self._due(0), ["blog", "critical", "db", "payment"])
+        self.scheduler.finish(now=1)
+        self.assertEqual(self.scheduler.seconds_until_due(now=1), 10)
+
+        self.assertEqual(self._due(11), ["critical", "db"])
+        self.scheduler.finish(now=11)
+        self.assertEqual(self._due(31), ["critical", "db", "payment"])
+        self.scheduler.finish(now=31)
+        self.assertEqual(self._due(35), [])
+        self.assertEqual(self._due(301), ["blog", "critical", "db", "payment"])
+
+    def test_due_groups_carry_their_interval(self):
+        """Test due groups are returned shortest interval first with their targets."""
+        groups = self.scheduler.due_groups([self.payment, self.critical, self.blog], [self.db], now=0)
+
+        self.assertEqual([(interval, [t.name for t in websites + databases]) for interval, websites, databases in groups],
+                         [(10, ["critical", "db"]), (30, ["payment"]), (300, ["blog"])])
+
+    def test_without_tag_intervals_everything_is_one_group(self):
+        """Test the default schedule checks all targets together."""
+        scheduler = CheckScheduler(60)
+
+        self.assertEqual(scheduler.seconds_until_due(), 60)
+        websites, databases = scheduler.due_targets([self.payment, self.blog], [self.db], now=0)
+        self.assertEqual(len(websites) + len(databases), 3)
+        scheduler.finish(now=0)
+        self.assertEqual(scheduler.due_targets([self.payment, self.blog], [self.db], now=30), ([], []))
+
+    def test_reset_makes_everything_due(self):
+        """Test reset schedules every group immediately."""
+        self._due(0)
+        self.scheduler.finish(now=0)
+        self.scheduler.reset()
+
+        self.assertEqual(self._due(1), ["blog", "critical", "db", "payment"])
+
+
+if __name__ == '__main__':
+    unittest.main()
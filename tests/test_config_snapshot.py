@@ -0,0 +1,90 @@
+"""
+Unit tests for the validated configuration snapshot.
+"""
+import json
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+from health_monitor.models.data_models import WebsiteTarget, DatabaseTarget
+from health_monitor.services.config_snapshot import ConfigSnapshotCache, file_digest
+
+
+class TestConfigSnapshotCache(unittest.TestCase):
+    """Test cases for ConfigSnapshotCache."""
+
+    def setUp(self):
+        """Set up a temporary directory with one configuration file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.snapshot_file = os.path.join(self.temp_dir, ".snapshot.json")
+        self.config_file = os.path.join(self.temp_dir, "databases.json")
+        with open(self.config_file, 'w', encoding='utf-8') as f:
+            f.write('{"databases": []}')
+        self.digest = file_digest(self.config_file)
+        self.targets = [DatabaseTarget("db", "localhost", 5432, "app", "user", "secret", "require")]
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        """Test saved targets are rebuilt for the same file contents."""
+        cache = ConfigSnapshotCache(self.snapshot_file)
+        cache.put(self.config_file, self.digest, "databases", self.targets)
+        cache.save()
+
+        loaded = ConfigSnapshotCache(self.snapshot_file)
+        self.assertEqual(loaded.get(self.config_file, self.digest, "databases"), self.targets)
+        self.assertIsNone(loaded.get(self.config_file, "other-digest", "databases"))
+        self.assertIsNone(loaded.get(self.config_file, self.digest, "websites"))
+        self.assertIsNone(loaded.get(os.path.join(self.temp_dir, "missing.json"), self.digest, "databases"))
+
+    @unittest.skipIf(os.name == 'nt', "POSIX permissions")
+    def test_snapshot_readable_by_owner_only(self):
+        """Test the snapshot holding passwords is written with mode 0600."""
+        cache = ConfigSnapshotCache(self.snapshot_file)
+        cache.put(self.config_file, self.digest, "databases", self.targets)
+        cache.save()
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.snapshot_file).st_mode), 0o600)
+        self.assertFalse(os.path.exists(self.snapshot_file + ".tmp"))
+
+    def test_unusable_snapshots_ignored(self):
+        """Test corrupt snapshots and snapshots for other target fields are discarded."""
+        with open(self.snapshot_file, 'w', encoding='utf-8') as f:
+            f.write("{not json")
+        self.assertIsNone(ConfigSnapshotCache(self.snapshot_file).get(self.config_file, self.digest, "databases"))
+
+        with open(self.snapshot_file, 'w', encoding='utf-8') as f:
+            json.dump({"version": 1, "fields": {"websites": ["name"]}, "files": {
+                os.path.abspath(self.config_file): {"sha256": self.digest, "section": "databases", "rows": [["db"]]}
+            }}, f)
+        self.assertIsNone(ConfigSnapshotCache(self.snapshot_file).get(self.config_file, self.digest, "databases"))
+
+    def test_prune(self):
+        """Test files no longer configured are dropped from their section only."""
+        cache = ConfigSnapshotCache(self.snapshot_file)
+        website_file = os.path.join(self.temp_dir, "websites.json")
+        cache.put(self.config_file, self.digest, "databases", self.targets)
+        cache.put(website_file, "abc", "websites", [WebsiteTarget("site", "https://example.com")])
+
+        cache.prune("databases", [])
+
+        self.assertIsNone(cache.get(self.config_file, self.digest, "databases"))
+        self.assertEqual(cache.get(website_file, "abc", "websites")[0].name, "site")
+
+    def test_save_only_when_changed(self):
+        """Test an unchanged cache does not write the snapshot."""
+        ConfigSnapshotCache(self.snapshot_file).save()
+        self.assertFalse(os.path.exists(self.snapshot_file))
+
+    def test_file_digest(self):
+        """Test digests follow file contents."""
+        self.assertEqual(len(self.digest), 64)
+        self.assertIsNone(file_digest(os.path.join(self.temp_dir, "missing.json")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Unit tests for the configuration file watcher.
+"""
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from health_monitor.services.config_watcher import ConfigWatcher, file_signature
+
+
+class TestConfigWatcher(unittest.TestCase):
+    """Test cases for ConfigWatcher."""
+
+    def setUp(self):
+        """Set up a temporary config file and a change counter."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "websites.json")
+        self._write('{"websites": []}')
+        self.changes = []
+        self.changed = threading.Event()
+        self.watcher = ConfigWatcher([self.path, os.path.join(self.temp_dir, "databases.json")],
+                                     on_change=self._on_change, poll_interval=0.02, debounce=0.1)
+
+    def tearDown(self):
+        """Stop the watcher and remove the temporary directory."""
+        self.watcher.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _on_change(self):
+        self.changes.append(time.monotonic())
+        self.changed.set()
+
+    def _write(self, content, path=None):
+        with open(path or self.path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def test_file_signature(self):
+        """Test signatures follow content size and report missing files."""
+        before = file_signature(self.path)
+        self._write('{"websites": [{}]}')
+
+        self.assertNotEqual(file_signature(self.path), before)
+        self.assertIsNone(file_signature(os.path.join(self.temp_dir, "missing.json")))
+
+    def test_poll(self):
+        """Test poll reports each change once, including created and deleted files."""
+        self.assertFalse(self.watcher.poll())
+
+        self._write('{"websites": [1]}')
+        self.assertTrue(self.watcher.poll())
+        self.assertFalse(self.watcher.poll())
+
+        self._write('{}', os.path.join(self.temp_dir, "databases.json"))
+        self.assertTrue(self.watcher.poll())
+        os.remove(self.path)
+        self.assertTrue(self.watcher.poll())
+
+    def test_change_reported_once_after_writes_settle(self):
+        """Test a burst of writes produces a single debounced callback."""
+        self.watcher.start()
+        self.assertTrue(self.watcher.is_running)
+
+        for size in range(5):
+            self._write('{"websites": []}' + " " * size)
+            time.sleep(0.03)
+        last_write = time.monotonic()
+
+        self.assertTrue(self.changed.wait(2.0))
+        time.sleep(0.3)
+        self.assertEqual(len(self.changes), 1)
+        self.assertGreaterEqual(self.changes[0] - last_write, 0.1)
+        self.assertEqual(self.watcher.changes_detected, 1)
+
+    def test_stop(self):
+        """Test a stopped watcher no longer reports changes."""
+        self.watcher.start()
+        self.watcher.stop()
+        self.assertFalse(self.watcher.is_running)
+
+        self._write('{"websites": [2]}')
+        time.sleep(0.2)
+        self.assertEqual(self.changes, [])
+
+    def test_paths_function(self):
+        """Test files returned by a paths function are picked up when they appear."""
+        fragment = os.path.join(self.temp_dir, "extra.json")
+        paths = [self.path]
+        watcher = ConfigWatcher(lambda: list(paths), on_change=lambda: None)
+
+        paths.append(fragment)
+        self._write('{}', fragment)
+
+        self.assertTrue(watcher.poll())
+        self.assertFalse(watcher.poll())
+
+    def test_invalid_poll_interval(self):
+        """Test a non-positive poll interval is rejected."""
+        with self.assertRaises(ValueError):
+            ConfigWatcher([self.path], on_change=lambda: None, poll_interval=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
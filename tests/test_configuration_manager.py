@@ -0,0 +1,208 @@
+"""
+Unit tests for configuration loading, fragments and templates.
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from health_monitor.services.configuration_manager import ConfigurationManager, ConfigurationError
+
+
+class TestConfigurationManager(unittest.TestCase):
+    """Test cases for ConfigurationManager."""
+
+    def setUp(self):
+        """Set up an empty configuration directory."""
+        self.config_dir = tempfile.mkdtemp()
+        self.manager = ConfigurationManager(self.config_dir)
+
+    def tearDown(self):
+        """Remove the configuration directory."""
+        shutil.rmtree(self.config_dir, ignore_errors=True)
+
+    def _write(self, relative_path, data):
+        path = os.path.join(self.config_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        return path
+
+    def test_main_file(self):
+        """Test the single websites.json layout still loads with defaults."""
+        self._write("websites.json", {"websites": [{"name": "Site", "url": "https://example.com"}]})
+
+        targets = self.manager.load_website_config()
+
+        self.assertEqual(len(targets), 1)
+        self.assertEqual(targets[0].timeout, 10)
+        self.assertEqual(targets[0].expected_status, 200)
+
+    def test_missing_configuration(self):
+        """Test a type with neither a main file nor fragments is an error."""
+        self.assertFalse(self.manager.has_website_config())
+        with self.assertRaises(ConfigurationError):
+            self.manager.load_website_config()
+
+    def test_fragments_merged_in_name_order(self):
+        """Test fragments are read after the main file, sorted by file name."""
+        self._write("websites.json", {"websites": [{"name": "Main", "url": "https://example.com"}]})
+        self._write("websites.d/20-b.json", {"websites": [{"name": "B", "url": "https://b.example.com"}]})
+        self._write("websites.d/10-a.json", {"websites": [{"name": "A", "url": "https://a.example.com"}]})
+        self._write("websites.d/.hidden.json", {"websites": [{"name": "Hidden", "url": "https://h.example.com"}]})
+        self._write("websites.d/notes.txt", {})
+
+        names = [target.name for target in self.manager.load_website_config()]
+
+        self.assertEqual(names, ["Main", "A", "B"])
+        self.assertIn(os.path.join(self.config_dir, "websites.d"), self.manager.config_files())
+        self.assertIn(os.path.join(self.config_dir, "websites.d", "10-a.json"), self.manager.config_files())
+
+    def test_fragments_without_main_file(self):
+        """Test fragments alone are a complete configuration."""
+        self._write("databases.d/app.json", {"databases": [{
+            "name": "DB", "host": "localhost", "port": 5432,
+            "database": "app", "username": "user", "password": "secret"
+        }]})
+
+        self.assertTrue(self.manager.has_database_config())
+        self.assertEqual(self.manager.load_database_config()[0].sslmode, "prefer")
+
+    def test_duplicate_names(self):
+        """Test a target name defined in two files is rejected."""
+        self._write("websites.json", {"websites": [{"name": "Site", "url": "https://example.com"}]})
+        self._write("websites.d/extra.json", {"websites": [{"name": "Site", "url": "https://other.example.com"}]})
+
+        with self.assertRaises(ConfigurationError) as context:
+            self.manager.load_website_config()
+        self.assertIn("Duplicate website target name 'Site'", str(context.exception))
+
+    def test_invalid_fragment(self):
+        """Test an invalid fragment names its file."""
+        self._write("websites.json", {"websites": []})
+        path = self._write("websites.d/bad.json", {"websites": [{"name": "Bad", "url": "ftp://example.com"}]})
+
+        with self.assertRaises(ConfigurationError) as context:
+            self.manager.load_website_config()
+        self.assertIn(path, str(context.exception))
+
+    def test_template_matrix(self):
+        """Test a template expands into one target per combination."""
+        self._write("websites.d/regions.json", {"templates": [{
+            "name": "{service} ({region})",
+            "url": "https://{region}.example.com/{service}/health",
+            "timeout": 5,
+            "matrix": {"region": ["tokyo", "osaka"], "service": ["api", "web", "auth"]}
+        }]})
+
+        targets = self.manager.load_website_config()
+
+        self.assertEqual(len(targets), 6)
+        self.assertEqual(targets[0].name, "api (tokyo)")
+        self.assertEqual(targets[0].url, "https://tokyo.example.com/api/health")
+        self.assertEqual(targets[5].name, "auth (osaka)")
+        self.assertTrue(all(target.timeout == 5 for target in targets))
+
+    def test_template_keeps_placeholder_types(self):
+        """Test a value that is a single placeholder keeps the variable's type."""
+        self._write("databases.json", {"databases": [], "templates": [{
+            "name": "shard-{shard}", "host": "db{shard}.internal", "port": "{port}",
+            "database": "app", "username": "user", "password": "secret",
+            "matrix": {"shard": [1, 2], "port": [5432]}
+        }]})
+
+        targets = self.manager.load_database_config()
+
+        self.assertEqual([t.name for t in targets], ["shard-1", "shard-2"])
+        self.assertEqual(targets[1].host, "db2.internal")
+        self.assertEqual(targets[0].port, 5432)
+
+    def test_invalid_templates(self):
+        """Test unknown variables and malformed matrices are rejected."""
+        self._write("websites.json", {"templates": [{
+            "name": "{service}", "url": "https://{region}.example.com", "matrix": {"service": ["api"]}
+        }]})
+        with self.assertRaises(ConfigurationError):
+            self.manager.load_website_config()
+
+        self._write("websites.json", {"templates": [{"name": "x", "url": "https://example.com", "matrix": {"a": []}}]})
+        with self.assertRaises(ConfigurationError):
+            self.manager.load_website_config()
+
+    def test_tags(self):
+        """Test tags are loaded, expanded in templates and validated."""
+        self._write("websites.json", {
+            "websites": [{"name": "Site", "url": "https://example.com", "tags": ["payments", "critical"]}],
+            "templates": [{
+                "name": "{region}", "url": "https://{region}.example.com", "tags": ["region-{region}"],
+                "matrix": {"region": ["tokyo"]}
+            }]
+        })
+
+        targets = self.manager.load_website_config()
+
+        self.assertEqual(targets[0].tags, ["payments", "critical"])
+        self.assertEqual(targets[1].tags, ["region-tokyo"])
+
+        self._write("websites.json", {"websites": [{"name": "Site", "url": "https://example.com", "tags": "payments"}]})
+        with self.assertRaises(ConfigurationError):
+            self.manager.load_website_config()
+
+    def test_unchanged_files_not_reparsed(self):
+        """Test reloads only parse files whose signature changed."""
+        self._write("websites.d/a.json", {"websites": [{"name": "A", "url": "https://a.example.com"}]})
+        path_b = self._write("websites.d/b.json", {"websites": [{"name": "B", "url": "https://b.example.com"}]})
+        first = self.manager.load_website_config()
+
+        with patch.object(self.manager, '_parse_file', wraps=self.manager._parse_file) as parse:
+            second = self.manager.load_website_config()
+            self.assertEqual(parse.call_count, 0)
+            self.assertIs(second[0], first[0])
+
+            self._write("websites.d/b.json", {"websites": [{"name": "B", "url": "https://b2.example.com"}]})
+            third = self.manager.load_website_config()
+            parse.assert_called_once_with("websites", path_b)
+
+        self.assertIs(third[0], first[0])
+        self.assertEqual(third[1].url, "https://b2.example.com")
+
+        os.remove(path_b)
+        self.assertEqual([t.name for t in self.manager.load_website_config()], ["A"])
+        self.assertNotIn(path_b, self.manager._file_cache)
+
+    def test_snapshot_skips_parsing_on_restart(self):
+        """Test a new manager rebuilds unchanged files from the snapshot."""
+        self._write("websites.json", {"templates": [{
+            "name": "{service}", "url": "https://{service}.example.com", "matrix": {"service": ["api", "web"]}
+        }]})
+        path_b = self._write("websites.d/b.json", {"websites": [{"name": "B", "url": "https://b.example.com"}]})
+        expected = self.manager.load_website_config()
+        self.assertTrue(os.path.exists(self.manager.snapshot_file))
+
+        restarted = ConfigurationManager(self.config_dir)
+        with patch.object(restarted, '_parse_file', wraps=restarted._parse_file) as parse:
+            self.assertEqual(restarted.load_website_config(), expected)
+            self.assertEqual(parse.call_count, 0)
+
+        # Same size and mtime but different contents is still caught by the hash
+        stat_b = os.stat(path_b)
+        self._write("websites.d/b.json", {"websites": [{"name": "C", "url": "https://b.example.com"}]})
+        os.utime(path_b, ns=(stat_b.st_atime_ns, stat_b.st_mtime_ns))
+        restarted = ConfigurationManager(self.config_dir)
+        self.assertEqual([t.name for t in restarted.load_website_config()], ["api", "web", "C"])
+
+    def test_snapshot_disabled(self):
+        """Test no snapshot is written when disabled."""
+        self._write("websites.json", {"websites": [{"name": "Site", "url": "https://example.com"}]})
+        manager = ConfigurationManager(self.config_dir, use_snapshot=False)
+
+        manager.load_website_config()
+
+        self.assertIsNone(manager.snapshot_file)
+        self.assertEqual(os.listdir(self.config_dir), ["websites.json"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+"""
+Unit tests for the interactive curses status display.
+"""
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from health_monitor.models.data_models import HealthStatus
+from health_monitor.services.curses_display import CursesStatusDisplay, curses, is_available
+
+
+BASE_TIME = datetime(2024, 1, 15, 10, 0, 0)
+
+
+def _status(name, healthy=True, response_time=0.1, minutes=0):
+    return HealthStatus(
+        target_name=name,
+        is_healthy=healthy,
+        response_time=response_time,
+        error_message=None if healthy else "Connection\nrefused",
+        timestamp=BASE_TIME + timedelta(minutes=minutes)
+    )
+
+
+class FakeScreen:
+    """Minimal curses window recording the text drawn on each row."""
+
+    def __init__(self, height=12, width=120):
+        self.height = height
+        self.width = width
+        self.rows = {}
+
+    def getmaxyx(self):
+        return self.height, self.width
+
+    def erase(self):
+        self.rows = {}
+
+    def addnstr(self, row, column, text, length, attr=0):
+        self.rows[row] = text[:length]
+
+    def noutrefresh(self):
+        pass
+
+
+@unittest.skipUnless(is_available(), "curses is not available")
+class TestCursesStatusDisplay(unittest.TestCase):
+    """Test cases for CursesStatusDisplay."""
+
+    def setUp(self):
+        """Set up a display with the UI thread disabled."""
+        patcher = patch.object(CursesStatusDisplay, '_ensure_started')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.on_quit = Mock()
+        self.display = CursesStatusDisplay(
+            group_resolver=lambda name: "database" if name.startswith("db") else "website",
+            on_quit=self.on_quit
+        )
+        self.statuses = {
+            "web-a": _status("web-a", response_time=0.5),
+            "web-b": _status("web-b", response_time=2.0),
+            "db-a": _status("db-a", healthy=False, response_time=0.0, minutes=1),
+        }
+        self.display.update_display(self.statuses)
+
+    def _keys(self, text):
+        for char in text:
+            self.display.handle_key(ord(char))
+
+    def test_sort_keys(self):
+        """Test name, latency and last-change sorting and reversing."""
+        self.assertEqual(self.display.visible_targets(), ["db-a", "web-a", "web-b"])
+
+        self._keys("l")
+        self.assertEqual(self.display.visible_targets(), ["web-b", "web-a", "db-a"])
+
+        self._keys("r")
+        self.assertEqual(self.display.visible_targets(), ["db-a", "web-a", "web-b"])
+
+        self._keys("c")
+        self.assertEqual(self.display.visible_targets()[0], "db-a")
+        self.assertFalse(self.display.descending)
+
+    def test_filter(self):
+        """Test typing a filter narrows the list case-insensitively."""
+        self._keys("/WEB")
+        self.assertTrue(self.display.editing_filter)
+        self.assertEqual(self.display.visible_targets(), ["web-a", "web-b"])
+
+        self._keys("-x")
+        self.display.handle_key(127)
+        self._keys("B\n")
+        self.assertFalse(self.display.editing_filter)
+        self.assertEqual(self.display.visible_targets(), ["web-b"])
+
+        # Keys are commands again once the filter is confirmed
+        self._keys("q")
+        self.on_quit.assert_called_once()
+
+        self.display.handle_key(27)
+        self.assertEqual(self.display.filter_text, "")
+        self.assertEqual(len(self.display.visible_targets()), 3)
+
+    def test_updates_refresh_view(self):
+        """Test new, changed and removed targets reach the sorted view."""
+        self._keys("l")
+        statuses = dict(self.statuses)
+        statuses["db-b"] = _status("db-b", response_time=5.0)
+        del statuses["web-b"]
+        self.display.update_display(statuses)
+
+        self.assertEqual(self.display.visible_targets(), ["db-b", "web-a", "db-a"])
+
+    def test_selection_and_scrolling(self):
+        """Test the selection is clamped and kept on screen."""
+        statuses = {f"site-{i:02d}": _status(f"site-{i:02d}") for i in range(30)}
+        self.display.update_display(statuses)
+        screen = FakeScreen(height=12)
+
+        self.display.handle_key(curses.KEY_END)
+        self.display._draw(screen)
+        self.assertEqual(self.display.selected, 29)
+        self.assertIn("site-29", screen.rows[10])
+        self.assertIn("site-21", screen.rows[2])
+
+        self.display.handle_key(curses.KEY_PPAGE)
+        self.display.handle_key(curses.KEY_UP)
+        self.assertEqual(self.display.selected, 19)
+        self.display.handle_key(curses.KEY_HOME)
+        self.display.handle_key(curses.KEY_UP)
+        self.assertEqual(self.display.selected, 0)
+
+    def test_list_drawing(self):
+        """Test the header, rows and help line of the list view."""
+        screen = FakeScreen()
+        self.display._draw(screen)
+
+        self.assertIn("監視対象: 3", screen.rows[0])
+        self.assertIn("異常: 1", screen.rows[0])
+        self.assertIn("✗ db-a", screen.rows[2])
+        self.assertIn("Connection refused", screen.rows[2])
+        self.assertIn("q:終了", screen.rows[11])
+
+        self.display.show_error("web-a", "timeout")
+        self.display._draw(screen)
+        self.assertIn("エラー - web-a: timeout", screen.rows[11])
+
+    def test_show_message(self):
+        """Test application messages go to the status line instead of stdout."""
+        self.display.show_message("\n設定再読み込み完了")
+
+        self.assertEqual(self.display._status_line("help"), "設定再読み込み完了")
+
+    def test_drill_down(self):
+        """Test Enter opens the selected target's history and Esc returns."""
+        self.display.update_display({**self.statuses, "db-a": _status("db-a", minutes=2)})
+        self.display.handle_key(10)
+        self.assertEqual(self.display.detail_target, "db-a")
+
+        screen = FakeScreen()
+        self.display._draw(screen)
+        self.assertIn("db-a  (database)", screen.rows[0])
+        self.assertIn("最終変化: 2024-01-15 10:02:00", screen.rows[2])
+        self.assertIn("10:02:00  正常", screen.rows[6])
+        self.assertIn("10:01:00  異常", screen.rows[7])
+
+        self.display.handle_key(27)
+        self.assertIsNone(self.display.detail_target)
+
+    def test_drill_down_target_removed(self):
+        """Test the detail view falls back to the list when its target goes away."""
+        self.display.handle_key(10)
+        self.display.update_display({"web-a": self.statuses["web-a"]})
+
+        screen = FakeScreen()
+        self.display._draw(screen)
+        self.assertIsNone(self.display.detail_target)
+        self.assertIn("web-a", screen.rows[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,284 @@
+"""
+Unit tests for the embedded live dashboard server.
+"""
+import unittest
+import json
+import os
+import shutil
+import tempfile
+import http.client
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from health_monitor.models.data_models import HealthStatus
+from health_monitor.services.dashboard_server import DashboardServer, status_to_dict
+from health_monitor.services.latency_histogram import LatencyHistogramRegistry
+from health_monitor.services.log_query import LogQuery
+from health_monitor.services.sampling_profiler import SamplingProfiler
+
+
+def _status(name, healthy=True, response_time=0.25):
+    return HealthStatus(
+        target_name=name,
+        is_healthy=healthy,
+        response_time=response_time,
+        error_message=None if healthy else "Connection refused",
+        timestamp=datetime(2024, 1, 15, 10, 0, 0)
+    )
+
+
+class TestDashboardServer(unittest.TestCase):
+    """Test cases for DashboardServer."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.statuses = {"web": _status("web"), "db": _status("db", healthy=False)}
+        self.engine = MagicMock()
+        self.engine.get_current_statuses.side_effect = lambda: dict(self.statuses)
+        self.log_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.log_dir, "health_monitor_20240115.log"), 'w', encoding='utf-8') as f:
+            for i in range(3):
+                f.write(json.dumps({
+                    "timestamp": f"2024-01-15T10:0{i}:00",
+                    "target_name": "web",
+                    "target_type": "website",
+                    "status_change": "up",
+                    "details": ""
+                }) + "\n")
+        self.server = DashboardServer(
+            self.engine, port=0,
+            target_type_resolver=lambda name: "database" if name == "db" else "website",
+            log_query=LogQuery(self.log_dir),
+            profiler=SamplingProfiler(output_dir=self.log_dir)
+        )
+        self.server.start()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.server.stop()
+        self.server.profiler.stop()
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+
+    def _connection(self):
+        return http.client.HTTPConnection(self.server.host, self.server.port, timeout=5)
+
+    def _read_event(self, response):
+        event, data = None, None
+        while True:
+            line = response.fp.readline().decode('utf-8').rstrip('\n')
+            if line.startswith('event: '):
+                event = line[len('event: '):]
+            elif line.startswith('data: '):
+                data = json.loads(line[len('data: '):])
+            elif line == '' and event:
+                return event, data
+
+    def test_registers_status_listener(self):
+        """Test the server subscribes to engine results while running."""
+        self.engine.add_status_listener.assert_called_once_with(self.server.publish)
+
+    def test_status_endpoint(self):
+        """Test /api/status serves the in-memory statuses."""
+        conn = self._connection()
+        conn.request("GET", "/api/status")
+        response = conn.getresponse()
+        payload = json.loads(response.read())
+        conn.close()
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(payload["summary"], {"total": 2, "up": 1, "down": 1})
+        self.assertEqual(payload["targets"]["db"]["type"], "database")
+        self.assertEqual(payload["targets"]["db"]["status"], "down")
+
+    def _get_json(self, path):
+        conn = self._connection()
+        conn.request("GET", path)
+        response = conn.getresponse()
+        payload = json.loads(response.read())
+        conn.close()
+        return response.status, payload
+
+    def test_history_endpoint_paginates(self):
+        """Test /api/history serves newest-first pages with a cursor."""
+        status, page = self._get_json("/api/history?target=web&limit=2")
+
+        self.assertEqual(status, 200)
+        self.assertEqual([e["timestamp"] for e in page["entries"]],
+                         ["2024-01-15T10:02:00", "2024-01-15T10:01:00"])
+
+        status, page = self._get_json(f"/api/history?target=web&limit=2&cursor={page['next_cursor']}")
+        self.assertEqual([e["timestamp"] for e in page["entries"]], ["2024-01-15T10:00:00"])
+        self.assertIsNone(page["next_cursor"])
+
+    def test_history_endpoint_accepts_utc_bounds(self):
+        """Test start and end with a Z suffix are compared in local time."""
+        start = datetime(2024, 1, 15, 10, 1, 0).astimezone().astimezone(timezone.utc)
+
+        status, page = self._get_json(f"/api/history?start={start.strftime('%Y-%m-%dT%H:%M:%SZ')}")
+
+        self.assertEqual(status, 200)
+        self.assertEqual([e["timestamp"] for e in page["entries"]],
+                         ["2024-01-15T10:02:00", "2024-01-15T10:01:00"])
+
+    def test_history_endpoint_rejects_bad_parameters(self):
+        """Test invalid query parameters return 400."""
+        status, payload = self._get_json("/api/history?cursor=bogus")
+
+        self.assertEqual(status, 400)
+        self.assertIn("error", payload)
+
+    def test_index_page(self):
+        """Test the dashboard page is served."""
+        conn = self._connection()
+        conn.request("GET", "/")
+        response = conn.getresponse()
+        body = response.read().decode('utf-8')
+        conn.close()
+
+        self.assertEqual(response.status, 200)
+        self.assertIn("EventSource('/events')", body)
+
+    def test_metrics_endpoint(self):
+        """Test /metrics serves OpenMetrics text from in-memory state."""
+        self.engine.self_monitor = None
+        self.engine.latency_histograms = LatencyHistogramRegistry()
+        self.engine.get_resilience_stats.return_value = {'retries': {}, 'circuit_breakers': {}}
+        self.engine.get_worker_pool_stats.return_value = {'size': 10, 'busy': 0}
+        self.engine.queue_wait_histograms = LatencyHistogramRegistry()
+        self.engine.run_time_histograms = LatencyHistogramRegistry()
+        self.engine.get_cycle_stats.return_value = {
+            'cycles': 0, 'overruns': 0, 'last_duration': None, 'check_interval': None
+        }
+
+        conn = self._connection()
+        conn.request("GET", "/metrics")
+        response = conn.getresponse()
+        body = response.read().decode('utf-8')
+        conn.close()
+
+        self.assertEqual(response.status, 200)
+        self.assertTrue(response.getheader("Content-Type").startswith("application/openmetrics-text"))
+        self.assertIn('healthmonitor_target_up{target="db",type="database"} 0', body)
+        self.assertTrue(body.endswith("# EOF\n"))
+
+    def test_profiler_control(self):
+        """Test the profiler can be started, queried and stopped over HTTP."""
+        conn = self._connection()
+        conn.request("POST", "/api/profiler/start?duration=60")
+        response = conn.getresponse()
+        started = json.loads(response.read().decode('utf-8'))
+        self.assertEqual(response.status, 200)
+        self.assertTrue(started["started"])
+
+        conn.request("POST", "/api/profiler/start")
+        response = conn.getresponse()
+        response.read()
+        self.assertEqual(response.status, 409)
+
+        conn.request("GET", "/api/profiler")
+        response = conn.getresponse()
+        self.assertTrue(json.loads(response.read().decode('utf-8'))["running"])
+
+        conn.request("POST", "/api/profiler/stop")
+        response = conn.getresponse()
+        stopped = json.loads(response.read().decode('utf-8'))
+        self.assertFalse(stopped["running"])
+        self.assertTrue(os.path.exists(stopped["last_output"]))
+
+        conn.request("POST", "/api/profiler/start?duration=abc")
+        response = conn.getresponse()
+        response.read()
+        self.assertEqual(response.status, 400)
+        conn.close()
+
+    def test_checks_endpoint(self):
+        """Test /api/checks checks the selected targets and returns their statuses."""
+        selectors = []
+
+        def check_runner(selector):
+            selectors.append(selector)
+            return {"web": _status("web")} if "web" in selector.names else {}
+
+        self.server.check_runner = check_runner
+        conn = self._connection()
+        conn.request("POST", "/api/checks?targets=web&tags=payments")
+        response = conn.getresponse()
+        payload = json.loads(response.read().decode('utf-8'))
+        self.assertEqual(response.status, 200)
+        self.assertEqual(payload["checked"], 1)
+        self.assertEqual(payload["targets"]["web"]["status"], "up")
+        self.assertEqual(selectors[0].tags, {"payments"})
+
+        conn.request("POST", "/api/checks?targets=missing")
+        response = conn.getresponse()
+        response.read()
+        self.assertEqual(response.status, 400)
+
+        conn.request("POST", "/api/checks")
+        response = conn.getresponse()
+        response.read()
+        self.assertEqual(response.status, 400)
+        conn.close()
+        self.assertEqual(len(selectors), 2)
+
+    def test_unknown_path(self):
+        """Test unknown paths return 404."""
+        conn = self._connection()
+        conn.request("GET", "/missing")
+        response = conn.getresponse()
+        response.read()
+        conn.close()
+
+        self.assertEqual(response.status, 404)
+
+    def test_event_stream_pushes_only_changed_targets(self):
+        """Test the event stream sends a snapshot followed by per-target deltas."""
+        conn = self._connection()
+        conn.request("GET", "/events")
+        response = conn.getresponse()
+
+        event, data = self._read_event(response)
+        self.assertEqual(event, "snapshot")
+        self.assertEqual(set(data["targets"]), {"web", "db"})
+
+        self.statuses["db"] = _status("db", healthy=True)
+        self.server.publish(dict(self.statuses))
+
+        event, data = self._read_event(response)
+        self.assertEqual(event, "update")
+        self.assertEqual(list(data), ["db"])
+        self.assertEqual(data["db"]["status"], "up")
+        conn.close()
+
+    def test_publish_without_changes_sends_nothing(self):
+        """Test unchanged results do not produce a delta."""
+        client = self.server._subscribe()
+
+        self.server.publish(dict(self.statuses))
+
+        self.assertTrue(client.empty())
+        self.server._unsubscribe(client)
+
+    def test_removed_targets_are_pruned_and_announced(self):
+        """Test targets dropped by a reload leave the published state with a remove event."""
+        client = self.server._subscribe()
+
+        del self.statuses["db"]
+        self.server.publish({})
+
+        self.assertEqual(client.get_nowait(), ('remove', ['db']))
+        self.assertNotIn("db", self.server._published)
+        self.server.publish({})
+        self.assertTrue(client.empty())
+        self.server._unsubscribe(client)
+
+    def test_status_to_dict(self):
+        """Test HealthStatus serialization."""
+        item = status_to_dict(_status("web"), "website")
+
+        self.assertEqual(item["status"], "up")
+        self.assertEqual(item["timestamp"], "2024-01-15T10:00:00")
+
+
+if __name__ == '__main__':
+    unittest.main()
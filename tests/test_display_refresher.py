@@ -0,0 +1,108 @@
+"""
+Unit tests for the background display refresher.
+"""
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import Mock
+
+from health_monitor.models.data_models import HealthStatus
+from health_monitor.services.display_refresher import DisplayRefresher
+
+
+class TestDisplayRefresher(unittest.TestCase):
+    """Test cases for DisplayRefresher."""
+
+    def setUp(self):
+        """Set up a display double and mutable engine state."""
+        self.display = Mock()
+        self.statuses = {}
+        self.version = 0
+        self.refresher = DisplayRefresher(
+            self.display,
+            snapshot=lambda: dict(self.statuses),
+            version=lambda: self.version,
+            max_fps=50,
+            idle_interval=60
+        )
+
+    def tearDown(self):
+        """Stop the refresh thread."""
+        self.refresher.stop()
+
+    def _wait_for_frames(self, count, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while self.display.update_display.call_count < count and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+    def test_redraws_only_on_change(self):
+        """Test frames are drawn for new versions and skipped otherwise."""
+        self.refresher.start()
+        self._wait_for_frames(1)
+        time.sleep(0.1)
+        self.assertEqual(self.display.update_display.call_count, 1)
+
+        self.statuses["web"] = HealthStatus(
+            target_name="web", is_healthy=True, response_time=0.1,
+            error_message=None, timestamp=datetime.now()
+        )
+        self.version += 1
+        self._wait_for_frames(2)
+
+        self.assertEqual(self.display.update_display.call_count, 2)
+        self.assertIn("web", self.display.update_display.call_args[0][0])
+
+    def test_frame_rate_is_capped(self):
+        """Test constantly changing state is drawn at most max_fps times per second."""
+        refresher = DisplayRefresher(self.display, snapshot=dict, max_fps=20)
+        refresher.start()
+        time.sleep(0.5)
+        refresher.stop()
+
+        self.assertGreater(self.display.update_display.call_count, 1)
+        self.assertLessEqual(self.display.update_display.call_count, 11)
+
+    def test_request_refresh(self):
+        """Test a requested refresh redraws without a status change."""
+        self.refresher.start()
+        self._wait_for_frames(1)
+
+        self.refresher.request_refresh()
+        self._wait_for_frames(2)
+
+        self.assertEqual(self.display.update_display.call_count, 2)
+
+    def test_display_errors_do_not_stop_refreshing(self):
+        """Test a failing frame is logged and later frames are still drawn."""
+        self.display.update_display.side_effect = [RuntimeError("terminal gone"), None]
+        self.refresher.start()
+        self._wait_for_frames(1)
+
+        self.version += 1
+        self._wait_for_frames(2)
+
+        self.assertTrue(self.refresher.is_running)
+        self.assertEqual(self.refresher.frames_drawn, 1)
+
+    def test_stop(self):
+        """Test stopping joins the thread and draws no more frames."""
+        self.refresher.start()
+        self._wait_for_frames(1)
+
+        self.refresher.stop()
+        count = self.display.update_display.call_count
+        self.version += 1
+        time.sleep(0.1)
+
+        self.assertFalse(self.refresher.is_running)
+        self.assertEqual(self.display.update_display.call_count, count)
+
+    def test_invalid_frame_rate(self):
+        """Test a non-positive frame rate is rejected."""
+        with self.assertRaises(ValueError):
+            DisplayRefresher(self.display, snapshot=dict, max_fps=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,11 +2,19 @@
 Unit tests for health check engine.
 """
 import unittest
+import json
+import os
+import tempfile
+import threading
+import time
 from unittest.mock import Mock, patch
 from datetime import datetime
 
 from health_monitor.models.data_models import WebsiteTarget, DatabaseTarget, HealthStatus
 from health_monitor.services.health_check_engine import HealthCheckEngine
+from health_monitor.services.target_diff import diff_targets
+from health_monitor.services.target_registry import TargetRegistry
+from health_monitor.services.tracing import JsonFileSpanExporter, Tracer
 
 
 class TestHealthCheckEngine(unittest.TestCase):
@@ -197,6 +205,325 @@ class TestHealthCheckEngine(unittest.TestCase):
         non_existent_status = self.engine.get_target_status("non-existent")
         self.assertIsNone(non_existent_status)
     
+    @patch('health_monitor.services.health_check_engine.WebsiteHealthChecker.check_website')
+    def test_status_listeners(self, mock_website_check):
+        """Test status listeners receive results and failing listeners are isolated."""
+        website_status = HealthStatus(
+            target_name="test-website",
+            is_healthy=True,
+            response_time=0.5,
+            error_message=None,
+            timestamp=datetime.now()
+        )
+        mock_website_check.return_value = website_status
+        
+        received = []
+        def failing_listener(results):
+            raise ValueError("listener error")
+        
+        self.engine.add_status_listener(failing_listener)
+        self.engine.add_status_listener(received.append)
+        self.engine.run_all_checks(website_targets=[self.website_target])
+        
+        self.assertEqual(received, [{"test-website": website_status}])
+        
+        self.engine.remove_status_listener(received.append)
+        self.engine.run_all_checks(website_targets=[self.website_target])
+        self.assertEqual(len(received), 1)
+    
+    @patch('health_monitor.services.health_check_engine.WebsiteHealthChecker.check_website')
+    def test_status_listeners_receive_each_check_as_it_finishes(self, mock_website_check):
+        """Test a fast result reaches listeners while a slow check of the same cycle still runs."""
+        fast_delivered = threading.Event()
+        
+        def check(target):
+            if target.name == "slow":
+                fast_delivered.wait(5)
+            return HealthStatus(target.name, True, 0.1, None, datetime.now())
+        mock_website_check.side_effect = check
+        
+        received = []
+        def listener(results):
+            received.append(dict(results))
+            if "fast" in results:
+                fast_delivered.set()
+        
+        self.engine.add_status_listener(listener)
+        self.engine.run_all_checks(website_targets=[
+            WebsiteTarget("slow", "https://example.com/slow"),
+            WebsiteTarget("fast", "https://example.com/fast")
+        ])
+        
+        self.assertTrue(fast_delivered.is_set())
+        self.assertEqual([list(results) for results in received], [["fast"], ["slow"]])
+    
+    @patch('health_monitor.services.health_check_engine.WebsiteHealthChecker.check_website')
+    def test_worker_pool_and_resilience_stats(self, mock_website_check):
+        """Test worker pool utilization and retry/circuit breaker counters."""
+        busy_during_check = []
+        
+        def check(target):
+            busy_during_check.append(self.engine.get_worker_pool_stats()['busy'])
+            return HealthStatus(
+                target_name=target.name,
+                is_healthy=True,
+                response_time=0.1,
+                error_message=None,
+                timestamp=datetime.now()
+            )
+        mock_website_check.side_effect = check
+        
+        self.engine.run_all_checks(website_targets=[self.website_target])
+        
+        self.assertEqual(busy_during_check, [1])
+        self.assertEqual(self.engine.get_worker_pool_stats(), {'size': 2, 'busy': 0})
+        
+        self.engine.website_checker.retry_handler.retry_count = 3
+        breaker = Mock(state='OPEN', open_count=1, rejected_count=4)
+        self.engine.website_checker.circuit_breakers["test-website"] = breaker
+        
+        stats = self.engine.get_resilience_stats()
+        
+        self.assertEqual(stats['retries']['website'], 3)
+        self.assertEqual(stats['circuit_breakers']['test-website'], {
+            'check_type': 'website', 'state': 'OPEN', 'opened': 1, 'rejected': 4
+        })
+    
+    @patch('health_monitor.services.health_check_engine.DatabaseHealthChecker.check_database')
+    @patch('health_monitor.services.health_check_engine.WebsiteHealthChecker.check_website')
+    def test_latency_histograms(self, mock_website_check, mock_database_check):
+        """Test per-target latency histograms split by check type."""
+        mock_website_check.return_value = HealthStatus(
+            target_name="test-website", is_healthy=True, response_time=0.2,
+            error_message=None, timestamp=datetime.now()
+        )
+        mock_database_check.return_value = HealthStatus(
+            target_name="test-database", is_healthy=True, response_time=0.03,
+            error_message=None, timestamp=datetime.now()
+        )
+        
+        for _ in range(2):
+            self.engine.run_all_checks([self.website_target], [self.database_target])
+        
+        histograms = self.engine.get_self_monitoring_data()["latency_histograms"]
+        self.assertEqual(histograms["website"]["test-website"]["count"], 2)
+        self.assertAlmostEqual(histograms["website"]["test-website"]["sum"], 0.4)
+        self.assertEqual(histograms["database"]["test-database"]["count"], 2)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "diagnostics.json")
+            self.engine.export_diagnostics(path)
+            with open(path) as f:
+                exported = json.load(f)
+        self.assertEqual(exported["latency_histograms"], histograms)
+    
+    @patch('health_monitor.services.health_check_engine.WebsiteHealthChecker.check_website')
+    def test_scheduling_stats(self, mock_website_check):
+        """Test queue wait, run time and cycle overrun accounting."""
+        def slow_check(target):
+            time.sleep(0.05)
+            return HealthStatus(
+                target_name=target.name, is_healthy=True, response_time=0.05,
+                error_message=None, timestamp=datetime.now()
+            )
+        mock_website_check.side_effect = slow_check
+        targets = [
+            WebsiteTarget(name=f"site-{i}", url="https://example.com", timeout=10, expected_status=200)
+            for i in range(4)
+        ]
+        self.engine.check_interval = 0.01
+        
+        self.engine.run_all_checks(targets, [])
+        
+        stats = self.engine.get_scheduling_stats()
+        self.assertEqual(stats['cycle']['cycles'], 1)
+        self.assertEqual(stats['cycle']['overruns'], 1)
+        self.assertGreater(stats['cycle']['last_duration'], 0.1)
+        run_times = stats['run_time']['website']
+        queue_waits = stats['queue_wait']['website']
+        self.assertEqual(sum(h['count'] for h in run_times.values()), 4)
+        self.assertGreaterEqual(min(h['sum'] for h in run_times.values()), 0.05)
+        # Two workers for four checks: the last two wait for a free worker
+        waits = sorted(h['sum'] for h in queue_waits.values())
+        self.assertGreaterEqual(waits[-1], 0.04)
+        self.assertEqual(self.engine.self_monitor._collect_application_metrics().cycle_overruns, 1)
+    
+    @patch('health_monitor.services.health_check_engine.WebsiteHealthChecker.check_website')
+    def test_partial_and_selected_runs_accounting(self, mock_website_check):
+        """Test group runs use their own interval and on-demand runs are not cycles."""
+        def slow_check(target):
+            time.sleep(0.05)
+            return HealthStatus(target.name, True, 0.05, None, datetime.now())
+        mock_website_check.side_effect = slow_check
+        engine = HealthCheckEngine(max_workers=2, check_interval=300)
+        try:
+            engine.update_target_count(10)
+            engine.run_all_checks([self.website_target], [], interval=0.01, partial=True)
+            engine.run_selected_checks([self.website_target], [])
+            
+            stats = engine.get_cycle_stats()
+            self.assertEqual(stats['cycles'], 1)
+            self.assertEqual(stats['overruns'], 1)
+            self.assertEqual(engine.self_monitor.get_health_summary()['active_targets'], 10)
+            
+            engine.run_all_checks([self.website_target], [])
+            self.assertEqual(engine.get_cycle_stats()['overruns'], 1)
+            self.assertEqual(engine.self_monitor.get_health_summary()['active_targets'], 1)
+        finally:
+            engine.close()
+    
+    @patch('health_monitor.services.health_check_engine.WebsiteHealthChecker.check_website')
+    def test_selected_checks_wait_for_running_cycle(self, mock_website_check):
+        """Test an on-demand run does not overlap a scheduled cycle."""
+        release = threading.Event()
+        active = []
+        overlaps = []
+        
+        def check(target):
+            active.append(target.name)
+            if len(active) > 1:
+                overlaps.append(list(active))
+            if target.name == "slow":
+                release.wait(5)
+            active.remove(target.name)
+            return HealthStatus(target.name, True, 0.01, None, datetime.now())
+        mock_website_check.side_effect = check
+        slow = WebsiteTarget(name="slow", url="https://example.com")
+        
+        cycle = threading.Thread(target=self.engine.run_all_checks, args=([slow], []))
+        cycle.start()
+        while not active:
+            time.sleep(0.01)
+        selected = threading.Thread(target=self.engine.run_selected_checks, args=([self.website_target], []))
+        selected.start()
+        time.sleep(0.1)
+        self.assertTrue(selected.is_alive())
+        release.set()
+        cycle.join()
+        selected.join(5)
+        
+        self.assertEqual(overlaps, [])
+        self.assertIn("test-website", self.engine.get_current_statuses())
+    
+    @patch('health_monitor.services.health_check_engine.WebsiteHealthChecker.check_website')
+    def test_results_visible_before_cycle_completes(self, mock_website_check):
+        """Test finished checks are published while slower ones are still running."""
+        release = threading.Event()
+        
+        def check(target):
+            if target.name == "slow":
+                release.wait(5)
+            return HealthStatus(
+                target_name=target.name, is_healthy=True, response_time=0.01,
+                error_message=None, timestamp=datetime.now()
+            )
+        mock_website_check.side_effect = check
+        targets = [
+            WebsiteTarget(name=name, url="https://example.com", timeout=10, expected_status=200)
+            for name in ("slow", "fast")
+        ]
+        version_before = self.engine.get_status_version()
+        
+        cycle = threading.Thread(target=self.engine.run_all_checks, args=(targets, []))
+        cycle.start()
+        try:
+            deadline = time.monotonic() + 5
+            while "fast" not in self.engine.get_current_statuses() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            
+            statuses = self.engine.get_current_statuses()
+            self.assertIn("fast", statuses)
+            self.assertNotIn("slow", statuses)
+            self.assertGreater(self.engine.get_status_version(), version_before)
+        finally:
+            release.set()
+            cycle.join()
+        
+        self.assertEqual(set(self.engine.get_current_statuses()), {"slow", "fast"})
+    
+    @patch('health_monitor.services.website_checker.WebsiteHealthChecker._perform_http_request')
+    def test_tracing(self, mock_request):
+        """Test each check is exported as a trace with queue wait and retry spans."""
+        mock_request.return_value = HealthStatus(
+            target_name="test-website", is_healthy=True, response_time=0.1,
+            error_message=None, timestamp=datetime.now()
+        )
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "traces.jsonl")
+            engine = HealthCheckEngine(max_workers=2, tracer=Tracer(JsonFileSpanExporter(path)))
+            try:
+                engine.run_all_checks([self.website_target], [])
+            finally:
+                engine.close()
+            with open(path) as f:
+                traces = [json.loads(line) for line in f]
+        
+        checks = []
+        for trace in traces:
+            spans = trace["resourceSpans"][0]["scopeSpans"][0]["spans"]
+            names = {span["name"] for span in spans}
+            if "health_check" in names:
+                checks.append(spans)
+        self.assertEqual(len(checks), 1)
+        spans = {span["name"]: span for span in checks[0]}
+        self.assertIn("queue_wait", spans)
+        self.assertIn("circuit_breaker", spans)
+        self.assertIn("retry.attempt", spans)
+        root = spans["health_check"]
+        self.assertIn({"key": "check.healthy", "value": {"boolValue": True}}, root["attributes"])
+        self.assertIn({"key": "target.name", "value": {"stringValue": "test-website"}}, root["attributes"])
+        self.assertEqual(spans["queue_wait"]["parentSpanId"], root["spanId"])
+        self.assertEqual(spans["retry.attempt"]["parentSpanId"], spans["circuit_breaker"]["spanId"])
+    
+    @patch('health_monitor.services.health_check_engine.WebsiteHealthChecker.check_website')
+    def test_target_registry_resolves_logged_types(self, mock_check):
+        """Test status changes are logged with the type held by the target registry."""
+        mock_check.return_value = HealthStatus("test-website", True, 0.1, None, datetime.now())
+        registry = TargetRegistry()
+        registry.replace([self.website_target], [])
+        log_manager = Mock()
+        engine = HealthCheckEngine(max_workers=1, log_manager=log_manager, enable_self_monitoring=False,
+                                   target_registry=registry)
+        
+        engine.run_all_checks(website_targets=[self.website_target])
+        engine.close()
+        
+        self.assertEqual(log_manager.log_status_change.call_args.kwargs["target_type"], "website")
+    
+    @patch('health_monitor.services.database_checker.DatabaseHealthChecker._perform_database_connection')
+    @patch('health_monitor.services.website_checker.WebsiteHealthChecker._perform_http_request')
+    def test_apply_target_diff(self, mock_http, mock_database):
+        """Test a reload releases removed and modified targets and keeps the rest."""
+        def healthy(target):
+            return HealthStatus(target.name, True, 0.1, None, datetime.now())
+        mock_http.side_effect = healthy
+        mock_database.side_effect = healthy
+        
+        websites = [WebsiteTarget("keep", "https://example.com/"), WebsiteTarget("drop", "https://example.org/")]
+        databases = [DatabaseTarget("db", "localhost", 5432, "app", "user", "pass")]
+        self.engine.run_all_checks(website_targets=websites, database_targets=databases)
+        kept_breaker = self.engine.website_checker.circuit_breakers["keep"]
+        version = self.engine.get_status_version()
+        listener = Mock()
+        self.engine.add_status_listener(listener)
+        
+        new_websites = websites[:1]
+        new_databases = [DatabaseTarget("db", "db.internal", 5432, "app", "user", "pass")]
+        diff = diff_targets(websites, new_websites, databases, new_databases)
+        self.engine.apply_target_diff(diff, new_websites)
+        
+        self.assertEqual(set(self.engine.get_current_statuses()), {"keep", "db"})
+        self.assertNotIn("drop", self.engine._previous_statuses)
+        self.assertGreater(self.engine.get_status_version(), version)
+        listener.assert_called_once_with({})
+        self.assertIs(self.engine.website_checker.circuit_breakers["keep"], kept_breaker)
+        self.assertNotIn("drop", self.engine.website_checker.circuit_breakers)
+        self.assertNotIn("db", self.engine.database_checker.circuit_breakers)
+        self.assertEqual(set(self.engine.get_latency_histograms()["website"]), {"keep"})
+        self.assertNotIn("database", self.engine.get_latency_histograms())
+        self.assertNotIn("drop", self.engine.self_monitor._target_checks)
+    
     def test_clear_statuses(self):
         """Test clearing all stored statuses."""
         # Manually add a status
@@ -0,0 +1,114 @@
+"""
+Unit tests for fixed-bucket latency histograms.
+"""
+import unittest
+import threading
+
+from health_monitor.services.latency_histogram import (
+    LatencyHistogram, LatencyHistogramRegistry, DEFAULT_BUCKETS
+)
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Test cases for LatencyHistogram."""
+
+    def test_bucket_boundaries(self):
+        """Test a value equal to a bound is counted in that bucket."""
+        histogram = LatencyHistogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 1.0, 3.0):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.counts, [2, 2, 1])
+        self.assertEqual(histogram.cumulative(), [(0.1, 2), (1.0, 4), (float('inf'), 5)])
+        self.assertEqual(histogram.count, 5)
+        self.assertAlmostEqual(histogram.total, 4.65)
+
+    def test_to_dict(self):
+        """Test serialization."""
+        histogram = LatencyHistogram()
+        histogram.observe(0.2)
+
+        data = histogram.to_dict()
+
+        self.assertEqual(data['buckets'], list(DEFAULT_BUCKETS))
+        self.assertEqual(len(data['counts']), len(DEFAULT_BUCKETS) + 1)
+        self.assertEqual(data['count'], 1)
+        self.assertEqual(data['sum'], 0.2)
+
+    def test_invalid_bounds(self):
+        """Test unsorted or empty bounds are rejected."""
+        with self.assertRaises(ValueError):
+            LatencyHistogram(())
+        with self.assertRaises(ValueError):
+            LatencyHistogram((1.0, 0.5))
+
+
+class TestLatencyHistogramRegistry(unittest.TestCase):
+    """Test cases for LatencyHistogramRegistry."""
+
+    def test_split_by_target_and_check_type(self):
+        """Test each (check type, target) pair has its own histogram."""
+        registry = LatencyHistogramRegistry(bounds=(1.0,))
+        registry.observe("website", "shared", 0.5)
+        registry.observe("database", "shared", 2.0)
+        registry.observe("website", "other", 0.1)
+
+        data = registry.to_dict()
+
+        self.assertEqual(set(data), {"website", "database"})
+        self.assertEqual(data["website"]["shared"]["counts"], [1, 0])
+        self.assertEqual(data["database"]["shared"]["counts"], [0, 1])
+        self.assertEqual(data["website"]["other"]["count"], 1)
+
+    def test_snapshot_is_a_copy(self):
+        """Test later observations do not change an earlier snapshot."""
+        registry = LatencyHistogramRegistry()
+        registry.observe("website", "web", 0.2)
+
+        snapshot = registry.snapshot()
+        registry.observe("website", "web", 0.2)
+
+        self.assertEqual(snapshot[("website", "web")].count, 1)
+        self.assertEqual(registry.snapshot()[("website", "web")].count, 2)
+
+    def test_concurrent_observations(self):
+        """Test no observation is lost when many threads record at once."""
+        registry = LatencyHistogramRegistry(stripes=4)
+
+        def worker(index):
+            for i in range(1000):
+                registry.observe("website", f"target-{(index + i) % 10}", 0.05)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = registry.snapshot()
+        self.assertEqual(len(snapshot), 10)
+        self.assertEqual(sum(h.count for h in snapshot.values()), 8000)
+
+    def test_remove(self):
+        """Test removing drops only the given target's histogram."""
+        registry = LatencyHistogramRegistry()
+        registry.observe("website", "web", 0.2)
+        registry.observe("database", "web", 0.2)
+
+        registry.remove("website", "web")
+        registry.remove("website", "missing")
+
+        self.assertEqual(list(registry.snapshot()), [("database", "web")])
+
+    def test_clear(self):
+        """Test clearing removes every histogram."""
+        registry = LatencyHistogramRegistry()
+        registry.observe("website", "web", 0.2)
+
+        registry.clear()
+
+        self.assertEqual(registry.snapshot(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Unit tests for the mergeable latency quantile sketch.
+"""
+import unittest
+import json
+import math
+import random
+
+from health_monitor.services.latency_sketch import LatencySketch
+
+
+def _exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+
+class TestLatencySketch(unittest.TestCase):
+    """Test cases for LatencySketch."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        rng = random.Random(42)
+        self.values = [rng.lognormvariate(-1.5, 0.8) for _ in range(5000)]
+
+    def _sketch(self, values, **kwargs):
+        sketch = LatencySketch(**kwargs)
+        for value in values:
+            sketch.add(value)
+        return sketch
+
+    def test_empty_sketch(self):
+        """Test an empty sketch reports no quantiles."""
+        sketch = LatencySketch()
+
+        self.assertIsNone(sketch.quantile(0.5))
+        self.assertIsNone(sketch.mean)
+        self.assertEqual(sketch.quantiles(), {'p50': None, 'p95': None, 'p99': None})
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test estimated percentiles are within the configured relative error."""
+        sketch = self._sketch(self.values, relative_accuracy=0.01)
+
+        for q in (0.5, 0.95, 0.99):
+            exact = _exact_quantile(self.values, q)
+            self.assertAlmostEqual(sketch.quantile(q), exact, delta=exact * 0.011)
+
+    def test_exact_summary_statistics(self):
+        """Test count, mean, min and max are exact."""
+        sketch = self._sketch([0.2, 0.4, 0.0])
+
+        self.assertEqual(sketch.count, 3)
+        self.assertAlmostEqual(sketch.mean, 0.2)
+        self.assertEqual(sketch.min, 0.0)
+        self.assertEqual(sketch.max, 0.4)
+        self.assertEqual(sketch.quantile(0.0), 0.0)
+
+    def test_merge_matches_single_sketch(self):
+        """Test merging partial sketches gives the single-sketch result."""
+        full = self._sketch(self.values)
+        merged = self._sketch(self.values[:1000])
+        merged.merge(self._sketch(self.values[1000:]))
+
+        self.assertEqual(merged.quantiles(), full.quantiles())
+        self.assertEqual(merged.count, full.count)
+
+    def test_merge_rejects_different_accuracy(self):
+        """Test sketches with different accuracies cannot be merged."""
+        with self.assertRaises(ValueError):
+            LatencySketch(relative_accuracy=0.01).merge(self._sketch([1.0], relative_accuracy=0.02))
+
+    def test_bucket_count_is_bounded(self):
+        """Test memory stays bounded and high percentiles stay accurate."""
+        values = [10 ** (i / 100.0 - 6) for i in range(1000)]
+        sketch = self._sketch(values, max_buckets=64)
+
+        self.assertLessEqual(len(sketch.buckets), 64)
+        exact = _exact_quantile(values, 0.99)
+        self.assertAlmostEqual(sketch.quantile(0.99), exact, delta=exact * 0.011)
+
+    def test_serialization_round_trip(self):
+        """Test to_dict/from_dict preserve the sketch."""
+        sketch = self._sketch(self.values)
+
+        restored = LatencySketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+        self.assertEqual(restored.quantiles(), sketch.quantiles())
+        self.assertEqual(restored.count, sketch.count)
+
+
+if __name__ == '__main__':
+    unittest.main()
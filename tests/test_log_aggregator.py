@@ -0,0 +1,226 @@
+"""
+Unit tests for the streaming log aggregator.
+"""
+import unittest
+import tempfile
+import shutil
+import json
+import os
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from health_monitor.services.log_aggregator import (
+    LogAggregator, aggregate_log_files, extract_response_time
+)
+from health_monitor.services.log_checkpoint import LogCheckpointCache, fold_log_file
+
+
+def _entry(timestamp, target, status_change, details="", target_type="website"):
+    return {
+        "timestamp": timestamp.isoformat(),
+        "target_name": target,
+        "target_type": target_type,
+        "status_change": status_change,
+        "details": details
+    }
+
+
+class TestLogAggregator(unittest.TestCase):
+    """Test cases for LogAggregator."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.base = datetime(2024, 1, 15, 10, 0, 0)
+        self.until = self.base + timedelta(days=3)
+        self.entries = [
+            _entry(self.base, "web", "unknown->up", "Response time: 0.20s"),
+            _entry(self.base + timedelta(minutes=1), "web", "up", "Response time: 0.40s"),
+            _entry(self.base + timedelta(minutes=2), "db", "unknown->down", "Error: refused", "database"),
+            _entry(self.base + timedelta(minutes=3), "web", "up->down", "Error: timeout"),
+            _entry(self.base + timedelta(minutes=4), "system", "running->shutdown", "", "application"),
+        ]
+
+    def _aggregate(self, entries, **kwargs):
+        aggregator = LogAggregator(**kwargs)
+        for entry in entries:
+            aggregator.add(entry)
+        return aggregator
+
+    def test_latest_status(self):
+        """Test latest status is taken from the newest entry and system is skipped."""
+        latest = self._aggregate(self.entries).get_latest_status()
+
+        self.assertEqual(set(latest), {"web", "db"})
+        self.assertEqual(latest["web"]["status"], "down")
+        self.assertEqual(latest["web"]["timestamp"], self.base + timedelta(minutes=3))
+        self.assertEqual(latest["db"]["type"], "database")
+
+    def test_uptime_and_latency_stats(self):
+        """Test uptime counters and latency statistics."""
+        until = self.base + timedelta(minutes=5)
+        stats = self._aggregate(self.entries).get_uptime_stats(until)["web"]
+
+        self.assertEqual(stats["total_checks"], 3)
+        self.assertEqual(stats["up_checks"], 2)
+        self.assertEqual(stats["down_checks"], 1)
+        # Up from 10:00 to 10:03, down from 10:03 to 10:05
+        self.assertEqual(stats["up_seconds"], 180)
+        self.assertEqual(stats["down_seconds"], 120)
+        self.assertAlmostEqual(stats["uptime_percentage"], 60.0)
+        self.assertAlmostEqual(stats["avg_response_time"], 0.3)
+        self.assertEqual(stats["min_response_time"], 0.2)
+        self.assertEqual(stats["max_response_time"], 0.4)
+        self.assertAlmostEqual(stats["p50_response_time"], 0.2, delta=0.003)
+        self.assertAlmostEqual(stats["p99_response_time"], 0.4, delta=0.005)
+
+    def test_since_limits_statistics_but_not_latest(self):
+        """Test entries before the window only update the latest status."""
+        aggregator = self._aggregate(self.entries, since=self.base + timedelta(minutes=2))
+
+        stats = aggregator.get_uptime_stats(self.base + timedelta(minutes=5))["web"]
+        self.assertEqual(stats["total_checks"], 1)
+        self.assertEqual(stats["up_checks"], 0)
+        # The pre-window "up" holds from the window start until 10:03
+        self.assertEqual(stats["up_seconds"], 60)
+        self.assertAlmostEqual(stats["uptime_percentage"], 100 / 3)
+        self.assertEqual(aggregator.get_latest_status()["web"]["status"], "down")
+
+    def test_uptime_for_target_without_changes_in_window(self):
+        """Test a target that stayed up through the window reports full uptime."""
+        aggregator = self._aggregate(self.entries[:2], since=self.base + timedelta(minutes=2))
+
+        stats = aggregator.get_uptime_stats(self.base + timedelta(minutes=10))["web"]
+
+        self.assertEqual(stats["total_checks"], 0)
+        self.assertEqual(stats["uptime_percentage"], 100.0)
+
+    def test_bounded_lists(self):
+        """Test history and recent entries are bounded."""
+        entries = [_entry(self.base + timedelta(seconds=i), "web", "up") for i in range(20)]
+        aggregator = self._aggregate(entries, history_limit=5, recent_limit=3)
+
+        history = aggregator.get_status_history()["web"]
+        self.assertEqual(len(history), 5)
+        self.assertEqual(history[-1]["timestamp"], self.base + timedelta(seconds=19))
+
+        recent = aggregator.get_recent_entries()
+        self.assertEqual(len(recent), 3)
+        self.assertEqual(recent[0]["parsed_timestamp"], self.base + timedelta(seconds=19))
+
+    def test_merge_matches_single_pass(self):
+        """Test merging partial aggregates gives the single-pass result."""
+        full = self._aggregate(self.entries)
+        merged = self._aggregate(self.entries[:2])
+        merged.merge(self._aggregate(self.entries[2:]))
+
+        self.assertEqual(merged.get_latest_status(), full.get_latest_status())
+        self.assertEqual(merged.get_uptime_stats(self.until), full.get_uptime_stats(self.until))
+        self.assertEqual(merged.get_status_history(), full.get_status_history())
+        self.assertEqual(
+            [e["timestamp"] for e in merged.get_recent_entries()],
+            [e["timestamp"] for e in full.get_recent_entries()]
+        )
+
+    def test_serialization_round_trip(self):
+        """Test to_dict/from_dict preserve the aggregate."""
+        aggregator = self._aggregate(self.entries)
+        data = json.loads(json.dumps(aggregator.to_dict()))
+
+        restored = LogAggregator.from_dict(data)
+
+        self.assertEqual(restored.get_latest_status(), aggregator.get_latest_status())
+        self.assertEqual(restored.get_uptime_stats(self.until), aggregator.get_uptime_stats(self.until))
+        self.assertEqual(restored.get_status_history(), aggregator.get_status_history())
+
+    def test_from_dict_rejects_unknown_version(self):
+        """Test incompatible serialized data is rejected."""
+        with self.assertRaises(ValueError):
+            LogAggregator.from_dict({"version": -1})
+
+    def test_extract_response_time(self):
+        """Test response time extraction from details."""
+        self.assertEqual(extract_response_time("Response time: 1.25s"), 1.25)
+        self.assertIsNone(extract_response_time("Error: timeout"))
+        self.assertIsNone(extract_response_time(""))
+
+
+class TestAggregateLogFiles(unittest.TestCase):
+    """Test cases for aggregate_log_files."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.base = datetime(2024, 1, 15, 10, 0, 0)
+        self.until = self.base + timedelta(days=3)
+        self.files = []
+        for day in range(3):
+            path = os.path.join(self.temp_dir, f"health_monitor_2024011{5 + day}.log")
+            with open(path, 'w', encoding='utf-8') as f:
+                for i in range(4):
+                    ts = self.base + timedelta(days=day, minutes=i)
+                    status = "up" if i % 2 == 0 else "down"
+                    f.write(json.dumps(_entry(ts, f"t{i % 2}", status, "Response time: 0.10s")) + "\n")
+            self.files.append(path)
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_cached_result_matches_uncached(self):
+        """Test checkpointed aggregation gives the same result as a full parse."""
+        cache_file = os.path.join(self.temp_dir, ".cache.json")
+        since = self.base + timedelta(days=1)
+
+        uncached = aggregate_log_files(self.files, since=since)
+        cache = LogCheckpointCache(cache_file)
+        aggregate_log_files(self.files, since=since, cache=cache)
+        cache.save()
+        cached = aggregate_log_files(self.files, since=since, cache=LogCheckpointCache(cache_file))
+
+        self.assertEqual(cached.get_uptime_stats(self.until), uncached.get_uptime_stats(self.until))
+        self.assertEqual(cached.get_latest_status(), uncached.get_latest_status())
+        self.assertEqual(uncached.get_uptime_stats(self.until)["t0"]["total_checks"], 4)
+
+    def test_window_inside_file_seeks_from_checkpoint_index(self):
+        """Test a window starting mid-file parses only from the index point before it."""
+        path = os.path.join(self.temp_dir, "health_monitor_20240118.log")
+        day = self.base + timedelta(days=3)
+        with open(path, 'w', encoding='utf-8') as f:
+            for i in range(200):
+                ts = day + timedelta(minutes=i)
+                status = "down" if i % 17 == 3 else "up"
+                f.write(json.dumps(_entry(ts, f"t{i % 3}", status, f"Response time: 0.{i % 9 + 1}0s")) + "\n")
+        files = self.files + [path]
+        since = day + timedelta(minutes=150)
+        until = day + timedelta(days=1)
+        cache_file = os.path.join(self.temp_dir, ".cache.json")
+
+        with patch('health_monitor.services.log_aggregator.INDEX_INTERVAL_BYTES', 1024):
+            uncached = aggregate_log_files(files, since=since, workers=1)
+            cache = LogCheckpointCache(cache_file)
+            aggregate_log_files(files, since=since, cache=cache, workers=1)
+            cache.save()
+            with patch('health_monitor.services.log_aggregator.fold_log_file', wraps=fold_log_file) as fold:
+                cached = aggregate_log_files(files, since=since, cache=LogCheckpointCache(cache_file), workers=1)
+
+        offsets = [call.args[3] for call in fold.call_args_list if call.args[0] == path]
+        self.assertEqual(len(offsets), 1)
+        self.assertGreater(offsets[0], os.path.getsize(path) // 2)
+        self.assertEqual(cached.get_uptime_stats(until), uncached.get_uptime_stats(until))
+        self.assertEqual(cached.get_latest_status(), uncached.get_latest_status())
+        self.assertEqual(cached.get_status_history(), uncached.get_status_history())
+        self.assertEqual(cached.get_recent_entries(), uncached.get_recent_entries())
+        self.assertEqual(uncached.get_uptime_stats(until)["t0"]["total_checks"], 17)
+
+    def test_parallel_matches_serial(self):
+        """Test process-pool aggregation merges to the serial result."""
+        serial = aggregate_log_files(self.files, workers=1)
+        parallel = aggregate_log_files(self.files, workers=2)
+
+        self.assertEqual(parallel.get_uptime_stats(self.until), serial.get_uptime_stats(self.until))
+        self.assertEqual(parallel.get_latest_status(), serial.get_latest_status())
+        self.assertEqual(parallel.get_status_history(), serial.get_status_history())
+
+
+if __name__ == '__main__':
+    unittest.main()
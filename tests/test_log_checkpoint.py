@@ -0,0 +1,140 @@
+"""
+Unit tests for incremental log parsing checkpoints.
+"""
+import unittest
+import tempfile
+import shutil
+import json
+import os
+
+from health_monitor.services.log_checkpoint import LogCheckpointCache, fold_log_file
+
+
+def _new_state():
+    return {"count": 0, "targets": []}
+
+
+class TestLogCheckpointCache(unittest.TestCase):
+    """Test cases for LogCheckpointCache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.temp_dir, "health_monitor_20240115.log")
+        self.cache_file = os.path.join(self.temp_dir, ".cache.json")
+        self.fed_entries = []
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _feed(self, state, entry):
+        self.fed_entries.append(entry)
+        state["count"] += 1
+        state["targets"].append(entry["target_name"])
+
+    def _append(self, *targets, newline=True):
+        with open(self.log_file, 'a', encoding='utf-8') as f:
+            for target in targets:
+                line = json.dumps({"timestamp": "2024-01-15T10:00:00", "target_name": target})
+                f.write(line + ("\n" if newline else ""))
+
+    def test_fold_parses_whole_file(self):
+        """Test first fold parses every line."""
+        self._append("a", "b")
+        cache = LogCheckpointCache(self.cache_file)
+
+        state = cache.fold(self.log_file, _new_state, self._feed)
+
+        self.assertEqual(state["count"], 2)
+        self.assertEqual(state["targets"], ["a", "b"])
+
+    def test_fold_only_parses_appended_lines(self):
+        """Test a persisted checkpoint resumes from the stored offset."""
+        self._append("a", "b")
+        cache = LogCheckpointCache(self.cache_file)
+        cache.fold(self.log_file, _new_state, self._feed)
+        cache.save()
+
+        self._append("c")
+        self.fed_entries.clear()
+
+        cache = LogCheckpointCache(self.cache_file)
+        state = cache.fold(self.log_file, _new_state, self._feed)
+
+        self.assertEqual([e["target_name"] for e in self.fed_entries], ["c"])
+        self.assertEqual(state["targets"], ["a", "b", "c"])
+
+    def test_unchanged_file_is_not_reparsed(self):
+        """Test an unchanged file is served entirely from the checkpoint."""
+        self._append("a")
+        cache = LogCheckpointCache(self.cache_file)
+        cache.fold(self.log_file, _new_state, self._feed)
+        self.fed_entries.clear()
+
+        state = cache.fold(self.log_file, _new_state, self._feed)
+
+        self.assertEqual(self.fed_entries, [])
+        self.assertEqual(state["count"], 1)
+
+    def test_partial_line_is_left_for_next_run(self):
+        """Test a line without trailing newline is not consumed."""
+        self._append("a")
+        self._append("b", newline=False)
+        cache = LogCheckpointCache(self.cache_file)
+
+        state = cache.fold(self.log_file, _new_state, self._feed)
+        self.assertEqual(state["targets"], ["a"])
+
+        with open(self.log_file, 'a', encoding='utf-8') as f:
+            f.write("\n")
+        state = cache.fold(self.log_file, _new_state, self._feed)
+        self.assertEqual(state["targets"], ["a", "b"])
+
+    def test_rewritten_file_invalidates_checkpoint(self):
+        """Test a replaced file is parsed again from the start."""
+        self._append("a", "b")
+        cache = LogCheckpointCache(self.cache_file)
+        cache.fold(self.log_file, _new_state, self._feed)
+
+        os.remove(self.log_file)
+        self._append("x", "y", "z")
+
+        state = cache.fold(self.log_file, _new_state, self._feed)
+        self.assertEqual(state["targets"], ["x", "y", "z"])
+
+    def test_namespace_mismatch_discards_cache(self):
+        """Test checkpoints from another state format are ignored."""
+        self._append("a")
+        cache = LogCheckpointCache(self.cache_file, namespace="one")
+        cache.fold(self.log_file, _new_state, self._feed)
+        cache.save()
+
+        other = LogCheckpointCache(self.cache_file, namespace="two")
+        self.assertIsNone(other.get(self.log_file))
+
+    def test_prune_removes_missing_files(self):
+        """Test checkpoints of deleted files are pruned."""
+        self._append("a")
+        cache = LogCheckpointCache(self.cache_file)
+        cache.fold(self.log_file, _new_state, self._feed)
+
+        cache.prune([])
+
+        self.assertIsNone(cache.get(self.log_file))
+
+    def test_fold_log_file_skips_invalid_lines(self):
+        """Test invalid JSON lines are skipped."""
+        with open(self.log_file, 'w', encoding='utf-8') as f:
+            f.write("not json\n")
+        self._append("a")
+        state = _new_state()
+
+        offset = fold_log_file(self.log_file, state, self._feed)
+
+        self.assertEqual(state["targets"], ["a"])
+        self.assertEqual(offset, os.path.getsize(self.log_file))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+Unit tests for paginated log history queries.
+"""
+import unittest
+import tempfile
+import shutil
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+
+from health_monitor.services import log_query
+from health_monitor.services.log_query import LogQuery, decode_cursor
+
+
+class TestLogQuery(unittest.TestCase):
+    """Test cases for LogQuery."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.base = datetime(2024, 1, 15, 0, 0, 0)
+        self.entries = []
+        for day in range(3):
+            day_entries = []
+            for i in range(10):
+                entry = {
+                    "timestamp": (self.base + timedelta(days=day, hours=i)).isoformat(),
+                    "target_name": "web" if i % 2 == 0 else "データベース",
+                    "target_type": "website",
+                    "status_change": "up->down" if i % 5 == 0 else "up",
+                    "details": ""
+                }
+                day_entries.append(entry)
+            self.entries.extend(day_entries)
+            name = f"health_monitor_{(self.base + timedelta(days=day)).strftime('%Y%m%d')}.log"
+            with open(os.path.join(self.temp_dir, name), 'w', encoding='utf-8') as f:
+                for entry in day_entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.newest_first = list(reversed(self.entries))
+        self.query = LogQuery(self.temp_dir)
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _collect(self, query, **kwargs):
+        entries, cursor = [], None
+        while True:
+            page = query.query(cursor=cursor, **kwargs)
+            entries.extend(page["entries"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return entries
+
+    def test_newest_first_pagination(self):
+        """Test following cursors returns every entry once, newest first."""
+        page = self.query.query(limit=7)
+        self.assertEqual(len(page["entries"]), 7)
+        self.assertIsNotNone(page["next_cursor"])
+
+        self.assertEqual(self._collect(self.query, limit=7), self.newest_first)
+
+    def test_target_and_status_filters(self):
+        """Test filtering by target, including non-ASCII names, and new status."""
+        entries = self._collect(self.query, target="データベース", limit=4)
+        self.assertEqual(entries, [e for e in self.newest_first if e["target_name"] == "データベース"])
+
+        entries = self._collect(self.query, status="down")
+        self.assertEqual(entries, [e for e in self.newest_first if e["status_change"] == "up->down"])
+
+    def test_time_range(self):
+        """Test start and end bound the results."""
+        start = self.base + timedelta(days=1, hours=3)
+        end = self.base + timedelta(days=2, hours=1)
+
+        entries = self._collect(self.query, start=start, end=end)
+
+        expected = [e for e in self.newest_first
+                    if start <= datetime.fromisoformat(e["timestamp"]) <= end]
+        self.assertEqual(entries, expected)
+
+    def test_aware_time_range(self):
+        """Test UTC bounds are compared in the local time of the log timestamps."""
+        start = self.base + timedelta(days=1, hours=3)
+        end = self.base + timedelta(days=2, hours=1)
+
+        entries = self._collect(self.query,
+                                start=start.astimezone().astimezone(timezone.utc),
+                                end=end.astimezone().astimezone(timezone.utc))
+
+        expected = [e for e in self.newest_first
+                    if start <= datetime.fromisoformat(e["timestamp"]) <= end]
+        self.assertEqual(entries, expected)
+
+    def test_cli_accepts_utc_start(self):
+        """Test the log_query.py tool accepts a start time with a Z suffix."""
+        start = (self.base + timedelta(days=2, hours=5)).astimezone().astimezone(timezone.utc)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        result = subprocess.run(
+            [sys.executable, os.path.join(root, "log_query.py"), "--log-dir", self.temp_dir,
+             "--start", start.strftime("%Y-%m-%dT%H:%M:%SZ")],
+            cwd=root, capture_output=True, text=True, timeout=30
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(json.loads(result.stdout)["entries"], self.newest_first[:5])
+
+    def test_scan_budget_bounds_each_request(self):
+        """Test a small budget yields partial pages that still cover everything."""
+        query = LogQuery(self.temp_dir, scan_budget=200)
+
+        page = query.query(target="web", limit=100)
+        self.assertLess(len(page["entries"]), 15)
+        self.assertLessEqual(page["scanned_bytes"], 200 + 200)
+
+        self.assertEqual(self._collect(query, target="web"),
+                         [e for e in self.newest_first if e["target_name"] == "web"])
+
+    def test_small_read_blocks(self):
+        """Test reading backwards across block boundaries."""
+        original = log_query.READ_BLOCK_SIZE
+        log_query.READ_BLOCK_SIZE = 16
+        try:
+            self.assertEqual(self._collect(self.query, limit=3), self.newest_first)
+        finally:
+            log_query.READ_BLOCK_SIZE = original
+
+    def test_incomplete_last_line_is_skipped(self):
+        """Test a line still being written is not returned."""
+        path = os.path.join(self.temp_dir, "health_monitor_20240117.log")
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('{"timestamp": "2024-01-17T23:00:00", "target_na')
+
+        page = self.query.query(limit=1)
+
+        self.assertEqual(page["entries"], self.newest_first[:1])
+
+    def test_invalid_arguments(self):
+        """Test invalid cursors and limits are rejected."""
+        with self.assertRaises(ValueError):
+            self.query.query(cursor="bogus")
+        with self.assertRaises(ValueError):
+            self.query.query(limit=0)
+        self.assertEqual(decode_cursor("20240115-42"), ("20240115", 42))
+
+
+if __name__ == '__main__':
+    unittest.main()
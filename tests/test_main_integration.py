@@ -151,6 +151,52 @@ class TestHealthMonitorIntegration(unittest.TestCase):
         self.assertEqual(self.app.website_targets[1].name, "New Website")
         self.assertEqual(self.app.website_targets[2].name, "Another Website")
     
+    def test_invalid_reload_keeps_configuration(self):
+        """Test a configuration that fails validation does not replace the current targets."""
+        self.app.initialize()
+        original_targets = list(self.app.website_targets)
+        
+        with open(os.path.join(self.config_dir, "websites.json"), 'w', encoding='utf-8') as f:
+            f.write('{"websites": [')
+        self.app.config_file_signatures.clear()
+        
+        self.assertFalse(self.app._check_and_reload_config())
+        self.assertEqual(self.app.website_targets, original_targets)
+        self.assertEqual(len(self.app.database_targets), 1)
+        
+        # The rejected file is not reloaded again until it changes
+        self.assertFalse(self.app._check_config_file_changes())
+    
+    def test_replaced_config_file_detected_with_same_mtime(self):
+        """Test a save that renames a new file into place is detected even if the mtime is unchanged."""
+        self.app.initialize()
+        path = os.path.join(self.config_dir, "websites.json")
+        stat = os.stat(path)
+        
+        replacement = path + ".tmp"
+        with open(path, 'r', encoding='utf-8') as source, open(replacement, 'w', encoding='utf-8') as f:
+            f.write(source.read())
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, path)
+        
+        self.assertTrue(self.app._check_config_file_changes())
+    
+    def test_config_change_interrupts_sleep(self):
+        """Test a change reported by the watcher is reloaded without waiting for the next cycle."""
+        self.app.initialize()
+        
+        with open(os.path.join(self.config_dir, "websites.json"), 'w', encoding='utf-8') as f:
+            json.dump({"websites": [{"name": "Only Website", "url": "https://example.com/"}]}, f)
+        self.app.config_file_signatures.clear()
+        self.app.config_changed.set()
+        
+        start = time.monotonic()
+        self.app._interruptible_sleep(30)
+        
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual([t.name for t in self.app.website_targets], ["Only Website"])
+        self.assertFalse(self.app.config_changed.is_set())
+    
     @patch('health_monitor.services.website_checker.WebsiteHealthChecker.check_website')
     @patch('health_monitor.services.database_checker.DatabaseHealthChecker.check_database')
     def test_complete_monitoring_workflow(self, mock_db_check, mock_web_check):
@@ -198,6 +244,39 @@ class TestHealthMonitorIntegration(unittest.TestCase):
         self.assertEqual(summary['healthy'], 1)
         self.assertEqual(summary['unhealthy'], 2)
     
+    def test_run_once_prints_every_target(self):
+        """Test a one-shot run prints all results even when they exceed the terminal height."""
+        from io import StringIO
+        from health_monitor.models.data_models import HealthStatus
+        from datetime import datetime
+        
+        websites_config = {"websites": [
+            {"name": f"Site {i:02d}", "url": f"https://example.com/{i}", "timeout": 5, "expected_status": 200}
+            for i in range(30)
+        ]}
+        with open(os.path.join(self.config_dir, "websites.json"), 'w', encoding='utf-8') as f:
+            json.dump(websites_config, f)
+        with open(os.path.join(self.config_dir, "databases.json"), 'w', encoding='utf-8') as f:
+            json.dump({"databases": []}, f)
+        
+        stdout = StringIO()
+        stdout.isatty = lambda: True
+        check = lambda target: HealthStatus(
+            target_name=target.name, is_healthy=True, response_time=0.1,
+            error_message=None, timestamp=datetime.now()
+        )
+        with patch('health_monitor.services.website_checker.WebsiteHealthChecker.check_website', side_effect=check), \
+                patch('health_monitor.services.terminal_renderer.shutil.get_terminal_size',
+                      return_value=os.terminal_size((80, 24))), \
+                patch('sys.stdout', stdout):
+            self.app.run_once()
+        
+        output = stdout.getvalue()
+        for i in range(30):
+            self.assertIn(f"Site {i:02d}", output)
+        self.assertNotIn("画面に収まりません", output)
+        self.assertNotIn("Ctrl+C", output)
+    
     def test_graceful_shutdown(self):
         """Test graceful shutdown functionality."""
         # Initialize the application
@@ -0,0 +1,114 @@
+"""
+Unit tests for non-blocking metrics collection.
+"""
+import unittest
+from unittest.mock import Mock, patch
+
+from health_monitor.services.metrics_collector import (
+    MetricsCollector, DEFAULT_METRICS
+)
+
+
+class TestMetricsCollector(unittest.TestCase):
+    """Test cases for MetricsCollector."""
+
+    def setUp(self):
+        """Set up mocked psutil calls."""
+        patchers = {
+            'cpu_percent': patch('health_monitor.services.metrics_collector.psutil.cpu_percent', return_value=30.0),
+            'virtual_memory': patch('health_monitor.services.metrics_collector.psutil.virtual_memory',
+                                    return_value=Mock(percent=50.0, used=2 * 1024 * 1024, available=1024 * 1024)),
+            'disk_usage': patch('health_monitor.services.metrics_collector.psutil.disk_usage',
+                                return_value=Mock(total=200, used=50, free=150)),
+            'pids': patch('health_monitor.services.metrics_collector.psutil.pids', return_value=[1, 2, 3]),
+            'Process': patch('health_monitor.services.metrics_collector.psutil.Process'),
+            'monotonic': patch('health_monitor.services.metrics_collector.time.monotonic', return_value=1000.0),
+        }
+        self.mocks = {}
+        for name, patcher in patchers.items():
+            self.mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+        process = self.mocks['Process'].return_value
+        process.cpu_percent.return_value = 5.0
+        process.memory_info.return_value = Mock(rss=10 * 1024 * 1024)
+        process.num_fds.return_value = 7
+        process.num_threads.return_value = 4
+
+    def test_default_metrics(self):
+        """Test that the default set covers the process but not every PID."""
+        values = MetricsCollector().collect()
+
+        self.assertEqual(values['cpu_percent'], 30.0)
+        self.assertEqual(values['memory_percent'], 50.0)
+        self.assertEqual(values['memory_used_mb'], 2.0)
+        self.assertEqual(values['disk_usage_percent'], 25.0)
+        self.assertEqual(values['process_cpu_percent'], 5.0)
+        self.assertEqual(values['process_rss_mb'], 10.0)
+        self.assertEqual(values['process_open_fds'], 7)
+        self.assertEqual(values['thread_count'], 4)
+        self.assertNotIn('process_count', values)
+        self.assertNotIn('process_count', DEFAULT_METRICS)
+        self.mocks['pids'].assert_not_called()
+
+    def test_cpu_sampling_does_not_block(self):
+        """Test that CPU usage is primed at start and then read as deltas."""
+        collector = MetricsCollector()
+        self.mocks['cpu_percent'].assert_called_once_with(interval=None)
+
+        collector.collect()
+        for call in self.mocks['cpu_percent'].call_args_list:
+            self.assertEqual(call.kwargs, {'interval': None})
+        for call in self.mocks['Process'].return_value.cpu_percent.call_args_list:
+            self.assertEqual(call.kwargs, {'interval': None})
+
+    def test_configured_metric_set(self):
+        """Test that only the configured metrics are sampled."""
+        values = MetricsCollector(metrics=['memory', 'process_count']).collect()
+
+        self.assertEqual(set(values), {'memory_percent', 'memory_used_mb',
+                                       'memory_available_mb', 'process_count'})
+        self.assertEqual(values['process_count'], 3)
+        self.mocks['cpu_percent'].assert_not_called()
+        self.mocks['disk_usage'].assert_not_called()
+
+    def test_unknown_metric(self):
+        """Test that an unknown metric name is rejected."""
+        with self.assertRaises(ValueError):
+            MetricsCollector(metrics=['cpu_percent', 'load_average'])
+
+    def test_per_metric_intervals(self):
+        """Test that a metric is only resampled once its interval elapsed."""
+        collector = MetricsCollector(intervals={'memory': 60.0})
+        collector.collect()
+        self.assertEqual(self.mocks['virtual_memory'].call_count, 1)
+        self.assertEqual(self.mocks['disk_usage'].call_count, 1)
+
+        # Not due yet: previous values are reused
+        self.mocks['monotonic'].return_value = 1030.0
+        self.mocks['virtual_memory'].return_value = Mock(percent=90.0, used=0, available=0)
+        values = collector.collect()
+        self.assertEqual(values['memory_percent'], 50.0)
+        self.assertEqual(self.mocks['virtual_memory'].call_count, 1)
+        self.assertEqual(self.mocks['cpu_percent'].call_count, 3)
+
+        self.mocks['monotonic'].return_value = 1060.0
+        values = collector.collect()
+        self.assertEqual(values['memory_percent'], 90.0)
+        self.assertEqual(self.mocks['virtual_memory'].call_count, 2)
+
+        # Disk keeps its longer default interval
+        self.assertEqual(self.mocks['disk_usage'].call_count, 1)
+
+    def test_failed_sample_is_skipped(self):
+        """Test that one failing metric does not prevent the others."""
+        self.mocks['disk_usage'].side_effect = OSError("unavailable")
+
+        values = MetricsCollector().collect()
+
+        self.assertNotIn('disk_usage_percent', values)
+        self.assertEqual(values['memory_percent'], 50.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
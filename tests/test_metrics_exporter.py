@@ -0,0 +1,180 @@
+"""
+Unit tests for the OpenMetrics exporter.
+"""
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from health_monitor.models.data_models import HealthStatus
+from health_monitor.services.latency_histogram import LatencyHistogramRegistry
+from health_monitor.services.metrics_exporter import OpenMetricsExporter
+from health_monitor.services.self_monitor import SelfMonitor
+
+
+def _status(name, healthy=True, response_time=0.25):
+    return HealthStatus(
+        target_name=name,
+        is_healthy=healthy,
+        response_time=response_time,
+        error_message=None if healthy else "Connection refused",
+        timestamp=datetime(2024, 1, 15, 10, 0, 0)
+    )
+
+
+class TestOpenMetricsExporter(unittest.TestCase):
+    """Test cases for OpenMetricsExporter."""
+
+    def setUp(self):
+        """Set up an engine double backed by a real SelfMonitor."""
+        self.engine = MagicMock()
+        self.engine.get_current_statuses.return_value = {
+            "web": _status("web"),
+            "db": _status("db", healthy=False, response_time=0.0)
+        }
+        self.engine.self_monitor = SelfMonitor()
+        self.engine.latency_histograms = LatencyHistogramRegistry(bounds=(0.1, 0.5, 1.0))
+        self.engine.get_resilience_stats.return_value = {
+            'retries': {'website': 4, 'database': 1},
+            'circuit_breakers': {
+                'db': {'check_type': 'database', 'state': 'OPEN', 'opened': 2, 'rejected': 7}
+            }
+        }
+        self.engine.get_worker_pool_stats.return_value = {'size': 10, 'busy': 3}
+        self.engine.queue_wait_histograms = LatencyHistogramRegistry(bounds=(0.1, 1.0))
+        self.engine.run_time_histograms = LatencyHistogramRegistry(bounds=(0.1, 1.0))
+        self.engine.get_cycle_stats.return_value = {
+            'cycles': 12, 'overruns': 2, 'last_duration': 312.5, 'check_interval': 300
+        }
+        self.exporter = OpenMetricsExporter(
+            self.engine, lambda name: "database" if name == "db" else "website"
+        )
+
+    def _samples(self, text):
+        samples = {}
+        for line in text.splitlines():
+            if line and not line.startswith('#'):
+                name, value = line.rsplit(' ', 1)
+                samples[name] = value
+        return samples
+
+    def test_target_gauges(self):
+        """Test per-target up/down and response time gauges."""
+        samples = self._samples(self.exporter.render())
+
+        self.assertEqual(samples['healthmonitor_target_up{target="web",type="website"}'], '1')
+        self.assertEqual(samples['healthmonitor_target_up{target="db",type="database"}'], '0')
+        self.assertEqual(samples['healthmonitor_target_response_time_seconds{target="web",type="website"}'], '0.25')
+
+    def test_check_counters(self):
+        """Test per-target check counters."""
+        for i in range(1, 101):
+            self.engine.self_monitor.record_health_check(True, i / 100.0, target_name="web")
+        self.engine.self_monitor.record_health_check(False, 0.0, target_name="web")
+
+        samples = self._samples(self.exporter.render())
+
+        self.assertEqual(samples['healthmonitor_checks_total{target="web",result="success"}'], '100')
+        self.assertEqual(samples['healthmonitor_checks_total{target="web",result="failure"}'], '1')
+
+    def test_latency_histograms(self):
+        """Test per-target, per-check-type cumulative latency buckets."""
+        for value in (0.05, 0.1, 0.3, 2.0):
+            self.engine.latency_histograms.observe("website", "web", value)
+        self.engine.latency_histograms.observe("database", "db", 0.7)
+
+        text = self.exporter.render()
+        samples = self._samples(text)
+
+        self.assertIn("# TYPE healthmonitor_check_latency_seconds histogram", text)
+        prefix = 'healthmonitor_check_latency_seconds_bucket{target="web",check_type="website",le='
+        self.assertEqual(samples[prefix + '"0.1"}'], '2')
+        self.assertEqual(samples[prefix + '"0.5"}'], '3')
+        self.assertEqual(samples[prefix + '"1.0"}'], '3')
+        self.assertEqual(samples[prefix + '"+Inf"}'], '4')
+        self.assertEqual(samples['healthmonitor_check_latency_seconds_count{target="web",check_type="website"}'], '4')
+        self.assertAlmostEqual(
+            float(samples['healthmonitor_check_latency_seconds_sum{target="web",check_type="website"}']), 2.45
+        )
+        self.assertEqual(
+            samples['healthmonitor_check_latency_seconds_bucket{target="db",check_type="database",le="0.5"}'], '0'
+        )
+
+    def test_resilience_and_pool_metrics(self):
+        """Test retry, circuit breaker and worker pool metrics."""
+        samples = self._samples(self.exporter.render())
+
+        self.assertEqual(samples['healthmonitor_retries_total{check_type="website"}'], '4')
+        self.assertEqual(samples['healthmonitor_circuit_breaker_open{target="db",check_type="database"}'], '1')
+        self.assertEqual(samples['healthmonitor_circuit_breaker_opened_total{target="db",check_type="database"}'], '2')
+        self.assertEqual(samples['healthmonitor_circuit_breaker_rejected_total{target="db",check_type="database"}'], '7')
+        self.assertEqual(samples['healthmonitor_worker_pool_busy'], '3')
+        self.assertEqual(samples['healthmonitor_worker_pool_utilization_ratio'], '0.3')
+
+    def test_scheduling_metrics(self):
+        """Test queue wait and run time histograms and cycle overrun counters."""
+        self.engine.queue_wait_histograms.observe("website", "web", 2.5)
+        self.engine.run_time_histograms.observe("website", "web", 0.05)
+
+        samples = self._samples(self.exporter.render())
+
+        self.assertEqual(
+            samples['healthmonitor_check_queue_wait_seconds_bucket{target="web",check_type="website",le="1.0"}'], '0'
+        )
+        self.assertEqual(
+            samples['healthmonitor_check_queue_wait_seconds_count{target="web",check_type="website"}'], '1'
+        )
+        self.assertEqual(
+            samples['healthmonitor_check_run_time_seconds_bucket{target="web",check_type="website",le="0.1"}'], '1'
+        )
+        self.assertEqual(samples['healthmonitor_cycles_total'], '12')
+        self.assertEqual(samples['healthmonitor_cycle_overruns_total'], '2')
+        self.assertEqual(samples['healthmonitor_cycle_duration_seconds'], '312.5')
+        self.assertEqual(samples['healthmonitor_check_interval_seconds'], '300')
+
+    def test_exposition_format(self):
+        """Test family metadata, label escaping and the EOF marker."""
+        self.engine.get_current_statuses.return_value = {'say "hi"\\': _status('say "hi"\\')}
+
+        text = self.exporter.render()
+
+        self.assertTrue(text.endswith("# EOF\n"))
+        self.assertIn("# TYPE healthmonitor_checks counter", text)
+        self.assertIn("# UNIT healthmonitor_check_latency_seconds seconds", text)
+        self.assertIn('healthmonitor_target_up{target="say \\"hi\\"\\\\",type="website"} 1', text)
+
+    def test_family_metadata_is_consistent(self):
+        """Test every family with a unit is named after it and every sample belongs to a family."""
+        self.engine.latency_histograms.observe("website", "web", 0.3)
+        self.engine.self_monitor.record_health_check(True, 0.3, "web")
+
+        families = {}
+        for line in self.exporter.render().splitlines():
+            if line.startswith("# TYPE "):
+                _, _, name, metric_type = line.split(" ")
+                families[name] = metric_type
+            elif line.startswith("# UNIT "):
+                _, _, name, unit = line.split(" ")
+                self.assertIn(name, families)
+                self.assertTrue(name.endswith(f"_{unit}"), f"{name} does not end with its unit {unit}")
+            elif line and not line.startswith("#"):
+                sample_name = line.split("{")[0].split(" ")[0]
+                suffixes = {"counter": ("_total", "_created"), "histogram": ("_bucket", "_count", "_sum")}
+                self.assertTrue(
+                    any(sample_name == name or (sample_name.startswith(name) and sample_name[len(name):]
+                                                in suffixes.get(metric_type, ()))
+                        for name, metric_type in families.items()),
+                    f"{sample_name} has no metric family"
+                )
+
+    def test_without_self_monitoring(self):
+        """Test that check metrics are omitted when self-monitoring is off."""
+        self.engine.self_monitor = None
+
+        text = self.exporter.render()
+
+        self.assertNotIn("healthmonitor_checks", text)
+        self.assertIn("healthmonitor_target_up", text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -80,6 +80,7 @@ class TestRetryHandler(unittest.TestCase):
         
         self.assertEqual(result, "success")
         self.assertEqual(mock_func.call_count, 3)
+        self.assertEqual(self.handler.retry_count, 2)
         # Should have delays between attempts
         self.assertGreater(end_time - start_time, 0.2)  # At least 0.1 + 0.2 seconds delay
     
@@ -91,6 +92,7 @@ class TestRetryHandler(unittest.TestCase):
             self.handler.execute_with_retry(mock_func)
         
         mock_func.assert_called_once()
+        self.assertEqual(self.handler.retry_count, 0)
     
     def test_max_attempts_reached(self):
         """Test behavior when max attempts are reached."""
@@ -202,6 +204,8 @@ class TestCircuitBreaker(unittest.TestCase):
         
         # Function should not have been called
         self.assertEqual(mock_func.call_count, 3)
+        self.assertEqual(self.circuit_breaker.open_count, 1)
+        self.assertEqual(self.circuit_breaker.rejected_count, 1)
     
     def test_circuit_recovery_after_timeout(self):
         """Test circuit recovery after timeout period."""
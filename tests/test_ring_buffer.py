@@ -0,0 +1,106 @@
+"""
+Unit tests for fixed-capacity ring buffers.
+"""
+import statistics
+import unittest
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from health_monitor.services.ring_buffer import NumericRingBuffer, RingBuffer
+
+
+@dataclass
+class Record:
+    timestamp: datetime
+    value: int
+
+
+class TestRingBuffer(unittest.TestCase):
+    """Test cases for RingBuffer."""
+
+    def setUp(self):
+        self.base = datetime(2024, 1, 15, 10, 0, 0)
+
+    def _records(self, count):
+        return [Record(self.base + timedelta(minutes=i), i) for i in range(count)]
+
+    def test_capacity_drops_oldest(self):
+        """Test that appending to a full buffer drops the oldest record."""
+        buffer = RingBuffer(3)
+        buffer.extend(self._records(5))
+
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual([r.value for r in buffer], [2, 3, 4])
+        self.assertEqual(buffer[0].value, 2)
+        self.assertEqual(buffer[-1].value, 4)
+
+    def test_expire(self):
+        """Test that expiry drops records at or before the cutoff."""
+        buffer = RingBuffer(10)
+        buffer.extend(self._records(5))
+
+        removed = buffer.expire(self.base + timedelta(minutes=2))
+
+        self.assertEqual(removed, 3)
+        self.assertEqual([r.value for r in buffer], [3, 4])
+        self.assertEqual(buffer.expire(self.base), 0)
+
+    def test_invalid_capacity(self):
+        """Test that a non-positive capacity is rejected."""
+        with self.assertRaises(ValueError):
+            RingBuffer(0)
+
+
+class TestNumericRingBuffer(unittest.TestCase):
+    """Test cases for NumericRingBuffer."""
+
+    def test_empty(self):
+        """Test an empty buffer."""
+        buffer = NumericRingBuffer(4)
+
+        self.assertEqual(len(buffer), 0)
+        self.assertIsNone(buffer.mean())
+        self.assertEqual(list(buffer), [])
+        with self.assertRaises(IndexError):
+            buffer[0]
+
+    def test_wraparound(self):
+        """Test that the oldest values are overwritten in order."""
+        buffer = NumericRingBuffer(4)
+        buffer.extend(float(i) for i in range(10))
+
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual(list(buffer), [6.0, 7.0, 8.0, 9.0])
+        self.assertEqual(buffer[0], 6.0)
+        self.assertEqual(buffer[-1], 9.0)
+        self.assertIn(8.0, buffer)
+        self.assertEqual(buffer.capacity, 4)
+
+    def test_running_mean(self):
+        """Test that the mean covers only the values held."""
+        buffer = NumericRingBuffer(3)
+        buffer.extend([1.0, 2.0, 3.0])
+        self.assertAlmostEqual(buffer.mean(), 2.0)
+
+        buffer.append(10.0)
+        self.assertAlmostEqual(buffer.mean(), 5.0)
+
+        buffer.clear()
+        self.assertIsNone(buffer.mean())
+        buffer.append(4.0)
+        self.assertEqual(list(buffer), [4.0])
+
+    def test_mean_does_not_drift(self):
+        """Test the mean stays exact after many wraps of mixed-magnitude values."""
+        buffer = NumericRingBuffer(100)
+        values = [(1e12 if i % 7 == 0 else 1e-3) * (1 + i % 13) for i in range(100_003)]
+        buffer.extend(values)
+
+        self.assertEqual(buffer.mean(), statistics.fmean(values[-100:]))
+
+        buffer.extend([0.0] * 100)
+        self.assertEqual(buffer.mean(), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
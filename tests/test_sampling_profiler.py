@@ -0,0 +1,122 @@
+"""
+Unit tests for the on-demand sampling profiler.
+"""
+import unittest
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from health_monitor.services.sampling_profiler import SamplingProfiler, MAX_DURATION
+
+
+def busy_target_for_profiling(stop_event):
+    while not stop_event.is_set():
+        sum(range(1000))
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    """Test cases for SamplingProfiler."""
+
+    def setUp(self):
+        """Set up a busy worker thread to sample."""
+        self.output_dir = tempfile.mkdtemp()
+        self.profiler = SamplingProfiler(output_dir=self.output_dir, interval=0.005)
+        self.stop_worker = threading.Event()
+        self.worker = threading.Thread(
+            target=busy_target_for_profiling,
+            args=(self.stop_worker,),
+            name="ThreadPoolExecutor-3_0"
+        )
+        self.worker.start()
+
+    def tearDown(self):
+        """Stop the worker and remove written profiles."""
+        self.profiler.stop()
+        self.stop_worker.set()
+        self.worker.join()
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def _wait_until_finished(self, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while self.profiler.is_running and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_session_writes_collapsed_stacks(self):
+        """Test a timed session writes collapsed stacks of other threads."""
+        self.assertTrue(self.profiler.start(duration=0.2))
+        self._wait_until_finished()
+
+        path = self.profiler.last_output_path
+        self.assertIsNotNone(path)
+        self.assertEqual(os.path.dirname(path), self.output_dir)
+        self.assertTrue(path.endswith(".collapsed"))
+
+        with open(path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        worker_lines = [line for line in lines if line.startswith("ThreadPoolExecutor;")]
+        self.assertTrue(worker_lines)
+        self.assertTrue(any("busy_target_for_profiling" in line for line in worker_lines))
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            self.assertGreater(int(count), 0)
+            self.assertNotIn("SamplingProfiler;", stack + ";")
+        self.assertGreater(self.profiler.get_status()['samples'], 0)
+
+    def test_stop_early_writes_profile(self):
+        """Test stopping a long session still writes the samples so far."""
+        self.profiler.start(duration=60)
+        time.sleep(0.05)
+
+        path = self.profiler.stop()
+
+        self.assertFalse(self.profiler.is_running)
+        self.assertTrue(os.path.exists(path))
+
+    def test_single_session_at_a_time(self):
+        """Test a second start is refused while a session runs."""
+        self.assertTrue(self.profiler.start(duration=60))
+        self.assertFalse(self.profiler.start(duration=60))
+        self.assertTrue(self.profiler.get_status()['running'])
+
+    def test_toggle(self):
+        """Test toggling starts a session and then stops it."""
+        self.assertTrue(self.profiler.toggle(duration=60))
+        self.assertTrue(self.profiler.is_running)
+
+        self.assertFalse(self.profiler.toggle())
+        self._wait_until_finished()
+        self.assertFalse(self.profiler.is_running)
+        self.assertIsNotNone(self.profiler.last_output_path)
+
+    def test_toggle_request_while_lock_is_held(self):
+        """Test a toggle request, as sent by the signal handler, never blocks on the profiler lock."""
+        self.profiler.start_toggle_listener()
+        try:
+            with self.profiler._lock:
+                # A signal arriving while the main thread is inside toggle()
+                self.profiler.request_toggle()
+            deadline = time.monotonic() + 5.0
+            while not self.profiler.is_running and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertTrue(self.profiler.is_running)
+
+            self.profiler.request_toggle()
+            deadline = time.monotonic() + 5.0
+            while self.profiler.last_output_path is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertIsNotNone(self.profiler.last_output_path)
+        finally:
+            self.profiler.stop_toggle_listener()
+
+    def test_invalid_duration(self):
+        """Test durations outside the allowed range are rejected."""
+        with self.assertRaises(ValueError):
+            self.profiler.start(duration=0)
+        with self.assertRaises(ValueError):
+            self.profiler.start(duration=MAX_DURATION + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
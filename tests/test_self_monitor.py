@@ -5,6 +5,7 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import time
 import tempfile
+import threading
 import os
 import json
 from datetime import datetime, timedelta
@@ -123,6 +124,57 @@ class TestSelfMonitor(unittest.TestCase):
         self.assertEqual(self.monitor._response_times[0], 50.0)  # First kept entry
         self.assertEqual(self.monitor._response_times[-1], 149.0)  # Last entry
     
+    def test_concurrent_record_health_check(self):
+        """Test counters stay exact when checks are recorded from many threads."""
+        def worker():
+            for i in range(500):
+                self.monitor.record_health_check(success=i % 5 != 0, response_time=0.1)
+                self.monitor.record_retry_attempt()
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(self.monitor._total_checks, 4000)
+        self.assertEqual(self.monitor._successful_checks, 3200)
+        self.assertEqual(self.monitor._failed_checks, 800)
+        self.assertEqual(self.monitor._retry_attempts, 4000)
+    
+    def test_metrics_storage_is_bounded(self):
+        """Test metric history never grows past the retention capacity."""
+        monitor = SelfMonitor(metrics_retention_hours=1)
+        capacity = monitor._system_metrics.capacity
+        self.assertEqual(capacity, 121)
+        
+        now = datetime.now()
+        for i in range(capacity * 3):
+            monitor._system_metrics.append(SystemMetrics(
+                timestamp=now, cpu_percent=0.0, memory_percent=0.0, memory_used_mb=0.0,
+                memory_available_mb=0.0, disk_usage_percent=0.0, disk_free_gb=0.0,
+                process_count=0, thread_count=i
+            ))
+        
+        self.assertEqual(len(monitor._system_metrics), capacity)
+        self.assertEqual(monitor._system_metrics[-1].thread_count, capacity * 3 - 1)
+    
+    def test_latency_percentiles(self):
+        """Test p50/p95/p99 are reported overall and per target."""
+        for i in range(1, 101):
+            self.monitor.record_health_check(success=True, response_time=i / 100.0, target_name="web")
+        self.monitor.record_health_check(success=True, response_time=5.0, target_name="db")
+        
+        percentiles = self.monitor.get_latency_percentiles()
+        
+        self.assertAlmostEqual(percentiles["targets"]["web"]["p50"], 0.5, delta=0.01)
+        self.assertAlmostEqual(percentiles["targets"]["web"]["p99"], 0.99, delta=0.02)
+        self.assertAlmostEqual(percentiles["targets"]["db"]["p95"], 5.0, delta=0.05)
+        self.assertAlmostEqual(percentiles["overall"]["p99"], 1.0, delta=0.02)
+        
+        metrics = self.monitor._collect_application_metrics()
+        self.assertAlmostEqual(metrics.p50_response_time, 0.51, delta=0.01)
+    
     def test_update_counters(self):
         """Test updating various counters."""
         self.monitor.update_target_count(5)
@@ -156,11 +208,11 @@ class TestSelfMonitor(unittest.TestCase):
         diagnostic = diagnostics[0]
         self.assertEqual(diagnostic["details"], details)
     
-    @patch('health_monitor.services.self_monitor.psutil.cpu_percent')
-    @patch('health_monitor.services.self_monitor.psutil.virtual_memory')
-    @patch('health_monitor.services.self_monitor.psutil.disk_usage')
-    @patch('health_monitor.services.self_monitor.psutil.pids')
-    @patch('health_monitor.services.self_monitor.psutil.Process')
+    @patch('health_monitor.services.metrics_collector.psutil.cpu_percent')
+    @patch('health_monitor.services.metrics_collector.psutil.virtual_memory')
+    @patch('health_monitor.services.metrics_collector.psutil.disk_usage')
+    @patch('health_monitor.services.metrics_collector.psutil.pids')
+    @patch('health_monitor.services.metrics_collector.psutil.Process')
     def test_collect_system_metrics(self, mock_process, mock_pids, mock_disk, mock_memory, mock_cpu):
         """Test system metrics collection."""
         # Mock system data
@@ -182,10 +234,14 @@ class TestSelfMonitor(unittest.TestCase):
         
         mock_process_obj = Mock()
         mock_process_obj.num_threads.return_value = 8
+        mock_process_obj.cpu_percent.return_value = 12.5
+        mock_process_obj.memory_info.return_value = Mock(rss=64 * 1024 * 1024)
+        mock_process_obj.num_fds.return_value = 21
         mock_process.return_value = mock_process_obj
         
         # Collect metrics
-        metrics = self.monitor._collect_system_metrics()
+        monitor = SelfMonitor()
+        metrics = monitor._collect_system_metrics()
         
         # Verify metrics
         self.assertEqual(metrics.cpu_percent, 45.5)
@@ -194,8 +250,21 @@ class TestSelfMonitor(unittest.TestCase):
         self.assertEqual(metrics.memory_available_mb, 512.0)
         self.assertEqual(metrics.disk_usage_percent, 75.0)
         self.assertAlmostEqual(metrics.disk_free_gb, 25.0, places=1)
-        self.assertEqual(metrics.process_count, 150)
         self.assertEqual(metrics.thread_count, 8)
+        self.assertEqual(metrics.process_cpu_percent, 12.5)
+        self.assertEqual(metrics.process_rss_mb, 64.0)
+        self.assertEqual(metrics.process_open_fds, 21)
+        
+        # CPU is sampled as a delta, never by sleeping through an interval
+        for call in mock_cpu.call_args_list:
+            self.assertIsNone(call.kwargs.get('interval'))
+        
+        # Walking every PID is opt-in
+        mock_pids.assert_not_called()
+        self.assertEqual(metrics.process_count, 0)
+        
+        monitor = SelfMonitor(metrics=['process_count'])
+        self.assertEqual(monitor._collect_system_metrics().process_count, 150)
     
     def test_collect_application_metrics(self):
         """Test application metrics collection."""
@@ -203,7 +272,7 @@ class TestSelfMonitor(unittest.TestCase):
         self.monitor._total_checks = 100
         self.monitor._successful_checks = 95
         self.monitor._failed_checks = 5
-        self.monitor._response_times = [0.1, 0.2, 0.3, 0.4, 0.5]
+        self.monitor._response_times.extend([0.1, 0.2, 0.3, 0.4, 0.5])
         self.monitor._active_targets = 10
         self.monitor._circuit_breakers_open = 1
         self.monitor._retry_attempts = 15
@@ -219,6 +288,35 @@ class TestSelfMonitor(unittest.TestCase):
         self.assertEqual(metrics.circuit_breakers_open, 1)
         self.assertEqual(metrics.retry_attempts, 15)
     
+    def test_scheduling_warnings(self):
+        """Test warnings for saturated workers and cycles overrunning the interval."""
+        system_metrics = SystemMetrics(
+            timestamp=datetime.now(), cpu_percent=10.0, memory_percent=10.0,
+            memory_used_mb=100.0, memory_available_mb=1000.0, disk_usage_percent=10.0,
+            disk_free_gb=100.0, process_count=1, thread_count=1
+        )
+        for _ in range(3):
+            self.monitor.record_check_timing(queue_wait=4.0, run_time=0.5)
+        self.monitor.record_cycle(250.0, check_interval=300)
+        self.monitor.record_cycle(312.5, check_interval=300)
+        
+        app_metrics = self.monitor._collect_application_metrics()
+        self.assertEqual(app_metrics.average_queue_wait, 4.0)
+        self.assertEqual(app_metrics.average_check_run_time, 0.5)
+        self.assertEqual(app_metrics.last_cycle_duration, 312.5)
+        self.assertEqual(app_metrics.cycle_overruns, 1)
+        
+        self.monitor._check_system_health(system_metrics, app_metrics)
+        messages = [d["message"] for d in self.monitor.get_diagnostics(level="WARNING")]
+        self.assertTrue(any("waiting for workers" in m for m in messages))
+        self.assertTrue(any("overran interval 1 time(s)" in m and "312.5s > 300s" in m for m in messages))
+        
+        # An overrun is reported once, the saturation warning persists while it lasts
+        self.monitor._check_system_health(system_metrics, self.monitor._collect_application_metrics())
+        messages = [d["message"] for d in self.monitor.get_diagnostics(level="WARNING")]
+        self.assertEqual(sum("overran" in m for m in messages), 1)
+        self.assertEqual(sum("waiting for workers" in m for m in messages), 2)
+    
     def test_get_current_metrics(self):
         """Test getting current metrics."""
         # Add some test data
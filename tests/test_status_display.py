@@ -5,6 +5,7 @@ import unittest
 from unittest.mock import Mock, patch, call
 from datetime import datetime
 from io import StringIO
+import os
 import sys
 
 from health_monitor.models.data_models import HealthStatus
@@ -35,23 +36,28 @@ class TestStatusDisplay(unittest.TestCase):
             timestamp=datetime(2023, 1, 1, 12, 0, 0)
         )
     
-    @patch('health_monitor.services.status_display.os.system')
-    @patch('builtins.print')
-    def test_update_display_basic(self, mock_print, mock_os_system):
+    def test_update_display_basic(self):
         """Test basic display update functionality."""
+        stream = StringIO()
+        display = StatusDisplay(stream=stream)
         statuses = {
             "test-website": self.healthy_status,
             "test-database": self.unhealthy_status
         }
         
-        self.display.update_display(statuses)
+        with patch('os.system') as mock_os_system:
+            display.update_display(statuses)
         
-        # Verify screen was cleared
-        mock_os_system.assert_called_once_with('cls')
+        # No shell is spawned to clear the screen
+        mock_os_system.assert_not_called()
         
-        # Verify print was called multiple times for header, targets, and footer
-        self.assertTrue(mock_print.called)
-        self.assertGreater(mock_print.call_count, 5)
+        # Header, targets and footer are written as one frame
+        output = stream.getvalue()
+        self.assertIn("ヘルスモニター", output)
+        self.assertIn("test-website", output)
+        self.assertIn("Connection timeout", output)
+        self.assertIn("最終更新", output)
+        self.assertGreater(len(output.splitlines()), 5)
     
     @patch('builtins.print')
     def test_show_error(self, mock_print):
@@ -68,6 +74,26 @@ class TestStatusDisplay(unittest.TestCase):
         self.assertIn(target, call_args)
         self.assertIn(error, call_args)
     
+    @patch('health_monitor.services.terminal_renderer.shutil.get_terminal_size',
+           return_value=os.terminal_size((80, 24)))
+    def test_show_message_between_frames_redraws_everything(self, _size):
+        """Test a message printed between frames does not leave stale rows."""
+        stream = StringIO()
+        stream.isatty = lambda: True
+        display = StatusDisplay(stream=stream)
+        statuses = {"test-website": self.healthy_status}
+        display.update_display(statuses)
+        
+        display.show_message("設定ファイルの変更を検出しました。")
+        stream.seek(0)
+        stream.truncate()
+        display.update_display(statuses)
+        
+        # The message scrolled the screen, so unchanged rows are redrawn too
+        output = stream.getvalue()
+        self.assertIn("\x1b[2J", output)
+        self.assertIn("test-website", output)
+    
     @patch('builtins.print')
     def test_refresh_ui(self, mock_print):
         """Test UI refresh functionality."""
@@ -126,19 +152,167 @@ class TestStatusDisplay(unittest.TestCase):
         self.assertIsInstance(tracker, StatusChangeTracker)
         self.assertEqual(tracker, self.display._change_tracker)
     
-    @patch('health_monitor.services.status_display.os.system')
-    def test_clear_screen_windows(self, mock_os_system):
-        """Test screen clearing on Windows."""
-        with patch('health_monitor.services.status_display.os.name', 'nt'):
-            self.display._clear_screen()
-            mock_os_system.assert_called_once_with('cls')
-    
-    @patch('health_monitor.services.status_display.os.system')
-    def test_clear_screen_unix(self, mock_os_system):
-        """Test screen clearing on Unix systems."""
-        with patch('health_monitor.services.status_display.os.name', 'posix'):
-            self.display._clear_screen()
-            mock_os_system.assert_called_once_with('clear')
+    def test_frame_fits_terminal_height(self):
+        """Test targets that do not fit on screen are summarized in one line."""
+        statuses = {
+            f"target-{i}": HealthStatus(
+                target_name=f"target-{i}", is_healthy=True, response_time=0.1,
+                error_message=None, timestamp=datetime(2023, 1, 1, 12, 0, 0)
+            )
+            for i in range(20)
+        }
+        
+        frame = self.display._build_frame(statuses, max_lines=20)
+        
+        self.assertLessEqual(len(frame), 20)
+        self.assertIn("target-0", "".join(frame))
+        self.assertNotIn("target-19", "".join(frame))
+        self.assertTrue(any("他 15 件" in line for line in frame))
+        self.assertEqual(len(self.display._build_frame(statuses)), 4 + 40 + 5)
+    
+    @patch('health_monitor.services.terminal_renderer.shutil.get_terminal_size',
+           return_value=os.terminal_size((80, 24)))
+    def test_show_results_prints_every_target(self, _size):
+        """Test one-shot results are neither clipped, paged nor cleared on a small terminal."""
+        stream = StringIO()
+        stream.isatty = lambda: True
+        statuses = {
+            f"target-{i}": HealthStatus(
+                target_name=f"target-{i}", is_healthy=True, response_time=0.1,
+                error_message=None, timestamp=datetime(2023, 1, 1, 12, 0, 0)
+            )
+            for i in range(60)
+        }
+        display = StatusDisplay(stream=stream, mode="auto", page_interval=0)
+        
+        display.show_results(statuses)
+        
+        output = stream.getvalue()
+        for name in statuses:
+            self.assertIn(f"{name} ", output)
+        self.assertNotIn("画面に収まりません", output)
+        self.assertNotIn("Ctrl+C", output)
+        self.assertNotIn("\033[2J", output)
+    
+    def test_change_indicator_persists_across_frames(self):
+        """Test a recent status change stays marked on later redraws."""
+        now = datetime.now()
+        up = HealthStatus(target_name="web", is_healthy=True, response_time=0.1,
+                          error_message=None, timestamp=now)
+        down = HealthStatus(target_name="web", is_healthy=False, response_time=0.0,
+                            error_message="HTTP 500", timestamp=now)
+        display = StatusDisplay(stream=StringIO())
+        display.update_display({"web": up})
+        display.update_display({"web": down})
+        
+        # Redraw without a new status, as the display refresher does
+        display.update_display({"web": down})
+        
+        self.assertEqual(display.get_status_changes(), {})
+        self.assertIn("正常→異常", display._format_target_status("web", down)[0])
+    
+    def test_multiline_error_stays_on_one_row(self):
+        """Test error messages with newlines do not add screen rows."""
+        status = HealthStatus(
+            target_name="db", is_healthy=False, response_time=0.0,
+            error_message="could not connect\n\tIs the server running?", timestamp=datetime(2023, 1, 1, 12, 0, 0)
+        )
+        
+        lines = self.display._format_target_status("db", status)
+        
+        self.assertEqual(len(lines), 3)
+        self.assertIn("could not connect Is the server running?", lines[1])
+
+
+class TestStatusDisplaySummaryMode(unittest.TestCase):
+    """Test cases for the aggregated summary mode."""
+    
+    def setUp(self):
+        """Set up a summary display over many targets."""
+        self.stream = StringIO()
+        self.resolver = Mock(side_effect=lambda name: "database" if name.startswith("db") else "website")
+        self.display = StatusDisplay(stream=self.stream, mode="summary", group_resolver=self.resolver,
+                                     top_n=3, page_interval=0)
+        self.statuses = {
+            f"web-{i:03d}": HealthStatus(
+                target_name=f"web-{i:03d}", is_healthy=True, response_time=i / 100.0,
+                error_message=None, timestamp=datetime(2023, 1, 1, 12, 0, 0)
+            )
+            for i in range(100)
+        }
+        self.statuses["db-main"] = HealthStatus(
+            target_name="db-main", is_healthy=False, response_time=0.0,
+            error_message="Connection refused", timestamp=datetime(2023, 1, 1, 12, 5, 0)
+        )
+    
+    def _frame(self):
+        self.stream.seek(0)
+        self.stream.truncate()
+        self.display.update_display(self.statuses)
+        return self.stream.getvalue()
+    
+    def test_summary_sections(self):
+        """Test group counts, slowest targets, newest failures and a page of targets."""
+        output = self._frame()
+        
+        self.assertIn("監視対象: 101件", output)
+        self.assertRegex(output, r"website\s+正常\s+100\s+異常\s+0")
+        self.assertRegex(output, r"database\s+正常\s+0\s+.*異常\s+1")
+        slowest = output.split("応答が遅い上位 3 件")[1].split("最近の異常")[0]
+        self.assertEqual(slowest.count("web-"), 3)
+        self.assertIn("web-099", slowest)
+        self.assertIn("12:05:00 db-main", output)
+        self.assertIn("Connection refused", output)
+        self.assertIn("一覧 (ページ 1/6)", output)
+        self.assertNotIn("web-050", output.split("一覧")[1])
+    
+    def test_pages_rotate(self):
+        """Test the target list advances one page per page interval."""
+        self.display.page_interval = 5.0
+        with patch('health_monitor.services.status_display.time.monotonic', return_value=12.0):
+            output = self._frame()
+        
+        self.assertIn("一覧 (ページ 3/6)", output)
+        self.assertIn("web-039", output.split("一覧")[1])
+    
+    def test_only_changed_targets_reindexed(self):
+        """Test later frames only resolve groups for new targets."""
+        self._frame()
+        self.assertEqual(self.resolver.call_count, 101)
+        
+        self.statuses["web-000"] = HealthStatus(
+            target_name="web-000", is_healthy=False, response_time=0.0,
+            error_message="HTTP 503", timestamp=datetime(2023, 1, 1, 12, 6, 0)
+        )
+        self.statuses["web-new"] = self.statuses["web-001"]
+        output = self._frame()
+        
+        self.assertEqual(self.resolver.call_count, 102)
+        self.assertIn("監視対象: 102件", output)
+        self.assertIn("12:06:00 web-000", output)
+    
+    def test_removed_targets_dropped(self):
+        """Test targets missing from the statuses leave the summary."""
+        self._frame()
+        del self.statuses["db-main"]
+        
+        output = self._frame()
+        
+        self.assertIn("監視対象: 100件", output)
+        self.assertNotIn("db-main", output)
+    
+    def test_auto_mode_switches_on_target_count(self):
+        """Test auto mode lists few targets in detail and summarizes many."""
+        display = StatusDisplay(stream=self.stream, mode="auto")
+        few = {"web-001": self.statuses["web-001"]}
+        
+        self.assertFalse(display._use_summary(few))
+        self.assertTrue(display._use_summary(self.statuses))
+    
+    def test_invalid_mode(self):
+        """Test unknown modes are rejected."""
+        with self.assertRaises(ValueError):
+            StatusDisplay(mode="fancy")
 
 
 class TestStatusChangeTracker(unittest.TestCase):
@@ -307,8 +481,7 @@ class TestStatusDisplayColorOutput(unittest.TestCase):
         """Set up test fixtures."""
         self.display = StatusDisplay()
     
-    @patch('builtins.print')
-    def test_display_target_status_healthy(self, mock_print):
+    def test_format_target_status_healthy(self):
         """Test displaying healthy target status with correct colors."""
         healthy_status = HealthStatus(
             target_name="test-website",
@@ -318,21 +491,19 @@ class TestStatusDisplayColorOutput(unittest.TestCase):
             timestamp=datetime(2023, 1, 1, 12, 0, 0)
         )
         
-        self.display._display_target_status("test-website", healthy_status)
+        lines = self.display._format_target_status("test-website", healthy_status)
         
-        # Verify print was called
-        self.assertTrue(mock_print.called)
+        # Status line plus spacing
+        self.assertEqual(len(lines), 2)
         
         # Check that the output contains expected elements
-        printed_calls = [str(call.args[0]) if call.args else str(call) for call in mock_print.call_args_list]
-        printed_output = ''.join(printed_calls)
+        printed_output = ''.join(lines)
         self.assertIn("test-website", printed_output)
         self.assertIn("正常", printed_output)
         self.assertIn("0.50s", printed_output)
         self.assertIn("12:00:00", printed_output)
     
-    @patch('builtins.print')
-    def test_display_target_status_unhealthy(self, mock_print):
+    def test_format_target_status_unhealthy(self):
         """Test displaying unhealthy target status with error message."""
         unhealthy_status = HealthStatus(
             target_name="test-database",
@@ -342,14 +513,13 @@ class TestStatusDisplayColorOutput(unittest.TestCase):
             timestamp=datetime(2023, 1, 1, 12, 0, 0)
         )
         
-        self.display._display_target_status("test-database", unhealthy_status)
+        lines = self.display._format_target_status("test-database", unhealthy_status)
         
-        # Verify print was called multiple times (status line + error line + spacing)
-        self.assertGreaterEqual(mock_print.call_count, 3)
+        # Status line + error line + spacing
+        self.assertEqual(len(lines), 3)
         
         # Check that the output contains expected elements
-        printed_calls = [str(call.args[0]) if call.args else str(call) for call in mock_print.call_args_list]
-        printed_output = ''.join(printed_calls)
+        printed_output = ''.join(lines)
         self.assertIn("test-database", printed_output)
         self.assertIn("異常", printed_output)
         self.assertIn("Connection timeout", printed_output)
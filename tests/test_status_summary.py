@@ -0,0 +1,125 @@
+"""
+Unit tests for the incremental status summary index.
+"""
+import unittest
+from datetime import datetime, timedelta
+
+from health_monitor.models.data_models import HealthStatus
+from health_monitor.services.status_summary import StatusSummaryIndex
+
+
+BASE_TIME = datetime(2024, 1, 15, 10, 0, 0)
+
+
+def _status(name, healthy=True, response_time=0.1, minutes=0, error=None):
+    return HealthStatus(
+        target_name=name,
+        is_healthy=healthy,
+        response_time=response_time,
+        error_message=None if healthy else (error or "down"),
+        timestamp=BASE_TIME + timedelta(minutes=minutes)
+    )
+
+
+class TestStatusSummaryIndex(unittest.TestCase):
+    """Test cases for StatusSummaryIndex."""
+
+    def setUp(self):
+        """Set up an index with a few targets."""
+        self.index = StatusSummaryIndex()
+        self.index.update("web-a", _status("web-a", response_time=0.5), "website")
+        self.index.update("web-b", _status("web-b", response_time=2.0), "website")
+        self.index.update("db-a", _status("db-a", healthy=False, response_time=0.0), "database")
+
+    def test_group_counts_follow_updates(self):
+        """Test counts move between healthy and unhealthy as statuses change."""
+        self.assertEqual(self.index.totals(), (2, 1))
+        self.assertEqual(self.index.group_counts(), {"database": (0, 1), "website": (2, 0)})
+
+        self.index.update("web-a", _status("web-a", healthy=False, minutes=1))
+        self.index.update("db-a", _status("db-a", minutes=1))
+
+        self.assertEqual(self.index.totals(), (2, 1))
+        self.assertEqual(self.index.group_counts(), {"database": (1, 0), "website": (1, 1)})
+
+    def test_group_fixed_at_first_sight(self):
+        """Test the group passed with later updates is ignored."""
+        self.index.update("web-a", _status("web-a"), "other")
+
+        self.assertNotIn("other", self.index.group_counts())
+
+    def test_slowest(self):
+        """Test the latency ordering tracks the latest response times."""
+        self.assertEqual([s.target_name for s in self.index.slowest(2)], ["web-b", "web-a"])
+
+        self.index.update("web-a", _status("web-a", response_time=5.0, minutes=1))
+
+        self.assertEqual([s.target_name for s in self.index.slowest(2)], ["web-a", "web-b"])
+        self.assertEqual(len(self.index.slowest(10)), 3)
+
+    def test_newest_failures_keep_failure_start(self):
+        """Test failures are ordered by when they started, not by the last check."""
+        self.index.update("web-b", _status("web-b", healthy=False, minutes=5))
+        self.index.update("db-a", _status("db-a", healthy=False, minutes=10, error="still down"))
+
+        failures = self.index.newest_failures(5)
+
+        self.assertEqual([s.target_name for _, s in failures], ["web-b", "db-a"])
+        self.assertEqual(failures[1][0], BASE_TIME)
+        self.assertEqual(failures[1][1].error_message, "still down")
+
+        self.index.update("web-b", _status("web-b", minutes=6))
+        self.assertEqual([s.target_name for _, s in self.index.newest_failures(5)], ["db-a"])
+
+    def test_paging_in_name_order(self):
+        """Test pages slice the sorted target names."""
+        self.assertEqual(self.index.page_count(2), 2)
+        self.assertEqual([s.target_name for s in self.index.page(0, 2)], ["db-a", "web-a"])
+        self.assertEqual([s.target_name for s in self.index.page(1, 2)], ["web-b"])
+        self.assertEqual(StatusSummaryIndex().page_count(10), 1)
+
+    def test_remove(self):
+        """Test removing a target drops it from every ordering."""
+        self.index.remove("db-a")
+        self.index.remove("missing")
+
+        self.assertEqual(len(self.index), 2)
+        self.assertNotIn("db-a", self.index)
+        self.assertEqual(self.index.group_counts(), {"website": (2, 0)})
+        self.assertEqual(self.index.newest_failures(5), [])
+        self.assertEqual(self.index.names(), ["web-a", "web-b"])
+        self.assertEqual(self.index.ordered("change"), ["web-b", "web-a"])
+
+    def test_ordered(self):
+        """Test the maintained name, latency and last-change orderings."""
+        self.index.update("web-a", _status("web-a", healthy=False, response_time=0.5, minutes=2))
+        self.index.update("web-b", _status("web-b", response_time=2.0, minutes=3))
+
+        self.assertEqual(self.index.ordered("name"), ["db-a", "web-a", "web-b"])
+        self.assertEqual(self.index.ordered("name", descending=True), ["web-b", "web-a", "db-a"])
+        self.assertEqual(self.index.ordered("latency"), ["web-b", "web-a", "db-a"])
+        # Only a health flip counts as a change
+        self.assertEqual(self.index.ordered("change"), ["web-a", "web-b", "db-a"])
+        self.assertEqual(self.index.changed_at("web-a"), BASE_TIME + timedelta(minutes=2))
+        self.assertEqual(self.index.changed_at("web-b"), BASE_TIME)
+        self.assertIsNone(self.index.changed_at("missing"))
+        with self.assertRaises(ValueError):
+            self.index.ordered("status")
+
+    def test_history(self):
+        """Test recent statuses are kept per target up to history_size."""
+        self.assertEqual(self.index.history("web-a"), [])
+
+        index = StatusSummaryIndex(history_size=2)
+        for minute in range(3):
+            index.update("web-a", _status("web-a", minutes=minute))
+
+        self.assertEqual([s.timestamp.minute for s in index.history("web-a")], [1, 2])
+        self.assertEqual(index.get("web-a").timestamp.minute, 2)
+        index.remove("web-a")
+        self.assertEqual(index.history("web-a"), [])
+        self.assertIsNone(index.get("web-a"))
+
+
+if __name__ == '__main__':
+    unittest.main()
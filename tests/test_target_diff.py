@@ -0,0 +1,62 @@
+"""
+Unit tests for configuration target diffs.
+"""
+import unittest
+
+from health_monitor.models.data_models import WebsiteTarget, DatabaseTarget
+from health_monitor.services.target_diff import TargetDiff, diff_targets
+
+
+class TestDiffTargets(unittest.TestCase):
+    """Test cases for diff_targets."""
+
+    def setUp(self):
+        """Set up a baseline configuration."""
+        self.websites = [
+            WebsiteTarget("site-a", "https://a.example.com/"),
+            WebsiteTarget("site-b", "https://b.example.com/"),
+        ]
+        self.databases = [DatabaseTarget("db", "localhost", 5432, "app", "user", "secret")]
+
+    def test_identical_configurations(self):
+        """Test equal targets count as unchanged, even as new objects."""
+        copies = [WebsiteTarget(t.name, t.url) for t in self.websites]
+
+        diff = diff_targets(self.websites, copies, self.databases, list(self.databases))
+
+        self.assertTrue(diff.is_empty())
+        self.assertEqual(diff.unchanged, 3)
+
+    def test_added_removed_modified(self):
+        """Test targets are matched by check type and name."""
+        new_websites = [
+            WebsiteTarget("site-b", "https://b.example.com/", timeout=30),
+            WebsiteTarget("site-c", "https://c.example.com/"),
+        ]
+
+        diff = diff_targets(self.websites, new_websites, self.databases, [])
+
+        self.assertEqual([(t, target.name) for t, target in diff.added], [("website", "site-c")])
+        self.assertEqual([(t, target.name) for t, target in diff.removed],
+                         [("website", "site-a"), ("database", "db")])
+        self.assertEqual(diff.modified, [("website", new_websites[0])])
+        self.assertEqual(diff.unchanged, 0)
+        self.assertFalse(diff.is_empty())
+        self.assertEqual(diff.summary(), "追加 1件, 削除 2件, 変更 1件, 変更なし 0件")
+
+    def test_same_name_in_both_types(self):
+        """Test a website and a database may share a name."""
+        databases = [DatabaseTarget("site-a", "localhost", 5432, "app", "user", "secret")]
+
+        diff = diff_targets(self.websites, self.websites, [], databases)
+
+        self.assertEqual([(t, target.name) for t, target in diff.added], [("database", "site-a")])
+        self.assertEqual(diff.removed, [])
+
+    def test_empty_diff(self):
+        """Test the default diff is empty."""
+        self.assertTrue(TargetDiff().is_empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
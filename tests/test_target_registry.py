@@ -0,0 +1,68 @@
+"""
+Unit tests for the target registry.
+"""
+import unittest
+
+from health_monitor.models.data_models import WebsiteTarget, DatabaseTarget
+from health_monitor.services.target_registry import TargetRegistry
+
+
+def _website(name):
+    return WebsiteTarget(name=name, url=f"https://{name}.example.com")
+
+
+def _database(name, host="localhost"):
+    return DatabaseTarget(name=name, host=host, port=5432, database="app", username="user", password="secret")
+
+
+class TestTargetRegistry(unittest.TestCase):
+    """Test cases for TargetRegistry."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.registry = TargetRegistry()
+        self.registry.replace([_website("web-a"), _website("web-b")], [_database("db")])
+
+    def test_lookup_by_name(self):
+        """Test targets and their types are found by name."""
+        self.assertEqual(len(self.registry), 3)
+        self.assertIn("db", self.registry)
+        self.assertEqual(self.registry.type_of("web-b"), "website")
+        self.assertEqual(self.registry.type_of("db"), "database")
+        self.assertEqual(self.registry.type_of("missing"), "unknown")
+        self.assertEqual(self.registry.get("db").host, "localhost")
+        self.assertIsNone(self.registry.get("missing"))
+
+    def test_lookup_by_id(self):
+        """Test every target gets a distinct id resolving back to it."""
+        ids = [self.registry.id_of(name) for name in ("web-a", "web-b", "db")]
+
+        self.assertEqual(len(set(ids)), 3)
+        self.assertEqual(self.registry.get_by_id(ids[2]).name, "db")
+        self.assertIsNone(self.registry.get_by_id(999))
+        self.assertIsNone(self.registry.id_of("missing"))
+
+    def test_replace_keeps_ids_of_remaining_names(self):
+        """Test a reload keeps ids, forgets removed names and never reuses ids."""
+        web_a, web_b = self.registry.id_of("web-a"), self.registry.id_of("web-b")
+
+        self.registry.replace([_website("web-a"), _website("web-c")], [_database("db", host="db.internal")])
+
+        self.assertEqual(self.registry.id_of("web-a"), web_a)
+        self.assertNotIn("web-b", self.registry)
+        self.assertIsNone(self.registry.get_by_id(web_b))
+        self.assertNotIn(self.registry.id_of("web-c"), (web_a, web_b))
+        self.assertEqual(self.registry.get("db").host, "db.internal")
+        self.assertEqual([t.name for t in self.registry.websites], ["web-a", "web-c"])
+
+    def test_website_shadows_database_of_same_name(self):
+        """Test a name used by both types resolves to the website."""
+        self.registry.replace([_website("shared")], [_database("shared")])
+
+        self.assertEqual(len(self.registry), 1)
+        self.assertEqual(self.registry.type_of("shared"), "website")
+        self.assertEqual(len(self.registry.databases), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
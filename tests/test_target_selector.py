@@ -0,0 +1,64 @@
+"""
+Unit tests for target selection by tag and name.
+"""
+import unittest
+
+from health_monitor.models.data_models import WebsiteTarget
+from health_monitor.services.target_selector import TargetSelector, parse_tag_intervals
+
+
+def _target(name, tags=()):
+    return WebsiteTarget(name=name, url=f"https://{name}.example.com", tags=list(tags))
+
+
+class TestTargetSelector(unittest.TestCase):
+    """Test cases for TargetSelector."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.targets = [
+            _target("payment-api", ["payments", "critical"]),
+            _target("payment-web", ["payments"]),
+            _target("blog", ["marketing"]),
+            _target("status")
+        ]
+
+    def test_empty_selector_matches_everything(self):
+        """Test a selector without criteria keeps every target."""
+        selector = TargetSelector.parse("", None)
+
+        self.assertTrue(selector.is_empty)
+        self.assertEqual(selector.select(self.targets), self.targets)
+        self.assertEqual(selector.describe(), "すべて")
+
+    def test_tags_match_any(self):
+        """Test a target needs only one of the tags."""
+        selector = TargetSelector.parse("critical, marketing")
+
+        self.assertEqual([t.name for t in selector.select(self.targets)], ["payment-api", "blog"])
+
+    def test_name_patterns(self):
+        """Test names match exactly or as shell-style patterns."""
+        selector = TargetSelector.parse(names="payment-*,status")
+
+        self.assertEqual([t.name for t in selector.select(self.targets)], ["payment-api", "payment-web", "status"])
+
+    def test_tags_and_names_combined(self):
+        """Test a target must satisfy both tags and names when both are given."""
+        selector = TargetSelector.parse("payments", "*-web")
+
+        self.assertEqual([t.name for t in selector.select(self.targets)], ["payment-web"])
+        self.assertEqual(selector.describe(), "タグ: payments / 名前: *-web")
+
+    def test_parse_tag_intervals(self):
+        """Test TAG=SECONDS values are parsed and validated."""
+        self.assertEqual(parse_tag_intervals(["payments=30", " critical = 5.5"]),
+                         {"payments": 30.0, "critical": 5.5})
+
+        for value in ("payments", "=30", "payments=abc", "payments=0"):
+            with self.assertRaises(ValueError):
+                parse_tag_intervals([value])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Unit tests for differential terminal rendering.
+"""
+import os
+import threading
+import time
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from health_monitor.services.terminal_renderer import (
+    DifferentialRenderer, CLEAR_SCREEN, CLEAR_TO_SCREEN_END
+)
+
+
+class _TerminalStream(StringIO):
+    """In-memory stream that reports itself as a terminal and counts writes."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def isatty(self):
+        return True
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+    def take(self):
+        value = self.getvalue()
+        self.seek(0)
+        self.truncate()
+        return value
+
+
+class _SlowTerminalStream(_TerminalStream):
+    """Terminal stream that yields to other threads on every write."""
+
+    def write(self, text):
+        time.sleep(0.001)
+        return super().write(text)
+
+
+@patch('health_monitor.services.terminal_renderer.shutil.get_terminal_size',
+       return_value=os.terminal_size((80, 24)))
+class TestDifferentialRenderer(unittest.TestCase):
+    """Test cases for DifferentialRenderer."""
+
+    def setUp(self):
+        """Set up a renderer writing to a fake terminal."""
+        self.stream = _TerminalStream()
+        self.renderer = DifferentialRenderer(self.stream)
+
+    def test_first_frame_clears_and_draws_everything(self, _size):
+        """Test the first frame is a full redraw in a single write."""
+        written = self.renderer.render(["header", "a", "b"])
+
+        output = self.stream.take()
+        self.assertEqual(written, 3)
+        self.assertEqual(self.stream.writes, 1)
+        self.assertIn(CLEAR_SCREEN, output)
+        self.assertIn("\x1b[1;1Hheader", output)
+        self.assertIn("\x1b[3;1Hb", output)
+        self.assertNotIn("\n", output)
+
+    def test_only_changed_lines_redrawn(self, _size):
+        """Test unchanged lines are skipped on later frames."""
+        self.renderer.render(["header", "a", "b", "footer 1"])
+        self.stream.take()
+
+        written = self.renderer.render(["header", "a", "B", "footer 2"])
+
+        output = self.stream.take()
+        self.assertEqual(written, 2)
+        self.assertNotIn(CLEAR_SCREEN, output)
+        self.assertNotIn("header", output)
+        self.assertIn("\x1b[3;1HB\x1b[K", output)
+        self.assertIn("\x1b[4;1Hfooter 2\x1b[K", output)
+
+    def test_shorter_frame_clears_leftover_lines(self, _size):
+        """Test rows below a shrinking frame are erased."""
+        self.renderer.render(["a", "b", "c"])
+        self.stream.take()
+
+        self.assertEqual(self.renderer.render(["a"]), 0)
+        self.assertIn("\x1b[2;1H" + CLEAR_TO_SCREEN_END, self.stream.take())
+
+    def test_resize_and_invalidate_force_full_redraw(self, size):
+        """Test a terminal resize or invalidate() redraws every line."""
+        self.renderer.render(["a", "b"])
+
+        size.return_value = os.terminal_size((100, 30))
+        self.assertEqual(self.renderer.render(["a", "b"]), 2)
+
+        self.renderer.invalidate()
+        self.assertEqual(self.renderer.render(["a", "b"]), 2)
+        self.assertEqual(self.renderer.render(["a", "b"]), 0)
+
+    def test_message_between_frames_forces_full_redraw(self, _size):
+        """Test a message written between two identical frames redraws every line."""
+        self.renderer.render(["header", "a", "b"])
+        self.stream.take()
+
+        self.renderer.write("設定再読み込み完了")
+        self.assertEqual(self.stream.take(), "設定再読み込み完了\n")
+
+        self.assertEqual(self.renderer.render(["header", "a", "b"]), 3)
+        output = self.stream.take()
+        self.assertIn(CLEAR_SCREEN, output)
+        self.assertIn("\x1b[1;1Hheader", output)
+
+    def test_messages_from_other_threads_are_not_split_by_frames(self, _size):
+        """Test a message and its newline are never separated by a frame drawn concurrently."""
+        stream = _SlowTerminalStream()
+        renderer = DifferentialRenderer(stream)
+        stop = threading.Event()
+
+        def draw_frames():
+            frame = 0
+            while not stop.is_set():
+                renderer.render([f"frame {frame}", "row"])
+                frame += 1
+
+        drawer = threading.Thread(target=draw_frames)
+        drawer.start()
+        try:
+            for i in range(20):
+                renderer.write(f"message {i}")
+        finally:
+            stop.set()
+            drawer.join()
+
+        output = stream.getvalue()
+        for i in range(20):
+            self.assertIn(f"message {i}\n", output)
+
+    def test_max_lines(self, _size):
+        """Test the usable height leaves one row for the cursor."""
+        self.assertEqual(self.renderer.max_lines(), 23)
+
+    def test_plain_output_when_not_a_terminal(self, _size):
+        """Test redirected output gets plain text without escape sequences."""
+        stream = StringIO()
+        renderer = DifferentialRenderer(stream)
+
+        renderer.render(["a", "b"])
+        renderer.render(["a", "b"])
+
+        self.assertEqual(stream.getvalue(), "a\nb\na\nb\n")
+        self.assertIsNone(renderer.max_lines())
+
+
+if __name__ == '__main__':
+    unittest.main()
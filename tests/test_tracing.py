@@ -0,0 +1,175 @@
+"""
+Unit tests for per-check tracing.
+"""
+import unittest
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from health_monitor.services.tracing import (
+    JsonFileSpanExporter, Tracer, record_span, span, STATUS_ERROR
+)
+
+
+class _ListExporter:
+    """Collects exported traces in memory."""
+
+    def __init__(self):
+        self.traces = []
+
+    def export(self, spans):
+        self.traces.append(list(spans))
+
+    def close(self):
+        pass
+
+
+class TestTracer(unittest.TestCase):
+    """Test cases for Tracer and span()."""
+
+    def test_span_without_trace_is_noop(self):
+        """Test spans outside a trace record nothing."""
+        with span("orphan", key="value") as s:
+            s.set_attribute("other", 1)
+
+        self.assertFalse(s.recording)
+        self.assertEqual(s.attributes, {})
+
+    def test_disabled_tracer(self):
+        """Test a tracer without exporter never records."""
+        tracer = Tracer()
+
+        with tracer.start_trace("health_check") as root:
+            with span("child") as child:
+                pass
+
+        self.assertFalse(tracer.enabled)
+        self.assertFalse(root.recording)
+        self.assertFalse(child.recording)
+
+    def test_nested_spans_share_trace(self):
+        """Test child spans link to their parent and are exported together."""
+        exporter = _ListExporter()
+        tracer = Tracer(exporter)
+
+        with tracer.start_trace("health_check", target="web") as root:
+            with span("retry.attempt") as attempt:
+                with span("http.request"):
+                    pass
+            record_span("queue_wait", root.start_ns, attempt.start_ns)
+
+        self.assertEqual(len(exporter.traces), 1)
+        spans = {s.name: s for s in exporter.traces[0]}
+        self.assertEqual(set(spans), {"health_check", "retry.attempt", "http.request", "queue_wait"})
+        self.assertEqual(len({s.trace.trace_id for s in spans.values()}), 1)
+        self.assertIsNone(spans["health_check"].parent_span_id)
+        self.assertEqual(spans["retry.attempt"].parent_span_id, root.span_id)
+        self.assertEqual(spans["http.request"].parent_span_id, attempt.span_id)
+        self.assertEqual(spans["queue_wait"].parent_span_id, root.span_id)
+        self.assertEqual(spans["health_check"].attributes, {"target": "web"})
+
+    def test_exception_recorded(self):
+        """Test an exception leaving a span marks it as an error."""
+        exporter = _ListExporter()
+        tracer = Tracer(exporter)
+
+        with self.assertRaises(RuntimeError):
+            with tracer.start_trace("health_check"):
+                with span("db.connect"):
+                    raise RuntimeError("refused")
+
+        spans = {s.name: s for s in exporter.traces[0]}
+        connect = spans["db.connect"]
+        self.assertEqual(connect.status_code, STATUS_ERROR)
+        self.assertEqual(connect.events[0]['attributes']['exception.type'], "RuntimeError")
+        self.assertEqual(spans["health_check"].status_code, STATUS_ERROR)
+
+    def test_slow_traces_kept_when_unsampled(self):
+        """Test tail-based retention of slow traces with a zero sample rate."""
+        exporter = _ListExporter()
+        tracer = Tracer(exporter, sample_rate=0.0, slow_threshold=0.05)
+
+        with tracer.start_trace("fast"):
+            pass
+        with tracer.start_trace("slow"):
+            time.sleep(0.06)
+
+        self.assertEqual([trace[-1].name for trace in exporter.traces], ["slow"])
+
+    def test_unsampled_without_threshold_is_noop(self):
+        """Test unsampled traces are not recorded when no slow threshold is set."""
+        exporter = _ListExporter()
+        tracer = Tracer(exporter, sample_rate=0.0)
+
+        with tracer.start_trace("health_check") as root:
+            pass
+
+        self.assertFalse(root.recording)
+        self.assertEqual(exporter.traces, [])
+
+    def test_invalid_sample_rate(self):
+        """Test sample rates outside [0, 1] are rejected."""
+        with self.assertRaises(ValueError):
+            Tracer(_ListExporter(), sample_rate=1.5)
+
+
+class TestJsonFileSpanExporter(unittest.TestCase):
+    """Test cases for JsonFileSpanExporter."""
+
+    def setUp(self):
+        """Set up a temporary trace directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "traces", "traces.jsonl")
+
+    def tearDown(self):
+        """Remove written traces."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_otlp_json_line(self):
+        """Test each trace is one OTLP/JSON resourceSpans line."""
+        tracer = Tracer(JsonFileSpanExporter(self.path))
+
+        with tracer.start_trace("health_check", **{"target.name": "web", "check.healthy": True}):
+            with span("http.request", **{"http.status_code": 200}):
+                pass
+
+        with open(self.path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 1)
+
+        request = json.loads(lines[0])
+        resource_spans = request['resourceSpans'][0]
+        self.assertEqual(resource_spans['resource']['attributes'][0],
+                         {'key': 'service.name', 'value': {'stringValue': 'health-monitor'}})
+        spans = {s['name']: s for s in resource_spans['scopeSpans'][0]['spans']}
+        root = spans['health_check']
+        child = spans['http.request']
+        self.assertEqual(len(root['traceId']), 32)
+        self.assertEqual(len(root['spanId']), 16)
+        self.assertEqual(child['parentSpanId'], root['spanId'])
+        self.assertNotIn('parentSpanId', root)
+        self.assertLessEqual(int(root['startTimeUnixNano']), int(child['startTimeUnixNano']))
+        self.assertIn({'key': 'check.healthy', 'value': {'boolValue': True}}, root['attributes'])
+        self.assertEqual(child['attributes'], [{'key': 'http.status_code', 'value': {'intValue': '200'}}])
+
+    def test_rotation(self):
+        """Test the file is rotated once it would exceed max_bytes."""
+        exporter = JsonFileSpanExporter(self.path, max_bytes=600, backup_count=2)
+        tracer = Tracer(exporter)
+
+        for _ in range(10):
+            with tracer.start_trace("health_check"):
+                pass
+
+        self.assertTrue(os.path.exists(self.path))
+        self.assertTrue(os.path.exists(self.path + ".1"))
+        self.assertTrue(os.path.exists(self.path + ".2"))
+        self.assertFalse(os.path.exists(self.path + ".3"))
+        for path in (self.path, self.path + ".1", self.path + ".2"):
+            self.assertLessEqual(os.path.getsize(path), 600)
+
+
+if __name__ == '__main__':
+    unittest.main()
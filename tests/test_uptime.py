@@ -0,0 +1,94 @@
+"""
+Unit tests for time-weighted uptime computation.
+"""
+import unittest
+import json
+from datetime import datetime, timedelta
+
+from health_monitor.services.uptime import UptimeTracker, compute_uptime
+
+
+class TestUptimeTracker(unittest.TestCase):
+    """Test cases for UptimeTracker and compute_uptime."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.base = datetime(2024, 1, 15, 0, 0, 0)
+        self.changes = [
+            (self.base, "up"),
+            (self.base + timedelta(hours=6), "down"),
+            (self.base + timedelta(hours=7), "up"),
+            (self.base + timedelta(hours=20), "shutdown"),
+        ]
+        self.until = self.base + timedelta(hours=24)
+
+    def _tracker(self, changes, since=None):
+        tracker = UptimeTracker(since=since)
+        for timestamp, status in changes:
+            tracker.observe(timestamp, status)
+        return tracker
+
+    def test_durations_follow_transitions(self):
+        """Test time between changes is credited to the status in force."""
+        durations = self._tracker(self.changes).get_durations(self.until)
+
+        self.assertEqual(durations["up"], 19 * 3600)
+        self.assertEqual(durations["down"], 3600)
+        self.assertEqual(durations["shutdown"], 4 * 3600)
+
+    def test_uptime_ignores_unmonitored_time(self):
+        """Test shutdown time is excluded from the uptime percentage."""
+        stats = compute_uptime(self.changes, until=self.until)
+
+        self.assertEqual(stats["monitored_seconds"], 20 * 3600)
+        self.assertAlmostEqual(stats["uptime_percentage"], 95.0)
+
+    def test_uptime_is_independent_of_logged_checks(self):
+        """Test repeated observations of the same status do not skew uptime."""
+        noisy = [(self.base + timedelta(minutes=m), "up") for m in range(0, 360, 5)]
+        noisy += self.changes[1:]
+
+        self.assertEqual(compute_uptime(noisy, until=self.until),
+                         compute_uptime(self.changes, until=self.until))
+
+    def test_since_clamps_earlier_changes(self):
+        """Test changes before the window only set the initial status."""
+        since = self.base + timedelta(hours=12)
+
+        stats = compute_uptime(self.changes, since=since, until=self.until)
+
+        self.assertEqual(stats["up_seconds"], 8 * 3600)
+        self.assertEqual(stats["down_seconds"], 0)
+        self.assertEqual(stats["uptime_percentage"], 100.0)
+
+    def test_merge_adjacent_periods_matches_single_sweep(self):
+        """Test merging in either order gives the single-sweep result."""
+        full = self._tracker(self.changes)
+
+        forward = self._tracker(self.changes[:2])
+        forward.merge(self._tracker(self.changes[2:]))
+        backward = self._tracker(self.changes[2:])
+        backward.merge(self._tracker(self.changes[:2]))
+
+        self.assertEqual(forward.get_durations(self.until), full.get_durations(self.until))
+        self.assertEqual(backward.get_durations(self.until), full.get_durations(self.until))
+
+    def test_empty_tracker(self):
+        """Test an empty tracker has no uptime."""
+        stats = UptimeTracker().get_stats(self.until)
+
+        self.assertIsNone(stats["uptime_percentage"])
+        self.assertEqual(stats["monitored_seconds"], 0)
+
+    def test_serialization_round_trip(self):
+        """Test to_dict/from_dict preserve the tracker."""
+        tracker = self._tracker(self.changes, since=self.base)
+
+        restored = UptimeTracker.from_dict(json.loads(json.dumps(tracker.to_dict())))
+
+        self.assertEqual(restored.get_durations(self.until), tracker.get_durations(self.until))
+        self.assertEqual(restored.since, tracker.since)
+
+
+if __name__ == '__main__':
+    unittest.main()